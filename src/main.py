@@ -149,4 +149,8 @@ def main(argv: list[str] | None = None) -> None:
 
 
 if __name__ == "__main__":  # pragma: no cover - import guard
+    import multiprocessing
+
+    # Spawned worker processes (GIF rendering) re-enter here in frozen builds.
+    multiprocessing.freeze_support()
     main()
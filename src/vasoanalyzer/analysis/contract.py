@@ -5,6 +5,8 @@ from typing import Any, Literal
 
 import numpy as np
 
+from vasoanalyzer.core.traces.stats import WindowStatsIndex
+
 from .errors import AnalysisError, InvalidEventError, InvalidTimebaseError, MissingTraceError
 
 FloatArray = np.ndarray  # must be 1D float64
@@ -157,6 +159,10 @@ class MyographyDataset:
 
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    _stats: dict[str, WindowStatsIndex] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self) -> None:
         if not isinstance(self.dataset_id, str) or not self.dataset_id:
             raise AnalysisError("dataset_id must be a non-empty string.")
@@ -186,6 +192,20 @@ class MyographyDataset:
 
         self._normalize_units()
 
+    def window_stats(self, name: str = "diameter_inner_um") -> WindowStatsIndex:
+        """
+        Window statistics index for trace ``name``, built once per dataset.
+        """
+
+        index = self._stats.get(name)
+        if index is None:
+            trace = getattr(self, name, None)
+            if not isinstance(trace, Trace):
+                raise MissingTraceError(f"{name} is not available.")
+            index = WindowStatsIndex(self.time.t_s, trace.values)
+            self._stats[name] = index
+        return index
+
     def _validate_trace_alignment(self, trace: Trace | None, name: str) -> None:
         if trace is None:
             return
@@ -5,6 +5,8 @@ from dataclasses import dataclass
 
 import numpy as np
 
+from vasoanalyzer.core.traces.stats import WindowStats
+
 from .contract import AnalysisParamsV1, MyographyDataset, TimeSeries
 from .errors import AnalysisError, MissingPassiveDiameterError
 from .provenance import Provenance, resolve_analyzer_version, stable_params_hash
@@ -27,40 +29,52 @@ class StepResult:
     mean_pressure_mmhg: float | None
 
 
+def _window_means(stats: WindowStats) -> np.ndarray:
+    # Match np.mean over the window: any NaN sample makes the mean NaN.
+    return np.where(stats.count == stats.samples, stats.mean, np.nan)
+
+
 def compute_step_steady_state(
     dataset: MyographyDataset,
     steps: Sequence[StepSegment],
     params: AnalysisParamsV1,
 ) -> tuple[StepResult, ...]:
-    results: list[StepResult] = []
+    if not steps:
+        return ()
     transient_exclude = params.step_windows.transient_exclude_s
     steady_window = params.step_windows.steady_state_window_s
 
-    for step in steps:
-        window_start = step.start_s + transient_exclude
-        window_start = max(window_start, step.end_s - steady_window)
-        mask = slice_mask(dataset.time, window_start, step.end_s)
-        if not np.any(mask):
-            raise AnalysisError(
-                f"Empty steady-state window for step {step.index} ({step.start_s}-{step.end_s}s)."
-            )
-        mean_diameter = float(np.mean(dataset.diameter_inner_um.values[mask]))
-        mean_pressure: float | None = None
-        if dataset.pressure_mmhg is not None:
-            mean_pressure = float(np.mean(dataset.pressure_mmhg.values[mask]))
-
-        results.append(
-            StepResult(
-                step_index=step.index,
-                start_s=step.start_s,
-                end_s=step.end_s,
-                target_mmhg=step.target_mmhg,
-                mean_diameter_inner_um=mean_diameter,
-                mean_pressure_mmhg=mean_pressure,
-            )
+    step_start = np.asarray([step.start_s for step in steps], dtype=np.float64)
+    step_end = np.asarray([step.end_s for step in steps], dtype=np.float64)
+    window_start = np.maximum(step_start + transient_exclude, step_end - steady_window)
+
+    diameter = dataset.window_stats("diameter_inner_um").query(window_start, step_end)
+    invalid = (step_end <= window_start) | (diameter.samples == 0)
+    if np.any(invalid):
+        first = int(np.flatnonzero(invalid)[0])
+        if step_end[first] <= window_start[first]:
+            raise AnalysisError("slice_mask end_s must be greater than start_s.")
+        step = steps[first]
+        raise AnalysisError(
+            f"Empty steady-state window for step {step.index} ({step.start_s}-{step.end_s}s)."
         )
-
-    return tuple(results)
+    mean_diameter = _window_means(diameter)
+    mean_pressure: np.ndarray | None = None
+    if dataset.pressure_mmhg is not None:
+        pressure = dataset.window_stats("pressure_mmhg").query(window_start, step_end)
+        mean_pressure = _window_means(pressure)
+
+    return tuple(
+        StepResult(
+            step_index=step.index,
+            start_s=step.start_s,
+            end_s=step.end_s,
+            target_mmhg=step.target_mmhg,
+            mean_diameter_inner_um=float(mean_diameter[i]),
+            mean_pressure_mmhg=float(mean_pressure[i]) if mean_pressure is not None else None,
+        )
+        for i, step in enumerate(steps)
+    )
 
 
 def compute_passive_diameter_per_step(
@@ -98,10 +112,12 @@ def compute_passive_diameter_per_step(
         start_s = selected.start_s
         end_s = selected.start_s + params.step_windows.steady_state_window_s
 
-    mask = slice_mask(dataset.time, start_s, end_s)
-    if not np.any(mask):
+    if end_s <= start_s:
+        raise AnalysisError("slice_mask end_s must be greater than start_s.")
+    window = dataset.window_stats("diameter_inner_um").query(start_s, end_s)
+    if window.samples == 0:
         raise AnalysisError("Passive marker interval contains no samples.")
-    mean_passive = float(np.mean(dataset.diameter_inner_um.values[mask]))
+    mean_passive = float(_window_means(window))
     return np.full(len(steps), mean_passive, dtype=np.float64)
 
 
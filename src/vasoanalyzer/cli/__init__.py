@@ -8,6 +8,7 @@ import sys
 
 from ..pkg.models import ChannelSpec, DatasetMeta, Event, Sampling
 from ..pkg.package import VasoPackage
+from .batch import add_batch_commands
 
 __all__ = ["main", "recover"]
 
@@ -60,6 +61,12 @@ def cmd_verify(args: argparse.Namespace) -> None:
     print(json.dumps(pkg.verify(), indent=2))
 
 
+def cmd_compact(args: argparse.Namespace) -> None:
+    pkg = VasoPackage.open(args.path)
+    reclaimed = pkg.compact()
+    print(f"Reclaimed {reclaimed} bytes")
+
+
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser("vaso")
     sub = parser.add_subparsers(dest="cmd", required=True)
@@ -103,14 +110,20 @@ def _build_parser() -> argparse.ArgumentParser:
     sp.add_argument("path")
     sp.set_defaults(func=cmd_verify)
 
+    sp = sub.add_parser("compact")
+    sp.add_argument("path")
+    sp.set_defaults(func=cmd_compact)
+
+    add_batch_commands(sub)
+
     return parser
 
 
-def main(argv: list[str] | None = None) -> None:
+def main(argv: list[str] | None = None) -> int:
     parser = _build_parser()
     args = parser.parse_args(argv)
-    args.func(args)
+    return int(args.func(args) or 0)
 
 
 if __name__ == "__main__":
-    main(sys.argv[1:])
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,7 @@
+"""Allow ``python -m vasoanalyzer.cli`` where the ``vaso`` script is not installed."""
+
+import sys
+
+from . import main
+
+sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,650 @@
+"""Headless batch commands over SQLite ``.vaso`` projects.
+
+Every command prints one JSON object per line on stdout so that schedulers
+and shell pipelines can follow progress without parsing log output::
+
+    {"event": "progress", "command": "analyze", "done": 3, "total": 12}
+    {"event": "summary", "command": "analyze", "computed": 9, "cached": 3, "failed": 0}
+
+Logging stays on stderr.  Commands that fan out accept ``--jobs N``; work is
+spread over a process pool while all project writes stay in the parent
+process, which owns the only SQLite connection.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import numpy as np
+import pandas as pd
+
+from ..export.profiles import (
+    EVENT_TABLE_ROW_PER_EVENT_ID,
+    EXPORT_PROFILE_BY_ID,
+    EXPORT_PROFILES,
+    PRESSURE_CURVE_STANDARD_ID,
+)
+
+if TYPE_CHECKING:
+    from ..export.report_batch import ReportPage, ReportResult
+    from ..services.project_service import SQLiteProjectRepository
+
+__all__ = ["add_batch_commands"]
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_TEMPLATE = (
+    Path(__file__).resolve().parent.parent
+    / "resources"
+    / "templates"
+    / "VasoAnalyzer_Standard_Template_v1.xlsx"
+)
+
+# SQLite trace columns -> labels expected by TraceModel.from_dataframe.
+_DB_TO_UI_COLUMNS = {
+    "t_seconds": "Time (s)",
+    "inner_diam": "Inner Diameter",
+    "outer_diam": "Outer Diameter",
+    "p_avg": "Avg Pressure (mmHg)",
+    "p1": "Pressure 1 (mmHg)",
+    "p2": "Set Pressure (mmHg)",
+    "frame_number": "FrameNumber",
+    "tiff_page": "TiffPage",
+}
+
+# SQLite event columns -> event table headers used by the report figure.
+_DB_TO_EVENT_TABLE = {
+    "label": "Event",
+    "t_seconds": "Time (s)",
+    "id_diam": "ID (µm)",
+    "od": "OD (µm)",
+    "p_avg": "Avg P (mmHg)",
+    "p2": "Set P (mmHg)",
+}
+
+
+# ---------------------------------------------------------------------------
+# Output helpers
+
+
+def _emit(event: str, command: str, **fields: Any) -> None:
+    record = {"event": event, "command": command, **fields}
+    sys.stdout.write(json.dumps(record, default=str) + "\n")
+    sys.stdout.flush()
+
+
+def _progress(command: str) -> Callable[[int, int], None]:
+    def _report(done: int, total: int) -> None:
+        _emit("progress", command, done=done, total=total)
+
+    return _report
+
+
+def _map(func: Callable[[T], R], items: list[T], jobs: int | None) -> Iterator[R]:
+    """Yield ``func(item)`` in order, across ``jobs`` processes when worthwhile."""
+
+    workers = min(jobs or os.cpu_count() or 1, len(items))
+    if workers <= 1:
+        yield from map(func, items)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(func, items)
+
+
+def _open_repository(path: str, *, validate: bool = True) -> SQLiteProjectRepository:
+    # The service layer is imported lazily so that ``vaso new`` & co. stay fast.
+    from ..services.project_service import open_project_repository
+
+    return open_project_repository(path, validate=validate)
+
+
+def _select_datasets(
+    repo: SQLiteProjectRepository, ids: Iterable[int] | None
+) -> list[dict[str, Any]]:
+    rows = list(repo.iter_datasets())
+    if not ids:
+        return rows
+    wanted = {int(i) for i in ids}
+    return [row for row in rows if int(row["id"]) in wanted]
+
+
+def _safe_filename(name: str, dataset_id: int) -> str:
+    stem = "".join(ch if ch.isalnum() or ch in "-_." else "_" for ch in name).strip("._")
+    return f"{dataset_id:04d}_{stem or 'dataset'}"
+
+
+# ---------------------------------------------------------------------------
+# Dataset frames
+
+
+def _nearest_samples(time: np.ndarray, values: np.ndarray, at: np.ndarray) -> np.ndarray:
+    if time.size == 0:
+        return np.full(at.shape, np.nan)
+    idx = np.clip(np.searchsorted(time, at), 1, max(time.size - 1, 1))
+    left = np.maximum(idx - 1, 0)
+    nearest = np.where(np.abs(at - time[left]) <= np.abs(time[idx] - at), left, idx)
+    return values[nearest]
+
+
+def _event_table(trace: pd.DataFrame, events: pd.DataFrame) -> pd.DataFrame:
+    """Return ``events`` with UI headers and the inner diameter filled from ``trace``."""
+
+    table = events.rename(columns=_DB_TO_EVENT_TABLE)
+    keep = [col for col in _DB_TO_EVENT_TABLE.values() if col in table.columns]
+    table = table[keep].copy()
+    if table.empty:
+        return table
+
+    times = pd.to_numeric(table["Time (s)"], errors="coerce").to_numpy(dtype=float)
+    sampled = _nearest_samples(
+        trace["t_seconds"].to_numpy(dtype=float),
+        trace["inner_diam"].to_numpy(dtype=float),
+        times,
+    )
+    stored = (
+        pd.to_numeric(table["ID (µm)"], errors="coerce").to_numpy(dtype=float)
+        if "ID (µm)" in table.columns
+        else np.full(times.shape, np.nan)
+    )
+    table["ID (µm)"] = np.where(np.isfinite(stored), stored, sampled)
+    return table.reset_index(drop=True)
+
+
+def _load_frames(
+    repo: SQLiteProjectRepository, dataset_id: int
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    from ..storage import sqlite_store
+
+    trace = sqlite_store.get_trace(repo.store, dataset_id)
+    events = sqlite_store.get_events(repo.store, dataset_id)
+    return trace, _event_table(trace, events)
+
+
+def _event_rows(table: pd.DataFrame) -> list[tuple[object, object, object]]:
+    if table.empty:
+        return []
+    return list(zip(table["Event"], table["Time (s)"], table["ID (µm)"], strict=True))
+
+
+# ---------------------------------------------------------------------------
+# import-folder
+
+
+def _load_candidate(candidate) -> dict[str, Any]:
+    # Runs in a worker process: parse the files, leave the database to the parent.
+    from ..io.trace_events import load_trace_and_events
+
+    try:
+        df, labels, times, frames, diam, od_diam, import_meta = load_trace_and_events(
+            candidate.trace_file, candidate.events_file
+        )
+    except Exception as exc:  # noqa: BLE001 - reported per candidate
+        return {"candidate": candidate, "error": f"{type(exc).__name__}: {exc}"}
+
+    events = None
+    if labels and times:
+        events_data: dict[str, Any] = {"Time (s)": times, "Event": labels}
+        if frames:
+            events_data["Frame"] = frames
+        if diam:
+            events_data["DiamBefore"] = diam
+        if od_diam:
+            events_data["OuterDiamBefore"] = od_diam
+        events = pd.DataFrame(events_data)
+    return {"candidate": candidate, "trace": df, "events": events, "meta": import_meta}
+
+
+def _imported_trace_paths(repo: SQLiteProjectRepository) -> set[str]:
+    paths = set()
+    for row in repo.iter_datasets():
+        extra = row.get("extra") or {}
+        if isinstance(extra, dict) and extra.get("trace_path"):
+            paths.add(str(extra["trace_path"]))
+    return paths
+
+
+def cmd_import_folder(args: argparse.Namespace) -> int:
+    from utils.config import APP_VERSION
+
+    from ..services.folder_import_service import scan_folder_with_status
+    from ..services.project_service import create_project_repository
+
+    command = "import-folder"
+    project_path = Path(args.project)
+    if project_path.exists():
+        repo = _open_repository(str(project_path))
+    else:
+        repo = create_project_repository(
+            str(project_path), app_version=APP_VERSION, timezone=args.timezone
+        )
+
+    with repo:
+        known = set() if args.force else _imported_trace_paths(repo)
+        candidates = [
+            cand
+            for cand in scan_folder_with_status(args.folder)
+            if str(Path(cand.trace_file).resolve()) not in known
+        ]
+        total = len(candidates)
+        _emit("start", command, total=total, folder=str(args.folder))
+
+        imported = failed = 0
+        for done, loaded in enumerate(_map(_load_candidate, candidates, args.jobs), 1):
+            candidate = loaded["candidate"]
+            error = loaded.get("error")
+            dataset_id = None
+            if error is None:
+                trace_path = str(Path(candidate.trace_file).resolve())
+                extra = {"trace_path": trace_path, "import": loaded["meta"] or {}}
+                if candidate.events_file:
+                    extra["events_path"] = str(Path(candidate.events_file).resolve())
+                try:
+                    dataset_id = repo.add_dataset(
+                        candidate.subfolder,
+                        loaded["trace"],
+                        loaded["events"],
+                        metadata={"extra_json": extra},
+                    )
+                except Exception as exc:  # noqa: BLE001 - reported per candidate
+                    error = f"{type(exc).__name__}: {exc}"
+            if error is None:
+                imported += 1
+            else:
+                failed += 1
+                log.warning("Import failed for %s: %s", candidate.trace_file, error)
+            _emit(
+                "progress",
+                command,
+                done=done,
+                total=total,
+                name=candidate.subfolder,
+                dataset_id=dataset_id,
+                error=error,
+            )
+
+        if imported:
+            repo.save()
+    _emit("summary", command, imported=imported, failed=failed, project=str(project_path))
+    return 1 if failed else 0
+
+
+# ---------------------------------------------------------------------------
+# analyze
+
+
+def cmd_analyze(args: argparse.Namespace) -> int:
+    from ..services.batch_analysis_service import run_batch_analysis
+
+    command = "analyze"
+    with _open_repository(args.project) as repo:
+        report = run_batch_analysis(
+            repo.store,
+            dataset_ids=args.dataset or None,
+            max_workers=args.jobs,
+            force=args.force,
+            progress=_progress(command),
+        )
+        if report.computed:
+            repo.save()
+    for item in report.items:
+        _emit(
+            "dataset",
+            command,
+            dataset_id=item.dataset_id,
+            name=item.name,
+            status=item.status,
+            result_id=item.result_id,
+            error=item.error,
+        )
+    _emit(
+        "summary",
+        command,
+        computed=report.computed,
+        cached=report.cached,
+        failed=report.failed,
+    )
+    return 1 if report.failed else 0
+
+
+# ---------------------------------------------------------------------------
+# export-events
+
+
+def _write_event_csv(job: tuple[str, list[tuple[object, object, object]], str, bool]) -> list[str]:
+    # Runs in a worker process: the parent has already read the event rows.
+    from ..export.clipboard import write_csv
+    from ..export.generator import build_export_table, events_from_rows
+
+    profile_id, rows, path, include_header = job
+    export = build_export_table(EXPORT_PROFILE_BY_ID[profile_id], events_from_rows(rows))
+    write_csv(Path(path), export, include_header=include_header)
+    return list(export.warnings)
+
+
+def cmd_export_events(args: argparse.Namespace) -> int:
+    command = "export-events"
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    jobs: list[tuple[str, list[tuple[object, object, object]], str, bool]] = []
+    with _open_repository(args.project) as repo:
+        datasets = _select_datasets(repo, args.dataset)
+        for row in datasets:
+            dataset_id = int(row["id"])
+            _trace, table = _load_frames(repo, dataset_id)
+            path = out_dir / f"{_safe_filename(str(row['name']), dataset_id)}.csv"
+            jobs.append((args.profile, _event_rows(table), str(path), not args.no_header))
+
+    written = 0
+    results = _map(_write_event_csv, jobs, args.jobs)
+    for done, (row, job, warnings) in enumerate(zip(datasets, jobs, results, strict=True), 1):
+        written += 1
+        _emit(
+            "progress",
+            command,
+            done=done,
+            total=len(datasets),
+            dataset_id=int(row["id"]),
+            path=job[2],
+            warnings=warnings,
+        )
+    _emit("summary", command, written=written, out=str(out_dir))
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# export-excel
+
+
+def _replicate_order(name: str) -> int:
+    suffix = name.split("_")[-1]
+    return int(suffix) if suffix.isdigit() else 0
+
+
+def _metric_frame(job: tuple[str, list[tuple[object, object, object]]]) -> pd.DataFrame:
+    # Runs in a worker process: one replicate's Metric/Value table.
+    from ..export.generator import build_export_table, events_from_rows
+
+    profile_id, rows = job
+    export = build_export_table(EXPORT_PROFILE_BY_ID[profile_id], events_from_rows(rows))
+    return pd.DataFrame(
+        [(r[0], r[1]) for r in export.rows if len(r) >= 2 and r[1] is not None],
+        columns=["Metric", "Value"],
+    )
+
+
+def cmd_export_excel(args: argparse.Namespace) -> int:
+    from ..excel.template_v1 import block_by_id, inspect_template, validate_template_or_raise
+    from ..excel.writer_v1 import apply_write_plans, build_write_plans
+
+    command = "export-excel"
+    template = str(args.template or DEFAULT_TEMPLATE)
+    output = Path(args.out)
+    inspection = inspect_template(template)
+    validate_template_or_raise(inspection)
+    block = block_by_id(inspection.blocks, args.block) if args.block else inspection.blocks[0]
+    if block is None:
+        raise SystemExit(f"Block '{args.block}' not found in {template}")
+    replicates = sorted(block.replicate_cols, key=_replicate_order)
+
+    with _open_repository(args.project) as repo:
+        datasets = _select_datasets(repo, args.dataset)
+        if len(datasets) > len(replicates):
+            log.warning(
+                "Block '%s' has %d replicate columns; %d datasets will be skipped",
+                block.block_id,
+                len(replicates),
+                len(datasets) - len(replicates),
+            )
+        jobs = []
+        for row in datasets[: len(replicates)]:
+            _trace, table = _load_frames(repo, int(row["id"]))
+            jobs.append((args.profile, _event_rows(table)))
+    frames = _map(_metric_frame, jobs, args.jobs)
+    tables = list(zip(replicates, frames, strict=False))
+
+    # One template read for every replicate column, one save for the workbook.
+    plans = build_write_plans(template, str(output), block, tables)
+    if plans:
+        apply_write_plans(plans, allow_missing=True)
+    written = skipped = 0
+    for done, (row, plan) in enumerate(zip(datasets, plans, strict=False), 1):
+        written += len(plan.items)
+        skipped += len(plan.missing_metrics)
+        _emit(
+            "progress",
+            command,
+            done=done,
+            total=len(datasets),
+            dataset_id=int(row["id"]),
+            replicate=plan.replicate_col,
+            cells=len(plan.items),
+            missing=list(plan.missing_metrics),
+        )
+    _emit("summary", command, cells=written, skipped=skipped, out=str(output))
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# render-report
+
+
+def _report_page(name: str, title: str, trace: pd.DataFrame, table: pd.DataFrame) -> ReportPage:
+    from ..export.report_batch import ReportPage
+
+    # The trace model is built by whichever process renders the page.
+    trace = trace.rename(columns=_DB_TO_UI_COLUMNS)
+    time = trace["Time (s)"].to_numpy(dtype=float)
+    xlim = (float(np.nanmin(time)), float(np.nanmax(time))) if time.size else (0.0, 1.0)
+    return ReportPage(
+        name=name,
+        trace=trace,
+        xlim=xlim,
+        events_df=table,
+        event_times=table["Time (s)"].tolist() if not table.empty else None,
+        event_labels=table["Event"].astype(str).tolist() if not table.empty else None,
+        metadata={"sample_name": title},
+    )
+
+
+def cmd_render_report(args: argparse.Namespace) -> int:
+    from ..export.report_batch import render_report_pages, write_report_pdf
+
+    command = "render-report"
+    if args.multipage and args.format != "pdf":
+        raise SystemExit("--multipage requires --format pdf")
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    pages: list[ReportPage] = []
+    dataset_ids: dict[str, int] = {}
+    with _open_repository(args.project) as repo:
+        for row in _select_datasets(repo, args.dataset):
+            dataset_id = int(row["id"])
+            trace, table = _load_frames(repo, dataset_id)
+            name = _safe_filename(str(row["name"]), dataset_id)
+            pages.append(_report_page(name, str(row["name"]), trace, table))
+            dataset_ids[name] = dataset_id
+
+    done = failed = 0
+
+    def _on_result(result: ReportResult) -> None:
+        nonlocal done, failed
+        done += 1
+        failed += not result.ok
+        _emit(
+            "progress",
+            command,
+            done=done,
+            total=len(pages),
+            dataset_id=dataset_ids[result.name],
+            path=str(result.path) if result.path is not None else None,
+            error=result.error,
+        )
+
+    # One figure layout is reused for every page a process renders.
+    options = {"dpi": args.dpi, "include_frame": False, "on_result": _on_result}
+    if args.multipage:
+        write_report_pdf(pages, out_dir / "report.pdf", **options)
+    else:
+        render_report_pages(pages, out_dir, fmt=args.format, workers=args.jobs, **options)
+    _emit("summary", command, rendered=len(pages) - failed, failed=failed, out=str(out_dir))
+    return 1 if failed else 0
+
+
+# ---------------------------------------------------------------------------
+# validate
+
+
+def _signature_drift(
+    stored: dict[str, str | None], computed: dict[str, str]
+) -> dict[str, dict[str, str | None]]:
+    return {
+        field: {"stored": stored[field], "computed": value}
+        for field, value in computed.items()
+        if stored[field] and stored[field] != value
+    }
+
+
+def cmd_validate(args: argparse.Namespace) -> int:
+    from ..services.validation_service import DatasetCheck, database_path, iter_dataset_checks
+    from ..storage.validation import compute_dataset_signatures
+
+    command = "validate"
+    # A normal open re-signs every dataset and overwrites the stored
+    # signatures, so the project is opened without that pass and the stored
+    # values are compared with freshly computed ones here.  Nothing is written.
+    with _open_repository(args.project, validate=False) as repo:
+        conn = repo.store.conn
+        rows = conn.execute(
+            "SELECT id, name, events_signature, trace_signature FROM dataset ORDER BY id"
+        ).fetchall()
+        stored = {int(row[0]): row for row in rows}
+        db_path = database_path(conn)
+        if db_path is None:
+            checks = [
+                DatasetCheck(ds_id, compute_dataset_signatures(conn, ds_id)) for ds_id in stored
+            ]
+        else:
+            conn.commit()
+            checks = list(iter_dataset_checks(db_path, list(stored), max_workers=args.jobs))
+
+    drifted = failed = 0
+    for check in sorted(checks, key=lambda item: item.dataset_id):
+        _id, name, events_sig, trace_sig = stored[check.dataset_id]
+        if check.signatures is None:
+            failed += 1
+            _emit("error", command, dataset_id=check.dataset_id, name=name, error=check.error)
+            continue
+        drift = _signature_drift(
+            {"events_signature": events_sig, "trace_signature": trace_sig},
+            {
+                "events_signature": check.signatures.events_signature,
+                "trace_signature": check.signatures.trace_signature,
+            },
+        )
+        if drift:
+            drifted += 1
+            _emit("drift", command, dataset_id=check.dataset_id, name=name, signatures=drift)
+    _emit(
+        "summary",
+        command,
+        datasets=len(rows),
+        drifted=drifted,
+        failed=failed,
+        project=str(args.project),
+    )
+    return 1 if drifted or failed else 0
+
+
+# ---------------------------------------------------------------------------
+# Parser wiring
+
+
+def _add_jobs(sp: argparse.ArgumentParser) -> None:
+    sp.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="worker processes (default: all cores)",
+    )
+
+
+def _add_dataset_filter(sp: argparse.ArgumentParser) -> None:
+    sp.add_argument(
+        "--dataset",
+        type=int,
+        action="append",
+        help="restrict to this dataset id (repeatable)",
+    )
+
+
+def add_batch_commands(sub: argparse._SubParsersAction) -> None:
+    """Register the headless project subcommands on ``sub``."""
+
+    profiles = [profile.profile_id for profile in EXPORT_PROFILES]
+
+    sp = sub.add_parser("import-folder", help="import every trace found under a folder")
+    sp.add_argument("project")
+    sp.add_argument("folder")
+    sp.add_argument("--timezone", default="UTC")
+    sp.add_argument("--force", action="store_true", help="re-import already imported traces")
+    _add_jobs(sp)
+    sp.set_defaults(func=cmd_import_folder)
+
+    sp = sub.add_parser("analyze", help="run pressure-myography analysis on each dataset")
+    sp.add_argument("project")
+    sp.add_argument("--force", action="store_true", help="ignore cached results")
+    _add_dataset_filter(sp)
+    _add_jobs(sp)
+    sp.set_defaults(func=cmd_analyze)
+
+    sp = sub.add_parser("export-events", help="write one event CSV per dataset")
+    sp.add_argument("project")
+    sp.add_argument("--out", required=True)
+    sp.add_argument("--profile", choices=profiles, default=EVENT_TABLE_ROW_PER_EVENT_ID)
+    sp.add_argument("--no-header", action="store_true")
+    _add_dataset_filter(sp)
+    _add_jobs(sp)
+    sp.set_defaults(func=cmd_export_events)
+
+    sp = sub.add_parser("export-excel", help="fill a template block, one replicate per dataset")
+    sp.add_argument("project")
+    sp.add_argument("--out", required=True)
+    sp.add_argument("--template", default=None)
+    sp.add_argument("--block", default=None)
+    sp.add_argument("--profile", choices=profiles, default=PRESSURE_CURVE_STANDARD_ID)
+    _add_dataset_filter(sp)
+    _add_jobs(sp)
+    sp.set_defaults(func=cmd_export_excel)
+
+    sp = sub.add_parser("render-report", help="render a report figure per dataset")
+    sp.add_argument("project")
+    sp.add_argument("--out", required=True)
+    sp.add_argument("--format", choices=("pdf", "png", "svg", "tiff"), default="pdf")
+    sp.add_argument("--dpi", type=int, default=150)
+    sp.add_argument(
+        "--multipage",
+        action="store_true",
+        help="write every page into one report.pdf (with --format pdf)",
+    )
+    _add_dataset_filter(sp)
+    _add_jobs(sp)
+    sp.set_defaults(func=cmd_render_report)
+
+    sp = sub.add_parser("validate", help="recompute signatures and report drift")
+    sp.add_argument("project")
+    _add_jobs(sp)
+    sp.set_defaults(func=cmd_validate)
@@ -1,8 +1,15 @@
-from .cluster import Cluster, cluster_events
+from .cluster import Cluster, EventClusterIndex, cluster_breaks, cluster_events
 from .summary import format_cluster_label, total_count
+from .values import SAMPLING_MODES, EventValueEngine, NearestSampleIndex, SamplingRule
 
 __all__ = [
+    "SAMPLING_MODES",
     "Cluster",
+    "EventClusterIndex",
+    "EventValueEngine",
+    "NearestSampleIndex",
+    "SamplingRule",
+    "cluster_breaks",
     "cluster_events",
     "format_cluster_label",
     "total_count",
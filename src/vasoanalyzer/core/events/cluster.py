@@ -4,7 +4,9 @@ import math
 from collections.abc import Sequence
 from dataclasses import dataclass
 
-__all__ = ["Cluster", "cluster_events"]
+import numpy as np
+
+__all__ = ["Cluster", "EventClusterIndex", "cluster_breaks", "cluster_events"]
 
 
 @dataclass(frozen=True)
@@ -16,6 +18,51 @@ class Cluster:
     hidden: int
 
 
+def _finite_sorted(times: Sequence[float]) -> np.ndarray:
+    try:
+        arr = np.asarray(times, dtype=float).ravel()
+    except (TypeError, ValueError):
+        values = []
+        for value in times:
+            try:
+                values.append(float(value))
+            except (TypeError, ValueError):
+                continue
+        arr = np.asarray(values, dtype=float)
+    return np.sort(arr[np.isfinite(arr)], kind="stable")
+
+
+def cluster_breaks(gaps: np.ndarray, min_gap: float, *, join_equal: bool = True) -> np.ndarray:
+    """Return the positions at which a new cluster starts.
+
+    ``gaps`` holds the distances between consecutive sorted events; position
+    ``i + 1`` starts a cluster when ``gaps[i]`` exceeds ``min_gap`` (or reaches
+    it, with ``join_equal=False``).
+    """
+
+    split = gaps > min_gap if join_equal else gaps >= min_gap
+    return np.flatnonzero(split) + 1
+
+
+def _build_clusters(
+    times: np.ndarray,
+    xs: np.ndarray,
+    starts: np.ndarray,
+    stops: np.ndarray,
+    max_visible: int,
+) -> list[Cluster]:
+    mids = 0.5 * (xs[starts] + xs[stops - 1])
+    sizes = stops - starts
+    return [
+        Cluster(
+            x_px=float(mid),
+            times=tuple(times[start : start + min(int(size), max_visible)].tolist()),
+            hidden=max(0, int(size) - max_visible),
+        )
+        for mid, start, size in zip(mids, starts, sizes, strict=True)
+    ]
+
+
 def cluster_events(
     times: Sequence[float],
     xlim: tuple[float, float],
@@ -26,59 +73,100 @@ def cluster_events(
 ) -> list[Cluster]:
     """Group events by pixel proximity along the x axis."""
 
-    if not times or ax_width_px <= 1:
+    if times is None or len(times) == 0 or ax_width_px <= 1:
         return []
 
     xmin, xmax = xlim
     if not (xmax > xmin):
         return []
 
-    filtered: list[float] = []
-    for value in times:
-        if value is None:
-            continue
-        try:
-            t = float(value)
-        except Exception:
-            continue
-        if not math.isfinite(t):
-            continue
-        if xmin <= t <= xmax:
-            filtered.append(t)
-
-    if not filtered:
+    sorted_times = _finite_sorted(times)
+    lo = np.searchsorted(sorted_times, xmin, side="left")
+    hi = np.searchsorted(sorted_times, xmax, side="right")
+    visible = sorted_times[lo:hi]
+    if not visible.size:
         return []
 
-    times = filtered
-    span = xmax - xmin
-    scale = float(ax_width_px) / span
-
-    xs = [(t - xmin) * scale for t in times]
-    order = sorted(range(len(times)), key=lambda i: xs[i])
-
-    min_gap_px = max(int(min_gap_px), 1)
-
-    groups: list[list[int]] = []
-    current: list[int] = []
-    for idx in order:
-        if current and xs[idx] - xs[current[-1]] > min_gap_px:
-            groups.append(current)
-            current = [idx]
-        else:
-            current.append(idx)
-    if current:
-        groups.append(current)
-
-    clusters: list[Cluster] = []
-    for group in groups:
-        visible_idx = group[:max_visible_per_cluster]
-        hidden = max(0, len(group) - len(visible_idx))
-        xmid = 0.5 * (xs[group[0]] + xs[group[-1]])
-        clusters.append(
-            Cluster(
-                x_px=xmid,
-                times=tuple(times[i] for i in visible_idx),
-                hidden=hidden,
-            )
-        )
-    return clusters
+    scale = float(ax_width_px) / (xmax - xmin)
+    xs = (visible - xmin) * scale
+    breaks = cluster_breaks(np.diff(xs), max(int(min_gap_px), 1))
+    starts = np.concatenate(([0], breaks))
+    stops = np.concatenate((breaks, [visible.size]))
+    return _build_clusters(visible, xs, starts, stops, max(int(max_visible_per_cluster), 0))
+
+
+class EventClusterIndex:
+    """Sorted event times with cluster boundaries cached per zoom level.
+
+    Whether two neighbouring events merge depends only on their time gap and
+    the current scale, not on where the view starts.  The index therefore
+    computes the cluster boundaries of the whole timeline once per scale
+    bucket (``1 / bucket_steps`` of an octave wide) and answers a view by
+    slicing them with two ``searchsorted`` calls, so pans never re-cluster.
+    Within a bucket the gap threshold is snapped to the bucket's scale, which
+    moves it by at most ``2 ** (0.5 / bucket_steps)`` (0.14 % by default).
+    """
+
+    def __init__(
+        self,
+        times: Sequence[float],
+        *,
+        bucket_steps: int = 256,
+        max_cached_scales: int = 16,
+    ) -> None:
+        self._times = _finite_sorted(times)
+        self._gaps = np.diff(self._times)
+        self._bucket_steps = max(int(bucket_steps), 1)
+        self._max_cached = max(int(max_cached_scales), 1)
+        self._breaks: dict[tuple[int, int], np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return int(self._times.size)
+
+    @property
+    def times(self) -> np.ndarray:
+        return self._times
+
+    def _breaks_for(self, scale: float, min_gap_px: int) -> np.ndarray:
+        bucket = round(math.log2(scale) * self._bucket_steps)
+        key = (bucket, min_gap_px)
+        breaks = self._breaks.get(key)
+        if breaks is None:
+            if len(self._breaks) >= self._max_cached:
+                self._breaks.clear()
+            bucket_scale = 2.0 ** (bucket / self._bucket_steps)
+            breaks = cluster_breaks(self._gaps, min_gap_px / bucket_scale)
+            self._breaks[key] = breaks
+        return breaks
+
+    def clusters(
+        self,
+        xlim: tuple[float, float],
+        ax_width_px: int,
+        *,
+        min_gap_px: int = 12,
+        max_visible_per_cluster: int = 3,
+    ) -> list[Cluster]:
+        """Return the clusters visible in ``xlim``; see :func:`cluster_events`."""
+
+        xmin, xmax = xlim
+        if not self._times.size or ax_width_px <= 1 or not (xmax > xmin):
+            return []
+
+        times = self._times
+        lo = int(np.searchsorted(times, xmin, side="left"))
+        hi = int(np.searchsorted(times, xmax, side="right"))
+        if hi <= lo:
+            return []
+
+        scale = float(ax_width_px) / (xmax - xmin)
+        breaks = self._breaks_for(scale, max(int(min_gap_px), 1))
+        first = np.searchsorted(breaks, lo, side="right")
+        last = np.searchsorted(breaks, hi, side="left")
+        inner = breaks[first:last]
+        starts = np.concatenate(([lo], inner)) - lo
+        stops = np.concatenate((inner, [hi])) - lo
+
+        visible = times[lo:hi]
+        xs = (visible - xmin) * scale
+        return _build_clusters(visible, xs, starts, stops, max(int(max_visible_per_cluster), 0))
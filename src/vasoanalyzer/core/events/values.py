@@ -0,0 +1,278 @@
+"""Vectorized sampling of trace columns at event times.
+
+The event table shows, for every event, the inner/outer diameter and the
+pressures read from the trace.  :class:`EventValueEngine` computes those
+columns for the whole event vector in one pass (sorted-time lookups instead
+of an ``argmin`` scan per event) and, when used statefully through
+:meth:`EventValueEngine.update`, re-evaluates only the rows whose sample
+time moved.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    "SAMPLING_MODES",
+    "EventValueEngine",
+    "NearestSampleIndex",
+    "SamplingRule",
+]
+
+SAMPLING_MODES = ("nearest", "window_mean", "steady_state")
+
+
+def _as_float_array(values: object) -> np.ndarray:
+    try:
+        return np.asarray(values, dtype=float).ravel()
+    except (TypeError, ValueError):
+        return pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(dtype=float)
+
+
+class NearestSampleIndex:
+    """Finite trace times sorted once for batched nearest-sample lookups."""
+
+    def __init__(self, trace_time: np.ndarray) -> None:
+        trace_time = _as_float_array(trace_time)
+        finite = np.flatnonzero(np.isfinite(trace_time))
+        order = np.argsort(trace_time[finite], kind="stable")
+        self._rows = finite[order]
+        self._times = trace_time[self._rows]
+
+    def __len__(self) -> int:
+        return int(self._rows.size)
+
+    @property
+    def rows(self) -> np.ndarray:
+        """Trace rows of the finite samples, in time order."""
+        return self._rows
+
+    @property
+    def times(self) -> np.ndarray:
+        """Finite trace times, sorted."""
+        return self._times
+
+    def nearest(self, targets: np.ndarray) -> np.ndarray:
+        """Return the trace row closest in time to each target.
+
+        Matches ``argmin(|t - target|)`` over the finite samples: ties resolve to
+        the lowest row, and NaN targets map to the first finite row.
+        """
+
+        targets = np.asarray(targets, dtype=float)
+        if self._rows.size == 0:
+            return np.zeros(targets.shape, dtype=np.int64)
+
+        times = self._times
+        last = times.size - 1
+        right = np.minimum(np.searchsorted(times, targets, side="left"), last)
+        # First sample of the run of equal times just below the target.
+        left = np.maximum(right - 1, 0)
+        left = np.searchsorted(times, times[left], side="left")
+
+        d_left = np.abs(times[left] - targets)
+        d_right = np.abs(times[right] - targets)
+        rows_left = self._rows[left]
+        rows_right = self._rows[right]
+        take_left = (d_left < d_right) | ((d_left == d_right) & (rows_left < rows_right))
+        nearest = np.where(take_left, rows_left, rows_right)
+        return np.where(np.isnan(targets), self._rows.min(), nearest)
+
+
+@dataclass(frozen=True)
+class SamplingRule:
+    """Where in the trace an event's values are read.
+
+    ``nearest``
+        The sample closest to the event time.
+    ``window_mean``
+        The mean of the finite samples in ``[t - window_s, t]``, falling back
+        to the nearest sample when the window holds none.
+    ``steady_state``
+        The sample shortly before the *next* event (the value the vessel
+        settled at after this event), at most ``max_lookback_s`` before it;
+        the last event uses ``settle_offset_s`` before the end of the trace.
+    """
+
+    mode: str = "nearest"
+    window_s: float = 2.0
+    settle_offset_s: float = 2.0
+    max_lookback_s: float = 5.0
+
+    def __post_init__(self) -> None:
+        if self.mode not in SAMPLING_MODES:
+            raise ValueError(
+                f"Unknown sampling mode {self.mode!r}; expected one of {SAMPLING_MODES}"
+            )
+        if not self.window_s >= 0:
+            raise ValueError("window_s must be non-negative")
+
+    def sample_times(
+        self, event_times: np.ndarray, trace_start: float, trace_end: float
+    ) -> np.ndarray:
+        """Return the trace time at which each event is sampled."""
+
+        times = _as_float_array(event_times)
+        if self.mode != "steady_state" or times.size == 0:
+            return times
+
+        after = np.empty_like(times)
+        gap = np.fmax(0.0, times[1:] - times[:-1])
+        lookback = np.minimum(
+            self.max_lookback_s, np.maximum(np.maximum(1.0, gap / 2.0), self.settle_offset_s)
+        )
+        lookback = np.where(gap > 0.05, np.minimum(lookback, gap - 0.05), gap * 0.5)
+        after[:-1] = np.where(
+            gap <= 0.5,
+            times[:-1] + gap * 0.5,
+            np.where(gap <= 1.0, times[:-1] + gap * 0.6, times[1:] - lookback),
+        )
+        after[-1] = trace_end - self.settle_offset_s
+        # Clamp into the trace as ``max(start, min(t, end))`` would, NaN included.
+        after = np.where(trace_end < after, trace_end, after)
+        return np.where(after > trace_start, after, trace_start)
+
+
+class EventValueEngine:
+    """Sample trace columns at event times, one vectorized pass per update.
+
+    ``columns`` maps column names (e.g. ``"Inner Diameter"``) to arrays
+    aligned with ``trace_time``; ``None`` entries are skipped.  Values are
+    float arrays with NaN where the trace has no finite value.
+
+    :meth:`evaluate` is stateless.  :meth:`update` keeps the last event
+    vector and recomputes only rows whose sample time can have changed, so
+    editing one event touches one or two rows; :meth:`shift` moves every
+    event at once.
+    """
+
+    def __init__(
+        self,
+        trace_time: Sequence[float] | np.ndarray,
+        columns: Mapping[str, Sequence[float] | np.ndarray | None],
+        *,
+        rule: SamplingRule | None = None,
+    ) -> None:
+        self._trace_time = _as_float_array(trace_time)
+        self._index = NearestSampleIndex(self._trace_time)
+        self._columns = {
+            str(name): _as_float_array(values)
+            for name, values in columns.items()
+            if values is not None
+        }
+        self._rule = rule or SamplingRule()
+        self._prefix: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self._event_times = np.empty(0, dtype=float)
+        self._values = {name: np.empty(0, dtype=float) for name in self._columns}
+
+    @property
+    def rule(self) -> SamplingRule:
+        return self._rule
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return tuple(self._columns)
+
+    @property
+    def event_times(self) -> np.ndarray:
+        """Event times of the last :meth:`update`."""
+        return self._event_times
+
+    @property
+    def values(self) -> dict[str, np.ndarray]:
+        """Column values of the last :meth:`update`, aligned with :attr:`event_times`."""
+        return self._values
+
+    def set_rule(self, rule: SamplingRule) -> None:
+        """Switch sampling rule and recompute the current rows under it."""
+
+        if rule != self._rule:
+            self._rule = rule
+            self._values = self.evaluate(self._event_times)
+
+    def _trace_bounds(self) -> tuple[float, float]:
+        if self._trace_time.size == 0:
+            return float("nan"), float("nan")
+        return float(self._trace_time[0]), float(self._trace_time[-1])
+
+    def nearest_rows(self, times: Sequence[float] | np.ndarray) -> np.ndarray:
+        """Return the trace row nearest to each time (``argmin(|t - time|)``)."""
+
+        return self._index.nearest(_as_float_array(times))
+
+    def sample_rows(
+        self, event_times: Sequence[float] | np.ndarray, *, rule: SamplingRule | None = None
+    ) -> np.ndarray:
+        """Return the trace row each event is sampled at (current rule unless given)."""
+
+        rule = rule or self._rule
+        start, end = self._trace_bounds()
+        return self.nearest_rows(rule.sample_times(event_times, start, end))
+
+    def _window_means(self, name: str, targets: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        prefix = self._prefix.get(name)
+        if prefix is None:
+            ordered = self._columns[name][self._index.rows]
+            finite = np.isfinite(ordered)
+            sums = np.concatenate(([0.0], np.cumsum(np.where(finite, ordered, 0.0))))
+            counts = np.concatenate(([0], np.cumsum(finite)))
+            prefix = self._prefix[name] = (sums, counts)
+        sums, counts = prefix
+        sorted_times = self._index.times
+        lo = np.searchsorted(sorted_times, targets - self._rule.window_s, side="left")
+        hi = np.searchsorted(sorted_times, targets, side="right")
+        n = counts[hi] - counts[lo]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = (sums[hi] - sums[lo]) / n
+        return np.where(n > 0, means, self._columns[name][rows])
+
+    def evaluate(self, event_times: Sequence[float] | np.ndarray) -> dict[str, np.ndarray]:
+        """Return every column sampled at ``event_times`` without touching state."""
+
+        times = _as_float_array(event_times)
+        if not self._index or times.size == 0:
+            return {name: np.full(times.shape, np.nan) for name in self._columns}
+        start, end = self._trace_bounds()
+        targets = self._rule.sample_times(times, start, end)
+        rows = self._index.nearest(targets)
+        if self._rule.mode == "window_mean":
+            return {name: self._window_means(name, targets, rows) for name in self._columns}
+        return {name: column[rows] for name, column in self._columns.items()}
+
+    def update(self, event_times: Sequence[float] | np.ndarray) -> np.ndarray:
+        """Adopt ``event_times`` and return the positions of rows whose values were recomputed."""
+
+        times = _as_float_array(event_times).copy()
+        previous = self._event_times
+        if previous.size != times.size or times.size == 0:
+            dirty = np.arange(times.size)
+            self._values = self.evaluate(times)
+        else:
+            moved = ~((times == previous) | (np.isnan(times) & np.isnan(previous)))
+            if self._rule.mode == "steady_state":
+                # Each row is sampled relative to the next event.
+                moved[:-1] |= moved[1:]
+            dirty = np.flatnonzero(moved)
+            if dirty.size:
+                if self._rule.mode == "steady_state":
+                    # Include each dirty row's successor so sample times see it.
+                    window = np.union1d(dirty, np.minimum(dirty + 1, times.size - 1))
+                    fresh = self.evaluate(times[window])
+                    keep = np.isin(window, dirty)
+                    for name, column in self._values.items():
+                        column[dirty] = fresh[name][keep]
+                else:
+                    fresh = self.evaluate(times[dirty])
+                    for name, column in self._values.items():
+                        column[dirty] = fresh[name]
+        self._event_times = times
+        return dirty
+
+    def shift(self, offset_s: float) -> np.ndarray:
+        """Move every event by ``offset_s`` seconds and recompute all rows."""
+
+        return self.update(self._event_times + float(offset_s))
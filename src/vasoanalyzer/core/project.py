@@ -3026,6 +3026,50 @@ def get_file_size_mb(file_path: str) -> float:
         return 0.0
 
 
+def _tiff_stack_npz_bytes(tiff_path: Path) -> bytes | None:
+    """Encode the TIFF at ``tiff_path`` as a snapshot ``npz`` one page at a time.
+
+    The ``stack`` member is written page by page, so only the compressed
+    output and one decoded page are held in memory.  Returns ``None`` for an
+    empty stack or pages whose shape/dtype differ.
+    """
+
+    from vasoanalyzer.io.tiffs import TiffPageSource
+
+    with TiffPageSource(tiff_path, cache_bytes=0, prefetch_ahead=0, prefetch_behind=0) as source:
+        count = len(source)
+        if not count:
+            return None
+        first = np.ascontiguousarray(source[0])
+        header = {
+            "descr": np.lib.format.dtype_to_descr(first.dtype),
+            "fortran_order": False,
+            "shape": (count, *first.shape),
+        }
+        buffer = io.BytesIO()
+        with (
+            zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive,
+            archive.open("stack.npy", "w", force_zip64=True) as member,
+        ):
+            np.lib.format.write_array_header_2_0(member, header)
+            member.write(first.tobytes())
+            for page_index in range(1, count):
+                frame = np.ascontiguousarray(source[page_index])
+                if frame.shape != first.shape or frame.dtype != first.dtype:
+                    log.warning(
+                        "Not embedding %s: page %d is %s %s, expected %s %s",
+                        tiff_path,
+                        page_index,
+                        frame.shape,
+                        frame.dtype,
+                        first.shape,
+                        first.dtype,
+                    )
+                    return None
+                member.write(frame.tobytes())
+    return buffer.getvalue()
+
+
 def _persist_sample_snapshots(
     repo: ProjectRepository,
     dataset_id: int,
@@ -3077,6 +3121,22 @@ def _persist_sample_snapshots(
                             if snapshot_format in {"npz", "npy"}
                             else "application/octet-stream"
                         )
+        if snapshot_bytes is None and sample.snapshots is None and sample.snapshot_path:
+            # Lazily viewed stacks keep no array in memory; embed from the TIFF itself.
+            tiff_path = _absolute_path(sample.snapshot_path, base_dir)
+            if (
+                tiff_path is not None
+                and tiff_path.suffix.lower() in {".tif", ".tiff"}
+                and tiff_path.exists()
+            ):
+                try:
+                    snapshot_bytes = _tiff_stack_npz_bytes(tiff_path)
+                except Exception:
+                    log.warning("Failed to embed snapshot stack from %s", tiff_path, exc_info=True)
+                    snapshot_bytes = None
+                if snapshot_bytes is not None:
+                    snapshot_format = "npz"
+                    snapshot_mime = "application/x-npz"
 
     if snapshot_bytes is not None:
         repo.add_or_update_asset(
@@ -34,14 +34,43 @@ class SweepResult:
 
     @property
     def count(self) -> int:
-        return int(self.inner_sweeps.shape[0])
+        return int(self.triggers.shape[0])
 
     def has_outer(self) -> bool:
-        return self.outer_sweeps is not None and self.outer_sweeps.size > 0
+        return self.average_outer is not None
 
 
-def compute_sweeps(model: TraceModel, config: TriggerConfig) -> SweepResult:
-    """Capture triggered sweeps from ``model`` according to ``config``."""
+# Upper bound on interpolated samples held at once when streaming sweeps.
+_CHUNK_SAMPLES = 1 << 20
+
+
+class _StreamingMean:
+    """Column-wise running mean over accepted sweep rows."""
+
+    def __init__(self, samples: int) -> None:
+        self.total = np.zeros(samples, dtype=float)
+        self.count = 0
+
+    def add(self, rows: np.ndarray) -> None:
+        if rows.shape[0]:
+            self.total += rows.sum(axis=0)
+            self.count += rows.shape[0]
+
+    def result(self) -> np.ndarray | None:
+        return self.total / self.count if self.count else None
+
+
+def compute_sweeps(
+    model: TraceModel, config: TriggerConfig, *, keep_sweeps: bool = True
+) -> SweepResult:
+    """Capture triggered sweeps from ``model`` according to ``config``.
+
+    All sweeps are interpolated in one pass over a (trigger x offset) time
+    matrix, processed in chunks so memory stays bounded for thousands of
+    triggers.  Sweeps touching NaN or the trace edges are rejected per row.
+    With ``keep_sweeps=False`` only the averages are accumulated and the sweep
+    matrices come back empty.
+    """
 
     if config.pre_window < 0 or config.post_window < 0:
         raise ValueError("pre_window and post_window must be non-negative")
@@ -61,13 +90,9 @@ def compute_sweeps(model: TraceModel, config: TriggerConfig) -> SweepResult:
     else:
         signal = model.inner_full
 
-    signal = np.asarray(signal, dtype=float)
-    mask_valid = np.isfinite(signal)
-    if not mask_valid.all():
-        signal = signal.copy()
-        signal[~mask_valid] = np.nan
-
-    triggers = _detect_triggers(time, signal, config.threshold, config.direction)
+    triggers = _detect_triggers(
+        time, np.asarray(signal, dtype=float), config.threshold, config.direction
+    )
     if config.min_interval > 0:
         triggers = _enforce_min_interval(triggers, config.min_interval)
 
@@ -76,54 +101,55 @@ def compute_sweeps(model: TraceModel, config: TriggerConfig) -> SweepResult:
     samples = 1 if total_window <= 0 else int(max(round(total_window / dt), 1)) + 1
     relative = np.linspace(-config.pre_window, config.post_window, samples)
 
-    kept_triggers = []
-    inner_sweeps = []
-    outer_sweeps = []
     inner_full = model.inner_full.astype(float, copy=False)
     outer_full = None if model.outer_full is None else model.outer_full.astype(float, copy=False)
 
-    for center in triggers:
-        target_times = center + relative
-        inner_vals = np.interp(target_times, time, inner_full, left=np.nan, right=np.nan)
-        if np.isnan(inner_vals).any():
+    kept: list[np.ndarray] = []
+    inner_rows: list[np.ndarray] = []
+    outer_rows: list[np.ndarray] = []
+    inner_mean = _StreamingMean(samples)
+    outer_mean = _StreamingMean(samples)
+    chunk = max(_CHUNK_SAMPLES // samples, 1)
+
+    for start in range(0, triggers.size, chunk):
+        centers = triggers[start : start + chunk]
+        targets = (centers[:, None] + relative[None, :]).ravel()
+        inner_vals = np.interp(targets, time, inner_full, left=np.nan, right=np.nan)
+        inner_vals = inner_vals.reshape(centers.size, samples)
+        accept = ~np.isnan(inner_vals).any(axis=1)
+        if not accept.any():
             continue
-        outer_vals = None
+        inner_vals = inner_vals[accept]
+        kept.append(centers[accept])
+        inner_mean.add(inner_vals)
+        if keep_sweeps:
+            inner_rows.append(inner_vals)
         if outer_full is not None:
-            outer_vals = np.interp(target_times, time, outer_full, left=np.nan, right=np.nan)
-            if np.isnan(outer_vals).any():
-                outer_vals = None
-        inner_sweeps.append(inner_vals)
-        if outer_vals is not None:
-            outer_sweeps.append(outer_vals)
-        kept_triggers.append(center)
-
-    if not inner_sweeps:
-        inner_array = np.empty((0, samples))
+            outer_targets = targets.reshape(centers.size, samples)[accept].ravel()
+            outer_vals = np.interp(outer_targets, time, outer_full, left=np.nan, right=np.nan)
+            outer_vals = outer_vals.reshape(-1, samples)
+            outer_vals = outer_vals[~np.isnan(outer_vals).any(axis=1)]
+            outer_mean.add(outer_vals)
+            if keep_sweeps:
+                outer_rows.append(outer_vals)
+
+    triggers_arr = np.concatenate(kept) if kept else np.empty((0,), dtype=float)
+    inner_array = np.concatenate(inner_rows) if inner_rows else np.empty((0, samples))
+    if outer_full is None:
         outer_array = None
-        avg_inner = None
-        avg_outer = None
-        triggers_arr = np.empty((0,), dtype=float)
     else:
-        inner_array = np.vstack(inner_sweeps)
-        triggers_arr = np.asarray(kept_triggers, dtype=float)
-        avg_inner = np.mean(inner_array, axis=0)
-        if outer_sweeps:
-            outer_array = np.vstack(outer_sweeps)
-            avg_outer = np.mean(outer_array, axis=0)
-        elif outer_full is not None:
-            outer_array = np.empty((0, samples))
-            avg_outer = None
-        else:
+        outer_array = np.concatenate(outer_rows) if outer_rows else np.empty((0, samples))
+        if triggers_arr.size == 0:
+            # Nothing captured: match the historical "no outer channel" shape.
             outer_array = None
-            avg_outer = None
 
     return SweepResult(
         relative_time=relative,
         triggers=triggers_arr,
         inner_sweeps=inner_array,
         outer_sweeps=outer_array,
-        average_inner=avg_inner,
-        average_outer=avg_outer,
+        average_inner=inner_mean.result(),
+        average_outer=outer_mean.result(),
     )
 
 
@@ -134,48 +160,51 @@ def _detect_triggers(
         raise ValueError("signal and time arrays must be the same length")
 
     direction = direction.lower()
-    valid = np.isfinite(signal)
-    sig = signal.astype(float, copy=False)
-    sig[~valid] = np.nan
-
-    lead = sig[:-1]
-    trail = sig[1:]
-    t0 = time[:-1]
-    t1 = time[1:]
-
-    if direction == "rising":
-        crossings = (lead < threshold) & (trail >= threshold)
-    elif direction == "falling":
-        crossings = (lead > threshold) & (trail <= threshold)
-    else:
-        raise ValueError("direction must be 'rising' or 'falling'")
+    lead = signal[:-1]
+    trail = signal[1:]
+
+    with np.errstate(invalid="ignore"):
+        if direction == "rising":
+            crossings = (lead < threshold) & (trail >= threshold)
+        elif direction == "falling":
+            crossings = (lead > threshold) & (trail <= threshold)
+        else:
+            raise ValueError("direction must be 'rising' or 'falling'")
 
-    indices = np.nonzero(crossings & np.isfinite(lead) & np.isfinite(trail))[0]
+    # Both neighbours must be finite: +/-inf would otherwise count as a crossing.
+    crossings &= np.isfinite(lead) & np.isfinite(trail)
+    indices = np.flatnonzero(crossings)
     if indices.size == 0:
         return np.empty((0,), dtype=float)
 
-    trigger_times = []
-    for idx in indices:
-        y0 = lead[idx]
-        y1 = trail[idx]
-        x0 = t0[idx]
-        x1 = t1[idx]
-        if y1 == y0:
-            trigger_times.append(x1)
-        else:
-            frac = (threshold - y0) / (y1 - y0)
-            frac = np.clip(frac, 0.0, 1.0)
-            trigger_times.append(x0 + frac * (x1 - x0))
-    return np.asarray(trigger_times, dtype=float)
+    y0 = lead[indices]
+    y1 = trail[indices]
+    x0 = time[:-1][indices]
+    x1 = time[1:][indices]
+    flat = y1 == y0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        frac = np.clip((threshold - y0) / np.where(flat, 1.0, y1 - y0), 0.0, 1.0)
+    return np.where(flat, x1, x0 + frac * (x1 - x0)).astype(float, copy=False)
 
 
 def _enforce_min_interval(triggers: np.ndarray, min_interval: float) -> np.ndarray:
     if triggers.size == 0 or min_interval <= 0:
         return triggers
-    accepted = [triggers[0]]
-    last = triggers[0]
-    for time in triggers[1:]:
-        if time - last >= min_interval:
-            accepted.append(time)
-            last = time
-    return np.asarray(accepted, dtype=float)
+    if np.all(np.diff(triggers) >= min_interval):
+        return triggers
+    # Greedy acceptance is inherently sequential, but each step jumps straight
+    # to the next eligible trigger, so the loop runs once per accepted trigger.
+    accepted = [0]
+    n = triggers.size
+    while True:
+        last = triggers[accepted[-1]]
+        idx = int(np.searchsorted(triggers, last + min_interval, side="left"))
+        # Re-check against the exact comparison to absorb rounding at the boundary.
+        while idx > accepted[-1] + 1 and triggers[idx - 1] - last >= min_interval:
+            idx -= 1
+        while idx < n and triggers[idx] - last < min_interval:
+            idx += 1
+        if idx >= n:
+            break
+        accepted.append(idx)
+    return triggers[np.asarray(accepted)]
@@ -868,38 +868,7 @@ def derive_tiff_page_times(
     )
 
 
-def page_for_time(
-    t: float,
-    tiff_page_times: Sequence[float],
-    *,
-    mode: str = "nearest",
-) -> int | None:
-    """Return the deterministic page index for a time value."""
-
-    try:
-        if len(tiff_page_times) == 0:
-            return None
-    except Exception:
-        return None
-    try:
-        t_val = float(t)
-    except (TypeError, ValueError):
-        return None
-    if not math.isfinite(t_val):
-        return None
-
-    times = [float(v) for v in tiff_page_times]
-    finite_indices = [i for i, v in enumerate(times) if math.isfinite(v)]
-    if not finite_indices:
-        return None
-
-    if len(finite_indices) != len(times):
-        return min(finite_indices, key=lambda i: abs(times[i] - t_val))
-
-    for idx in range(1, len(times)):
-        if times[idx] < times[idx - 1] - TIME_EPS_S:
-            return min(range(len(times)), key=lambda i: abs(times[i] - t_val))
-
+def _bisect_page(times: list[float], t_val: float, mode: str) -> int:
     if mode == "floor":
         pos = bisect.bisect_right(times, t_val) - 1
         return max(0, min(int(pos), len(times) - 1))
@@ -916,6 +885,140 @@ def page_for_time(
     return int(prev_idx)
 
 
+class PageTimeIndex:
+    """Immutable page/time lookup built once per TIFF stack.
+
+    The page times are validated a single time (finite entries, monotonic
+    within :data:`TIME_EPS_S`) so lookups are binary searches instead of
+    rescans.  Results match :func:`page_for_time`: monotonic stacks honour
+    ``mode``, anything else falls back to the nearest finite page, lowest
+    page first on ties.
+    """
+
+    __slots__ = ("_times", "_list", "_sorted", "_sorted_times", "_sorted_pages", "_run_start")
+
+    def __init__(self, tiff_page_times: Sequence[float] | np.ndarray) -> None:
+        times = np.array(tiff_page_times, dtype=float).ravel()
+        times.setflags(write=False)
+        self._times = times
+        finite = np.isfinite(times)
+        monotonic = bool(
+            times.size and finite.all() and not np.any(times[1:] < times[:-1] - TIME_EPS_S)
+        )
+        # Scalar lookups on monotonic stacks bisect a plain list, which is
+        # cheaper than a NumPy call and also exact for the small backwards
+        # steps that the TIME_EPS_S tolerance lets through.
+        self._list: list[float] | None = times.tolist() if monotonic else None
+        self._sorted = monotonic and not np.any(times[1:] < times[:-1])
+
+        pages = np.flatnonzero(finite)
+        order = np.argsort(times[pages], kind="stable")
+        self._sorted_times = times[pages][order]
+        self._sorted_pages = pages[order]
+        self._run_start = np.searchsorted(self._sorted_times, self._sorted_times, side="left")
+
+    def __len__(self) -> int:
+        return int(self._times.size)
+
+    @property
+    def times(self) -> np.ndarray:
+        """Read-only page times, indexed by page."""
+
+        return self._times
+
+    @property
+    def monotonic(self) -> bool:
+        return self._list is not None
+
+    def page_for_time(self, t: float, *, mode: str = "nearest") -> int | None:
+        """Return the page for ``t`` or ``None`` if it cannot be mapped."""
+
+        try:
+            t_val = float(t)
+        except (TypeError, ValueError):
+            return None
+        if not math.isfinite(t_val) or not self._sorted_pages.size:
+            return None
+        if self._list is not None:
+            return _bisect_page(self._list, t_val, mode)
+        page = int(self.pages_for_times(np.array([t_val]), mode=mode)[0])
+        return None if page < 0 else page
+
+    def pages_for_times(
+        self, times: Sequence[float] | np.ndarray, *, mode: str = "nearest"
+    ) -> np.ndarray:
+        """Vectorised :meth:`page_for_time`; unmappable times give ``-1``."""
+
+        query = np.asarray(times, dtype=float)
+        out = np.full(query.shape, -1, dtype=np.int64)
+        ok = np.isfinite(query)
+        if not self._sorted_pages.size or not ok.any():
+            return out
+        q = query[ok]
+
+        if self._sorted:
+            out[ok] = self._monotonic_pages(q, mode)
+        elif self._list is not None:
+            out[ok] = [_bisect_page(self._list, t_val, mode) for t_val in q.tolist()]
+        else:
+            out[ok] = self._nearest_pages(q)
+        return out
+
+    def _monotonic_pages(self, q: np.ndarray, mode: str) -> np.ndarray:
+        times = self._times
+        last = times.size - 1
+        if mode == "floor":
+            return np.clip(np.searchsorted(times, q, side="right") - 1, 0, last)
+        pos = np.searchsorted(times, q, side="left")
+        prev_idx = np.clip(pos - 1, 0, last)
+        next_idx = np.clip(pos, 0, last)
+        take_next = np.abs(times[next_idx] - q) < np.abs(q - times[prev_idx])
+        pages = np.where(take_next, next_idx, prev_idx)
+        pages[pos <= 0] = 0
+        pages[pos > last] = last
+        return pages
+
+    def _nearest_pages(self, q: np.ndarray) -> np.ndarray:
+        values = self._sorted_times
+        pages = self._sorted_pages
+        last = values.size - 1
+        pos = np.searchsorted(values, q, side="left")
+        next_rank = np.clip(pos, 0, last)
+        prev_rank = self._run_start[np.clip(pos - 1, 0, last)]
+        next_dist = np.abs(values[next_rank] - q)
+        prev_dist = np.abs(values[prev_rank] - q)
+        next_page = pages[next_rank]
+        prev_page = pages[prev_rank]
+        take_next = (pos <= last) & (
+            (pos == 0)
+            | (next_dist < prev_dist)
+            | ((next_dist == prev_dist) & (next_page < prev_page))
+        )
+        return np.where(take_next, next_page, prev_page)
+
+
+def page_for_time(
+    t: float,
+    tiff_page_times: Sequence[float] | PageTimeIndex,
+    *,
+    mode: str = "nearest",
+) -> int | None:
+    """Return the deterministic page index for a time value.
+
+    Callers that look up many times against the same stack should build a
+    :class:`PageTimeIndex` once and pass it instead of the raw sequence.
+    """
+
+    if isinstance(tiff_page_times, PageTimeIndex):
+        return tiff_page_times.page_for_time(t, mode=mode)
+    try:
+        if len(tiff_page_times) == 0:
+            return None
+    except Exception:
+        return None
+    return PageTimeIndex(tiff_page_times).page_for_time(t, mode=mode)
+
+
 __all__ = [
     "TIME_EPS_S",
     "RANGE_TOL_S",
@@ -925,6 +1028,7 @@ __all__ = [
     "EventTimeReport",
     "FrameTimeResult",
     "TiffPageTimeResult",
+    "PageTimeIndex",
     "resolve_trace_timebase",
     "validate_and_normalize_events",
     "resolve_tiff_frame_times",
@@ -11,6 +11,7 @@ import numpy as np
 from .audit import EditAction, deserialize_edit_log
 from .traces.actions import bridge_segment, find_neighbor
 from .traces.lod import LODLevel
+from .traces.stats import WindowStatsIndex
 from .traces.window import TraceWindow, ensure_float_array
 
 
@@ -88,6 +89,7 @@ class TraceModel:
         self._base_factor = max(int(base_factor), 2)
         self._max_points_per_level = max(int(max_points_per_level), 64)
         self._window_cache: dict[tuple[int, float, float], TraceWindow] = {}
+        self._stats_cache: dict[str, WindowStatsIndex] = {}
         self._levels: tuple[LODLevel, ...] = ()
         self._edit_log: list[EditAction] = []
 
@@ -151,6 +153,7 @@ class TraceModel:
 
     def clear_cache(self) -> None:
         self._window_cache.clear()
+        self._stats_cache.clear()
 
     def _build_levels(self) -> tuple[LODLevel, ...]:
         levels: list[LODLevel] = []
@@ -296,6 +299,31 @@ class TraceModel:
                 self._window_cache.pop(oldest, None)
         return window
 
+    # ------------------------------------------------------------------ window statistics
+    def window_stats(self, channel: str = "inner") -> WindowStatsIndex:
+        """Return the statistics index for ``channel`` over the cleaned trace.
+
+        ``channel`` is one of ``"inner"``, ``"outer"``, ``"avg_pressure"`` or
+        ``"set_pressure"``.  The index is built on first use and dropped
+        whenever edits change the trace.
+        """
+
+        key = channel.strip().lower()
+        cached = self._stats_cache.get(key)
+        if cached is not None:
+            return cached
+        series = {
+            "inner": self._inner_clean,
+            "outer": self._outer_clean,
+            "avg_pressure": self._avg_pressure,
+            "set_pressure": self._set_pressure,
+        }.get(key)
+        if series is None:
+            raise ValueError(f"Trace does not include a {channel!r} channel")
+        index = WindowStatsIndex(self._time_full, series)
+        self._stats_cache[key] = index
+        return index
+
     # ------------------------------------------------------------------ editing
     def apply_actions(self, actions: Sequence[EditAction], *, rebuild: bool = True) -> None:
         if not actions:
@@ -637,6 +665,7 @@ def load_lod(
 __all__ = [
     "TraceModel",
     "TraceWindow",
+    "WindowStatsIndex",
     "EditAction",
     "bridge_segment",
     "find_neighbor",
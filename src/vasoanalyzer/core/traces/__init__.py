@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from .actions import bridge_segment, find_neighbor
 from .lod import LODLevel
+from .stats import WindowStats, WindowStatsIndex
 from .window import TraceWindow, ensure_float_array
 
 __all__ = [
@@ -10,4 +11,6 @@ __all__ = [
     "LODLevel",
     "find_neighbor",
     "bridge_segment",
+    "WindowStats",
+    "WindowStatsIndex",
 ]
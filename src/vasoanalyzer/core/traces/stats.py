@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .window import ensure_float_array
+
+__all__ = ["WindowStats", "WindowStatsIndex"]
+
+
+@dataclass(frozen=True)
+class WindowStats:
+    """Per-window statistics returned by :meth:`WindowStatsIndex.query`.
+
+    ``samples`` counts every sample in the window, ``count`` only the finite
+    ones; ``mean``/``min``/``max`` ignore NaNs and are NaN for windows without
+    finite samples.
+    """
+
+    samples: np.ndarray
+    count: np.ndarray
+    mean: np.ndarray
+    min: np.ndarray
+    max: np.ndarray
+
+
+class WindowStatsIndex:
+    """Prefix sums and a block sparse table over one trace channel.
+
+    Built once in O(n), the index answers count/mean for any time window in
+    O(log n) (two ``searchsorted`` calls and two prefix lookups) and min/max
+    in O(log n + block) using a sparse table over fixed-size blocks plus a
+    direct scan of the two partial blocks at the window edges.  Keeping the
+    table at block granularity bounds its memory at ``2 * n / block * log n``
+    floats instead of ``2 * n * log n``.
+
+    Windows are half-open ``[t0, t1)`` by default, matching
+    :func:`vasoanalyzer.analysis.metrics.slice_mask`; pass ``inclusive=True``
+    for ``[t0, t1]``.
+    """
+
+    def __init__(self, time: np.ndarray, values: np.ndarray, *, block: int = 64) -> None:
+        time = ensure_float_array(time)
+        values = ensure_float_array(values)
+        if time.shape != values.shape:
+            raise ValueError("time and values must have the same length")
+        if time.size > 1 and np.any(np.diff(time) < 0):
+            raise ValueError("time must be sorted ascending")
+
+        self._time = time
+        self._block = max(int(block), 1)
+        finite = np.isfinite(values)
+        n = values.size
+
+        self._csum = np.zeros(n + 1, dtype=np.float64)
+        np.cumsum(np.where(finite, values, 0.0), out=self._csum[1:])
+        self._ccount = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(finite, out=self._ccount[1:])
+
+        n_blocks = -(-n // self._block)
+        padded = n_blocks * self._block
+        self._lo_vals = np.full(padded, np.inf)
+        self._lo_vals[:n] = np.where(finite, values, np.inf)
+        self._hi_vals = np.full(padded, -np.inf)
+        self._hi_vals[:n] = np.where(finite, values, -np.inf)
+        self._min_table = self._sparse_table(
+            self._lo_vals.reshape(n_blocks, self._block).min(axis=1), np.minimum
+        )
+        self._max_table = self._sparse_table(
+            self._hi_vals.reshape(n_blocks, self._block).max(axis=1), np.maximum
+        )
+
+    @staticmethod
+    def _sparse_table(base: np.ndarray, op: np.ufunc) -> list[np.ndarray]:
+        table = [base]
+        span = 1
+        while 2 * span <= base.size:
+            prev = table[-1]
+            table.append(op(prev[:-span], prev[span:]))
+            span *= 2
+        return table
+
+    def __len__(self) -> int:
+        return int(self._time.size)
+
+    # ------------------------------------------------------------------ queries
+    def bounds(
+        self, t0: np.ndarray | float, t1: np.ndarray | float, *, inclusive: bool = False
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return sample index ranges ``[lo, hi)`` for the given time windows."""
+
+        lo = np.searchsorted(self._time, np.asarray(t0, dtype=np.float64), side="left")
+        hi = np.searchsorted(
+            self._time,
+            np.asarray(t1, dtype=np.float64),
+            side="right" if inclusive else "left",
+        )
+        return lo, np.maximum(hi, lo)
+
+    def _range_extreme(
+        self, lo: np.ndarray, hi: np.ndarray, vals: np.ndarray, table: list[np.ndarray], op
+    ) -> np.ndarray:
+        block = self._block
+        identity = np.inf if op is np.minimum else -np.inf
+        result = np.full(lo.shape, identity)
+
+        first_full = -(-lo // block)
+        end_full = hi // block
+        head_end = np.minimum(first_full * block, hi)
+        tail_start = np.maximum(end_full * block, head_end)
+
+        # Whole blocks: two overlapping lookups in the sparse table.
+        has_full = end_full > first_full
+        if np.any(has_full):
+            b0 = first_full[has_full]
+            b1 = end_full[has_full]
+            level = np.floor(np.log2(b1 - b0)).astype(np.int64)
+            full = np.empty(b0.shape)
+            for k in np.unique(level):
+                sel = level == k
+                row = table[int(k)]
+                full[sel] = op(row[b0[sel]], row[b1[sel] - (1 << int(k))])
+            result[has_full] = full
+
+        # Partial blocks at either edge: at most ``block`` samples each.
+        offsets = np.arange(block)
+        for start, stop in ((lo, head_end), (tail_start, hi)):
+            idx = start[..., None] + offsets
+            valid = idx < stop[..., None]
+            if not np.any(valid):
+                continue
+            picked = np.where(valid, vals[np.minimum(idx, vals.size - 1)], identity)
+            reduced = picked.min(axis=-1) if op is np.minimum else picked.max(axis=-1)
+            result = op(result, reduced)
+        return result
+
+    def query(
+        self, t0: np.ndarray | float, t1: np.ndarray | float, *, inclusive: bool = False
+    ) -> WindowStats:
+        """Return statistics for one window or a batch of windows.
+
+        ``t0`` and ``t1`` broadcast against each other; scalars yield 0-d arrays.
+        """
+
+        t0_arr, t1_arr = np.broadcast_arrays(
+            np.asarray(t0, dtype=np.float64), np.asarray(t1, dtype=np.float64)
+        )
+        lo, hi = self.bounds(t0_arr, t1_arr, inclusive=inclusive)
+        count = self._ccount[hi] - self._ccount[lo]
+        total = self._csum[hi] - self._csum[lo]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(count > 0, total / np.maximum(count, 1), np.nan)
+        if self._lo_vals.size:
+            lo_min = self._range_extreme(lo, hi, self._lo_vals, self._min_table, np.minimum)
+            hi_max = self._range_extreme(lo, hi, self._hi_vals, self._max_table, np.maximum)
+        else:
+            lo_min = np.full(lo.shape, np.inf)
+            hi_max = np.full(lo.shape, -np.inf)
+        empty = count == 0
+        return WindowStats(
+            samples=hi - lo,
+            count=count,
+            mean=mean,
+            min=np.where(empty, np.nan, lo_min),
+            max=np.where(empty, np.nan, hi_max),
+        )
+
+    def _moments(self, t0: float, t1: float, inclusive: bool) -> tuple[int, float]:
+        lo, hi = self.bounds(t0, t1, inclusive=inclusive)
+        count = int(self._ccount[hi] - self._ccount[lo])
+        return count, float(self._csum[hi] - self._csum[lo])
+
+    def mean(self, t0: float, t1: float, *, inclusive: bool = False) -> float:
+        count, total = self._moments(t0, t1, inclusive)
+        return total / count if count else float("nan")
+
+    def count(self, t0: float, t1: float, *, inclusive: bool = False) -> int:
+        return self._moments(t0, t1, inclusive)[0]
+
+    def min(self, t0: float, t1: float, *, inclusive: bool = False) -> float:
+        return float(self.query(t0, t1, inclusive=inclusive).min)
+
+    def max(self, t0: float, t1: float, *, inclusive: bool = False) -> float:
+        return float(self.query(t0, t1, inclusive=inclusive).max)
@@ -8,9 +8,10 @@
 from .flexible_writer import (
     FlexibleWritePlan,
     apply_flexible_write_plan,
+    apply_flexible_write_plans,
     build_flexible_write_plan,
 )
-from .label_matching import best_match, normalize_label
+from .label_matching import LabelIndex, best_match, normalize_label
 from .template_metadata import (
     DateColumnMetadata,
     EventRowMetadata,
@@ -28,6 +29,8 @@ __all__ = [
     "FlexibleWritePlan",
     "build_flexible_write_plan",
     "apply_flexible_write_plan",
+    "apply_flexible_write_plans",
     "normalize_label",
     "best_match",
+    "LabelIndex",
 ]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import shutil
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -98,28 +98,49 @@ def apply_flexible_write_plan(plan: FlexibleWritePlan) -> None:
         FileNotFoundError: If the template file does not exist.
         ValueError: If the plan has no writes.
     """
-    template = Path(plan.template_path)
-    if not template.exists():
-        raise FileNotFoundError(f"Template not found: {template}")
+    apply_flexible_write_plans([plan])
 
-    if not plan.writes:
-        raise ValueError("FlexibleWritePlan has no write operations.")
 
-    output = Path(plan.output_path)
-    output.parent.mkdir(parents=True, exist_ok=True)
+def apply_flexible_write_plans(plans: Sequence[FlexibleWritePlan]) -> None:
+    """Execute several plans against one template with a single load and save.
 
-    # Copy template → output (preserves formulas, styles, charts)
-    shutil.copy2(template, output)
+    Use this to fill many target columns (one per dataset or replicate) of the
+    same workbook; every plan must share ``template_path`` and ``output_path``.
 
-    wb = load_workbook(output, data_only=False)
-    if plan.sheet_name not in wb.sheetnames:
-        raise ValueError(
-            f"Sheet '{plan.sheet_name}' not found in template. "
-            f"Available: {wb.sheetnames}"
-        )
-    ws = wb[plan.sheet_name]
+    Args:
+        plans: Plans produced by ``build_flexible_write_plan``.
 
-    for row_idx, col_idx, value in plan.writes:
-        ws.cell(row=row_idx, column=col_idx, value=value)
+    Raises:
+        FileNotFoundError: If the template file does not exist.
+        ValueError: If there are no plans, a plan has no writes, the plans
+            disagree on template/output paths, or a sheet is missing.
+    """
+    if not plans:
+        raise ValueError("No FlexibleWritePlans to apply.")
+
+    template = Path(plans[0].template_path)
+    output = Path(plans[0].output_path)
+    for plan in plans:
+        if not plan.writes:
+            raise ValueError("FlexibleWritePlan has no write operations.")
+        if Path(plan.template_path) != template or Path(plan.output_path) != output:
+            raise ValueError("FlexibleWritePlans in one batch must share template and output.")
+    if not template.exists():
+        raise FileNotFoundError(f"Template not found: {template}")
 
+    # Loading the template and saving to the output preserves formulas,
+    # styles and charts just like copying it first, without a second parse.
+    wb = load_workbook(template, data_only=False)
+    for plan in plans:
+        if plan.sheet_name not in wb.sheetnames:
+            raise ValueError(
+                f"Sheet '{plan.sheet_name}' not found in template. "
+                f"Available: {wb.sheetnames}"
+            )
+    for plan in plans:
+        ws = wb[plan.sheet_name]
+        for row_idx, col_idx, value in plan.writes:
+            ws.cell(row=row_idx, column=col_idx, value=value)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
     wb.save(output)
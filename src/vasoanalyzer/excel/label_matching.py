@@ -7,17 +7,25 @@
 
 Provides normalisation and fuzzy-matching functions used by both the
 Excel Map Wizard and the Excel Template Export Dialog to align session
-event labels with template row labels.
+event labels with template row labels.  :class:`LabelIndex` precomputes
+the candidate side once so many template labels can be matched cheaply.
 """
 
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable, Sequence
 
-__all__ = ["normalize_label", "best_match"]
+__all__ = ["normalize_label", "best_match", "LabelIndex"]
 
 # Characters stripped during normalisation (separators, brackets, etc.)
 _NORM_SUBS = re.compile(r"[:\-–—•+/\\()\[\]{}=,;]")
+_DIGIT_ALPHA = re.compile(r"(\d)([a-z])")
+_ALPHA_DIGIT = re.compile(r"([a-z])(\d)")
+_WHITESPACE = re.compile(r"\s+")
+
+# Substring candidates are looked up by character trigrams.
+_GRAM = 3
 
 
 def normalize_label(label: str) -> str:
@@ -41,21 +49,143 @@ def normalize_label(label: str) -> str:
     s = s.replace("µ", "u").replace("μ", "u")  # micro sign variants
     s = _NORM_SUBS.sub(" ", s)
     # Split digit/letter boundaries (e.g. "20mmhg" → "20 mmhg", "1um" → "1 um")
-    s = re.sub(r"(\d)([a-z])", r"\1 \2", s)
-    s = re.sub(r"([a-z])(\d)", r"\1 \2", s)
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _DIGIT_ALPHA.sub(r"\1 \2", s)
+    s = _ALPHA_DIGIT.sub(r"\1 \2", s)
+    s = _WHITESPACE.sub(" ", s).strip()
     return s
 
 
 def _token_overlap_score(a: str, b: str) -> float:
     """Jaccard similarity between word-token sets of two normalized labels."""
-    tokens_a = set(a.split())
-    tokens_b = set(b.split())
+    return _jaccard(set(a.split()), set(b.split()))
+
+
+def _jaccard(tokens_a: set[str] | frozenset[str], tokens_b: set[str] | frozenset[str]) -> float:
     if not tokens_a or not tokens_b:
         return 0.0
-    intersection = tokens_a & tokens_b
-    union = tokens_a | tokens_b
-    return len(intersection) / len(union)
+    intersection = len(tokens_a & tokens_b)
+    return intersection / (len(tokens_a) + len(tokens_b) - intersection)
+
+
+def _grams(text: str) -> set[str]:
+    return {text[i : i + _GRAM] for i in range(len(text) - _GRAM + 1)}
+
+
+class LabelIndex:
+    """Candidate labels preprocessed for repeated :func:`best_match` lookups.
+
+    Each candidate is normalised once.  Exact hits come from a dict, the
+    substring pass only checks candidates that share character trigrams with
+    the query, and the token-overlap pass only scores candidates that share
+    at least one word token.  Results are identical to :func:`best_match`
+    over the same candidate list, including its earliest-candidate tie-break.
+    """
+
+    def __init__(self, candidates: Iterable[str]):
+        self._labels: list[str] = list(candidates)
+        self._norms: list[str] = [normalize_label(c) for c in self._labels]
+        self._token_sets: list[frozenset[str]] = [frozenset(n.split()) for n in self._norms]
+        self._alive: list[bool] = [True] * len(self._labels)
+
+        self._exact: dict[str, list[int]] = {}
+        self._tokens: dict[str, list[int]] = {}
+        # Candidates containing a trigram (for "query in candidate") and
+        # candidates keyed by their leading trigram (for "candidate in query").
+        self._grams: dict[str, list[int]] = {}
+        self._heads: dict[str, list[int]] = {}
+        # Candidates shorter than a trigram can sit inside any query.
+        self._short: list[int] = []
+        for pos, (norm, tokens) in enumerate(zip(self._norms, self._token_sets, strict=True)):
+            self._exact.setdefault(norm, []).append(pos)
+            for token in tokens:
+                self._tokens.setdefault(token, []).append(pos)
+            if len(norm) < _GRAM:
+                self._short.append(pos)
+                continue
+            for gram in _grams(norm):
+                self._grams.setdefault(gram, []).append(pos)
+            self._heads.setdefault(norm[:_GRAM], []).append(pos)
+
+    def match(self, template_label: str, *, threshold: float = 0.5) -> str | None:
+        """Best remaining candidate for *template_label* (see :func:`best_match`)."""
+        pos = self._lookup(normalize_label(template_label), threshold)
+        return None if pos is None else self._labels[pos]
+
+    def match_all(
+        self,
+        template_labels: Sequence[str],
+        *,
+        threshold: float = 0.5,
+        consume: bool = False,
+    ) -> list[str | None]:
+        """Match every template label in order.
+
+        With *consume*, each matched candidate is removed before the next
+        lookup so no candidate is assigned to two template labels.
+        """
+        matches: list[str | None] = []
+        for label in template_labels:
+            pos = self._lookup(normalize_label(label), threshold)
+            if pos is None:
+                matches.append(None)
+                continue
+            if consume:
+                self._alive[pos] = False
+            matches.append(self._labels[pos])
+        return matches
+
+    def _first_alive(self, positions: Iterable[int]) -> int | None:
+        alive = [pos for pos in positions if self._alive[pos]]
+        return min(alive) if alive else None
+
+    def _lookup(self, norm: str, threshold: float) -> int | None:
+        # Pass 1 – exact normalised match
+        pos = self._first_alive(self._exact.get(norm, ()))
+        if pos is not None:
+            return pos
+
+        # Pass 2 – substring containment
+        pos = self._first_alive(
+            p for p in self._substring_candidates(norm) if self._contains(norm, self._norms[p])
+        )
+        if pos is not None:
+            return pos
+
+        # Pass 3 – token-overlap scoring
+        tokens = frozenset(norm.split())
+        candidates: set[int] = set()
+        for token in tokens:
+            candidates.update(self._tokens.get(token, ()))
+        best_score = 0.0
+        best_pos: int | None = None
+        for p in sorted(candidates):
+            if not self._alive[p]:
+                continue
+            score = _jaccard(tokens, self._token_sets[p])
+            if score > best_score:
+                best_score = score
+                best_pos = p
+        if best_score >= threshold:
+            return best_pos
+        return None
+
+    @staticmethod
+    def _contains(a: str, b: str) -> bool:
+        return a in b or b in a
+
+    def _substring_candidates(self, norm: str) -> Iterable[int]:
+        if len(norm) < _GRAM:
+            # Too short to index: it may sit inside any candidate.
+            return range(len(self._labels))
+        grams = _grams(norm)
+        # Candidates containing the query hold every one of its trigrams.
+        postings = sorted((self._grams.get(g, ()) for g in grams), key=len)
+        containing = set(postings[0]).intersection(*postings[1:])
+        # Candidates inside the query start with one of its trigrams.
+        for gram in grams:
+            containing.update(self._heads.get(gram, ()))
+        containing.update(self._short)
+        return containing
 
 
 def best_match(
@@ -76,28 +206,4 @@ def best_match(
     the token-overlap pass the candidate with the highest score is chosen.
     Returns ``None`` if no candidate meets any criterion.
     """
-    norm_tpl = normalize_label(template_label)
-
-    # Pass 1 – exact normalised match
-    for c in candidates:
-        if normalize_label(c) == norm_tpl:
-            return c
-
-    # Pass 2 – substring containment
-    for c in candidates:
-        norm_c = normalize_label(c)
-        if norm_tpl in norm_c or norm_c in norm_tpl:
-            return c
-
-    # Pass 3 – token-overlap scoring
-    best_score = 0.0
-    best_candidate: str | None = None
-    for c in candidates:
-        score = _token_overlap_score(norm_tpl, normalize_label(c))
-        if score > best_score:
-            best_score = score
-            best_candidate = c
-    if best_score >= threshold:
-        return best_candidate
-
-    return None
+    return LabelIndex(candidates).match(template_label, threshold=threshold)
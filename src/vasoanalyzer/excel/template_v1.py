@@ -71,7 +71,11 @@ def _cell_has_formula(cell) -> bool:
 
 
 def inspect_template(path: str) -> TemplateInspection:
-    wb = load_workbook(path, data_only=False)
+    return inspect_workbook(load_workbook(path, data_only=False))
+
+
+def inspect_workbook(wb) -> TemplateInspection:
+    """Inspect an already-loaded workbook (see :func:`inspect_template`)."""
     warnings: list[str] = []
 
     signature_value = _resolve_defined_name_value(wb, SIGNATURE_NAME)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import math
-import shutil
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -11,7 +11,7 @@ import pandas as pd
 from openpyxl import load_workbook
 from openpyxl.utils import coordinate_to_tuple, get_column_letter, range_boundaries
 
-from .template_v1 import block_by_id, inspect_template, validate_template_or_raise
+from .template_v1 import block_by_id, inspect_workbook, validate_template_or_raise
 
 
 @dataclass(frozen=True)
@@ -50,62 +50,69 @@ def _cell_has_formula(cell) -> bool:
     return isinstance(value, str) and value.startswith("=")
 
 
-def build_write_plan(
-    template_path: str,
-    output_path: str,
-    block,
-    replicate_col: str,
-    export_table: pd.DataFrame,
-) -> WritePlan:
-    if list(export_table.columns) != ["Metric", "Value"]:
-        raise ValueError("export_table must have columns exactly: Metric, Value")
-    if replicate_col not in block.replicate_cols:
-        raise ValueError(
-            f"Replicate column '{replicate_col}' not available in block '{block.block_id}'."
-        )
+@dataclass(frozen=True)
+class _TableLayout:
+    """Row/column positions of one block's table, resolved once per workbook."""
 
-    wb = load_workbook(template_path, data_only=False)
-    ws = wb[block.sheet_name]
+    min_row: int
+    max_row: int
+    metric_rows: dict[str, int]
+    column_index: dict[str, int]
+    warnings: list[str]
+
+
+def _table_layout(ws, block) -> _TableLayout:
     table = _find_table(ws, block.table_name)
     if table is None:
         raise ValueError(f"Table '{block.table_name}' not found in '{block.sheet_name}'.")
 
-    min_col, min_row, max_col, max_row = range_boundaries(table.ref)
-    col_names = [col.name for col in table.tableColumns]
-    metric_idx = col_names.index("Metric")
-    replicate_idx = col_names.index(replicate_col)
-    metric_col = min_col + metric_idx
-    replicate_col_idx = min_col + replicate_idx
+    min_col, min_row, _max_col, max_row = range_boundaries(table.ref)
+    column_index = {col.name: min_col + i for i, col in enumerate(table.tableColumns)}
+    metric_col = column_index["Metric"]
 
-    metrics_to_row: dict[str, int] = {}
+    metric_rows: dict[str, int] = {}
     warnings: list[str] = []
     for row in range(min_row + 1, max_row + 1):
         cell = ws.cell(row=row, column=metric_col)
         if cell.value is None:
             continue
         label = str(cell.value).strip()
-        if label in metrics_to_row:
+        if label in metric_rows:
             warnings.append(f"Duplicate metric '{label}' in template block '{block.block_id}'.")
             continue
-        metrics_to_row[label] = row
+        metric_rows[label] = row
+    return _TableLayout(min_row, max_row, metric_rows, column_index, warnings)
+
 
+def _plan_from_layout(
+    layout: _TableLayout,
+    template_path: str,
+    output_path: str,
+    block,
+    replicate_col: str,
+    export_table: pd.DataFrame,
+) -> WritePlan:
+    column_letter = get_column_letter(layout.column_index[replicate_col])
     items: list[WriteItem] = []
     missing: list[str] = []
-    for _, row in export_table.iterrows():
-        metric = str(row["Metric"]).strip()
-        if metric not in metrics_to_row:
+    for metric, value in zip(
+        export_table["Metric"].astype(str).str.strip(),
+        # Non-numeric values only matter for metrics the template places.
+        pd.to_numeric(export_table["Value"], errors="coerce").to_numpy(dtype=float),
+        strict=True,
+    ):
+        row = layout.metric_rows.get(metric)
+        if row is None:
             missing.append(metric)
             continue
-        value = float(row["Value"])
         if math.isnan(value) or math.isinf(value):
             raise ValueError(f"Non-numeric value for metric '{metric}'.")
-        target_cell = f"{get_column_letter(replicate_col_idx)}{metrics_to_row[metric]}"
         items.append(
             WriteItem(
                 metric=metric,
-                value=value,
+                value=float(value),
                 target_sheet=block.sheet_name,
-                target_cell=target_cell,
+                target_cell=f"{column_letter}{row}",
                 block_id=block.block_id,
                 replicate_col=replicate_col,
             )
@@ -118,67 +125,118 @@ def build_write_plan(
         replicate_col=replicate_col,
         items=items,
         missing_metrics=missing,
-        warnings=warnings,
+        warnings=list(layout.warnings),
     )
 
 
-def validate_write_plan_or_raise(plan: WritePlan) -> None:
-    if plan.missing_metrics:
-        raise ValueError("Missing metrics in template block: " + ", ".join(plan.missing_metrics))
+def build_write_plan(
+    template_path: str,
+    output_path: str,
+    block,
+    replicate_col: str,
+    export_table: pd.DataFrame,
+) -> WritePlan:
+    return build_write_plans(template_path, output_path, block, [(replicate_col, export_table)])[0]
+
+
+def build_write_plans(
+    template_path: str,
+    output_path: str,
+    block,
+    tables: Iterable[tuple[str, pd.DataFrame]],
+) -> list[WritePlan]:
+    """Plan several replicate columns of one block from a single template read.
+
+    ``tables`` pairs each replicate column with its ``Metric``/``Value``
+    export table; one :class:`WritePlan` is returned per pair, in order.
+    """
+    tables = list(tables)
+    for replicate_col, export_table in tables:
+        if list(export_table.columns) != ["Metric", "Value"]:
+            raise ValueError("export_table must have columns exactly: Metric, Value")
+        if replicate_col not in block.replicate_cols:
+            raise ValueError(
+                f"Replicate column '{replicate_col}' not available in block '{block.block_id}'."
+            )
 
-    inspection = inspect_template(plan.template_path)
+    wb = load_workbook(template_path, data_only=False)
+    layout = _table_layout(wb[block.sheet_name], block)
+    return [
+        _plan_from_layout(layout, template_path, output_path, block, replicate_col, export_table)
+        for replicate_col, export_table in tables
+    ]
+
+
+def _validate_plans(wb, plans: Sequence[WritePlan], *, allow_missing: bool = False) -> None:
+    if not allow_missing:
+        for plan in plans:
+            if plan.missing_metrics:
+                raise ValueError(
+                    "Missing metrics in template block: " + ", ".join(plan.missing_metrics)
+                )
+
+    inspection = inspect_workbook(wb)
     validate_template_or_raise(inspection)
-    block = block_by_id(inspection.blocks, plan.block_id)
-    if block is None:
-        raise ValueError(f"Block '{plan.block_id}' not found in template.")
-    if plan.replicate_col not in block.replicate_cols:
-        raise ValueError(
-            f"Replicate column '{plan.replicate_col}' not available in '{plan.block_id}'."
-        )
+    layouts: dict[str, _TableLayout] = {}
+    for plan in plans:
+        block = block_by_id(inspection.blocks, plan.block_id)
+        if block is None:
+            raise ValueError(f"Block '{plan.block_id}' not found in template.")
+        if plan.replicate_col not in block.replicate_cols:
+            raise ValueError(
+                f"Replicate column '{plan.replicate_col}' not available in '{plan.block_id}'."
+            )
 
-    wb = load_workbook(plan.template_path, data_only=False)
-    ws = wb[block.sheet_name]
-    if ws.protection.sheet:
-        raise ValueError(f"Sheet '{block.sheet_name}' is protected.")
+        ws = wb[block.sheet_name]
+        if ws.protection.sheet:
+            raise ValueError(f"Sheet '{block.sheet_name}' is protected.")
+        layout = layouts.get(block.block_id)
+        if layout is None:
+            layout = layouts[block.block_id] = _table_layout(ws, block)
+        replicate_col_idx = layout.column_index[plan.replicate_col]
+
+        for item in plan.items:
+            row_idx, col_idx = coordinate_to_tuple(item.target_cell)
+            if not (layout.min_row + 1 <= row_idx <= layout.max_row):
+                raise ValueError(f"Target cell {item.target_cell} is outside table rows.")
+            if col_idx != replicate_col_idx:
+                raise ValueError(f"Target cell {item.target_cell} is not in replicate column.")
+            cell = ws.cell(row=row_idx, column=col_idx)
+            if _cell_has_formula(cell):
+                raise ValueError(f"Target cell {item.target_cell} contains a formula.")
+            for merged in ws.merged_cells.ranges:
+                if item.target_cell in merged:
+                    raise ValueError(f"Target cell {item.target_cell} is merged.")
 
-    table = _find_table(ws, block.table_name)
-    if table is None:
-        raise ValueError(f"Table '{block.table_name}' not found in '{block.sheet_name}'.")
 
-    min_col, min_row, max_col, max_row = range_boundaries(table.ref)
-    col_names = [col.name for col in table.tableColumns]
-    replicate_idx = col_names.index(plan.replicate_col)
-    replicate_col_idx = min_col + replicate_idx
-
-    for item in plan.items:
-        row_idx, col_idx = coordinate_to_tuple(item.target_cell)
-        if not (min_row + 1 <= row_idx <= max_row):
-            raise ValueError(f"Target cell {item.target_cell} is outside table rows.")
-        if col_idx != replicate_col_idx:
-            raise ValueError(f"Target cell {item.target_cell} is not in replicate column.")
-        cell = ws.cell(row=row_idx, column=col_idx)
-        if _cell_has_formula(cell):
-            raise ValueError(f"Target cell {item.target_cell} contains a formula.")
-        for merged in ws.merged_cells.ranges:
-            if item.target_cell in merged:
-                raise ValueError(f"Target cell {item.target_cell} is merged.")
+def validate_write_plan_or_raise(plan: WritePlan) -> None:
+    _validate_plans(load_workbook(plan.template_path, data_only=False), [plan])
 
 
 def apply_write_plan(plan: WritePlan) -> None:
-    validate_write_plan_or_raise(plan)
-
-    template_path = Path(plan.template_path)
-    output_path = Path(plan.output_path)
-    if output_path.resolve() != template_path.resolve():
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(template_path, output_path)
-
-    wb = load_workbook(output_path, data_only=False)
-    if not plan.items:
-        wb.save(output_path)
-        return
-
-    ws = wb[plan.items[0].target_sheet]
-    for item in plan.items:
-        ws[item.target_cell].value = float(item.value)
+    apply_write_plans([plan])
+
+
+def apply_write_plans(plans: Sequence[WritePlan], *, allow_missing: bool = False) -> None:
+    """Validate and write many plans with one template read and one save.
+
+    All plans must share the same template and output path; they may target
+    different blocks and replicate columns.  With ``allow_missing`` the
+    metrics a plan could not place are skipped instead of failing the batch.
+    """
+    if not plans:
+        raise ValueError("No write plans to apply.")
+    template_path = Path(plans[0].template_path)
+    output_path = Path(plans[0].output_path)
+    for plan in plans[1:]:
+        if Path(plan.template_path) != template_path or Path(plan.output_path) != output_path:
+            raise ValueError("Write plans in one batch must share template and output paths.")
+
+    wb = load_workbook(template_path, data_only=False)
+    _validate_plans(wb, plans, allow_missing=allow_missing)
+
+    for plan in plans:
+        for item in plan.items:
+            wb[item.target_sheet][item.target_cell].value = float(item.value)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
     wb.save(output_path)
@@ -0,0 +1,397 @@
+"""Render report figures for many datasets with one reusable figure per process.
+
+:func:`~vasoanalyzer.export.report_figure.render_report_figure` builds a new
+figure for every dataset.  :class:`ReportFigureRenderer` builds the layout
+(header, trace axes, snapshot panel, table axes) once and, for each following
+page, swaps the header text, trace line data, event markers, snapshot and
+event table in place; the grid is only rebuilt when a page gains or loses
+the snapshot or table panel.  Each page comes out as it would from
+``render_report_figure``.
+
+:func:`render_report_pages` writes one PNG/TIFF/SVG/PDF file per page across
+a process pool, each worker rendering a contiguous run of pages with its own
+renderer; :func:`write_report_pdf` writes every page into one multi-page PDF.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import repeat
+from pathlib import Path
+from typing import Any
+
+import matplotlib
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+
+from vasoanalyzer.core.trace_model import TraceModel
+
+from .report_figure import (
+    _LIGHT_RC,
+    _add_event_markers,
+    _auto_detect_traces,
+    _header_text,
+    _layout_grid,
+    _render_event_table,
+    _render_header,
+    _render_snapshot,
+    _render_traces,
+    _trace_def,
+    _trace_window,
+)
+
+log = logging.getLogger(__name__)
+
+ReportCallback = Callable[["ReportResult"], None]
+
+REPORT_FORMATS = ("png", "tiff", "svg", "pdf")
+
+__all__ = [
+    "REPORT_FORMATS",
+    "ReportFigureRenderer",
+    "ReportPage",
+    "ReportResult",
+    "render_report_pages",
+    "write_report_pdf",
+]
+
+
+@dataclass
+class ReportPage:
+    """Inputs for one report page; see ``render_report_figure`` for the fields.
+
+    ``trace`` may be a :class:`TraceModel` or a trace DataFrame with UI
+    column names.  A DataFrame is turned into a model by the process that
+    renders the page, which keeps what is sent to worker processes small.
+    ``name`` is the output file stem.
+    """
+
+    name: str
+    trace: TraceModel | pd.DataFrame | None
+    xlim: tuple[float, float]
+    visible_traces: list[str] | None = None
+    events_df: pd.DataFrame | None = None
+    event_times: list[float] | None = None
+    event_labels: list[str] | None = None
+    snapshot_image: np.ndarray | None = None
+    metadata: dict[str, str] = field(default_factory=dict)
+
+    def trace_model(self) -> TraceModel | None:
+        if isinstance(self.trace, pd.DataFrame):
+            return TraceModel.from_dataframe(self.trace)
+        return self.trace
+
+
+@dataclass(frozen=True)
+class ReportResult:
+    """Outcome of rendering one page."""
+
+    name: str
+    path: Path | None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ReportFigureRenderer:
+    """Render report pages into one figure, reusing its layout and artists.
+
+    The figure returned by :meth:`render` is the same object every time and
+    is only valid until the next call; save it before rendering another page.
+    """
+
+    def __init__(
+        self,
+        *,
+        figsize: tuple[float, float] = (11.0, 8.5),
+        dpi: int = 300,
+        include_frame: bool = True,
+        include_table: bool = True,
+    ) -> None:
+        self.figure = Figure(figsize=figsize, dpi=dpi, facecolor="white", edgecolor="none")
+        self.include_frame = bool(include_frame)
+        self.include_table = bool(include_table)
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop the cached layout; the next page is built from scratch."""
+        self.figure.clear()
+        self._layout_key: tuple[bool, bool] | None = None
+        self._axes: dict[str, Any] = {}
+        self._header: tuple[Any, Any] | None = None
+        self._trace_key: object = None
+        self._twin = None
+        self._lines: list[tuple[Any, str]] = []
+        self._markers: list[Any] = []
+        self._image = None
+
+    def render(self, page: ReportPage) -> Figure:
+        """Draw ``page`` into the shared figure and return it."""
+        with matplotlib.rc_context(_LIGHT_RC):
+            try:
+                self._render(page)
+            except Exception:
+                self.reset()
+                raise
+        return self.figure
+
+    def _render(self, page: ReportPage) -> None:
+        model = page.trace_model()
+        visible = page.visible_traces
+        if visible is None:
+            visible = _auto_detect_traces(model)
+        snapshot = page.snapshot_image if self.include_frame else None
+        events = page.events_df
+        if not self.include_table or events is None or len(events) == 0:
+            events = None
+
+        layout_key = (snapshot is not None, events is not None)
+        grid = _layout_grid(self.figure, layout_key[0], None if events is None else len(events))
+        if layout_key != self._layout_key:
+            self.reset()
+            self._layout_key = layout_key
+            self._axes["header"] = self.figure.add_subplot(grid[0, :])
+            self._axes["trace"] = self.figure.add_subplot(grid[1, 0])
+            if snapshot is not None:
+                self._axes["frame"] = self.figure.add_subplot(grid[1, 1])
+            if events is not None:
+                self._axes["table"] = self.figure.add_subplot(grid[2, :])
+            # The pressure twin axes is recreated with the traces, after these;
+            # keep drawing it first, as a freshly built figure does.
+            for name in ("frame", "table"):
+                if name in self._axes:
+                    self._axes[name].set_zorder(0.5)
+        else:
+            # Same panels; only the row heights follow the event count.
+            self._axes["header"].set_subplotspec(grid[0, :])
+            self._axes["trace"].set_subplotspec(grid[1, 0])
+            if self._twin is not None:
+                self._twin.set_subplotspec(grid[1, 0])
+            if "frame" in self._axes:
+                self._axes["frame"].set_subplotspec(grid[1, 1])
+            if "table" in self._axes:
+                self._axes["table"].set_subplotspec(grid[2, :])
+
+        self._update_header(page.metadata or {})
+        self._update_traces(model, page, visible)
+        if snapshot is not None:
+            self._update_snapshot(snapshot)
+        if events is not None:
+            ax_table = self._axes["table"]
+            ax_table.cla()
+            _render_event_table(ax_table, events, visible)
+
+    def _update_header(self, meta: dict[str, str]) -> None:
+        if self._header is None:
+            ax = self._axes["header"]
+            _render_header(ax, meta)
+            self._header = (ax.texts[0], ax.texts[1])
+            return
+        title, subtitle = _header_text(meta)
+        self._header[0].set_text(title)
+        self._header[1].set_text(subtitle)
+
+    def _update_traces(
+        self, model: TraceModel | None, page: ReportPage, visible: Sequence[str]
+    ) -> None:
+        ax = self._axes["trace"]
+        window = None
+        if model is None:
+            key: object = None
+        else:
+            window = _trace_window(ax, model, page.xlim)
+            if window.time.size == 0:
+                key = "empty"
+            else:
+                attrs = [defn[4] for defn in map(_trace_def, visible) if defn is not None]
+                key = (tuple(visible), tuple(getattr(window, a) is not None for a in attrs))
+
+        if key != self._trace_key or not isinstance(key, tuple):
+            self._rebuild_traces(model, page, list(visible))
+            self._trace_key = key
+            return
+
+        for artist in self._markers:
+            artist.remove()
+        for line, attr in self._lines:
+            line.set_data(window.time, getattr(window, attr))
+        for axes in (ax, self._twin):
+            if axes is not None:
+                axes.relim()
+                axes.autoscale_view()
+        self._markers = _add_event_markers(ax, page.xlim, page.event_times, page.event_labels)
+        ax.set_xlim(*page.xlim)
+
+    def _rebuild_traces(self, model: TraceModel | None, page: ReportPage, visible: list[str]):
+        ax = self._axes["trace"]
+        if self._twin is not None:
+            self._twin.remove()
+        ax.cla()
+        before = set(self.figure.axes)
+        self._markers = _render_traces(
+            ax, model, page.xlim, visible, page.event_times, page.event_labels
+        )
+        twins = [axes for axes in self.figure.axes if axes not in before]
+        self._twin = twins[0] if twins else None
+
+        attr_by_label = {defn[1]: defn[4] for defn in map(_trace_def, visible) if defn is not None}
+        marker_ids = {id(artist) for artist in self._markers}
+        self._lines = [
+            (line, attr_by_label[line.get_label()])
+            for axes in (ax, self._twin)
+            if axes is not None
+            for line in axes.get_lines()
+            if id(line) not in marker_ids and line.get_label() in attr_by_label
+        ]
+
+    def _update_snapshot(self, image: np.ndarray) -> None:
+        ax = self._axes["frame"]
+        previous = self._image
+        if previous is not None and previous.get_array().ndim == image.ndim:
+            previous.set_data(image)
+            previous.autoscale()
+            height, width = image.shape[:2]
+            previous.set_extent((-0.5, width - 0.5, height - 0.5, -0.5))
+            return
+        ax.cla()
+        _render_snapshot(ax, image)
+        self._image = ax.images[-1]
+
+
+def _save(figure: Figure, path: Path, fmt: str, dpi: int) -> None:
+    figure.savefig(path, format=fmt, dpi=dpi, facecolor="white")
+
+
+def _render_chunk(
+    jobs: Sequence[tuple[ReportPage, Path]], options: dict[str, Any]
+) -> list[ReportResult]:
+    # Runs once per contiguous run of pages, in a worker or in-process.
+    fmt = options["fmt"]
+    dpi = options["dpi"]
+    renderer = ReportFigureRenderer(
+        figsize=options["figsize"],
+        dpi=dpi,
+        include_frame=options["include_frame"],
+        include_table=options["include_table"],
+    )
+    results = []
+    for page, path in jobs:
+        try:
+            _save(renderer.render(page), path, fmt, dpi)
+        except Exception as exc:  # noqa: BLE001 - reported per page
+            log.warning("Report page %s failed: %s", page.name, exc)
+            results.append(ReportResult(page.name, None, str(exc)))
+        else:
+            results.append(ReportResult(page.name, path))
+    return results
+
+
+def _worker_count(workers: int | None, n_items: int) -> int:
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return max(1, min(int(workers), n_items))
+
+
+def render_report_pages(
+    pages: Iterable[ReportPage],
+    out_dir: str | os.PathLike[str],
+    *,
+    fmt: str = "png",
+    dpi: int = 150,
+    figsize: tuple[float, float] = (11.0, 8.5),
+    include_frame: bool = True,
+    include_table: bool = True,
+    workers: int | None = None,
+    on_result: ReportCallback | None = None,
+) -> list[ReportResult]:
+    """Write each page to ``out_dir/<name>.<fmt>`` and return the results in order.
+
+    Pages are split into contiguous runs rendered on up to ``workers``
+    processes (all CPUs by default); each run reuses one figure.  A page
+    that fails is reported with its error and does not stop the others.
+    ``on_result`` is called on the calling thread as results arrive.
+    """
+
+    fmt = fmt.lower()
+    if fmt not in REPORT_FORMATS:
+        raise ValueError(f"Unsupported report format {fmt!r}; expected one of {REPORT_FORMATS}")
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    jobs = [(page, out / f"{page.name}.{fmt}") for page in pages]
+    if not jobs:
+        return []
+    options = {
+        "fmt": fmt,
+        "dpi": int(dpi),
+        "figsize": figsize,
+        "include_frame": include_frame,
+        "include_table": include_table,
+    }
+
+    n_workers = _worker_count(workers, len(jobs))
+    # A few runs per worker balances uneven pages without rebuilding too often.
+    size = max(1, -(-len(jobs) // (n_workers * 4)))
+    chunks = [jobs[i : i + size] for i in range(0, len(jobs), size)]
+    results: list[ReportResult] = []
+
+    def _collect(batch: list[ReportResult]) -> None:
+        results.extend(batch)
+        if on_result is not None:
+            for result in batch:
+                on_result(result)
+
+    if n_workers <= 1:
+        for chunk in chunks:
+            _collect(_render_chunk(chunk, options))
+        return results
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        for batch in pool.map(_render_chunk, chunks, repeat(options)):
+            _collect(batch)
+    return results
+
+
+def write_report_pdf(
+    pages: Iterable[ReportPage],
+    path: str | os.PathLike[str],
+    *,
+    dpi: int = 150,
+    figsize: tuple[float, float] = (11.0, 8.5),
+    include_frame: bool = True,
+    include_table: bool = True,
+    on_result: ReportCallback | None = None,
+) -> list[ReportResult]:
+    """Write every page into one multi-page PDF at ``path``.
+
+    The PDF is written by a single process (pages are vector output, so
+    there is little to gain from splitting them up).  Failed pages are
+    left out of the document and reported with their error.
+    """
+
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    renderer = ReportFigureRenderer(
+        figsize=figsize, dpi=dpi, include_frame=include_frame, include_table=include_table
+    )
+    results: list[ReportResult] = []
+    with PdfPages(target) as pdf:
+        for page in pages:
+            try:
+                pdf.savefig(renderer.render(page), dpi=dpi, facecolor="white")
+            except Exception as exc:  # noqa: BLE001 - reported per page
+                log.warning("Report page %s failed: %s", page.name, exc)
+                result = ReportResult(page.name, None, str(exc))
+            else:
+                result = ReportResult(page.name, target)
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+    return results
@@ -73,6 +73,21 @@ _COL_MAP: dict[str, str] = {
 }
 
 
+# rcParams applied while building report figures, whatever the app theme
+_LIGHT_RC: dict[str, str] = {
+    "figure.facecolor": "white",
+    "axes.facecolor": "white",
+    "axes.edgecolor": "#333333",
+    "axes.labelcolor": "black",
+    "text.color": "black",
+    "xtick.color": "black",
+    "ytick.color": "black",
+    "grid.color": "#CCCCCC",
+    "legend.facecolor": "white",
+    "legend.edgecolor": "#CCCCCC",
+}
+
+
 # ── Public API ───────────────────────────────────────────────────────────────
 
 def render_report_figure(
@@ -115,18 +130,7 @@ def render_report_figure(
     # Force light-mode rendering regardless of system/app theme
     import matplotlib as _mpl
     _saved_rcParams = _mpl.rcParams.copy()
-    _mpl.rcParams.update({
-        "figure.facecolor": "white",
-        "axes.facecolor": "white",
-        "axes.edgecolor": "#333333",
-        "axes.labelcolor": "black",
-        "text.color": "black",
-        "xtick.color": "black",
-        "ytick.color": "black",
-        "grid.color": "#CCCCCC",
-        "legend.facecolor": "white",
-        "legend.edgecolor": "#CCCCCC",
-    })
+    _mpl.rcParams.update(_LIGHT_RC)
 
     try:
         return _render_figure_impl(
@@ -155,32 +159,7 @@ def _render_figure_impl(
         visible_traces = _auto_detect_traces(trace_model)
 
     # ── Build layout ─────────────────────────────────────────────────────
-    # Row heights: header (small) | traces (large) | table (scaled to row count)
-    row_ratios = [0.06]  # header
-    if has_table:
-        n_event_rows = len(events_df) + 1  # +1 for header
-        # Give table more space for more rows, but cap it
-        table_ratio = min(0.55, max(0.30, n_event_rows * 0.022))
-        trace_ratio = 0.94 - table_ratio
-        row_ratios.append(trace_ratio)
-        row_ratios.append(table_ratio)
-    else:
-        row_ratios.append(0.94)
-    n_rows = len(row_ratios)
-
-    # Column widths: traces | frame (optional)
-    col_ratios = [0.65, 0.35] if has_frame else [1.0]
-    n_cols = len(col_ratios)
-
-    gs = GridSpec(
-        n_rows, n_cols,
-        figure=fig,
-        height_ratios=row_ratios,
-        width_ratios=col_ratios,
-        hspace=0.25,
-        wspace=0.08,
-        left=0.06, right=0.96, top=0.96, bottom=0.08,
-    )
+    gs = _layout_grid(fig, has_frame, len(events_df) if has_table else None)
 
     # ── Header (spans full width) ────────────────────────────────────────
     ax_header = fig.add_subplot(gs[0, :])
@@ -204,6 +183,36 @@ def _render_figure_impl(
     return fig
 
 
+# ── Helper: grid layout ──────────────────────────────────────────────────────
+
+def _layout_grid(fig: Figure, has_frame: bool, n_events: int | None) -> GridSpec:
+    """Grid for header / traces (+ frame) / table; ``n_events`` None omits the table."""
+    # Row heights: header (small) | traces (large) | table (scaled to row count)
+    row_ratios = [0.06]  # header
+    if n_events is not None:
+        n_event_rows = n_events + 1  # +1 for header
+        # Give table more space for more rows, but cap it
+        table_ratio = min(0.55, max(0.30, n_event_rows * 0.022))
+        trace_ratio = 0.94 - table_ratio
+        row_ratios.append(trace_ratio)
+        row_ratios.append(table_ratio)
+    else:
+        row_ratios.append(0.94)
+
+    # Column widths: traces | frame (optional)
+    col_ratios = [0.65, 0.35] if has_frame else [1.0]
+
+    return GridSpec(
+        len(row_ratios), len(col_ratios),
+        figure=fig,
+        height_ratios=row_ratios,
+        width_ratios=col_ratios,
+        hspace=0.25,
+        wspace=0.08,
+        left=0.06, right=0.96, top=0.96, bottom=0.08,
+    )
+
+
 # ── Helper: auto-detect available traces ─────────────────────────────────────
 
 def _auto_detect_traces(model: TraceModel | None) -> list[str]:
@@ -228,9 +237,7 @@ def _render_header(ax, meta: dict[str, str]) -> None:
     ax.set_ylim(0, 1)
     ax.axis("off")
 
-    sample_name = meta.get("sample_name", "Untitled Sample")
-    experiment = meta.get("experiment", "")
-    date_str = meta.get("date", datetime.now().strftime("%Y-%m-%d"))
+    sample_name, subtitle = _header_text(meta)
 
     ax.set_facecolor("white")
     ax.text(
@@ -239,13 +246,8 @@ def _render_header(ax, meta: dict[str, str]) -> None:
         transform=ax.transAxes,
     )
 
-    subtitle_parts = []
-    if experiment:
-        subtitle_parts.append(experiment)
-    subtitle_parts.append(date_str)
-    subtitle_parts.append(f"VasoAnalyzer {APP_VERSION}")
     ax.text(
-        0.0, 0.20, "  |  ".join(subtitle_parts),
+        0.0, 0.20, subtitle,
         fontsize=9, color="#666666", va="center",
         transform=ax.transAxes,
     )
@@ -253,6 +255,20 @@ def _render_header(ax, meta: dict[str, str]) -> None:
     ax.axhline(y=0.0, xmin=0, xmax=1, color="#CCCCCC", linewidth=1.0)
 
 
+def _header_text(meta: dict[str, str]) -> tuple[str, str]:
+    """Return the header title and the ``experiment | date | version`` subtitle."""
+    sample_name = meta.get("sample_name", "Untitled Sample")
+    experiment = meta.get("experiment", "")
+    date_str = meta.get("date", datetime.now().strftime("%Y-%m-%d"))
+
+    subtitle_parts = []
+    if experiment:
+        subtitle_parts.append(experiment)
+    subtitle_parts.append(date_str)
+    subtitle_parts.append(f"VasoAnalyzer {APP_VERSION}")
+    return sample_name, "  |  ".join(subtitle_parts)
+
+
 # ── Render: stacked traces ──────────────────────────────────────────────────
 
 def _render_traces(
@@ -262,24 +278,25 @@ def _render_traces(
     visible_traces: list[str],
     event_times: list[float] | None,
     event_labels: list[str] | None,
-) -> None:
-    """Render stacked trace lines on a single axes with secondary Y-axes."""
+) -> list:
+    """Render stacked trace lines on a single axes with secondary Y-axes.
+
+    Returns the event marker artists so a reused figure can replace them.
+    """
     ax.set_facecolor("white")
     if model is None:
         ax.text(0.5, 0.5, "No trace data", ha="center", va="center",
                 fontsize=12, color="black")
         ax.set_frame_on(False)
-        return
+        return []
 
     x0, x1 = xlim
-    pixel_width = 2000
-    level_idx = model.best_level_for_window(x0, x1, pixel_width)
-    window = model.window(level_idx, x0, x1)
+    window = _trace_window(ax, model, xlim)
 
     time_arr = window.time
     if time_arr.size == 0:
         ax.text(0.5, 0.5, "No data in view range", ha="center", va="center")
-        return
+        return []
 
     # Separate diameter traces (left Y) from pressure traces (right Y)
     diam_traces = [t for t in visible_traces if t in ("inner", "outer")]
@@ -334,19 +351,7 @@ def _render_traces(
             ax2.set_ylabel("Pressure (mmHg)", fontsize=9)
             ax2.tick_params(axis="y", labelsize=8)
 
-    # Event markers
-    if event_times:
-        for i, evt_time in enumerate(event_times):
-            if x0 <= evt_time <= x1:
-                ax.axvline(evt_time, color="#888888", linestyle="--",
-                           linewidth=0.8, alpha=0.6)
-                if event_labels and i < len(event_labels):
-                    ylim = ax.get_ylim()
-                    ax.text(
-                        evt_time, ylim[1], f" {event_labels[i]}",
-                        rotation=90, va="top", fontsize=6.5,
-                        color="#888888", alpha=0.85,
-                    )
+    markers = _add_event_markers(ax, xlim, event_times, event_labels)
 
     ax.set_xlabel("Time (s)", fontsize=9, color="black")
     ax.set_xlim(x0, x1)
@@ -366,6 +371,40 @@ def _render_traces(
         for text in legend.get_texts():
             text.set_color("black")
 
+    return markers
+
+
+def _trace_window(ax, model: TraceModel, xlim: tuple[float, float]):
+    """LOD window with about as many points as ``ax`` has pixels at the figure DPI."""
+    x0, x1 = xlim
+    pixel_width = max(1, int(round(ax.get_window_extent().width)))
+    level_idx = model.best_level_for_window(x0, x1, pixel_width)
+    return model.window(level_idx, x0, x1)
+
+
+def _add_event_markers(
+    ax,
+    xlim: tuple[float, float],
+    event_times: list[float] | None,
+    event_labels: list[str] | None,
+) -> list:
+    """Draw dashed event lines (and labels) inside ``xlim``; return the artists."""
+    x0, x1 = xlim
+    artists = []
+    if event_times:
+        for i, evt_time in enumerate(event_times):
+            if x0 <= evt_time <= x1:
+                artists.append(ax.axvline(evt_time, color="#888888", linestyle="--",
+                                          linewidth=0.8, alpha=0.6))
+                if event_labels and i < len(event_labels):
+                    ylim = ax.get_ylim()
+                    artists.append(ax.text(
+                        evt_time, ylim[1], f" {event_labels[i]}",
+                        rotation=90, va="top", fontsize=6.5,
+                        color="#888888", alpha=0.85,
+                    ))
+    return artists
+
 
 # ── Render: snapshot frame ───────────────────────────────────────────────────
 
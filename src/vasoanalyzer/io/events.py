@@ -8,6 +8,7 @@
 from __future__ import annotations
 
 import csv
+import io
 import logging
 import re
 from collections.abc import Iterable
@@ -148,87 +149,97 @@ def _looks_like_number_or_time(val: str) -> bool:
     return bool(re.fullmatch(r"\d{1,2}(?::\d{2}){1,2}(?:\.\d+)?", s))
 
 
-def _safe_read_events_csv(path: Path | str, delimiter: str | None = None) -> pd.DataFrame:
-    """Read an events CSV robustly, handling files where data rows have more
-    fields than the header row (which would otherwise create a MultiIndex)."""
+def _sniff_delimiter(sample: str) -> str:
+    try:
+        return csv.Sniffer().sniff(sample).delimiter
+    except csv.Error:
+        if "," in sample:
+            return ","
+        if "\t" in sample:
+            return "\t"
+        return ";"
+
+
+def _read_event_text(path: Path | str) -> str:
+    """Return the decoded contents of an event table with a single read."""
+
+    return Path(path).read_bytes().decode("utf-8-sig")
+
+
+def _parse_events_text(text: str, delimiter: str | None = None) -> pd.DataFrame:
+    """Build an events DataFrame from the in-memory contents of a table file.
+
+    The delimiter, header and ragged rows are all detected from ``text``, and
+    the frame is parsed from the same buffer exactly once.
+    """
 
-    path = Path(path)
     if delimiter is None:
-        with open(path, encoding="utf-8-sig") as _h:
-            sample = _h.read(1024)
-        try:
-            delimiter = csv.Sniffer().sniff(sample).delimiter
-        except csv.Error:
-            if "," in sample:
-                delimiter = ","
-            elif "\t" in sample:
-                delimiter = "\t"
-            else:
-                delimiter = ";"
+        delimiter = _sniff_delimiter(text[:1024])
 
     # Pre-check: count fields in the header vs data rows.
     # When data rows have MORE fields than the header, pandas silently
     # absorbs the extra leading fields into a MultiIndex row index,
-    # discarding the actual event times and labels.  Read the raw CSV
-    # first to detect and correct this before calling pd.read_csv.
-    with open(path, encoding="utf-8-sig") as _f:
-        _raw = list(csv.reader(_f, delimiter=delimiter))
-    if _raw:
-        _header = _raw[0]
-        _data_rows = [r for r in _raw[1:] if any(c.strip() for c in r)]
-        _max_cols = max((len(r) for r in _data_rows), default=len(_header))
+    # discarding the actual event times and labels.
+    rows = list(csv.reader(io.StringIO(text), delimiter=delimiter))
+    if rows:
+        header = rows[0]
+        max_cols = max(
+            (len(r) for r in rows[1:] if any(c.strip() for c in r)), default=len(header)
+        )
     else:
-        _header, _max_cols = [], 0
+        header, max_cols = [], 0
 
-    if _max_cols > len(_header):
-        _extra = [f"_extra{i}" for i in range(_max_cols - len(_header))]
+    if any(_looks_like_number_or_time(c) for c in header):
+        # No header row: the first line is already data.
+        frame = pd.read_csv(io.StringIO(text), delimiter=delimiter, header=None)
+        frame.columns = [f"col{i}" for i in range(frame.shape[1])]
+        return frame
+
+    if max_cols > len(header):
+        extra = [f"_extra{i}" for i in range(max_cols - len(header))]
         frame = pd.read_csv(
-            path,
+            io.StringIO(text),
             delimiter=delimiter,
-            names=_header + _extra,
+            names=header + extra,
             skiprows=1,
         )
     else:
-        frame = pd.read_csv(path, delimiter=delimiter)
+        frame = pd.read_csv(io.StringIO(text), delimiter=delimiter)
 
     if isinstance(frame.columns, pd.MultiIndex):
         frame.columns = [
             " ".join(str(part) for part in col if pd.notna(part)) for col in frame.columns
         ]
     if any(_looks_like_number_or_time(c) for c in frame.columns):
-        frame = pd.read_csv(path, delimiter=delimiter, header=None)
+        frame = pd.read_csv(io.StringIO(text), delimiter=delimiter, header=None)
         frame.columns = [f"col{i}" for i in range(frame.shape[1])]
     return frame
 
 
+def _safe_read_events_csv(path: Path | str, delimiter: str | None = None) -> pd.DataFrame:
+    """Read an events CSV robustly, handling files where data rows have more
+    fields than the header row (which would otherwise create a MultiIndex)."""
+
+    return _parse_events_text(_read_event_text(path), delimiter=delimiter)
+
+
+def read_events_dataframe(file_path: Path | str, *, cache: Any | None = None) -> pd.DataFrame:
+    """Return the raw events table at ``file_path``, through ``cache`` when given."""
+
+    if cache is not None and DataCache is not None:
+        return cache.read_dataframe(file_path, loader=_safe_read_events_csv)
+    return _safe_read_events_csv(file_path)
+
+
 def load_events(file_path, *, cache: Any | None = None):
     """Return event labels, times and optional frames from a table file or DataFrame."""
 
     if isinstance(file_path, pd.DataFrame):
         log.debug("Loading events from DataFrame")
         df = file_path.copy()
-        delimiter = ","
     else:
         log.debug("Loading events from %s", file_path)
-        with open(file_path, encoding="utf-8-sig") as handle:
-            sample = handle.read(1024)
-            try:
-                delimiter = csv.Sniffer().sniff(sample).delimiter
-            except csv.Error:
-                if "," in sample:
-                    delimiter = ","
-                elif "\t" in sample:
-                    delimiter = "\t"
-                else:
-                    delimiter = ";"
-
-        def _read_events(path: Path) -> pd.DataFrame:
-            return _safe_read_events_csv(path, delimiter=delimiter)
-
-        if cache is not None and DataCache is not None:
-            df = cache.read_dataframe(file_path, loader=_read_events)
-        else:
-            df = _read_events(Path(file_path))
+        df = read_events_dataframe(file_path, cache=cache)
 
     df = _standardize_headers(df)
 
@@ -240,7 +251,9 @@ def load_events(file_path, *, cache: Any | None = None):
             df = df.reset_index()
             df.rename(columns={"index": "EventLabel"}, inplace=True)
 
-    label_candidates = [col for col in df.columns if not _is_numeric_or_time_series(df[col])]
+    # Classify each column once; both label and time detection reuse the result.
+    numeric_like = {col: _is_numeric_or_time_series(df[col]) for col in df.columns}
+    label_candidates = [col for col in df.columns if not numeric_like[col]]
     if label_candidates:
         fallback_label = label_candidates[0]
     elif len(df.columns) > 1:
@@ -253,7 +266,7 @@ def load_events(file_path, *, cache: Any | None = None):
         label_col = fallback_label
 
     numeric_candidates = [
-        col for col in df.columns if col != label_col and _is_numeric_or_time_series(df[col])
+        col for col in df.columns if col != label_col and numeric_like.get(col, False)
     ]
     if numeric_candidates:
         default_time = numeric_candidates[0]
@@ -417,5 +430,6 @@ __all__ = [
     "find_matching_event_file",
     "find_matching_tiff_file",
     "find_matching_trace_file",
+    "read_events_dataframe",
     "_safe_read_events_csv",
 ]
@@ -0,0 +1,335 @@
+# VasoAnalyzer
+# Copyright © 2025 Osvaldo J. Vega Rodríguez
+# Licensed under CC BY-NC-SA 4.0 International
+# http://creativecommons.org/licenses/by-nc-sa/4.0/
+
+"""Persistent page index for TIFF stacks.
+
+Walking every page of a long stack to read tags and parse XML descriptions is
+slower than decoding preview frames.  :class:`TiffPageIndex` records what the
+viewer and timebase need (IFD offsets, page shapes, dtype and raw per-page
+``FrameTime`` values) in one sequential pass over the IFD chain and is stored
+as a small ``.npz`` sidecar keyed by the source path, so later opens skip the
+walk entirely.  Full per-page metadata is still available on demand through
+:class:`TiffFrameMetadata`, which seeks straight to a page's IFD.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import tifffile
+
+from vasoanalyzer.io.tiffs import parse_description
+
+log = logging.getLogger(__name__)
+
+INDEX_FORMAT_VERSION = 1
+_FRAME_TIME_KEY = "FrameTime"
+_METADATA_CACHE_SIZE = 32
+
+
+def _source_signature(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return int(stat.st_size), int(stat.st_mtime_ns)
+
+
+def _frame_time_from_description(description: str) -> Any:
+    # Most pages carry no timing; skip the JSON/XML parse entirely for those.
+    if not description or _FRAME_TIME_KEY not in description:
+        return None
+    return parse_description(description).get(_FRAME_TIME_KEY)
+
+
+@dataclass(frozen=True)
+class TiffPageIndex:
+    """Offsets, shapes and raw timestamps for every page of a TIFF file."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    offsets: np.ndarray
+    shapes: np.ndarray
+    dtype: str
+    frame_times: tuple[Any, ...]
+
+    @property
+    def page_count(self) -> int:
+        return int(self.offsets.size)
+
+    def matches(self, file_path: str | os.PathLike[str]) -> bool:
+        """Return True when ``file_path`` is unchanged since the index was built."""
+
+        try:
+            return _source_signature(Path(file_path)) == (self.size, self.mtime_ns)
+        except OSError:
+            return False
+
+    def page_shape(self, page_index: int) -> tuple[int, ...]:
+        return tuple(int(v) for v in self.shapes[page_index] if v > 0)
+
+    def timing_metadata(self, page_indices: Sequence[int] | None = None) -> list[dict[str, Any]]:
+        """Return minimal per-page dicts carrying only ``FrameTime`` values."""
+
+        indices = range(self.page_count) if page_indices is None else page_indices
+        rows: list[dict[str, Any]] = []
+        for idx in indices:
+            value = self.frame_times[int(idx)]
+            rows.append({_FRAME_TIME_KEY: value} if value is not None else {})
+        return rows
+
+    # ------------------------------------------------------------------
+    def save(self, dest: str | os.PathLike[str]) -> None:
+        header = {
+            "version": INDEX_FORMAT_VERSION,
+            "path": self.path,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "dtype": self.dtype,
+            "frame_times": list(self.frame_times),
+        }
+        dest_path = Path(dest)
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest_path.with_name(dest_path.name + ".tmp")
+        with tmp.open("wb") as handle:
+            np.savez(
+                handle,
+                offsets=self.offsets,
+                shapes=self.shapes,
+                header=np.frombuffer(json.dumps(header).encode("utf-8"), dtype=np.uint8),
+            )
+        tmp.replace(dest_path)
+
+    @classmethod
+    def load(cls, src: str | os.PathLike[str]) -> TiffPageIndex:
+        with np.load(src, allow_pickle=False) as payload:
+            header = json.loads(payload["header"].tobytes().decode("utf-8"))
+            if header.get("version") != INDEX_FORMAT_VERSION:
+                raise ValueError(f"Unsupported TIFF page index version {header.get('version')}")
+            return cls(
+                path=str(header["path"]),
+                size=int(header["size"]),
+                mtime_ns=int(header["mtime_ns"]),
+                offsets=np.asarray(payload["offsets"], dtype=np.int64),
+                shapes=np.asarray(payload["shapes"], dtype=np.int64),
+                dtype=str(header["dtype"]),
+                frame_times=tuple(header["frame_times"]),
+            )
+
+
+def build_tiff_page_index(file_path: str | os.PathLike[str]) -> TiffPageIndex:
+    """Walk the IFD chain of ``file_path`` once and return its page index."""
+
+    path = Path(file_path)
+    size, mtime_ns = _source_signature(path)
+    offsets: list[int] = []
+    shapes: list[tuple[int, ...]] = []
+    frame_times: list[Any] = []
+    dtype = ""
+    with tifffile.TiffFile(path) as tif:
+        tif.pages.cache = False
+        for page in tif.pages:
+            offsets.append(int(page.offset))
+            shapes.append(tuple(int(v) for v in page.shape))
+            if not dtype and page.dtype is not None:
+                dtype = str(page.dtype)
+            frame_times.append(_frame_time_from_description(getattr(page, "description", "")))
+
+    width = max((len(shape) for shape in shapes), default=0)
+    shape_array = np.zeros((len(shapes), width), dtype=np.int64)
+    for row, shape in enumerate(shapes):
+        shape_array[row, : len(shape)] = shape
+    return TiffPageIndex(
+        path=path.expanduser().resolve(strict=False).as_posix(),
+        size=size,
+        mtime_ns=mtime_ns,
+        offsets=np.asarray(offsets, dtype=np.int64),
+        shapes=shape_array,
+        dtype=dtype,
+        frame_times=tuple(frame_times),
+    )
+
+
+def tiff_page_index_path(
+    file_path: str | os.PathLike[str], cache_dir: str | os.PathLike[str] | None = None
+) -> Path:
+    """Return the sidecar location for ``file_path`` inside ``cache_dir``."""
+
+    if cache_dir is None:
+        from vasoanalyzer.services.cache_service import cache_dir_for_project
+
+        cache_dir = cache_dir_for_project(None)
+    resolved = Path(file_path).expanduser().resolve(strict=False)
+    digest = hashlib.sha1(resolved.as_posix().encode("utf-8", "ignore")).hexdigest()[:16]
+    return Path(cache_dir) / "tiff_index" / f"{resolved.stem}-{digest}.npz"
+
+
+def load_tiff_page_index(
+    file_path: str | os.PathLike[str],
+    *,
+    cache_dir: str | os.PathLike[str] | None = None,
+) -> TiffPageIndex:
+    """Return the page index for ``file_path``, building and persisting it once.
+
+    A stale or unreadable sidecar is rebuilt.  Failure to write the sidecar
+    (e.g. a read-only cache location) is logged and otherwise ignored.
+    """
+
+    sidecar = tiff_page_index_path(file_path, cache_dir)
+    if sidecar.exists():
+        try:
+            index = TiffPageIndex.load(sidecar)
+            if index.matches(file_path):
+                return index
+        except (OSError, ValueError, KeyError):
+            log.debug("Discarding unreadable TIFF page index %s", sidecar, exc_info=True)
+
+    index = build_tiff_page_index(file_path)
+    try:
+        index.save(sidecar)
+    except (OSError, TypeError):
+        log.debug("Could not persist TIFF page index to %s", sidecar, exc_info=True)
+    return index
+
+
+def read_page_metadata(tif: tifffile.TiffFile, index: TiffPageIndex | None, page: int) -> dict:
+    """Return the full metadata dict for ``page`` by seeking to its IFD.
+
+    Without an ``index`` the page is located through ``tif.pages``.
+    """
+
+    if index is not None:
+        tif.filehandle.seek(int(index.offsets[page]))
+        tiff_page = tifffile.TiffPage(tif, index=page)
+    else:
+        tiff_page = tif.pages[page]
+    meta: dict[str, Any] = {
+        "index": page,
+        "shape": tuple(tiff_page.shape),
+        "dtype": str(tiff_page.dtype),
+    }
+    description = getattr(tiff_page, "description", "")
+    if description:
+        parsed = parse_description(description)
+        if parsed:
+            meta.update(parsed)
+        else:
+            meta["description_raw"] = description
+    for tag in tiff_page.tags.values():
+        meta[tag.name] = tag.value
+    return meta
+
+
+class _PageMetadataReader:
+    """Reads page metadata through one ``TiffFile`` kept open between calls."""
+
+    def __init__(self, index: TiffPageIndex) -> None:
+        self._index = index
+        self._tif: tifffile.TiffFile | None = None
+        self._lock = threading.Lock()
+
+    def __call__(self, page: int) -> dict:
+        with self._lock:
+            if self._tif is None:
+                self._tif = tifffile.TiffFile(self._index.path)
+            return read_page_metadata(self._tif, self._index, page)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._tif is not None:
+                self._tif.close()
+                self._tif = None
+
+    def __del__(self) -> None:
+        self.close()
+
+
+class TiffFrameMetadata(Sequence):
+    """Lazy per-frame metadata for a (possibly subsampled) set of TIFF pages.
+
+    Items have the same content ``load_tiff`` used to build eagerly, but each
+    one is read from its IFD only when accessed, through a file handle that
+    stays open for the lifetime of the object (or through ``reader``, e.g.
+    :meth:`TiffPageSource.page_metadata`, to share the viewer's handle).
+    Slices and :meth:`select` share the handle and the cache.  Timing
+    consumers should use :meth:`timing_metadata`, which is served from the
+    index without I/O.
+    """
+
+    def __init__(
+        self,
+        index: TiffPageIndex,
+        page_indices: Sequence[int],
+        *,
+        reader: Callable[[int], dict] | None = None,
+        _cache: OrderedDict[int, dict] | None = None,
+    ) -> None:
+        self.index = index
+        self.page_indices = [int(i) for i in page_indices]
+        self._reader = reader if reader is not None else _PageMetadataReader(index)
+        self._cache: OrderedDict[int, dict] = OrderedDict() if _cache is None else _cache
+
+    def __len__(self) -> int:
+        return len(self.page_indices)
+
+    def __getitem__(self, item):  # type: ignore[override]
+        if isinstance(item, slice):
+            return self._view(self.page_indices[item])
+        page = self.page_indices[item]
+        cached = self._cache.get(page)
+        if cached is not None:
+            self._cache.move_to_end(page)
+            return cached
+        meta = self._reader(page)
+        self._cache[page] = meta
+        while len(self._cache) > _METADATA_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return meta
+
+    def select(self, positions: Sequence[int]) -> TiffFrameMetadata:
+        """Return the metadata for a subset of positions, still lazily."""
+
+        return self._view([self.page_indices[p] for p in positions])
+
+    def close(self) -> None:
+        """Release the file handle (reopened if metadata is read again)."""
+
+        if isinstance(self._reader, _PageMetadataReader):
+            self._reader.close()
+
+    def _view(self, page_indices: Sequence[int]) -> TiffFrameMetadata:
+        return TiffFrameMetadata(self.index, page_indices, reader=self._reader, _cache=self._cache)
+
+    def timing_metadata(self) -> list[dict[str, Any]]:
+        """Return dicts sufficient for frame-time resolution.
+
+        The first entry is the full metadata of the first frame so interval
+        keys such as ``Rec_intvl`` remain available; the rest carry only
+        ``FrameTime``.
+        """
+
+        if not self.page_indices:
+            return []
+        rows = self.index.timing_metadata(self.page_indices)
+        rows[0] = dict(self[0])
+        return rows
+
+
+__all__ = [
+    "TiffFrameMetadata",
+    "TiffPageIndex",
+    "build_tiff_page_index",
+    "load_tiff_page_index",
+    "read_page_metadata",
+    "tiff_page_index_path",
+]
@@ -7,7 +7,9 @@
 
 import json
 import logging
+import threading
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
 
 import numpy as np
 import tifffile
@@ -16,12 +18,21 @@ from vasoanalyzer.core.timebase import FrameTimeResult, resolve_tiff_frame_times
 
 log = logging.getLogger(__name__)
 
+DEFAULT_DECODE_CACHE_MB = 256
+DEFAULT_PREFETCH_AHEAD = 8
+DEFAULT_PREFETCH_BEHIND = 2
+
 # Snapshot image model:
 # - TIFF snapshots are fully materialised in memory (optionally subsampled to ``max_frames``) and returned as a list
 #   of np.ndarray frames (grayscale H×W or RGB H×W×3). Callers such as VasoAnalyzerApp/_SnapshotLoadJob stack these
 #   into ``(n_frames, H, W[,3])`` arrays for persistence/playback.
 # - Timing is not decoded here; downstream code reads FrameTime/Rec_intvl tags from the returned metadata to derive
 #   recording_interval and per-frame timestamps.
+# - ``TiffPageSource`` is the lazy alternative: it keeps the file open and decodes pages on
+#   demand into a bounded LRU.  The snapshot viewer opens full stacks through ``open_tiff_stack``
+#   and only reduced (subsampled) loads are materialised.
+# - Per-frame metadata comes from a cached page index (``vasoanalyzer.io.tiff_index``) and is
+#   read lazily, so ``metadata=True`` no longer walks every page's tags.
 
 
 def parse_description(desc: str) -> dict[str, object]:
@@ -66,7 +77,7 @@ def parse_description(desc: str) -> dict[str, object]:
     return {}
 
 
-def load_tiff(file_path, max_frames=None, metadata=True):
+def load_tiff(file_path, max_frames=None, metadata=True, *, index_dir=None):
     """Load frames from a TIFF file.
 
     Args:
@@ -74,13 +85,17 @@ def load_tiff(file_path, max_frames=None, metadata=True):
         max_frames (int or None, optional): Maximum number of frames to load. If ``None``,
             loads all frames. If an integer, frames are sampled evenly across the stack
             if it contains more than this value. Defaults to ``None`` (load all frames).
-        metadata (bool, optional): If ``True`` extract metadata for each frame.
-            Disabling metadata speeds up loading for preview-only usage.
+        metadata (bool, optional): If ``True`` return per-frame metadata. Metadata is
+            served lazily from a cached page index (see :mod:`vasoanalyzer.io.tiff_index`),
+            so this no longer requires a full pass over every page's tags.
+        index_dir (str or Path or None, optional): Directory holding page index sidecars.
+            Defaults to the user-level cache directory.
 
     Returns:
-        tuple[list[numpy.ndarray], list[dict], dict]: A tuple containing:
+        tuple[list[numpy.ndarray], Sequence[dict], dict]: A tuple containing:
             - Extracted frames (list of numpy arrays)
-            - Metadata for each sampled frame (list of dicts)
+            - Metadata for each sampled frame (a lazy ``TiffFrameMetadata`` sequence,
+              or an empty list when ``metadata`` is ``False``)
             - Loading info dict with keys:
                 - 'total_frames': Total frames in original TIFF
                 - 'loaded_frames': Number of frames actually loaded
@@ -96,9 +111,14 @@ def load_tiff(file_path, max_frames=None, metadata=True):
 
     frames = []
     frames_metadata = []
+    page_index = None
+    if metadata:
+        from vasoanalyzer.io.tiff_index import TiffFrameMetadata, load_tiff_page_index
+
+        page_index = load_tiff_page_index(file_path, cache_dir=index_dir)
 
     with tifffile.TiffFile(file_path) as tif:
-        total_frames = len(tif.pages)
+        total_frames = page_index.page_count if page_index is not None else len(tif.pages)
 
         # Determine sampling strategy
         if max_frames is None or total_frames <= max_frames:
@@ -117,42 +137,49 @@ def load_tiff(file_path, max_frames=None, metadata=True):
             "is_subsampled": skip > 1,
         }
 
-        if not metadata:
+        if indices:
+            # Frames are views into the one decoded array; copying each frame
+            # would briefly hold the whole stack twice.
             frames_array = tif.asarray(key=indices)
-            if frames_array.ndim == 2:
-                frames.append(np.array(frames_array))
+            if len(indices) == 1:
+                frames.append(frames_array)
             else:
-                for frame in frames_array:
-                    frames.append(np.array(frame))
-            log.info("Loaded %d frames (total: %d, stride: %d)", len(frames), total_frames, skip)
-            return frames, frames_metadata, loading_info
-
-        for i in indices:
-            page = tif.pages[i]
-            frame = page.asarray()
-            frames.append(frame)
-
-            frame_meta = {}
-            frame_meta["index"] = i
-            frame_meta["shape"] = frame.shape
-            frame_meta["dtype"] = str(frame.dtype)
-
-            if hasattr(page, "description") and page.description:
-                parsed = parse_description(page.description)
-                if parsed:
-                    frame_meta.update(parsed)
-                else:
-                    frame_meta["description_raw"] = page.description
+                frames.extend(frames_array)
 
-            for tag in page.tags.values():
-                frame_meta[tag.name] = tag.value
-
-            frames_metadata.append(frame_meta)
+    if page_index is not None:
+        frames_metadata = TiffFrameMetadata(page_index, indices)
 
     log.info("Loaded %d frames (total: %d, stride: %d)", len(frames), total_frames, skip)
     return frames, frames_metadata, loading_info
 
 
+def open_tiff_stack(file_path, *, index_dir=None, **source_options):
+    """Open a TIFF stack for viewing without decoding its pages.
+
+    Returns the same triple as :func:`load_tiff` for a full load, except that
+    the frames are a :class:`TiffPageSource` decoding pages on demand and the
+    metadata is read through that source's file handle.  The caller owns the
+    source and must close it.  ``source_options`` are passed to
+    :class:`TiffPageSource`.
+    """
+
+    from vasoanalyzer.io.tiff_index import TiffFrameMetadata, load_tiff_page_index
+
+    log.info("Opening TIFF stack %s", file_path)
+    page_index = load_tiff_page_index(file_path, cache_dir=index_dir)
+    source = TiffPageSource(file_path, page_index=page_index, **source_options)
+    indices = list(range(len(source)))
+    frames_metadata = TiffFrameMetadata(page_index, indices, reader=source.page_metadata)
+    loading_info = {
+        "total_frames": len(indices),
+        "loaded_frames": len(indices),
+        "frame_stride": 1,
+        "frame_indices": indices,
+        "is_subsampled": False,
+    }
+    return source, frames_metadata, loading_info
+
+
 def load_tiff_preview(file_path, max_frames=300):
     """Fast loading without metadata for quick previews."""
 
@@ -174,6 +201,11 @@ def resolve_frame_times(
 ) -> FrameTimeResult:
     """Resolve frame timing with canonical timebase rules."""
 
+    timing_metadata = getattr(frames_metadata, "timing_metadata", None)
+    if callable(timing_metadata):
+        # Lazy TIFF metadata: read timestamps from the page index, not every IFD.
+        frames_metadata = timing_metadata()
+
     info = {
         "frames_metadata": frames_metadata or [],
         "n_frames": n_frames,
@@ -190,4 +222,192 @@ def resolve_frame_times(
     )
 
 
-__all__ = ["load_tiff", "load_tiff_preview", "resolve_frame_times"]
+class TiffPageSource:
+    """Lazily decoded view of a TIFF stack.
+
+    The file is opened once and pages are decoded on demand (compressed pages
+    included) into a byte-budgeted LRU.  Each access schedules a background
+    prefetch of the pages ahead of and behind the playhead in the direction of
+    travel, so sequential playback usually hits the cache.  Memory use is
+    bounded by ``cache_bytes`` regardless of stack size.  Passing a
+    ``TiffPageIndex`` for the file skips the initial IFD walk.
+
+    Implements the ``StackSource`` protocol used by the TIFF viewer.
+    """
+
+    def __init__(
+        self,
+        file_path,
+        *,
+        cache_bytes: int = DEFAULT_DECODE_CACHE_MB * 1024 * 1024,
+        prefetch_ahead: int = DEFAULT_PREFETCH_AHEAD,
+        prefetch_behind: int = DEFAULT_PREFETCH_BEHIND,
+        source_kind: str = "tiff",
+        page_index=None,
+    ) -> None:
+        self.path = str(file_path)
+        self._source_kind = source_kind
+        self._tif = tifffile.TiffFile(self.path)
+        self._tif.pages.cache = False
+        self._io_lock = threading.RLock()
+        # A matching TiffPageIndex lets pages be located without walking the IFD chain.
+        if page_index is not None and page_index.matches(self.path):
+            self._page_index = page_index
+            self._page_count = page_index.page_count
+        else:
+            self._page_index = None
+            self._page_count = len(self._tif.pages)
+
+        self._cache: OrderedDict[int, np.ndarray] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_bytes = 0
+        self._max_cache_bytes = max(0, int(cache_bytes))
+
+        self._prefetch_ahead = max(0, int(prefetch_ahead))
+        self._prefetch_behind = max(0, int(prefetch_behind))
+        self._last_index: int | None = None
+        self._pending: list[int] = []
+        self._wake = threading.Condition()
+        self._closed = False
+        self._worker: threading.Thread | None = None
+        if self._prefetch_ahead or self._prefetch_behind:
+            self._worker = threading.Thread(
+                target=self._prefetch_loop, name="TiffPageSourcePrefetch", daemon=True
+            )
+            self._worker.start()
+
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return self._page_count
+
+    def __getitem__(self, page_index: int) -> np.ndarray:
+        frame = self.get_frame(page_index)
+        if frame is None:
+            raise IndexError(page_index)
+        return frame
+
+    def __enter__(self) -> "TiffPageSource":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def source_kind(self) -> str:
+        return self._source_kind
+
+    @property
+    def cached_bytes(self) -> int:
+        return self._cache_bytes
+
+    def get_frame(self, page_index: int):
+        """Return page ``page_index`` as an ndarray, or ``None`` when out of range."""
+
+        try:
+            idx = int(page_index)
+        except (TypeError, ValueError):
+            return None
+        if self._closed or idx < 0 or idx >= self._page_count:
+            return None
+        frame = self._cached(idx)
+        if frame is None:
+            frame = self._decode(idx)
+            self._store(idx, frame)
+        self._schedule_prefetch(idx)
+        return frame
+
+    def page_metadata(self, page_index: int) -> dict:
+        """Full metadata for one page, read through this source's open handle."""
+
+        from vasoanalyzer.io.tiff_index import read_page_metadata
+
+        with self._io_lock:
+            return read_page_metadata(self._tif, self._page_index, int(page_index))
+
+    def close(self) -> None:
+        """Stop the prefetch thread and release the file handle."""
+
+        with self._wake:
+            self._closed = True
+            self._pending = []
+            self._wake.notify_all()
+        if self._worker is not None and self._worker is not threading.current_thread():
+            self._worker.join(timeout=2.0)
+        with self._io_lock:
+            self._tif.close()
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_bytes = 0
+
+    # ------------------------------------------------------------------
+    def _decode(self, idx: int) -> np.ndarray:
+        with self._io_lock:
+            if self._page_index is not None:
+                self._tif.filehandle.seek(int(self._page_index.offsets[idx]))
+                page = tifffile.TiffPage(self._tif, index=idx)
+            else:
+                page = self._tif.pages[idx]
+        # The lock only guards file reads; decompression runs unlocked.
+        return page.asarray(lock=self._io_lock)
+
+    def _cached(self, idx: int) -> np.ndarray | None:
+        with self._cache_lock:
+            frame = self._cache.get(idx)
+            if frame is not None:
+                self._cache.move_to_end(idx)
+            return frame
+
+    def _store(self, idx: int, frame: np.ndarray) -> None:
+        size = int(frame.nbytes)
+        if size > self._max_cache_bytes:
+            return
+        with self._cache_lock:
+            previous = self._cache.pop(idx, None)
+            if previous is not None:
+                self._cache_bytes -= int(previous.nbytes)
+            self._cache[idx] = frame
+            self._cache_bytes += size
+            while self._cache and self._cache_bytes > self._max_cache_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes -= int(evicted.nbytes)
+
+    def _schedule_prefetch(self, idx: int) -> None:
+        if self._worker is None:
+            return
+        step = -1 if self._last_index is not None and idx < self._last_index else 1
+        self._last_index = idx
+        order = [idx + step * k for k in range(1, self._prefetch_ahead + 1)]
+        order += [idx - step * k for k in range(1, self._prefetch_behind + 1)]
+        wanted = [i for i in order if 0 <= i < self._page_count]
+        with self._wake:
+            # Replace stale work so a seek does not wait on the old neighbourhood.
+            self._pending = wanted
+            self._wake.notify()
+
+    def _prefetch_loop(self) -> None:
+        while True:
+            with self._wake:
+                while not self._pending and not self._closed:
+                    self._wake.wait()
+                if self._closed:
+                    return
+                idx = self._pending.pop(0)
+            if self._cached(idx) is not None:
+                continue
+            try:
+                frame = self._decode(idx)
+            except Exception:
+                if self._closed:
+                    return
+                log.debug("Prefetch failed for page %d of %s", idx, self.path, exc_info=True)
+                continue
+            self._store(idx, frame)
+
+
+__all__ = [
+    "TiffPageSource",
+    "load_tiff",
+    "load_tiff_preview",
+    "open_tiff_stack",
+    "resolve_frame_times",
+]
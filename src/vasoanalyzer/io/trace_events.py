@@ -5,58 +5,66 @@
 
 from __future__ import annotations
 
-import csv
 import logging
 import os
 from collections.abc import Sequence
-from pathlib import Path
 from typing import Any
 
 import numpy as np
 import pandas as pd
 
-try:
-    from vasoanalyzer.services.cache_service import DataCache
-except ImportError:  # pragma: no cover - optional during bootstrap
-    DataCache = None
-
+from vasoanalyzer.core.events.values import NearestSampleIndex as _TraceTimeIndex
 from vasoanalyzer.core.timebase import (
     RANGE_TOL_S,
     TIME_EPS_S,
     derive_tiff_page_times,
     validate_and_normalize_events,
 )
-from vasoanalyzer.io.events import _safe_read_events_csv, _standardize_headers, find_matching_event_file
+from vasoanalyzer.io.events import (
+    _standardize_headers,
+    find_matching_event_file,
+    read_events_dataframe,
+)
 from vasoanalyzer.io.traces import load_trace, merge_traces
 
 
 def _read_event_dataframe(path: str, *, cache: Any | None = None) -> pd.DataFrame:
     """Return ``path`` loaded into a DataFrame with normalized headers."""
-    with open(path, encoding="utf-8-sig") as f:
-        sample = f.read(1024)
-        try:
-            delimiter = csv.Sniffer().sniff(sample).delimiter
-        except csv.Error:
-            if "," in sample:
-                delimiter = ","
-            elif "\t" in sample:
-                delimiter = "\t"
-            else:
-                delimiter = ";"
-
-    def _load_csv(p: str | Path) -> pd.DataFrame:
-        return _safe_read_events_csv(p, delimiter=delimiter)
-
-    if cache is not None and DataCache is not None:
-        df = cache.read_dataframe(path, loader=_load_csv)
-    else:
-        df = _load_csv(path)
+    df = read_events_dataframe(path, cache=cache)
     return _standardize_headers(df)
 
 
 log = logging.getLogger(__name__)
 
 
+def _integer_key_index(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return sorted integer keys and the trace row each maps to.
+
+    Non-finite values are skipped and, as with a dict built row by row, the
+    last row wins for duplicate keys.
+    """
+
+    rows = np.flatnonzero(np.isfinite(values))
+    keys = values[rows].astype(np.int64)
+    keys_rev = keys[::-1]
+    unique_keys, first_rev = np.unique(keys_rev, return_index=True)
+    return unique_keys, rows[::-1][first_rev]
+
+
+def _lookup_rows(keys: np.ndarray, rows: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """Return the mapped row for each finite ``query`` key, or -1 when absent."""
+
+    result = np.full(query.shape, -1, dtype=np.int64)
+    finite = np.isfinite(query)
+    if not keys.size or not finite.any():
+        return result
+    wanted = np.round(query[finite]).astype(np.int64)
+    pos = np.minimum(np.searchsorted(keys, wanted), keys.size - 1)
+    hit = keys[pos] == wanted
+    result[np.flatnonzero(finite)[hit]] = rows[pos[hit]]
+    return result
+
+
 def load_trace_and_events(
     trace_path: str | Sequence[str],
     events_path: str | Sequence[str] | pd.DataFrame | None = None,
@@ -253,14 +261,17 @@ def load_trace_and_events(
     # if available, else Time (s) for legacy files). All other time views
     # (event CSV strings, TIFF metadata) map back onto this column.
     trace_time = df["Time (s)"].to_numpy(dtype=float)
+    time_index = _TraceTimeIndex(trace_time)
+    # Frame/page lookups run on sorted key arrays; the dict views are still
+    # published in extras/attrs for the snapshot and TIFF consumers.
+    frame_keys = frame_rows = np.empty(0, dtype=np.int64)
     frame_number_to_trace_idx: dict[int, int] = {}
     tiff_page_to_trace_idx: dict[int, int] = {}
     if "FrameNumber" in df.columns:
         # FrameNumber values in the trace CSV align with the events CSV "Frame" column.
         frame_numbers = pd.to_numeric(df["FrameNumber"], errors="coerce")
-        frame_number_to_trace_idx = {
-            int(fn): int(i) for i, fn in enumerate(frame_numbers.to_numpy()) if pd.notna(fn)
-        }
+        frame_keys, frame_rows = _integer_key_index(frame_numbers.to_numpy(dtype=float))
+        frame_number_to_trace_idx = dict(zip(frame_keys.tolist(), frame_rows.tolist(), strict=True))
         log.info(
             "Import: Prepared %d frame→trace index mappings from trace CSV",
             len(frame_number_to_trace_idx),
@@ -271,9 +282,8 @@ def load_trace_and_events(
         if "Saved" in df.columns:
             saved_mask = pd.to_numeric(df["Saved"], errors="coerce").fillna(0) > 0
             tiff_pages = tiff_pages.where(saved_mask)
-        tiff_page_to_trace_idx = {
-            int(tp): int(i) for i, tp in enumerate(tiff_pages.to_numpy()) if pd.notna(tp)
-        }
+        page_keys, page_rows = _integer_key_index(tiff_pages.to_numpy(dtype=float))
+        tiff_page_to_trace_idx = dict(zip(page_keys.tolist(), page_rows.tolist(), strict=True))
         log.info(
             "Import: Prepared %d TIFF-page→trace index mappings from trace CSV",
             len(tiff_page_to_trace_idx),
@@ -335,16 +345,6 @@ def load_trace_and_events(
         result.loc[numeric.loc[valid_mask].index] = mapped
         return result
 
-    def _nearest_trace_index(target: float) -> int:
-        arr_t = df["Time (s)"].to_numpy(dtype=float)
-        valid_mask = np.isfinite(arr_t)
-        if not valid_mask.any():
-            return 0
-        indices = np.flatnonzero(valid_mask)
-        arr_valid = arr_t[indices]
-        pos = int(np.argmin(np.abs(arr_valid - target)))
-        return int(indices[pos])
-
     working_df = events_df.copy()
 
     label_col = "EventLabel" if "EventLabel" in working_df.columns else working_df.columns[0]
@@ -393,24 +393,13 @@ def load_trace_and_events(
 
     resolved_times = pd.Series(np.nan, index=working_df.index, dtype=float)
     if frame_series is not None and frame_number_to_trace_idx:
-        mapped_idx: list[int | None] = []
-        for val in frame_series.to_numpy():
-            idx = None
-            if pd.notna(val):
-                idx = frame_number_to_trace_idx.get(int(round(float(val))))
-            mapped_idx.append(idx)
-        mapped_idx_series = pd.Series(mapped_idx, index=working_df.index, dtype="Int64")
+        mapped_idx = _lookup_rows(frame_keys, frame_rows, frame_series.to_numpy(dtype=float))
+        matched = mapped_idx >= 0
         extras["frame_map_used"] = True
-        extras["frame_map_rows"] = int(mapped_idx_series.notna().sum())
-        extras["frame_map_missing"] = int(mapped_idx_series.isna().sum())
+        extras["frame_map_rows"] = int(matched.sum())
+        extras["frame_map_missing"] = int((~matched).sum())
         if trace_time.size:
-            mapped_times = []
-            for idx_val in mapped_idx_series.tolist():
-                if idx_val is None or idx_val < 0 or idx_val >= len(trace_time):
-                    mapped_times.append(np.nan)
-                else:
-                    mapped_times.append(float(trace_time[idx_val]))
-            resolved_times.loc[mapped_idx_series.notna()] = mapped_times
+            resolved_times.loc[matched] = trace_time[mapped_idx[matched]]
     else:
         resolved_times = resolved_times.combine_first(time_series)
         if approx_frame_times is not None:
@@ -480,15 +469,15 @@ def load_trace_and_events(
     else:
         raw_frames = None
 
+    # One batched nearest-sample lookup serves diameters and frame fallback.
+    nearest_rows = time_index.nearest(times_series.to_numpy(dtype=float))
+
     arr_id = df["Inner Diameter"].to_numpy(dtype=float)
     if "DiamBefore" in working_df.columns:
         diam_series = pd.to_numeric(working_df["DiamBefore"], errors="coerce")
         diam = diam_series.astype(float).tolist()
     else:
-        diam = []
-        for tv in times:
-            idx = _nearest_trace_index(tv)
-            diam.append(float(arr_id[idx]))
+        diam = arr_id[nearest_rows].tolist()
 
     if "OuterDiamBefore" in working_df.columns:
         od_series = pd.to_numeric(working_df["OuterDiamBefore"], errors="coerce")
@@ -496,11 +485,9 @@ def load_trace_and_events(
     elif "Outer Diameter" in df.columns:
         arr_od = df["Outer Diameter"].to_numpy(dtype=float)
         if arr_od.size == len(arr_id):
-            for tv in times:
-                idx = _nearest_trace_index(tv)
-                od_diam.append(float(arr_od[idx]))
+            od_diam = arr_od[nearest_rows].tolist()
 
-    resolved_frames = [_nearest_trace_index(tv) for tv in times]
+    resolved_frames = nearest_rows.tolist()
     if raw_frames is None:
         frames = resolved_frames
     else:
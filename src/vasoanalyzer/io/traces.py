@@ -9,8 +9,11 @@ from __future__ import annotations
 
 import csv
 import logging
+import os
 import re
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
@@ -243,19 +246,93 @@ def load_trace(file_path, *, cache: Any | None = None):
     return df
 
 
+_OFFSET_COLUMNS = ("Time (s)", "FrameNumber", "TiffPage")
+
+
+@dataclass(slots=True)
+class _Segment:
+    """A loaded trace segment with the statistics needed to place it."""
+
+    path: str
+    df: pd.DataFrame
+    columns: dict[str, np.ndarray]
+    ranges: dict[str, tuple[float, float] | None]
+    dt: float
+
+
+def _finite_range(values: np.ndarray) -> tuple[float, float] | None:
+    """Return ``(min, max)`` over the finite entries of ``values``."""
+
+    if values.size == 0:
+        return None
+    finite = values[np.isfinite(values)] if values.dtype.kind == "f" else values
+    if finite.size == 0:
+        return None
+    return float(finite.min()), float(finite.max())
+
+
+def _median_positive_step(values: np.ndarray) -> float:
+    finite = values[np.isfinite(values)] if values.dtype.kind == "f" else values
+    diffs = np.diff(finite)
+    diffs = diffs[diffs > 0]
+    if diffs.size:
+        return float(np.median(diffs))
+    return 0.0
+
+
+def _load_segment(path: str, cache: Any | None) -> _Segment:
+    df = load_trace(path, cache=cache)
+    columns: dict[str, np.ndarray] = {}
+    ranges: dict[str, tuple[float, float] | None] = {}
+    for name in _OFFSET_COLUMNS:
+        if name not in df.columns:
+            continue
+        values = pd.to_numeric(df[name], errors="coerce").to_numpy()
+        columns[name] = values
+        ranges[name] = _finite_range(values)
+    dt = _median_positive_step(columns["Time (s)"])
+    return _Segment(path=path, df=df, columns=columns, ranges=ranges, dt=dt)
+
+
+def _merge_column(segments: list[_Segment], name: Any, total: int) -> Any:
+    """Concatenate one column across segments into a single preallocated array."""
+
+    parts = [seg.df[name] if name in seg.df.columns else None for seg in segments]
+    dtypes = [part.dtype for part in parts if part is not None]
+    if all(isinstance(dtype, np.dtype) and dtype.kind in "biuf" for dtype in dtypes):
+        dtype = np.result_type(*dtypes)
+        if len(dtypes) < len(parts):
+            dtype = np.result_type(dtype, np.float64)
+        out = np.empty(total, dtype=dtype)
+        start = 0
+        for seg, part in zip(segments, parts, strict=True):
+            stop = start + len(seg.df.index)
+            out[start:stop] = np.nan if part is None else part.to_numpy()
+            start = stop
+        return out
+    filled = [
+        part if part is not None else pd.Series(np.nan, index=pd.RangeIndex(len(seg.df.index)))
+        for seg, part in zip(segments, parts, strict=True)
+    ]
+    return pd.concat(filled, ignore_index=True).array
+
+
 def merge_traces(
     trace_paths: Sequence[str],
     *,
     cache: Any | None = None,
+    max_workers: int | None = None,
 ) -> pd.DataFrame:
     """Merge multiple trace CSVs into one continuous dataset.
 
     Files are appended in the provided order with time, frame, and TIFF indices
-    offset so they remain strictly increasing across segments.
+    offset so they remain strictly increasing across segments.  Segments are
+    loaded concurrently and written straight into preallocated output columns.
 
     Args:
         trace_paths: Ordered collection of CSV paths to merge.
         cache: Optional cache for faster repeated reads.
+        max_workers: Thread count for segment loading (defaults to CPU count).
 
     Returns:
         Merged trace dataframe with provenance stored in ``attrs``:
@@ -266,115 +343,115 @@ def merge_traces(
         raise ValueError("trace_paths must contain at least one file")
 
     normalized_paths = [str(p) for p in trace_paths]
-    merged_frames: list[pd.DataFrame] = []
-    merged_paths: list[str] = []
-    segments: list[dict[str, object]] = []
+    loaded: list[_Segment] = []
     merge_warnings: list[str] = []
     skipped: list[dict[str, str]] = []
 
+    workers = max(1, min(len(normalized_paths), max_workers or os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_load_segment, path, cache) for path in normalized_paths]
+        for path, future in zip(normalized_paths, futures, strict=True):
+            try:
+                loaded.append(future.result())
+            except Exception as exc:  # Skip malformed files but record why
+                msg = f"Skipped {os.path.basename(path)}: {exc}"
+                log.warning(msg, exc_info=True)
+                merge_warnings.append(msg)
+                skipped.append({"path": path, "reason": str(exc)})
+
+    if not loaded:
+        raise ValueError("No valid trace files found to merge")
+
+    # Offsets depend only on per-segment ranges, so place every segment first.
     time_offset = 0.0
     frame_offset: float | None = None
     tiff_offset: float | None = None
-    canonical_source: str | None = None
-    total_neg_inner = 0
-    total_neg_outer = 0
-
-    def _estimate_dt(values: pd.Series | np.ndarray) -> float:
-        arr = pd.to_numeric(values, errors="coerce")
-        diffs = np.diff(arr[np.isfinite(arr)])
-        diffs = diffs[diffs > 0]
-        if diffs.size:
-            return float(np.nanmedian(diffs))
-        return 0.0
-
-    for idx, path in enumerate(normalized_paths):
-        try:
-            df = load_trace(path, cache=cache).copy()
-        except Exception as exc:  # Skip malformed files but record why
-            msg = f"Skipped {os.path.basename(path)}: {exc}"
-            log.warning(msg, exc_info=True)
-            merge_warnings.append(msg)
-            skipped.append({"path": path, "reason": str(exc)})
-            continue
-
-        merged_paths.append(path)
-
-        if canonical_source is None:
-            canonical_source = df.attrs.get("canonical_time_source", "Time (s)")
-
-        time_values = pd.to_numeric(df["Time (s)"], errors="coerce")
-        dt = _estimate_dt(time_values)
-        t_start = float(np.nanmin(time_values)) if np.isfinite(np.nanmin(time_values)) else 0.0
+    shifts: list[dict[str, float]] = []
+    segments: list[dict[str, object]] = []
+    for idx, seg in enumerate(loaded):
+        time_range = seg.ranges.get("Time (s)")
+        t_start = time_range[0] if time_range else 0.0
         shift = 0.0
         if idx > 0:
             shift = time_offset - t_start
-            if dt > 0:
-                shift += dt
-            df["Time (s)"] = time_values + shift
+            if seg.dt > 0:
+                shift += seg.dt
 
         frame_shift = 0
-        if "FrameNumber" in df.columns:
-            frame_vals = pd.to_numeric(df["FrameNumber"], errors="coerce")
-            f_start = float(np.nanmin(frame_vals)) if np.isfinite(np.nanmin(frame_vals)) else 0.0
-            if idx > 0 and frame_offset is not None and np.isfinite(frame_offset):
+        frame_range = seg.ranges.get("FrameNumber")
+        if "FrameNumber" in seg.columns:
+            f_start = frame_range[0] if frame_range else 0.0
+            if idx > 0 and frame_offset is not None:
                 frame_shift = int(frame_offset - f_start + 1)
-            df["FrameNumber"] = frame_vals + frame_shift
-            frame_offset_candidate = (
-                float(np.nanmax(df["FrameNumber"]))
-                if np.isfinite(np.nanmax(df["FrameNumber"]))
-                else None
-            )
-            if frame_offset_candidate is not None and np.isfinite(frame_offset_candidate):
-                frame_offset = frame_offset_candidate
+            if frame_range is not None:
+                frame_offset = frame_range[1] + frame_shift
 
         tiff_shift = 0
-        if "TiffPage" in df.columns:
-            tiff_vals = pd.to_numeric(df["TiffPage"], errors="coerce")
-            tp_start = float(np.nanmin(tiff_vals)) if np.isfinite(np.nanmin(tiff_vals)) else 0.0
-            if idx > 0 and tiff_offset is not None and np.isfinite(tiff_offset):
+        tiff_range = seg.ranges.get("TiffPage")
+        if "TiffPage" in seg.columns:
+            tp_start = tiff_range[0] if tiff_range else 0.0
+            if idx > 0 and tiff_offset is not None:
                 tiff_shift = int(tiff_offset - tp_start + 1)
-            df["TiffPage"] = tiff_vals + tiff_shift
-            tiff_offset_candidate = (
-                float(np.nanmax(df["TiffPage"])) if np.isfinite(np.nanmax(df["TiffPage"])) else None
-            )
-            if tiff_offset_candidate is not None and np.isfinite(tiff_offset_candidate):
-                tiff_offset = tiff_offset_candidate
-
-        merged_frames.append(df)
-
-        t_end = (
-            float(np.nanmax(df["Time (s)"]))
-            if np.isfinite(np.nanmax(df["Time (s)"]))
-            else time_offset
-        )
-        time_offset = max(time_offset, t_end)
-
-        total_neg_inner += int(df.attrs.get("negative_inner_diameters", 0) or 0)
-        total_neg_outer += int(df.attrs.get("negative_outer_diameters", 0) or 0)
+            if tiff_range is not None:
+                tiff_offset = tiff_range[1] + tiff_shift
 
+        t_end = time_range[1] + shift if time_range else time_offset
+        time_offset = max(time_offset, t_end)
+        shifts.append({"Time (s)": shift, "FrameNumber": frame_shift, "TiffPage": tiff_shift})
         segments.append(
             {
-                "path": path,
-                "rows": int(len(df.index)),
+                "path": seg.path,
+                "rows": int(len(seg.df.index)),
                 "applied_time_offset": float(shift),
                 "applied_frame_offset": int(frame_shift) if frame_shift else 0,
                 "applied_tiff_offset": int(tiff_shift) if tiff_shift else 0,
                 "t_start": float(t_start),
                 "t_end": float(t_end),
-                "dt_median": float(dt),
+                "dt_median": float(seg.dt),
             }
         )
 
-    if not merged_frames:
-        raise ValueError("No valid trace files found to merge")
+    total = sum(len(seg.df.index) for seg in loaded)
+    column_order: dict[Any, None] = {}
+    for seg in loaded:
+        column_order.update(dict.fromkeys(seg.df.columns))
 
-    merged_df = pd.concat(merged_frames, ignore_index=True, sort=False)
-    merged_df.attrs["canonical_time_source"] = canonical_source or "Time (s)"
+    merged: dict[Any, Any] = {}
+    for name in column_order:
+        if name not in _OFFSET_COLUMNS:
+            merged[name] = _merge_column(loaded, name, total)
+            continue
+        parts = [seg.columns.get(name) for seg in loaded]
+        dtype = np.result_type(*(part for part in parts if part is not None))
+        if name == "Time (s)" or any(part is None for part in parts):
+            dtype = np.result_type(dtype, np.float64)
+        out = np.empty(total, dtype=dtype)
+        start = 0
+        for seg, part, shift_map in zip(loaded, parts, shifts, strict=True):
+            stop = start + len(seg.df.index)
+            if part is None:
+                out[start:stop] = np.nan
+            else:
+                np.add(part, shift_map[name], out=out[start:stop], casting="unsafe")
+            start = stop
+        merged[name] = out
+
+    merged_df = pd.DataFrame(merged, columns=list(column_order), copy=False)
+    first_attrs = loaded[0].df.attrs
+    if all(seg.df.attrs == first_attrs for seg in loaded[1:]):
+        merged_df.attrs.update(first_attrs)
+    merged_df.attrs["canonical_time_source"] = loaded[0].df.attrs.get(
+        "canonical_time_source", "Time (s)"
+    )
     merged_df.attrs["merged_requested_paths"] = normalized_paths
-    merged_df.attrs["merged_from_paths"] = merged_paths
+    merged_df.attrs["merged_from_paths"] = [seg.path for seg in loaded]
     merged_df.attrs["merged_segments"] = segments
-    merged_df.attrs["negative_inner_diameters"] = total_neg_inner
-    merged_df.attrs["negative_outer_diameters"] = total_neg_outer
+    merged_df.attrs["negative_inner_diameters"] = sum(
+        int(seg.df.attrs.get("negative_inner_diameters", 0) or 0) for seg in loaded
+    )
+    merged_df.attrs["negative_outer_diameters"] = sum(
+        int(seg.df.attrs.get("negative_outer_diameters", 0) or 0) for seg in loaded
+    )
     if merge_warnings:
         merged_df.attrs["merge_warnings"] = merge_warnings
     if skipped:
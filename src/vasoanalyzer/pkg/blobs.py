@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Container
 from hashlib import sha256
 from pathlib import Path
 from zipfile import ZipFile
 
-from .io_zip import write_bytes
+from . import paths
+from .io_zip import exists, write_file
 
 
 def compute_sha256(fs_path: Path) -> str:
@@ -15,9 +17,16 @@ def compute_sha256(fs_path: Path) -> str:
     return hasher.hexdigest()
 
 
-def add_blob_file(z: ZipFile, fs_path: Path) -> str:
+def add_blob_file(z: ZipFile, fs_path: Path, members: Container[str] | None = None) -> str:
+    """Store ``fs_path`` under its SHA-256 unless that blob is already present.
+
+    ``members`` is the caller's index of archive member names; without one the
+    archive's own name lookup is used.
+    """
+
     digest = compute_sha256(fs_path)
-    arc = f"datasets/_shared/blobs/{digest}"
-    if not any(info.filename == arc for info in z.infolist()):
-        write_bytes(z, arc, Path(fs_path).read_bytes(), stored=True)
+    arc = f"{paths.BLOBS_SHARED_DIR}/{digest}"
+    present = arc in members if members is not None else exists(z, arc)
+    if not present:
+        write_file(z, arc, Path(fs_path), stored=True)
     return digest
@@ -52,6 +52,7 @@ def export_project_to_package(
         package.set_events([])
 
     package.save_project_meta()
+    package.compact()
     return package
 
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+import shutil
+from pathlib import Path
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
 
 TEXT_SUFFIXES = {".json", ".jsonl", ".yaml", ".yml", ".md", ".csv"}
 
@@ -10,6 +12,26 @@ def write_bytes(z: ZipFile, arcname: str, data: bytes, stored: bool = False) ->
     z.writestr(arcname, data, compress_type=compress)
 
 
+def write_file(z: ZipFile, arcname: str, fs_path: Path, stored: bool = False) -> None:
+    """Stream ``fs_path`` into the archive without reading it into memory."""
+
+    info = ZipInfo.from_file(fs_path, arcname)
+    info.compress_type = ZIP_STORED if stored else ZIP_DEFLATED
+    with open(fs_path, "rb") as src, z.open(info, "w") as dst:
+        shutil.copyfileobj(src, dst, 1024 * 1024)
+
+
+def copy_member(src: ZipFile, dst: ZipFile, info: ZipInfo) -> None:
+    """Copy one specific member (``info``, not just its name) into ``dst``."""
+
+    target = ZipInfo(info.filename, date_time=info.date_time)
+    target.compress_type = info.compress_type
+    target.external_attr = info.external_attr
+    target.file_size = info.file_size
+    with src.open(info, "r") as reader, dst.open(target, "w") as writer:
+        shutil.copyfileobj(reader, writer, 1024 * 1024)
+
+
 def write_text(z: ZipFile, arcname: str, text: str) -> None:
     z.writestr(arcname, text.encode("utf-8"), compress_type=ZIP_DEFLATED)
 
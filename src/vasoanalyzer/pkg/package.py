@@ -1,16 +1,17 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator, MutableMapping
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
-from zipfile import ZIP_DEFLATED, ZipFile
+from typing import Any, Generic, TypeVar
+from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
 
 from . import paths
-from .blobs import add_blob_file, compute_sha256
+from .blobs import add_blob_file
 from .catalog import DatasetCatalog, DatasetEntry
-from .io_zip import exists, read_bytes, write_bytes, write_text
+from .io_zip import copy_member, exists, read_bytes, write_bytes, write_text
 from .models import (
     DatasetMeta,
     Event,
@@ -20,24 +21,87 @@ from .models import (
     ProjectMeta,
     RefEntry,
 )
+from .relink import RelinkTarget, locate_files
 
 APP_GENERATOR = {"app": "VasoAnalyzer", "version": "2.0.0"}
 
+# Members are rewritten by appending a new copy, so the archive is compacted
+# once superseded copies outweigh the live data (and pass this floor).
+COMPACT_MIN_STALE_BYTES = 1024 * 1024
+
+V = TypeVar("V")
+_UNLOADED: Any = object()
+
 
 def _generator_info() -> GeneratorInfo:
     return GeneratorInfo(**APP_GENERATOR)
 
 
+class _LazyMap(MutableMapping[str, V], Generic[V]):
+    """Mapping whose values are parsed from the archive on first access.
+
+    Keys are known up front from the member index; ``loader`` receives the
+    keys still pending and returns their values, so bulk access (``values``,
+    ``items``) opens the archive once.
+    """
+
+    def __init__(self, keys: Iterable[str], loader: Callable[[list[str]], dict[str, V]]):
+        self._data: dict[str, V] = dict.fromkeys(keys, _UNLOADED)
+        self._loader = loader
+
+    def _load(self, keys: Iterable[str]) -> None:
+        pending = [key for key in keys if self._data.get(key, None) is _UNLOADED]
+        if pending:
+            self._data.update(self._loader(pending))
+
+    def __getitem__(self, key: str) -> V:
+        self._load([key])
+        return self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def loaded_keys(self) -> list[str]:
+        """Return the keys whose values have been parsed (or set) so far."""
+
+        return [key for key, value in self._data.items() if value is not _UNLOADED]
+
+    def __setitem__(self, key: str, value: V) -> None:
+        self._data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def values(self):
+        self._load(list(self._data))
+        return super().values()
+
+    def items(self):
+        self._load(list(self._data))
+        return super().items()
+
+
 class VasoPackage:
     def __init__(self, path: Path):
         self.path = Path(path)
         self.manifest: Manifest = Manifest(generator=_generator_info(), summary=ManifestSummary())
         self.project: ProjectMeta = ProjectMeta()
-        self.datasets: dict[str, DatasetMeta] = {}
-        self.refs: dict[str, list[RefEntry]] = {}
+        self.datasets: MutableMapping[str, DatasetMeta] = {}
+        self.refs: MutableMapping[str, list[RefEntry]] = {}
         self.events: list[Event] = []
         self.catalog: DatasetCatalog = DatasetCatalog()
         self.linkmap: dict[str, str] = {}
+        # Latest ZipInfo per member name, plus compressed bytes held by live
+        # members and by copies they superseded.
+        self._members: dict[str, ZipInfo] = {}
+        self._live_bytes = 0
+        self._stale_bytes = 0
 
     @classmethod
     def create(cls, path: str | Path, title: str = "") -> VasoPackage:
@@ -52,26 +116,25 @@ class VasoPackage:
             write_text(z, "README.md", "# Vaso Project\n")
             write_text(z, paths.LINKMAP_JSON, _dump_json({}))
             write_bytes(z, paths.CATALOG_SQLITE, pkg.catalog.to_bytes(), stored=True)
+            pkg._index_members(z.infolist())
         return pkg
 
     @classmethod
     def open(cls, path: str | Path) -> VasoPackage:
         pkg = cls(Path(path))
         with ZipFile(pkg.path, "r") as z:
+            pkg._index_members(z.infolist())
             manifest_data = json.loads(read_bytes(z, paths.MANIFEST).decode("utf-8"))
             project_data = json.loads(read_bytes(z, paths.PROJECT_JSON).decode("utf-8"))
             pkg.manifest = Manifest(**_coerce_datetimes(manifest_data))
             pkg.project = ProjectMeta(**project_data)
-            dataset_ids = _scan_datasets(z)
-            for ds_id in dataset_ids:
-                dataset_meta = json.loads(
-                    read_bytes(z, f"datasets/{ds_id}/dataset.json").decode("utf-8")
-                )
-                pkg.datasets[ds_id] = DatasetMeta(**dataset_meta)
-                refs_path = f"datasets/{ds_id}/refs.json"
-                if exists(z, refs_path):
-                    ref_entries = json.loads(read_bytes(z, refs_path).decode("utf-8"))
-                    pkg.refs[ds_id] = [RefEntry(**entry) for entry in ref_entries]
+            # Dataset metadata and refs are parsed on first access.
+            dataset_ids = _scan_datasets(pkg._members)
+            pkg.datasets = _LazyMap(dataset_ids, pkg._load_dataset_meta)
+            pkg.refs = _LazyMap(
+                [ds_id for ds_id in dataset_ids if _refs_arc(ds_id) in pkg._members],
+                pkg._load_refs,
+            )
             events_text = read_bytes(z, paths.EVENTS_JSONL).decode("utf-8")
             if events_text.strip():
                 pkg.events = [
@@ -84,7 +147,6 @@ class VasoPackage:
             else:
                 for ds_id in dataset_ids:
                     pkg._update_catalog_entry(ds_id)
-        pkg._apply_linkmap()
         return pkg
 
     def add_dataset(
@@ -96,8 +158,8 @@ class VasoPackage:
     ) -> None:
         self.datasets[meta.id] = meta
         self.refs[meta.id] = refs or []
-        with ZipFile(self.path, "a", compression=ZIP_DEFLATED) as z:
-            write_text(z, f"datasets/{meta.id}/dataset.json", _dump_json(meta))
+        with self._append() as z:
+            write_text(z, _dataset_arc(meta.id), _dump_json(meta))
             write_text(
                 z,
                 f"datasets/{meta.id}/timebase.json",
@@ -131,8 +193,8 @@ class VasoPackage:
         rel_hint: str | None = None,
     ) -> RefEntry:
         fs_path = Path(fs_path)
-        with ZipFile(self.path, "a", compression=ZIP_DEFLATED) as z:
-            digest = add_blob_file(z, fs_path)
+        with self._append() as z:
+            digest = add_blob_file(z, fs_path, self._members)
         ref = RefEntry(
             sha256=digest,
             size=fs_path.stat().st_size,
@@ -142,18 +204,39 @@ class VasoPackage:
             rel_hint=rel_hint,
         )
         self.refs.setdefault(dataset_id, []).append(ref)
-        with ZipFile(self.path, "a", compression=ZIP_DEFLATED) as z:
+        with self._append() as z:
             self._write_refs(z, dataset_id)
         self._update_catalog_entry(dataset_id)
         self._touch_manifest()
         return ref
 
     def save_project_meta(self) -> None:
-        with ZipFile(self.path, "a", compression=ZIP_DEFLATED) as z:
+        with self._append() as z:
             write_text(z, paths.PROJECT_JSON, _dump_json(self.project))
             write_text(z, paths.MANIFEST, _dump_json(self.manifest))
             write_bytes(z, paths.CATALOG_SQLITE, self.catalog.to_bytes(), stored=True)
             write_text(z, paths.LINKMAP_JSON, _dump_json(self.linkmap))
+        if self._stale_bytes > max(COMPACT_MIN_STALE_BYTES, self._live_bytes):
+            self.compact()
+
+    def compact(self) -> int:
+        """Rewrite the archive keeping only the latest copy of each member.
+
+        Returns the number of bytes reclaimed.
+        """
+
+        size_before = self.path.stat().st_size
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with ZipFile(self.path, "r") as src, ZipFile(tmp_path, "w") as dst:
+                for info in self._members.values():
+                    copy_member(src, dst, info)
+                members = dst.infolist()
+            tmp_path.replace(self.path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        self._index_members(members)
+        return size_before - self.path.stat().st_size
 
     def verify(self) -> dict[str, Any]:
         problems: list[str] = []
@@ -161,12 +244,12 @@ class VasoPackage:
             for arc in (paths.MANIFEST, paths.PROJECT_JSON, paths.EVENTS_JSONL):
                 if not exists(z, arc):
                     problems.append(f"missing:{arc}")
-            dataset_ids = self.datasets or _scan_datasets(z)
+            dataset_ids = self.datasets or _scan_datasets(z.namelist())
             for ds_id in dataset_ids:
                 for arc in (
-                    f"datasets/{ds_id}/dataset.json",
+                    _dataset_arc(ds_id),
                     f"datasets/{ds_id}/timebase.json",
-                    f"datasets/{ds_id}/refs.json",
+                    _refs_arc(ds_id),
                 ):
                     if not exists(z, arc):
                         problems.append(f"missing:{arc}")
@@ -176,11 +259,10 @@ class VasoPackage:
         self.manifest.modified_utc = datetime.now(timezone.utc)
         self.manifest.summary.datasets = len(self.datasets)
         self.manifest.summary.events = len(self.events)
-        has_embedded = any(
-            any(ref.uri.startswith("vaso://blobs/") for ref in entries)
-            for entries in self.refs.values()
+        # The catalog tracks this per dataset, so untouched refs stay unparsed.
+        self.manifest.summary.has_embedded_blobs = any(
+            entry.has_embedded_blobs for entry in self.catalog.datasets.values()
         )
-        self.manifest.summary.has_embedded_blobs = has_embedded
         self.save_project_meta()
 
     def _write_events(self) -> None:
@@ -188,22 +270,62 @@ class VasoPackage:
         content = "\n".join(lines)
         if content:
             content += "\n"
-        with ZipFile(self.path, "a", compression=ZIP_DEFLATED) as z:
+        with self._append() as z:
             write_bytes(z, paths.EVENTS_JSONL, content.encode("utf-8"))
 
     def _write_refs(self, z: ZipFile, dataset_id: str) -> None:
         payload = [ref.model_dump(mode="json") for ref in self.refs.get(dataset_id, [])]
-        write_text(z, f"datasets/{dataset_id}/refs.json", _dump_json(payload))
+        write_text(z, _refs_arc(dataset_id), _dump_json(payload))
 
     def _rewrite_refs(self, dataset_id: str) -> None:
-        with ZipFile(self.path, "a", compression=ZIP_DEFLATED) as z:
+        with self._append() as z:
             self._write_refs(z, dataset_id)
 
-    def _update_catalog_entry(self, dataset_id: str) -> None:
+    @contextmanager
+    def _append(self) -> Iterator[ZipFile]:
+        with ZipFile(self.path, "a", compression=ZIP_DEFLATED) as z:
+            first_new = len(z.filelist)
+            yield z
+            self._index_members(z.filelist[first_new:], reset=False)
+
+    def _index_members(self, infos: Iterable[ZipInfo], *, reset: bool = True) -> None:
+        if reset:
+            self._members = {}
+            self._live_bytes = self._stale_bytes = 0
+        for info in infos:
+            previous = self._members.get(info.filename)
+            if previous is not None:
+                self._live_bytes -= previous.compress_size
+                self._stale_bytes += previous.compress_size
+            self._members[info.filename] = info
+            self._live_bytes += info.compress_size
+
+    def _read_json_members(self, arcnames: dict[str, str]) -> dict[str, Any]:
+        with ZipFile(self.path, "r") as z:
+            return {
+                key: json.loads(read_bytes(z, arc).decode("utf-8")) for key, arc in arcnames.items()
+            }
+
+    def _load_dataset_meta(self, dataset_ids: list[str]) -> dict[str, DatasetMeta]:
+        raw = self._read_json_members({ds_id: _dataset_arc(ds_id) for ds_id in dataset_ids})
+        return {ds_id: DatasetMeta(**payload) for ds_id, payload in raw.items()}
+
+    def _load_refs(self, dataset_ids: list[str]) -> dict[str, list[RefEntry]]:
+        raw = self._read_json_members({ds_id: _refs_arc(ds_id) for ds_id in dataset_ids})
+        loaded: dict[str, list[RefEntry]] = {}
+        for ds_id, entries in raw.items():
+            refs = [RefEntry(**entry) for entry in entries]
+            if self._apply_linkmap(refs):
+                self._update_catalog_entry(ds_id, refs)
+            loaded[ds_id] = refs
+        return loaded
+
+    def _update_catalog_entry(self, dataset_id: str, refs: list[RefEntry] | None = None) -> None:
         meta = self.datasets.get(dataset_id)
         if meta is None:
             return
-        refs = self.refs.get(dataset_id, [])
+        if refs is None:
+            refs = self.refs.get(dataset_id, [])
         entry = DatasetEntry(
             dataset_id=dataset_id,
             title=meta.name,
@@ -212,24 +334,25 @@ class VasoPackage:
         )
         self.catalog.register(entry)
 
-    def _apply_linkmap(self) -> None:
-        if not self.linkmap:
-            return
-        for dataset_id, ref_entries in self.refs.items():
-            changed = False
-            for ref in ref_entries:
-                key = ref.rel_hint or ref.uri
-                mapped = self.linkmap.get(key)
-                if not mapped:
-                    continue
-                if not ref.rel_hint:
-                    ref.rel_hint = ref.uri
-                ref.uri = mapped
-                changed = True
-            if changed:
-                self._update_catalog_entry(dataset_id)
+    def _apply_linkmap(self, ref_entries: list[RefEntry]) -> bool:
+        """Point ``ref_entries`` at their link map targets; True if any changed.
+
+        Called as each dataset's refs are parsed, so opening a package does not
+        read every refs.json up front.
+        """
 
-    def _resolve_reference(self, ref: RefEntry, pkg_dir: Path, root_path: Path) -> str | None:
+        changed = False
+        for ref in ref_entries:
+            mapped = self.linkmap.get(ref.rel_hint or ref.uri)
+            if not mapped:
+                continue
+            if not ref.rel_hint:
+                ref.rel_hint = ref.uri
+            ref.uri = mapped
+            changed = True
+        return changed
+
+    def _resolve_reference(self, ref: RefEntry, pkg_dir: Path) -> str | None:
         candidate_path = self._uri_to_path(ref.uri)
         if candidate_path is not None and candidate_path.exists():
             return candidate_path.resolve().as_posix()
@@ -246,31 +369,6 @@ class VasoPackage:
             if mapped_path.exists():
                 return mapped_path.resolve().as_posix()
 
-        return self._scan_for_checksum(root_path, ref)
-
-    def _scan_for_checksum(self, root_path: Path, ref: RefEntry) -> str | None:
-        if not root_path.is_dir():
-            return None
-
-        target_name = Path(ref.uri).name
-        try:
-            candidates = root_path.rglob(target_name)
-        except (OSError, ValueError):
-            return None
-
-        for candidate in candidates:
-            if not candidate.is_file():
-                continue
-            try:
-                if ref.size and candidate.stat().st_size != ref.size:
-                    continue
-            except OSError:
-                continue
-            try:
-                if _sha_matches(candidate, ref.sha256):
-                    return candidate.resolve().as_posix()
-            except OSError:
-                continue
         return None
 
     @staticmethod
@@ -283,32 +381,64 @@ class VasoPackage:
             return None
         return Path(uri)
 
-    def relink(self, root: str | Path) -> dict[str, str]:
+    def relink(
+        self,
+        root: str | Path,
+        *,
+        workers: int | None = None,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> dict[str, str]:
+        """Point external refs at their files, searching ``root`` for missing ones.
+
+        Refs that do not resolve directly (as given, beside the package, or via
+        the link map) are located together by one indexed walk of ``root``;
+        see :func:`~.relink.locate_files` for ``workers`` and
+        ``progress_callback``.
+        """
+
         root_path = Path(root)
         if not root_path.exists():
             raise FileNotFoundError(root)
 
         pkg_dir = self.path.parent
-        updates: dict[str, str] = {}
-
+        resolved: dict[tuple[str, int], str] = {}
+        targets: list[RelinkTarget] = []
         for dataset_id, ref_entries in list(self.refs.items()):
-            changed = False
-            for ref in ref_entries:
+            for position, ref in enumerate(ref_entries):
                 if ref.uri.startswith("vaso://blobs/"):
                     continue
-                resolved = self._resolve_reference(ref, pkg_dir, root_path)
-                if resolved is None:
-                    continue
-                original = ref.rel_hint or ref.uri
-                if resolved != ref.uri:
-                    if not ref.rel_hint:
-                        ref.rel_hint = ref.uri
-                    ref.uri = resolved
-                    updates[original] = resolved
-                    changed = True
-            if changed:
-                self._rewrite_refs(dataset_id)
-                self._update_catalog_entry(dataset_id)
+                direct = self._resolve_reference(ref, pkg_dir)
+                if direct is not None:
+                    resolved[(dataset_id, position)] = direct
+                else:
+                    targets.append(
+                        RelinkTarget(
+                            key=(dataset_id, position),
+                            name=Path(ref.uri).name,
+                            size=ref.size,
+                            sha256=ref.sha256,
+                            rel_hint=ref.rel_hint,
+                        )
+                    )
+        for key, path in locate_files(
+            root_path, targets, workers=workers, progress_callback=progress_callback
+        ).items():
+            resolved[key] = path.resolve().as_posix()
+
+        updates: dict[str, str] = {}
+        changed: set[str] = set()
+        for (dataset_id, position), path in resolved.items():
+            ref = self.refs[dataset_id][position]
+            original = ref.rel_hint or ref.uri
+            if path != ref.uri:
+                if not ref.rel_hint:
+                    ref.rel_hint = ref.uri
+                ref.uri = path
+                updates[original] = path
+                changed.add(dataset_id)
+        for dataset_id in changed:
+            self._rewrite_refs(dataset_id)
+            self._update_catalog_entry(dataset_id)
 
         if updates:
             self.linkmap.update(updates)
@@ -316,15 +446,19 @@ class VasoPackage:
         return updates
 
 
-def _scan_datasets(z: ZipFile) -> list[str]:
+def _dataset_arc(dataset_id: str) -> str:
+    return f"{paths.DATASETS_DIR}/{dataset_id}/dataset.json"
+
+
+def _refs_arc(dataset_id: str) -> str:
+    return f"{paths.DATASETS_DIR}/{dataset_id}/refs.json"
+
+
+def _scan_datasets(names: Iterable[str]) -> list[str]:
     ids: set[str] = set()
-    for info in z.infolist():
-        if (
-            info.filename.startswith("datasets/")
-            and info.filename.endswith("dataset.json")
-            and info.filename.count("/") >= 2
-        ):
-            ids.add(info.filename.split("/")[1])
+    for name in names:
+        if name.startswith("datasets/") and name.endswith("dataset.json") and name.count("/") >= 2:
+            ids.add(name.split("/")[1])
     return sorted(ids)
 
 
@@ -336,7 +470,3 @@ def _dump_json(value: Any) -> str:
     model_dump = getattr(value, "model_dump", None)
     payload = model_dump(mode="json", by_alias=True) if callable(model_dump) else value
     return json.dumps(payload, indent=2)
-
-
-def _sha_matches(path: Path, expected: str) -> bool:
-    return compute_sha256(path) == expected
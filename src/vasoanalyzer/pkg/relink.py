@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Hashable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+
+from .blobs import compute_sha256
+
+_MAX_HASH_WORKERS = 8
+
+
+@dataclass(frozen=True, slots=True)
+class RelinkTarget:
+    """A missing file to look for under a search root.
+
+    ``size`` and ``sha256`` narrow the candidates when known; ``rel_hint`` (the
+    file's old relative path) breaks ties between same-named files.
+    """
+
+    key: Hashable
+    name: str
+    size: int | None = None
+    sha256: str | None = None
+    rel_hint: str | None = None
+
+
+class FileIndex:
+    """Name -> [(path, size)] for the files under one search root."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, list[tuple[Path, int]]] = {}
+
+    @classmethod
+    def build(
+        cls,
+        root: str | Path,
+        names: Iterable[str] | None = None,
+        *,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> FileIndex:
+        """Walk ``root`` once, keeping only files called one of ``names``.
+
+        ``should_stop`` is polled per directory; when it returns True the walk
+        ends early and the index holds what was seen so far.
+        """
+
+        index = cls()
+        wanted = set(names) if names is not None else None
+        stack = [os.fspath(root)]
+        while stack:
+            if should_stop is not None and should_stop():
+                break
+            try:
+                scanner = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with scanner:
+                for entry in scanner:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif (wanted is None or entry.name in wanted) and entry.is_file():
+                            size = entry.stat().st_size
+                            index._entries.setdefault(entry.name, []).append(
+                                (Path(entry.path), size)
+                            )
+                    except OSError:
+                        continue
+        for entries in index._entries.values():
+            entries.sort()
+        return index
+
+    def candidates(self, name: str, size: int | None = None) -> list[Path]:
+        return [
+            path
+            for path, entry_size in self._entries.get(name, ())
+            if not size or entry_size == size
+        ]
+
+
+def locate_files(
+    root: str | Path,
+    targets: Iterable[RelinkTarget],
+    *,
+    workers: int | None = None,
+    progress_callback: Callable[[int, int], None] | None = None,
+    should_stop: Callable[[], bool] | None = None,
+) -> dict[Hashable, Path]:
+    """Find ``targets`` under ``root`` and return ``{target.key: path}``.
+
+    The root is walked once for all targets, and candidates are filtered by
+    size before any hashing.  Each remaining candidate is hashed at most once,
+    on a thread pool.  Targets that cannot be found are left out.
+    ``progress_callback(done, total)`` counts targets, each settled as soon as
+    its last candidate has been hashed.  ``should_stop`` is polled during the
+    walk and between hashes; once it returns True, hashes not yet started are
+    dropped and only the targets already settled are returned.
+    """
+
+    def _stopped() -> bool:
+        return should_stop is not None and should_stop()
+
+    targets = list(targets)
+    total = len(targets)
+    found: dict[Hashable, Path] = {}
+    done = 0
+
+    def _settle(target: RelinkTarget, options: list[Path]) -> None:
+        nonlocal done
+        match = _prefer_hint(options, target.rel_hint)
+        if match is not None:
+            found[target.key] = match
+        done += 1
+        if progress_callback is not None:
+            progress_callback(done, total)
+
+    if progress_callback is not None:
+        progress_callback(0, total)
+    if not targets or not Path(root).is_dir():
+        return found
+
+    index = FileIndex.build(root, {target.name for target in targets}, should_stop=should_stop)
+    if _stopped():
+        return found
+    # Candidate paths still waiting on a hash, per target that needs one.
+    waiting: dict[int, set[Path]] = {}
+    for position, target in enumerate(targets):
+        options = index.candidates(target.name, target.size)
+        if target.sha256 and options:
+            waiting[position] = set(options)
+        else:
+            _settle(target, options)
+
+    if not waiting:
+        return found
+    to_hash = sorted(set().union(*waiting.values()))
+    waiters: dict[Path, list[int]] = {}
+    for position, paths in waiting.items():
+        for path in paths:
+            waiters.setdefault(path, []).append(position)
+
+    digests: dict[Path, str | None] = {}
+    if workers is None:
+        workers = min(_MAX_HASH_WORKERS, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(to_hash)))) as pool:
+        futures = {pool.submit(_safe_sha256, path): path for path in to_hash}
+        for future in as_completed(futures):
+            if _stopped():
+                for pending_future in futures:
+                    pending_future.cancel()
+                break
+            path = futures[future]
+            digests[path] = future.result()
+            for position in waiters[path]:
+                pending = waiting[position]
+                pending.discard(path)
+                if pending:
+                    continue
+                target = targets[position]
+                options = index.candidates(target.name, target.size)
+                _settle(target, [p for p in options if digests[p] == target.sha256])
+    return found
+
+
+def _safe_sha256(path: Path) -> str | None:
+    try:
+        return compute_sha256(path)
+    except OSError:
+        return None
+
+
+def _prefer_hint(options: list[Path], rel_hint: str | None) -> Path | None:
+    if not options:
+        return None
+    if rel_hint and len(options) > 1:
+        hint_parts = Path(rel_hint.replace("\\", "/")).parts
+        hint_parts = tuple(part for part in hint_parts if part not in ("", ".", ".."))
+
+        def _shared_tail(path: Path) -> int:
+            count = 0
+            for mine, theirs in zip(reversed(path.parts), reversed(hint_parts), strict=False):
+                if mine != theirs:
+                    break
+                count += 1
+            return count
+
+        return max(options, key=_shared_tail)
+    return options[0]
@@ -18,6 +18,8 @@ __all__ = [
     "create_project_repository",
     "convert_project_repository",
     "SQLiteProjectRepository",
+    "run_batch_analysis",
+    "validate_project",
 ]
 
 _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
@@ -40,6 +42,11 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     ),
     "SQLiteProjectRepository": ("vasoanalyzer.services.project_service", "SQLiteProjectRepository"),
     "check_for_new_version": ("vasoanalyzer.services.version", "check_for_new_version"),
+    "run_batch_analysis": (
+        "vasoanalyzer.services.batch_analysis_service",
+        "run_batch_analysis",
+    ),
+    "validate_project": ("vasoanalyzer.services.validation_service", "validate_project"),
 }
 
 
@@ -0,0 +1,384 @@
+# VasoAnalyzer
+# Copyright © 2025 Osvaldo J. Vega Rodríguez
+# Licensed under CC BY-NC-SA 4.0 International
+# http://creativecommons.org/licenses/by-nc-sa/4.0/
+
+"""Project-wide pressure myography analysis with a persistent result cache.
+
+Every dataset in a project is converted to a :class:`MyographyDataset` and
+analysed with :func:`analyze_pressure_myography_v1` in a process pool.  Results
+are stored through :func:`sqlite_store.add_result` together with the key they
+were computed from: the parameter hash and the dataset's trace and events
+signatures.  A later run with the same parameters skips every dataset whose
+trace and events are unchanged and only recomputes the rest.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import re
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Literal
+
+import numpy as np
+
+from vasoanalyzer.analysis.contract import (
+    AnalysisParamsV1,
+    Event,
+    MyographyDataset,
+    build_dataset_from_arrays,
+)
+from vasoanalyzer.analysis.errors import AnalysisError
+from vasoanalyzer.analysis.metrics import AnalysisResultsV1, analyze_pressure_myography_v1
+from vasoanalyzer.analysis.provenance import resolve_analyzer_version, stable_params_hash
+from vasoanalyzer.storage import sqlite_store
+from vasoanalyzer.storage.sqlite import events as _events
+from vasoanalyzer.storage.sqlite import traces as _traces
+from vasoanalyzer.storage.validation import compute_dataset_signatures
+
+log = logging.getLogger(__name__)
+
+RESULT_KIND = "pressure_myography_v1"
+
+_PRESSURE_LABEL_RE = re.compile(r"(-?\d+(?:\.\d+)?)\s*mm\s*hg", re.IGNORECASE)
+
+ItemStatus = Literal["cached", "computed", "failed"]
+ProgressCallback = Callable[[int, int], None]
+
+__all__ = [
+    "RESULT_KIND",
+    "BatchItem",
+    "BatchReport",
+    "ResultKey",
+    "build_dataset_from_store",
+    "dataset_result_key",
+    "find_cached_results",
+    "run_batch_analysis",
+]
+
+
+@dataclass(frozen=True)
+class ResultKey:
+    """Inputs that fully determine an analysis result for one dataset."""
+
+    params_hash: str
+    trace_signature: str
+    events_signature: str
+
+    def as_dict(self) -> dict[str, str]:
+        return {
+            "params_hash": self.params_hash,
+            "trace_signature": self.trace_signature,
+            "events_signature": self.events_signature,
+        }
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    dataset_id: int
+    name: str
+    status: ItemStatus
+    result_id: int | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class BatchReport:
+    items: tuple[BatchItem, ...]
+
+    def _count(self, status: ItemStatus) -> int:
+        return sum(1 for item in self.items if item.status == status)
+
+    @property
+    def cached(self) -> int:
+        return self._count("cached")
+
+    @property
+    def computed(self) -> int:
+        return self._count("computed")
+
+    @property
+    def failed(self) -> int:
+        return self._count("failed")
+
+
+# ---------------------------------------------------------------------------
+# Cache keys
+
+
+def dataset_result_key(
+    store: sqlite_store.ProjectStore, dataset_id: int, params_hash: str
+) -> ResultKey:
+    """Return the cache key for ``dataset_id`` under ``params_hash``.
+
+    Signatures are always computed from the current rows, never read from the
+    dataset row (those columns are only refreshed by validation and can lag
+    behind event edits).  The trace signature comes from ``signature_cache``
+    while the trace's change token is unchanged; nothing is written.
+    """
+
+    sigs = compute_dataset_signatures(store.conn, dataset_id)
+    return ResultKey(params_hash, sigs.trace_signature, sigs.events_signature)
+
+
+def find_cached_results(
+    store: sqlite_store.ProjectStore,
+    keys: dict[int, ResultKey],
+    *,
+    version: str | None = None,
+) -> dict[int, int]:
+    """Return ``{dataset_id: result_id}`` for stored results matching ``keys``."""
+
+    if not keys:
+        return {}
+    version = version or resolve_analyzer_version()
+    rows = store.conn.execute(
+        """
+        SELECT id, dataset_id,
+               json_extract(payload_json, '$.key.params_hash'),
+               json_extract(payload_json, '$.key.trace_signature'),
+               json_extract(payload_json, '$.key.events_signature')
+          FROM result
+         WHERE kind = ? AND version = ?
+         ORDER BY id DESC
+        """,
+        (RESULT_KIND, version),
+    ).fetchall()
+    hits: dict[int, int] = {}
+    for result_id, dataset_id, params_hash, trace_sig, events_sig in rows:
+        key = keys.get(int(dataset_id))
+        if key is None or int(dataset_id) in hits:
+            continue
+        if (params_hash, trace_sig, events_sig) == (
+            key.params_hash,
+            key.trace_signature,
+            key.events_signature,
+        ):
+            hits[int(dataset_id)] = int(result_id)
+    return hits
+
+
+# ---------------------------------------------------------------------------
+# Dataset adapter
+
+
+def _column(frame, name: str) -> np.ndarray | None:
+    if name not in frame.columns:
+        return None
+    values = frame[name].to_numpy(dtype=np.float64, na_value=np.nan)
+    if not np.isfinite(values).any():
+        return None
+    return values
+
+
+def _pressure_target(label: str) -> float | None:
+    match = _PRESSURE_LABEL_RE.search(label)
+    return float(match.group(1)) if match else None
+
+
+def _events_from_labels(
+    times: Iterable[float],
+    labels: Iterable[str],
+    end_s: float,
+    params: AnalysisParamsV1,
+) -> tuple[Event, ...]:
+    """Turn point annotations into the interval events the analysis expects.
+
+    A label naming a pressure (``"60 mmHg"``) opens a ``PressureStep`` that
+    lasts until the next pressure label or the end of the trace.  A label
+    containing the passive marker value (``"passive"`` by default) becomes a
+    marker interval ending at the next annotation.
+    """
+
+    points = [(float(t), str(label)) for t, label in zip(times, labels, strict=False)]
+    passive_key = params.passive.passive_event_key
+    passive_value = params.passive.passive_event_value
+    step_starts = [i for i, (_t, label) in enumerate(points) if _pressure_target(label) is not None]
+
+    events: list[Event] = []
+    for n, i in enumerate(step_starts):
+        start, label = points[i]
+        stop = points[step_starts[n + 1]][0] if n + 1 < len(step_starts) else end_s
+        if stop <= start:
+            continue
+        payload = {"target_mmhg": _pressure_target(label)}
+        events.append(Event("PressureStep", start, stop, label=label, payload=payload))
+
+    for i, (start, label) in enumerate(points):
+        if passive_value.lower() not in label.lower():
+            continue
+        stop = points[i + 1][0] if i + 1 < len(points) else end_s
+        if stop > start:
+            events.append(
+                Event("Marker", start, stop, label=label, payload={passive_key: passive_value})
+            )
+    return tuple(events)
+
+
+def build_dataset_from_store(
+    store: sqlite_store.ProjectStore,
+    dataset_id: int,
+    params: AnalysisParamsV1,
+    *,
+    name: str | None = None,
+) -> MyographyDataset:
+    """Build the analysis dataset for ``dataset_id`` from its stored trace and events."""
+
+    trace = _traces.fetch_trace_dataframe(store.conn, dataset_id)
+    if trace.empty:
+        raise AnalysisError(f"Dataset {dataset_id} has no trace samples.")
+    time_s = trace["t_seconds"].to_numpy(dtype=np.float64)
+    inner = _column(trace, "inner_diam")
+    if inner is None:
+        raise AnalysisError(f"Dataset {dataset_id} has no inner diameter trace.")
+    keep = np.isfinite(time_s) & np.isfinite(inner)
+    pressure = _column(trace, "p_avg")
+    temperature = _column(trace, "temp")
+    outer = _column(trace, "outer_diam")
+    for optional in (pressure, temperature, outer):
+        if optional is not None:
+            keep &= np.isfinite(optional)
+    if not keep.any():
+        raise AnalysisError(f"Dataset {dataset_id} has no finite samples.")
+
+    events_df = _events.fetch_events_dataframe(store.conn, dataset_id)
+    events = _events_from_labels(
+        events_df.get("t_seconds", ()),
+        events_df.get("label", ()),
+        float(time_s[keep][-1]),
+        params,
+    )
+    meta = sqlite_store.get_dataset_meta(store, dataset_id) or {}
+    extra = meta.get("extra") if isinstance(meta.get("extra"), dict) else {}
+    return build_dataset_from_arrays(
+        dataset_id=str(dataset_id),
+        time_s=time_s[keep],
+        diameter_inner_um=inner[keep],
+        pressure_mmhg=pressure[keep] if pressure is not None else None,
+        temperature_c=temperature[keep] if temperature is not None else None,
+        diameter_outer_um=outer[keep] if outer is not None else None,
+        events=events,
+        metadata={"name": name or meta.get("name") or "", **extra},
+    )
+
+
+# ---------------------------------------------------------------------------
+# Execution
+
+
+def _analyze(
+    dataset: MyographyDataset, params: AnalysisParamsV1
+) -> tuple[str, AnalysisResultsV1 | None, str | None]:
+    # Runs in a worker process; a failure is reported for this dataset only,
+    # so one malformed trace cannot abort the whole batch.
+    try:
+        return dataset.dataset_id, analyze_pressure_myography_v1(dataset, params), None
+    except Exception as exc:
+        return dataset.dataset_id, None, _error_text(exc)
+
+
+def _error_text(exc: Exception) -> str:
+    if isinstance(exc, AnalysisError):
+        return str(exc)
+    return f"{type(exc).__name__}: {exc}"
+
+
+def _json_safe(value: Any) -> Any:
+    # JSON has no NaN/inf (SQLite's json_extract rejects them); store null.
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return _json_safe(value.tolist())
+    if isinstance(value, np.generic):
+        return _json_safe(value.item())
+    return value
+
+
+def _result_payload(result: AnalysisResultsV1, key: ResultKey) -> dict[str, Any]:
+    return {"key": key.as_dict(), "result": _json_safe(asdict(result))}
+
+
+def run_batch_analysis(
+    store: sqlite_store.ProjectStore,
+    params: AnalysisParamsV1 | None = None,
+    *,
+    dataset_ids: Iterable[int] | None = None,
+    max_workers: int | None = None,
+    force: bool = False,
+    progress: ProgressCallback | None = None,
+) -> BatchReport:
+    """Analyse every dataset in ``store`` (or ``dataset_ids``) and cache the results.
+
+    Datasets whose (params hash, trace signature, events signature) match a
+    stored result are reported as ``"cached"`` and not recomputed unless
+    ``force`` is set.  The remaining datasets are analysed in a process pool
+    of ``max_workers`` (default: all cores); with one worker or one pending
+    dataset the analysis runs in-process.
+    """
+
+    params = params or AnalysisParamsV1()
+    params_hash = stable_params_hash(params)
+    names = {int(row["id"]): str(row["name"]) for row in sqlite_store.iter_datasets(store)}
+    ids = list(names) if dataset_ids is None else [int(i) for i in dataset_ids]
+
+    keys = {ds_id: dataset_result_key(store, ds_id, params_hash) for ds_id in ids}
+    hits = {} if force else find_cached_results(store, keys)
+    items: dict[int, BatchItem] = {
+        ds_id: BatchItem(ds_id, names.get(ds_id, ""), "cached", result_id=result_id)
+        for ds_id, result_id in hits.items()
+    }
+
+    pending: list[MyographyDataset] = []
+    for ds_id in ids:
+        if ds_id in hits:
+            continue
+        try:
+            pending.append(build_dataset_from_store(store, ds_id, params, name=names.get(ds_id)))
+        except Exception as exc:
+            log.debug("Could not build dataset %s for analysis", ds_id, exc_info=True)
+            items[ds_id] = BatchItem(ds_id, names.get(ds_id, ""), "failed", error=_error_text(exc))
+
+    total = len(ids)
+    done = len(items)
+    if progress is not None:
+        progress(done, total)
+
+    def _record(dataset_id: str, result: AnalysisResultsV1 | None, error: str | None) -> None:
+        nonlocal done
+        ds_id = int(dataset_id)
+        name = names.get(ds_id, "")
+        if result is None:
+            items[ds_id] = BatchItem(ds_id, name, "failed", error=error)
+        else:
+            result_id = sqlite_store.add_result(
+                store,
+                ds_id,
+                RESULT_KIND,
+                result.provenance.version,
+                _result_payload(result, keys[ds_id]),
+            )
+            items[ds_id] = BatchItem(ds_id, name, "computed", result_id=result_id)
+        done += 1
+        if progress is not None:
+            progress(done, total)
+
+    workers = max_workers or os.cpu_count() or 1
+    workers = min(workers, len(pending))
+    if workers <= 1:
+        for dataset in pending:
+            _record(*_analyze(dataset, params))
+    else:
+        log.info("Analysing %d datasets across %d processes", len(pending), workers)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for outcome in pool.map(_analyze, pending, [params] * len(pending)):
+                _record(*outcome)
+
+    return BatchReport(tuple(items[ds_id] for ds_id in ids if ds_id in items))
@@ -1,4 +1,11 @@
-"""Local disk cache helpers for speeding up repeated data loads."""
+"""Local disk cache helpers for speeding up repeated data loads.
+
+Cached DataFrames are stored content-addressed under ``data/`` as one ``.npy``
+file per column so numeric columns can be memory-mapped on read.  A small
+SQLite index (``index.sqlite``) maps source paths to payloads and records size,
+last access time and hit count so the cache can be held to a byte budget with
+least-recently-used eviction.
+"""
 
 from __future__ import annotations
 
@@ -7,17 +14,29 @@ import json
 import os
 import platform
 import shutil
+import sqlite3
 import sys
-from collections.abc import Callable, Iterable
+import tempfile
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
+import numpy as np
 import pandas as pd
 
 __all__ = ["DataCache", "cache_dir_for_project", "DEFAULT_CACHE_LIMIT_GB", "get_cache_root"]
 
 DEFAULT_CACHE_LIMIT_GB = 25
 
+_INDEX_NAME = "index.sqlite"
+_LEGACY_INDEX_NAME = "index.json"
+_MANIFEST_NAME = "columns.json"
+_HASH_CHUNK_BYTES = 1 << 20
+_STAT_KEY_PREFIX = "s"
+
 
 def get_cache_root(app_name: str = "VasoAnalyzer") -> Path | None:
     """Return the system cache root when ``VASO_CACHE_MODE=system`` is set."""
@@ -87,30 +106,52 @@ def cache_dir_for_project(project_path: str | os.PathLike[str] | None) -> Path:
     return base / "cache"
 
 
-def _default_meta_path(cache_dir: Path) -> Path:
-    return cache_dir / "index.json"
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    path_key TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    sig TEXT NOT NULL,
+    content_key TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    content_key TEXT PRIMARY KEY,
+    format TEXT NOT NULL,
+    rel_path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_access REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries(last_access);
+CREATE INDEX IF NOT EXISTS idx_sources_content ON sources(content_key);
+"""
 
 
-def _safe_read_json(path: Path) -> dict:
-    if not path.exists():
-        return {}
-    try:
-        payload = json.loads(path.read_text())
-    except (OSError, json.JSONDecodeError):
-        return {}
-    return payload if isinstance(payload, dict) else {}
+def _signature(path: Path, version: int) -> str:
+    stat = path.stat()
+    return f"{stat.st_size}-{stat.st_mtime_ns}-v{version}"
 
 
-def _safe_write_json(path: Path, payload: dict) -> None:
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp.write_text(json.dumps(payload, indent=2, sort_keys=True))
-    tmp.replace(path)
+def _path_key(path: Path) -> str:
+    return hashlib.sha1(path.as_posix().encode("utf-8", "ignore")).hexdigest()
 
 
-def _signature(path: Path, version: int) -> str:
-    stat = path.stat()
-    return f"{stat.st_size}-{int(stat.st_mtime)}-v{version}"
+def _stat_key(path_key: str, sig: str) -> str:
+    """Return a provisional key for a source whose contents have not been hashed."""
+
+    digest = hashlib.blake2b(f"{path_key}:{sig}".encode(), digest_size=20)
+    return _STAT_KEY_PREFIX + digest.hexdigest()
+
+
+def _content_key(path: Path, version: int) -> str:
+    """Return a digest of the file bytes so identical files share one entry."""
+
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"v{version}:".encode())
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
 
 
 def _mirror_source(src: Path, dest: Path) -> Path:
@@ -124,14 +165,147 @@ def _mirror_source(src: Path, dest: Path) -> Path:
     return dest
 
 
+def _dir_size(path: Path) -> int:
+    if path.is_file():
+        return path.stat().st_size
+    return sum(item.stat().st_size for item in path.rglob("*") if item.is_file())
+
+
+def _remove_payload(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path)
+    elif path.exists():
+        path.unlink()
+
+
+def _publish_payload(staging: Path, dest: Path) -> None:
+    """Move a fully written payload from ``staging`` to ``dest``.
+
+    Payloads are keyed on their contents, so when a concurrent writer already
+    put ``dest`` in place its copy is kept and ``staging`` is discarded.
+    """
+
+    try:
+        os.replace(staging, dest)
+    except OSError:
+        with suppress(OSError):
+            _remove_payload(staging)
+        if not dest.exists():
+            raise
+
+
+# ---------------------------------------------------------------------------
+# Columnar payloads
+
+
+def _columnar_supported(df: pd.DataFrame) -> bool:
+    """Return True when ``df`` can round-trip through the per-column layout."""
+
+    if isinstance(df.columns, pd.MultiIndex) or isinstance(df.index, pd.MultiIndex):
+        return False
+    if df.columns.has_duplicates:
+        return False
+    for name in df.columns:
+        if not isinstance(name, str | int) or isinstance(name, bool):
+            return False
+    return not any(isinstance(dtype, pd.DatetimeTZDtype) for dtype in df.dtypes)
+
+
+def _save_array(path: Path, values: np.ndarray) -> None:
+    np.save(path, values, allow_pickle=values.dtype == object)
+
+
+def _encode_series(series: pd.Series, dest: Path, stem: str) -> dict[str, Any]:
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        _save_array(dest / f"{stem}.codes.npy", np.asarray(series.cat.codes))
+        _save_array(
+            dest / f"{stem}.categories.npy",
+            np.asarray(series.cat.categories.to_numpy(dtype=object), dtype=object),
+        )
+        return {"kind": "category", "file": stem, "ordered": bool(dtype.ordered)}
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufcmM":
+        _save_array(dest / f"{stem}.npy", series.to_numpy())
+        return {"kind": "array", "file": stem}
+    _save_array(dest / f"{stem}.npy", series.to_numpy(dtype=object))
+    return {"kind": "object", "file": stem, "dtype": str(dtype)}
+
+
+def _decode_series(spec: dict[str, Any], src: Path, mmap_mode: str | None) -> Any:
+    stem = spec["file"]
+    kind = spec.get("kind")
+    if kind == "category":
+        codes = np.load(src / f"{stem}.codes.npy")
+        categories = np.load(src / f"{stem}.categories.npy", allow_pickle=True)
+        return pd.Categorical.from_codes(
+            codes, categories=categories, ordered=bool(spec.get("ordered"))
+        )
+    if kind == "object":
+        values = np.load(src / f"{stem}.npy", allow_pickle=True)
+        dtype = spec.get("dtype", "object")
+        if dtype == "object":
+            return values
+        try:
+            return pd.array(values, dtype=dtype)
+        except (TypeError, ValueError):
+            return values
+    return np.load(src / f"{stem}.npy", mmap_mode=mmap_mode)
+
+
+def _write_columnar(df: pd.DataFrame, dest: Path) -> None:
+    dest.mkdir(parents=True, exist_ok=True)
+    columns: list[dict[str, Any]] = []
+    for position, name in enumerate(df.columns):
+        spec = _encode_series(df.iloc[:, position], dest, f"c{position}")
+        spec["name"] = name
+        columns.append(spec)
+
+    index_spec: dict[str, Any] | None = None
+    index = df.index
+    is_default_index = isinstance(index, pd.RangeIndex) and (
+        index.start == 0 and index.step == 1 and index.name is None
+    )
+    if not is_default_index:
+        index_spec = _encode_series(index.to_series(index=None), dest, "index")
+        index_spec["name"] = index.name
+
+    manifest = {"rows": int(len(df)), "columns": columns, "index": index_spec}
+    (dest / _MANIFEST_NAME).write_text(json.dumps(manifest))
+
+
+def _read_columnar(src: Path, *, memory_map: bool) -> pd.DataFrame:
+    manifest = json.loads((src / _MANIFEST_NAME).read_text())
+    mmap_mode = "c" if memory_map else None
+    data = {spec["name"]: _decode_series(spec, src, mmap_mode) for spec in manifest["columns"]}
+    index: pd.Index | None = None
+    index_spec = manifest.get("index")
+    if index_spec:
+        index = pd.Index(_decode_series(index_spec, src, None), name=index_spec.get("name"))
+    if not data:
+        return pd.DataFrame(index=index if index is not None else pd.RangeIndex(manifest["rows"]))
+    return pd.DataFrame(data, index=index, copy=False)
+
+
+# ---------------------------------------------------------------------------
+
+
 @dataclass(slots=True)
 class DataCache:
-    """Simple disk cache that stores DataFrames derived from external files."""
+    """Disk cache that stores DataFrames derived from external files.
+
+    Sources are looked up by a hash of their resolved path and validated
+    against size and modification time.  On a miss the file contents are
+    only hashed when another cached source has the same size, so identical
+    files imported from different folders resolve to the same payload without
+    every miss reading the source twice.  ``limit_gb`` is enforced whenever a new entry is
+    written by evicting the least recently accessed payloads.
+    """
 
     root: Path
-    version: int = 1
+    version: int = 2
     mirror_sources: bool = False
-    _meta: dict | None = None
+    limit_gb: float = DEFAULT_CACHE_LIMIT_GB
+    _index_ready: bool = False
 
     def __post_init__(self) -> None:
         self.root = self.root.expanduser().resolve(strict=False)
@@ -139,8 +313,8 @@ class DataCache:
 
     # ------------------------------------------------------------------
     @property
-    def meta_path(self) -> Path:
-        return _default_meta_path(self.root)
+    def index_path(self) -> Path:
+        return self.root / _INDEX_NAME
 
     @property
     def data_dir(self) -> Path:
@@ -150,25 +324,177 @@ class DataCache:
     def mirror_dir(self) -> Path:
         return self.root / "sources"
 
-    @property
-    def meta(self) -> dict:
-        if self._meta is None:
-            self._meta = _safe_read_json(self.meta_path)
-        return self._meta
-
     # ------------------------------------------------------------------
-    def _record_entry(self, key: str, entry: dict) -> None:
-        meta = self.meta
-        meta[key] = entry
-        _safe_write_json(self.meta_path, meta)
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.index_path.as_posix(), timeout=10.0)
+        try:
+            if not self._index_ready:
+                conn.executescript(_SCHEMA)
+                self._index_ready = True
+                self._drop_legacy_index()
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _drop_legacy_index(self) -> None:
+        """Remove payloads tracked by the old path-stem keyed ``index.json``."""
+
+        legacy = self.root / _LEGACY_INDEX_NAME
+        if not legacy.exists():
+            return
+        try:
+            payload = json.loads(legacy.read_text())
+        except (OSError, json.JSONDecodeError):
+            payload = {}
+        if isinstance(payload, dict):
+            for entry in payload.values():
+                cache_path = entry.get("cache_path") if isinstance(entry, dict) else None
+                if not cache_path:
+                    continue
+                try:
+                    Path(cache_path).unlink(missing_ok=True)
+                except OSError:
+                    continue
+        with suppress(OSError):
+            legacy.unlink()
 
-    def _cache_path_for(self, src: Path, suffix: str) -> Path:
-        stem = src.stem
-        return (self.data_dir / stem).with_suffix(suffix)
+    def _payload_path(self, content_key: str) -> Path:
+        return self.data_dir / content_key[:2] / content_key
 
     def _should_mirror(self, src: Path) -> bool:
         return self.mirror_sources and src.exists() and src.is_file()
 
+    # ------------------------------------------------------------------
+    def _lookup(self, conn: sqlite3.Connection, path_key: str, sig: str) -> str | None:
+        row = conn.execute(
+            "SELECT content_key FROM sources WHERE path_key = ? AND sig = ?",
+            (path_key, sig),
+        ).fetchone()
+        return row[0] if row else None
+
+    def _resolve_content_key(
+        self, conn: sqlite3.Connection, src: Path, path_key: str, sig: str
+    ) -> str:
+        """Return the entry key for a miss on ``src``.
+
+        Files can only share contents with sources of the same size, so when
+        there are none the entry is keyed on its stat signature and the file is
+        read once, by the loader.  Provisionally keyed entries are hashed and
+        re-keyed once a same-sized source turns up.
+        """
+
+        size = sig.split("-", 1)[0]
+        rows = conn.execute(
+            "SELECT DISTINCT source, sig, content_key FROM sources "
+            "WHERE path_key != ? AND sig LIKE ?",
+            (path_key, f"{size}-%-v{self.version}"),
+        ).fetchall()
+        if not rows:
+            return _stat_key(path_key, sig)
+        for source, other_sig, key in rows:
+            if key.startswith(_STAT_KEY_PREFIX):
+                self._rekey_by_content(conn, Path(source), other_sig, key)
+        return _content_key(src, self.version)
+
+    def _rekey_by_content(
+        self, conn: sqlite3.Connection, source: Path, sig: str, stat_key: str
+    ) -> None:
+        try:
+            unchanged = _signature(source, self.version) == sig
+        except OSError:
+            unchanged = False
+        if not unchanged:
+            return  # the source moved on; its entry can no longer be matched by content
+        content_key = _content_key(source, self.version)
+        existing = conn.execute(
+            "SELECT 1 FROM entries WHERE content_key = ?", (content_key,)
+        ).fetchone()
+        if existing is None:
+            conn.execute(
+                "UPDATE entries SET content_key = ? WHERE content_key = ?",
+                (content_key, stat_key),
+            )
+        else:
+            row = conn.execute(
+                "SELECT rel_path FROM entries WHERE content_key = ?", (stat_key,)
+            ).fetchone()
+            if row is not None:
+                with suppress(OSError):
+                    _remove_payload(self.root / row[0])
+                conn.execute("DELETE FROM entries WHERE content_key = ?", (stat_key,))
+        conn.execute(
+            "UPDATE sources SET content_key = ? WHERE content_key = ?", (content_key, stat_key)
+        )
+
+    def _load_entry(
+        self, conn: sqlite3.Connection, content_key: str, *, memory_map: bool
+    ) -> pd.DataFrame | None:
+        row = conn.execute(
+            "SELECT format, rel_path FROM entries WHERE content_key = ?", (content_key,)
+        ).fetchone()
+        if row is None:
+            return None
+        fmt, rel_path = row
+        path = self.root / rel_path
+        try:
+            if fmt == "columnar":
+                df = _read_columnar(path, memory_map=memory_map)
+            else:
+                df = pd.read_pickle(path)
+        except Exception:
+            conn.execute("DELETE FROM entries WHERE content_key = ?", (content_key,))
+            with suppress(OSError):
+                _remove_payload(path)
+            return None
+        conn.execute(
+            "UPDATE entries SET last_access = ?, hits = hits + 1 WHERE content_key = ?",
+            (time.time(), content_key),
+        )
+        return df
+
+    def _store_entry(self, conn: sqlite3.Connection, content_key: str, df: pd.DataFrame) -> None:
+        path = self._payload_path(content_key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{path.name}.", dir=path.parent))
+        fmt = "columnar"
+        try:
+            if not _columnar_supported(df):
+                raise ValueError("frame layout not supported by columnar payloads")
+            _write_columnar(df, staging)
+        except Exception:
+            with suppress(OSError):
+                _remove_payload(staging)
+            fmt = "pickle"
+            path = path.with_suffix(".pkl")
+            handle, name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+            os.close(handle)
+            staging = Path(name)
+            try:
+                df.to_pickle(staging, compression=None)
+            except Exception:
+                staging.unlink(missing_ok=True)
+                raise
+        _publish_payload(staging, path)
+
+        now = time.time()
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO entries
+                (content_key, format, rel_path, size, created, last_access, hits)
+            VALUES (?, ?, ?, ?, ?, ?, 0)
+            """,
+            (
+                content_key,
+                fmt,
+                path.relative_to(self.root).as_posix(),
+                _dir_size(path),
+                now,
+                now,
+            ),
+        )
+
     # ------------------------------------------------------------------
     def read_dataframe(
         self,
@@ -176,55 +502,44 @@ class DataCache:
         loader: Callable[[Path], pd.DataFrame],
         *,
         preserve_columns: Iterable[str] | None = None,
-        allow_parquet: bool = True,
+        memory_map: bool = True,
         category_threshold: float = 0.2,
     ) -> pd.DataFrame:
-        """Return a cached DataFrame or populate the cache via ``loader``."""
+        """Return a cached DataFrame or populate the cache via ``loader``.
+
+        Numeric columns of cached frames are memory-mapped copy-on-write when
+        ``memory_map`` is true, so callers may still modify the result.
+        """
 
         src = Path(src_path).expanduser().resolve(strict=False)
-        key = src.as_posix()
+        path_key = _path_key(src)
         sig = _signature(src, self.version)
-        entry = self.meta.get(key)
 
-        if entry and entry.get("sig") == sig:
-            cached_path = Path(entry.get("cache_path", ""))
-            if cached_path.exists():
-                try:
-                    if entry.get("format") == "parquet" and allow_parquet:
-                        return pd.read_parquet(cached_path)
-                    return pd.read_pickle(cached_path)
-                except Exception:
-                    pass  # fall through to rebuild cache
-
-        df = loader(src)
-        df = self._downcast(df, preserve_columns=preserve_columns, threshold=category_threshold)
-
-        cache_dir = self.data_dir
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        fmt = "pickle"
-        cache_path = self._cache_path_for(src, ".pkl")
-
-        if allow_parquet:
-            try:
-                import pyarrow  # noqa: F401
-
-                cache_path = self._cache_path_for(src, ".parquet")
-                df.to_parquet(cache_path)
-                fmt = "parquet"
-            except Exception:
-                df.to_pickle(cache_path)
-        else:
-            df.to_pickle(cache_path)
+        with self._connect() as conn:
+            content_key = self._lookup(conn, path_key, sig)
+            if content_key is not None:
+                df = self._load_entry(conn, content_key, memory_map=memory_map)
+                if df is not None:
+                    return df
+
+            content_key = self._resolve_content_key(conn, src, path_key, sig)
+            df = self._load_entry(conn, content_key, memory_map=memory_map)
+            if df is None:
+                df = loader(src)
+                df = self._downcast(
+                    df, preserve_columns=preserve_columns, threshold=category_threshold
+                )
+                self._store_entry(conn, content_key, df)
+                self._enforce_budget(conn, keep=content_key)
+
+            conn.execute(
+                "INSERT OR REPLACE INTO sources (path_key, source, sig, content_key) "
+                "VALUES (?, ?, ?, ?)",
+                (path_key, src.as_posix(), sig, content_key),
+            )
 
-        entry = {
-            "sig": sig,
-            "cache_path": cache_path.as_posix(),
-            "format": fmt,
-        }
         if self._should_mirror(src):
-            mirrored = _mirror_source(src, self.mirror_dir / src.name)
-            entry["mirrored_source"] = mirrored.as_posix()
-        self._record_entry(key, entry)
+            _mirror_source(src, self.mirror_dir / path_key[:12] / src.name)
         return df
 
     # ------------------------------------------------------------------
@@ -259,39 +574,45 @@ class DataCache:
         return df
 
     # ------------------------------------------------------------------
-    def prune(self, *, limit_gb: int = DEFAULT_CACHE_LIMIT_GB) -> None:
-        """Delete least-recently-updated entries when cache exceeds ``limit_gb``."""
-
-        limit_bytes = max(limit_gb, 1) * 1024**3
+    def _enforce_budget(
+        self, conn: sqlite3.Connection, *, limit_bytes: int | None = None, keep: str | None = None
+    ) -> None:
+        if limit_bytes is None:
+            limit_bytes = int(max(self.limit_gb, 0) * 1024**3)
         if limit_bytes <= 0:
             return
-
-        total = 0
-        entries = []
-        for entry in self.meta.values():
-            path = Path(entry.get("cache_path", ""))
-            if not path.exists():
-                continue
-            size = path.stat().st_size
-            total += size
-            entries.append((path, entry, size))
-
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
         if total <= limit_bytes:
             return
 
-        entries.sort(key=lambda item: item[0].stat().st_mtime if item[0].exists() else 0)
-
-        current = total
-        for path, _entry, size in entries:
-            if current <= limit_bytes:
+        rows = conn.execute(
+            "SELECT content_key, rel_path, size FROM entries ORDER BY last_access ASC"
+        ).fetchall()
+        for content_key, rel_path, size in rows:
+            if total <= limit_bytes:
                 break
+            if content_key == keep:
+                continue
             try:
-                path.unlink()
+                _remove_payload(self.root / rel_path)
             except OSError:
-                continue
-            current -= size
-
-        # Rewrite metadata without missing entries
-        cleaned = {k: v for k, v in self.meta.items() if Path(v.get("cache_path", "")).exists()}
-        self._meta = cleaned
-        _safe_write_json(self.meta_path, cleaned)
+                continue  # still mapped elsewhere; retry on a later insert
+            conn.execute("DELETE FROM entries WHERE content_key = ?", (content_key,))
+            conn.execute("DELETE FROM sources WHERE content_key = ?", (content_key,))
+            total -= size
+
+    def prune(self, *, limit_gb: float | None = None) -> None:
+        """Evict least-recently-accessed entries until the cache fits ``limit_gb``."""
+
+        budget = self.limit_gb if limit_gb is None else limit_gb
+        with self._connect() as conn:
+            self._enforce_budget(conn, limit_bytes=int(max(budget, 0) * 1024**3))
+
+    def stats(self) -> dict[str, int]:
+        """Return entry count, total payload bytes and cumulative hits."""
+
+        with self._connect() as conn:
+            count, size, hits = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hits), 0) FROM entries"
+            ).fetchone()
+        return {"entries": int(count), "bytes": int(size), "hits": int(hits)}
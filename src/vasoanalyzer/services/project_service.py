@@ -10,14 +10,11 @@ import logging
 import os
 import shutil
 import sqlite3
-import warnings
 from collections.abc import Callable, Mapping, Sequence
 from pathlib import Path
 from typing import Any, cast
 
-import numpy as np
 import pandas as pd
-import tifffile
 
 from vasoanalyzer.core.project import (
     Experiment,
@@ -43,70 +40,9 @@ from vasoanalyzer.storage.sqlite import traces as _traces
 from vasoanalyzer.storage.sqlite.utils import transaction
 from vasoanalyzer.tools.portable_export import export_single_file
 
-LARGE_TIFF_MEMMAP_THRESHOLD = 8 * 1024**2  # 8 MiB
-
 log = logging.getLogger(__name__)
 
 
-def _load_tiff_stack(
-    path: str, *, compressed: bool | None
-) -> tuple[Any, Callable[[], None] | None]:
-    """Return a TIFF stack together with an optional cleanup callback."""
-
-    try:
-        size = os.path.getsize(path)
-    except OSError:
-        size = None
-
-    if not compressed and size is not None and size >= LARGE_TIFF_MEMMAP_THRESHOLD:
-        try:
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", UserWarning)
-                logger_factory = getattr(tifffile, "logger", None)
-                logger_obj = logger_factory() if callable(logger_factory) else None
-                if logger_obj is not None:
-                    previous_level = logger_obj.level
-                    logger_obj.setLevel(max(logging.ERROR, previous_level))
-                try:
-                    with tifffile.TiffFile(path) as tif:
-                        page_count = len(tif.pages)
-                        if page_count == 0:
-                            raise ValueError(f"TIFF file {path!r} contains no frames")
-                        first_page = tif.pages[0]
-                        frame_shape = first_page.shape
-                finally:
-                    if logger_obj is not None:
-                        logger_obj.setLevel(previous_level)
-
-            raw_stack = tifffile.memmap(path, page=None)
-
-            if raw_stack.ndim == len(frame_shape):
-                raw_stack = raw_stack.reshape((page_count, *frame_shape))
-
-            view = raw_stack
-            if page_count > 1:
-                try:
-                    if not np.any(raw_stack[-1]) and np.any(raw_stack[-2]):
-                        view = raw_stack[:-1]
-                        log.debug("Dropped trailing blank frame from %s", path)
-                except (IndexError, TypeError, ValueError):
-                    # Any issue checking the tail should not block loading.
-                    view = raw_stack
-
-            def _closer(memmap_obj=raw_stack) -> None:
-                mm_handle = getattr(memmap_obj, "_mmap", None)
-                close_handle = getattr(mm_handle, "close", None)
-                if callable(close_handle):
-                    close_handle()
-
-            return view, _closer
-        except (ValueError, TypeError, tifffile.TiffFileError, OSError) as exc:
-            log.debug("Falling back to eager TIFF load for %s (%s)", path, exc)
-
-    stack = tifffile.imread(path)
-    return stack, None
-
-
 def manifest_to_project(manifest: dict[str, Any], state: dict[str, Any], path: str) -> Project:
     """Convert ``manifest`` and ``state`` dictionaries into a :class:`Project`."""
 
@@ -603,10 +539,13 @@ class SQLiteProjectRepository(ProjectRepository):
                     log.debug("Failed to close fresh store after operation", exc_info=True)
 
 
-def open_project_repository(path: str) -> SQLiteProjectRepository:
-    """Open an existing SQLite project as a typed repository façade."""
+def open_project_repository(path: str, *, validate: bool = True) -> SQLiteProjectRepository:
+    """Open an existing SQLite project as a typed repository façade.
+
+    ``validate`` is passed to :func:`sqlite_store.open_project`.
+    """
 
-    store = sqlite_store.open_project(path)
+    store = sqlite_store.open_project(path, validate=validate)
     return SQLiteProjectRepository(store)
 
 
@@ -0,0 +1,222 @@
+# VasoAnalyzer
+# Copyright © 2025 Osvaldo J. Vega Rodríguez
+# Licensed under CC BY-NC-SA 4.0 International
+# http://creativecommons.org/licenses/by-nc-sa/4.0/
+
+"""Concurrent project validation with per-dataset results as they finish.
+
+:func:`vasoanalyzer.storage.validation.quick_validate_project` signs every
+dataset serially on the caller's connection.  :func:`validate_project` computes
+the same signatures on a pool of read-only connections, one per worker thread,
+hands each dataset to ``on_result`` as soon as it is done, and then records
+everything on the caller's connection in one transaction.  Workers read the
+database file, so they only see committed data.  Listeners registered with
+:func:`add_result_listener` receive every result too, which is how the UI
+follows validation run deep inside a project open.
+
+Database-level integrity checks live in :mod:`vasoanalyzer.storage.integrity`;
+:func:`schedule_integrity_check` is re-exported here for callers that drive
+both from one place.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from vasoanalyzer.storage import validation
+from vasoanalyzer.storage.integrity import schedule_full_check as schedule_integrity_check
+from vasoanalyzer.storage.validation import DatasetSignatures
+
+log = logging.getLogger(__name__)
+
+DatasetCallback = Callable[["DatasetCheck"], None]
+
+__all__ = [
+    "DatasetCheck",
+    "add_result_listener",
+    "database_path",
+    "iter_dataset_checks",
+    "schedule_integrity_check",
+    "validate_project",
+]
+
+
+_listeners: list[DatasetCallback] = []
+_listeners_lock = threading.Lock()
+
+
+def add_result_listener(callback: DatasetCallback) -> Callable[[], None]:
+    """Deliver every :class:`DatasetCheck` from :func:`validate_project` to ``callback``.
+
+    Listeners run on the validating thread after ``on_result``.  Returns a
+    function that removes the listener.
+    """
+
+    with _listeners_lock:
+        _listeners.append(callback)
+
+    def _remove() -> None:
+        with _listeners_lock:
+            if callback in _listeners:
+                _listeners.remove(callback)
+
+    return _remove
+
+
+def _notify(check: DatasetCheck, on_result: DatasetCallback | None) -> None:
+    if on_result is not None:
+        on_result(check)
+    with _listeners_lock:
+        callbacks = list(_listeners)
+    for callback in callbacks:
+        try:
+            callback(check)
+        except Exception:
+            log.debug("Validation result listener failed", exc_info=True)
+
+
+@dataclass(frozen=True)
+class DatasetCheck:
+    """Outcome of signing one dataset on a worker connection."""
+
+    dataset_id: int
+    signatures: DatasetSignatures | None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.signatures is not None
+
+
+def database_path(conn: sqlite3.Connection) -> Path | None:
+    """Return the file behind ``conn``'s main database, or None if in-memory."""
+
+    for row in conn.execute("PRAGMA database_list").fetchall():
+        if row[1] == "main":
+            return Path(row[2]) if row[2] else None
+    return None
+
+
+class _ReadOnlyConnections:
+    """One read-only connection per worker thread, closed together."""
+
+    def __init__(self, path: Path) -> None:
+        self._uri = f"file:{path.as_posix()}?mode=ro"
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._opened: list[sqlite3.Connection] = []
+
+    def get(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._uri, uri=True, timeout=30.0, check_same_thread=False)
+            self._local.conn = conn
+            with self._lock:
+                self._opened.append(conn)
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            opened, self._opened = self._opened, []
+        for conn in opened:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                log.debug("Failed to close validation connection", exc_info=True)
+
+
+def _sign(pool: _ReadOnlyConnections, dataset_id: int) -> DatasetCheck:
+    try:
+        sigs = validation.compute_dataset_signatures(pool.get(), dataset_id)
+    except sqlite3.Error as exc:
+        return DatasetCheck(dataset_id, None, str(exc))
+    return DatasetCheck(dataset_id, sigs)
+
+
+def _worker_count(max_workers: int | None, n_items: int) -> int:
+    if max_workers is None:
+        max_workers = min(4, os.cpu_count() or 1)
+    return max(1, min(int(max_workers), n_items))
+
+
+def iter_dataset_checks(
+    db_path: str | os.PathLike[str],
+    dataset_ids: Iterable[int],
+    *,
+    max_workers: int | None = None,
+) -> Iterator[DatasetCheck]:
+    """Sign ``dataset_ids`` concurrently and yield each result as it completes.
+
+    Nothing is written; datasets whose connection fails are yielded with
+    ``signatures=None`` and the error message.
+    """
+
+    ids = [int(ds_id) for ds_id in dataset_ids]
+    if not ids:
+        return
+    pool = _ReadOnlyConnections(Path(db_path))
+    try:
+        workers = _worker_count(max_workers, len(ids))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="validate") as executor:
+            futures = [executor.submit(_sign, pool, ds_id) for ds_id in ids]
+            for future in as_completed(futures):
+                yield future.result()
+    finally:
+        pool.close()
+
+
+def validate_project(
+    conn: sqlite3.Connection,
+    *,
+    max_workers: int | None = None,
+    on_result: DatasetCallback | None = None,
+) -> list[dict[str, Any]]:
+    """Concurrent equivalent of :func:`validation.quick_validate_project`.
+
+    Commits ``conn`` first so the workers see its latest state, streams each
+    :class:`DatasetCheck` to ``on_result`` (on the calling thread), then
+    records signatures, drift and duplicate issues on ``conn``.  Datasets a
+    worker could not read are signed on ``conn`` instead.  In-memory
+    databases fall back to the serial path.
+    """
+
+    path = database_path(conn)
+    if path is None:
+        return validation.quick_validate_project(conn)
+
+    conn.commit()
+    now = datetime.now(timezone.utc).isoformat()
+    datasets = conn.execute(
+        "SELECT id, events_signature, trace_signature FROM dataset ORDER BY id"
+    ).fetchall()
+    signed: dict[int, DatasetSignatures] = {}
+    for check in iter_dataset_checks(path, [row[0] for row in datasets], max_workers=max_workers):
+        if check.signatures is not None:
+            signed[check.dataset_id] = check.signatures
+        else:
+            log.warning(
+                "Validation worker failed for dataset %s: %s", check.dataset_id, check.error
+            )
+        _notify(check, on_result)
+
+    issues: list[dict[str, Any]] = []
+    for row in datasets:
+        ds_id = int(row[0])
+        sigs = signed.get(ds_id) or validation.compute_dataset_signatures(conn, ds_id)
+        issues.extend(
+            validation.record_dataset_validation(
+                conn, sigs, stored_events=row[1], stored_trace=row[2], now=now
+            )
+        )
+    issues.extend(validation.flag_duplicate_signatures(conn))
+    conn.commit()
+    return issues
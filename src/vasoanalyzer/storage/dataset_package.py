@@ -5,27 +5,40 @@ from __future__ import annotations
 import hashlib
 import io
 import json
-import tempfile
 import uuid
 import zipfile
-from collections.abc import Mapping, Sequence
-from dataclasses import dataclass
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from utils.config import APP_VERSION
 from vasoanalyzer.storage import bundle_adapter, sqlite_store
 from vasoanalyzer.storage.sqlite import projects as _projects
 
-PACKAGE_FORMAT = "vasods-v1"
+# v2 stores trace/event tables column by column; v1 (CSV) is still read, and
+# written on request for older VasoAnalyzer versions.
+PACKAGE_FORMAT = "vasods-v2"
+CSV_PACKAGE_FORMAT = "vasods-v1"
+_SUPPORTED_FORMATS = (PACKAGE_FORMAT, CSV_PACKAGE_FORMAT)
+PAYLOAD_FORMATS = ("columnar", "csv")
+COLUMN_COMPRESSIONS = ("zstd", "none")
+
 _TRACE_FILENAME = "data/trace.csv"
 _EVENTS_FILENAME = "data/events.csv"
 _DATASET_FILENAME = "data/dataset.json"
 _RESULTS_FILENAME = "data/results.json"
 _MANIFEST_FILENAME = "manifest.json"
+_TABLE_DIRS = {"trace": "data/trace", "events": "data/events"}
+
+_CHUNK_SIZE = 1 << 20
+# Numeric kinds stored as raw little-endian bytes; anything else is JSON.
+_BINARY_KINDS = "biuf"
+_NULLABLE_NUMERIC = {"empty", "floating", "integer", "mixed-integer-float"}
 
 
 class DatasetPackageError(ValueError):
@@ -48,24 +61,157 @@ class DatasetPackageManifest:
     includes: Mapping[str, bool]
     counts: Mapping[str, int]
     checksums: Mapping[str, str]
+    tables: Mapping[str, Any] = field(default_factory=dict)
 
 
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
-def _sha256_bytes(payload: bytes) -> str:
-    return hashlib.sha256(payload).hexdigest()
-
+def _write_member(
+    zf: zipfile.ZipFile,
+    member: str,
+    chunks: Iterable[bytes | memoryview],
+    *,
+    compress_type: int = zipfile.ZIP_DEFLATED,
+) -> str:
+    """Stream ``chunks`` into ``member`` and return their SHA-256."""
 
-def _sha256_path(path: Path) -> str:
     hasher = hashlib.sha256()
-    with open(path, "rb") as fh:
-        for chunk in iter(lambda: fh.read(8192), b""):
+    info = zipfile.ZipInfo(member, date_time=datetime.now().timetuple()[:6])
+    info.compress_type = compress_type
+    with zf.open(info, "w", force_zip64=True) as fh:
+        for chunk in chunks:
             hasher.update(chunk)
+            fh.write(chunk)
     return hasher.hexdigest()
 
 
+def _chunked(payload: bytes | memoryview) -> Iterable[memoryview]:
+    view = memoryview(payload)
+    for start in range(0, len(view), _CHUNK_SIZE):
+        yield view[start : start + _CHUNK_SIZE]
+
+
+def _zstd():
+    import imagecodecs  # heavy import; only needed for columnar payloads
+
+    return imagecodecs
+
+
+def _encode_column(
+    values: pd.Series, compression: str
+) -> tuple[dict[str, Any], bytes | memoryview]:
+    """Serialize one column, returning its manifest entry and stored bytes."""
+
+    array = values.to_numpy()
+    if (
+        array.dtype.kind == "O"
+        and pd.api.types.infer_dtype(values, skipna=True) in _NULLABLE_NUMERIC
+    ):
+        # SQLite hands back sparse numeric columns as objects holding None;
+        # NaN reads back the same way on import.
+        array = pd.to_numeric(values, errors="coerce").to_numpy(dtype="float64")
+    if array.dtype.kind not in _BINARY_KINDS:
+        payload = json.dumps(values.tolist(), ensure_ascii=False, default=str).encode("utf-8")
+        return {"dtype": "json"}, payload
+
+    array = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<"))
+    spec: dict[str, Any] = {"dtype": array.dtype.str}
+    if compression == "none":
+        return spec, memoryview(array).cast("B")
+
+    codecs = _zstd()
+    payload = codecs.zstd_encode(array)
+    if array.dtype.itemsize > 1 and array.size:
+        # Byte-shuffling wins for regular columns (time, frame numbers) and
+        # loses for noisy ones, so keep whichever comes out smaller.
+        shuffled = codecs.zstd_encode(codecs.byteshuffle_encode(array))
+        if len(shuffled) < len(payload):
+            payload = shuffled
+            spec["filter"] = "byteshuffle"
+    spec["compression"] = "zstd"
+    return spec, payload
+
+
+def _decode_column(spec: Mapping[str, Any], data: bytes, rows: int) -> Any:
+    dtype_name = spec.get("dtype")
+    if dtype_name == "json":
+        try:
+            values = json.loads(data)
+        except json.JSONDecodeError as exc:
+            raise DatasetPackageValidationError(
+                f"Column {spec.get('name')!r} is corrupted"
+            ) from exc
+        if not isinstance(values, list) or len(values) != rows:
+            raise DatasetPackageValidationError(f"Column {spec.get('name')!r} has the wrong length")
+        return values
+
+    try:
+        dtype = np.dtype(str(dtype_name))
+    except TypeError as exc:
+        raise DatasetPackageValidationError(f"Unsupported column dtype {dtype_name!r}") from exc
+    if dtype.kind not in _BINARY_KINDS:
+        raise DatasetPackageValidationError(f"Unsupported column dtype {dtype_name!r}")
+    compression = spec.get("compression", "none")
+    if compression == "zstd":
+        data = _zstd().zstd_decode(data)
+    elif compression != "none":
+        raise DatasetPackageValidationError(f"Unsupported column compression {compression!r}")
+    if len(data) != rows * dtype.itemsize:
+        raise DatasetPackageValidationError(f"Column {spec.get('name')!r} has the wrong length")
+    array = np.frombuffer(data, dtype=dtype)
+    if spec.get("filter") == "byteshuffle":
+        array = _zstd().byteshuffle_decode(array.copy())
+    return array
+
+
+def _write_table(
+    zf: zipfile.ZipFile,
+    table: str,
+    df: pd.DataFrame,
+    compression: str,
+    checksums: dict[str, str],
+) -> dict[str, Any]:
+    columns = []
+    for position, name in enumerate(df.columns):
+        spec, payload = _encode_column(df.iloc[:, position], compression)
+        member = f"{_TABLE_DIRS[table]}/{position:03d}.col"
+        # Binary columns are already compressed (or deliberately raw).
+        compress_type = zipfile.ZIP_DEFLATED if spec["dtype"] == "json" else zipfile.ZIP_STORED
+        checksums[member] = _write_member(
+            zf, member, _chunked(payload), compress_type=compress_type
+        )
+        columns.append({"name": str(name), "member": member, **spec})
+    return {"rows": len(df.index), "columns": columns}
+
+
+def _read_columns(
+    zf: zipfile.ZipFile, table: str, spec: Mapping[str, Any], checksums: Mapping[str, str]
+) -> dict[str, Any]:
+    try:
+        rows = int(spec["rows"])
+        columns = list(spec["columns"])
+    except (KeyError, TypeError, ValueError) as exc:
+        raise DatasetPackageValidationError(f"Manifest entry for {table} is malformed") from exc
+
+    data: dict[str, Any] = {}
+    for column in columns:
+        member = str(column.get("member", ""))
+        if not member.startswith(_TABLE_DIRS[table] + "/"):
+            raise DatasetPackageValidationError(f"Unexpected {table} column member {member!r}")
+        payload = _read_and_verify(zf, member, checksums.get(member, ""))
+        data[str(column.get("name"))] = _decode_column(column, payload, rows)
+    return data
+
+
+def _read_table(
+    zf: zipfile.ZipFile, table: str, spec: Mapping[str, Any], checksums: Mapping[str, str]
+) -> pd.DataFrame:
+    data = _read_columns(zf, table, spec, checksums)
+    return pd.DataFrame(data, columns=list(data), copy=False)
+
+
 def _ensure_suffix(path: Path, suffix: str) -> Path:
     if path.suffix != suffix:
         return path.with_suffix(suffix)
@@ -112,11 +258,23 @@ def export_dataset_package(
     out_path: str | Path,
     *,
     include_results: bool = True,
+    payload: str = "columnar",
+    compression: str = "zstd",
 ) -> Path:
     """
     Export ``dataset_id`` from ``project_path`` into a portable .vasods archive.
+
+    ``payload="columnar"`` (the default) stores each trace/event column as its
+    own member, compressed with zstd unless ``compression="none"``.
+    ``payload="csv"`` writes the older CSV package that previous releases can
+    import.  Members are hashed as they are written into the archive.
     """
 
+    if payload not in PAYLOAD_FORMATS:
+        raise ValueError(f"payload must be one of {PAYLOAD_FORMATS}, got {payload!r}")
+    if compression not in COLUMN_COMPRESSIONS:
+        raise ValueError(f"compression must be one of {COLUMN_COMPRESSIONS}, got {compression!r}")
+
     project_path = Path(project_path).expanduser()
     out_path = _ensure_suffix(Path(out_path), ".vasods")
     out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -137,7 +295,9 @@ def export_dataset_package(
     finally:
         store.close()
 
-    events_df = _prepare_events_for_export(events_df)
+    columnar = payload == "columnar"
+    if not columnar:
+        events_df = _prepare_events_for_export(events_df)
     dataset_uuid = str(uuid.uuid4())
 
     dataset_json = {
@@ -151,55 +311,50 @@ def export_dataset_package(
         "extra": dataset_meta.get("extra"),
     }
 
-    with tempfile.TemporaryDirectory(dir=out_path.parent) as tmpdir:
-        tmp_root = Path(tmpdir)
-        data_dir = tmp_root / "data"
-        data_dir.mkdir(parents=True, exist_ok=True)
-
-        dataset_json_path = data_dir / "dataset.json"
-        dataset_json_path.write_text(json.dumps(dataset_json, ensure_ascii=False, indent=2))
-
-        trace_path = data_dir / "trace.csv"
-        trace_included = trace_df is not None and not trace_df.empty
-        if trace_included:
-            trace_df.to_csv(trace_path, index=False)
-
-        events_path = data_dir / "events.csv"
-        events_included = events_df is not None and not events_df.empty
-        if events_included:
-            events_df.to_csv(events_path, index=False)
-
-        results_path = data_dir / "results.json"
-        results_included = bool(include_results and results)
-        if results_included:
-            trimmed = []
-            for row in results:
-                trimmed.append(
-                    {
-                        "kind": row.get("kind"),
-                        "version": row.get("version"),
-                        "created_utc": row.get("created_utc"),
-                        "payload": row.get("payload"),
-                    }
+    trace_included = trace_df is not None and not trace_df.empty
+    events_included = events_df is not None and not events_df.empty
+    results_included = bool(include_results and results)
+
+    checksums: dict[str, str] = {}
+    tables: dict[str, Any] = {}
+    tmp_zip = out_path.with_suffix(out_path.suffix + ".tmp")
+    try:
+        with zipfile.ZipFile(tmp_zip, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            checksums[_DATASET_FILENAME] = _write_member(
+                zf,
+                _DATASET_FILENAME,
+                [json.dumps(dataset_json, ensure_ascii=False, indent=2).encode("utf-8")],
+            )
+            for table, df, csv_member, included in (
+                ("trace", trace_df, _TRACE_FILENAME, trace_included),
+                ("events", events_df, _EVENTS_FILENAME, events_included),
+            ):
+                if not included:
+                    continue
+                if columnar:
+                    tables[table] = _write_table(zf, table, df, compression, checksums)
+                else:
+                    text = df.to_csv(index=False).encode("utf-8")
+                    checksums[csv_member] = _write_member(zf, csv_member, _chunked(text))
+
+            if results_included:
+                trimmed = []
+                for row in results:
+                    trimmed.append(
+                        {
+                            "kind": row.get("kind"),
+                            "version": row.get("version"),
+                            "created_utc": row.get("created_utc"),
+                            "payload": row.get("payload"),
+                        }
+                    )
+                checksums[_RESULTS_FILENAME] = _write_member(
+                    zf,
+                    _RESULTS_FILENAME,
+                    [json.dumps(trimmed, ensure_ascii=False, indent=2).encode("utf-8")],
                 )
-            results_path.write_text(json.dumps(trimmed, ensure_ascii=False, indent=2))
-
-        checksums: dict[str, str] = {}
-        checksums[_DATASET_FILENAME] = _sha256_path(dataset_json_path)
-        if trace_included:
-            checksums[_TRACE_FILENAME] = _sha256_path(trace_path)
-        if events_included:
-            checksums[_EVENTS_FILENAME] = _sha256_path(events_path)
-        if results_included:
-            checksums[_RESULTS_FILENAME] = _sha256_path(results_path)
-
-        manifest = {
-            "format": PACKAGE_FORMAT,
-            "created_utc": _utc_now_iso(),
-            "app_version_created": APP_VERSION,
-            "schema_version_created": sqlite_store.SCHEMA_VERSION,
-            "source_project_uuid": project_uuid,
-            "dataset_export": {
+
+            dataset_export: dict[str, Any] = {
                 "dataset_name": dataset_meta.get("name"),
                 "dataset_uuid": dataset_uuid,
                 "includes": {
@@ -213,24 +368,22 @@ def export_dataset_package(
                     "results": len(results) if results_included else 0,
                 },
                 "checksums": checksums,
-            },
-        }
-
-        manifest_path = tmp_root / "manifest.json"
-        manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2))
-
-        tmp_zip = out_path.with_suffix(out_path.suffix + ".tmp")
-        with zipfile.ZipFile(tmp_zip, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-            zf.write(manifest_path, arcname=_MANIFEST_FILENAME)
-            zf.write(dataset_json_path, arcname=_DATASET_FILENAME)
-            if trace_included:
-                zf.write(trace_path, arcname=_TRACE_FILENAME)
-            if events_included:
-                zf.write(events_path, arcname=_EVENTS_FILENAME)
-            if results_included:
-                zf.write(results_path, arcname=_RESULTS_FILENAME)
+            }
+            if columnar:
+                dataset_export["tables"] = tables
+            manifest = {
+                "format": PACKAGE_FORMAT if columnar else CSV_PACKAGE_FORMAT,
+                "created_utc": _utc_now_iso(),
+                "app_version_created": APP_VERSION,
+                "schema_version_created": sqlite_store.SCHEMA_VERSION,
+                "source_project_uuid": project_uuid,
+                "dataset_export": dataset_export,
+            }
+            zf.writestr(_MANIFEST_FILENAME, json.dumps(manifest, ensure_ascii=False, indent=2))
 
         tmp_zip.replace(out_path)
+    finally:
+        tmp_zip.unlink(missing_ok=True)
 
     return out_path
 
@@ -239,12 +392,15 @@ def _validate_manifest(manifest: Mapping[str, Any]) -> DatasetPackageManifest:
     if not isinstance(manifest, Mapping):
         raise DatasetPackageValidationError("Package manifest is missing or malformed.")
     fmt = manifest.get("format")
-    if fmt != PACKAGE_FORMAT:
+    if fmt not in _SUPPORTED_FORMATS:
         raise DatasetPackageValidationError(f"Unsupported dataset package format: {fmt!r}")
     dataset_info = manifest.get("dataset_export") or {}
     includes = dataset_info.get("includes") or {}
     counts = dataset_info.get("counts") or {}
     checksums = dataset_info.get("checksums") or {}
+    tables = dataset_info.get("tables") or {}
+    if fmt == PACKAGE_FORMAT and not isinstance(tables, Mapping):
+        raise DatasetPackageValidationError("Package manifest is missing or malformed.")
     dataset_uuid = dataset_info.get("dataset_uuid") or str(uuid.uuid4())
     dataset_name = dataset_info.get("dataset_name") or "Imported Dataset"
     return DatasetPackageManifest(
@@ -258,15 +414,22 @@ def _validate_manifest(manifest: Mapping[str, Any]) -> DatasetPackageManifest:
         includes={k: bool(v) for k, v in includes.items()},
         counts={k: int(v) for k, v in counts.items()},
         checksums={k: str(v) for k, v in checksums.items()},
+        tables=dict(tables) if isinstance(tables, Mapping) else {},
     )
 
 
 def _read_and_verify(zf: zipfile.ZipFile, member: str, expected_sha: str) -> bytes:
+    hasher = hashlib.sha256()
+    buffer = bytearray()
     try:
-        data = zf.read(member)
+        with zf.open(member) as fh:
+            for chunk in iter(lambda: fh.read(_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+                buffer += chunk
     except KeyError as exc:
         raise DatasetPackageValidationError(f"Missing required file in package: {member}") from exc
-    actual = _sha256_bytes(data)
+    data = bytes(buffer)
+    actual = hasher.hexdigest()
     if expected_sha and actual != expected_sha:
         raise DatasetPackageValidationError(f"Checksum mismatch for {member}")
     return data
@@ -334,14 +497,28 @@ def import_dataset_package(
         except json.JSONDecodeError as exc:
             raise DatasetPackageValidationError("dataset.json is corrupted") from exc
 
-        trace_df: pd.DataFrame | None = None
+        # Columnar trace tables stay as decoded arrays; add_dataset inserts them
+        # without rebuilding a DataFrame.
+        trace_df: pd.DataFrame | dict[str, Any] | None = None
         events_df: pd.DataFrame | None = None
         results_payload: list[Mapping[str, Any]] = []
 
-        if manifest_obj.includes.get("trace"):
+        columnar = manifest_obj.format == PACKAGE_FORMAT
+        if columnar:
+            for table in ("trace", "events"):
+                if not manifest_obj.includes.get(table):
+                    continue
+                spec = manifest_obj.tables.get(table)
+                if not isinstance(spec, Mapping):
+                    raise DatasetPackageValidationError(f"Manifest is missing the {table} table")
+                if table == "trace":
+                    trace_df = _read_columns(zf, table, spec, checksums)
+                else:
+                    events_df = _read_table(zf, table, spec, checksums)
+        elif manifest_obj.includes.get("trace"):
             trace_bytes = _read_and_verify(zf, _TRACE_FILENAME, checksums.get(_TRACE_FILENAME, ""))
             trace_df = pd.read_csv(io.StringIO(trace_bytes.decode("utf-8")))
-        if manifest_obj.includes.get("events"):
+        if not columnar and manifest_obj.includes.get("events"):
             events_bytes = _read_and_verify(
                 zf, _EVENTS_FILENAME, checksums.get(_EVENTS_FILENAME, "")
             )
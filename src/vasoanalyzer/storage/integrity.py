@@ -0,0 +1,288 @@
+"""SQLite integrity checks that stay off the open/save critical path.
+
+``PRAGMA integrity_check`` reads every page and cross-checks every index,
+which is far too slow to run synchronously on each save of a large project.
+This module splits the work:
+
+- :func:`check_integrity` runs ``quick_check`` (or the full check on
+  request) on a read-only connection and remembers files that passed, keyed
+  by path, size and modification time in a bounded LRU.  Snapshots are
+  immutable, so a file is only checked again after it changes.
+- :class:`IntegrityScheduler` queues full checks on a daemon thread and runs
+  them once submissions have been quiet for ``idle_delay_s`` seconds.  A
+  failed background check is remembered, so later checks of the unchanged
+  file fail without rescanning, and is reported to listeners registered with
+  :func:`add_failure_listener`.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+log = logging.getLogger(__name__)
+
+IntegrityCallback = Callable[[Path, list[str]], None]
+
+__all__ = [
+    "IntegrityCallback",
+    "IntegrityScheduler",
+    "add_failure_listener",
+    "check_integrity",
+    "default_scheduler",
+    "is_verified",
+    "known_problems",
+    "mark_failed",
+    "mark_verified",
+    "schedule_full_check",
+]
+
+_QUICK = 1
+_FULL = 2
+
+# Results are keyed by (path, size, mtime_ns), so an edited file simply misses
+# and its stale entries age out of the LRU.
+_MAX_REMEMBERED_FILES = 256
+
+_FileKey = tuple[str, int, int]
+_verified: OrderedDict[_FileKey, int] = OrderedDict()
+_failed: OrderedDict[_FileKey, list[str]] = OrderedDict()
+_verified_lock = threading.Lock()
+_failure_listeners: list[IntegrityCallback] = []
+
+
+def _file_state(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _file_key(path: Path) -> _FileKey | None:
+    state = _file_state(path)
+    if state is None:
+        return None
+    return (os.fspath(path), *state)
+
+
+def _remember(table: OrderedDict[_FileKey, Any], key: _FileKey, value: Any) -> None:
+    """Store ``value`` as the most recent entry, evicting the oldest past the bound."""
+
+    table[key] = value
+    table.move_to_end(key)
+    while len(table) > _MAX_REMEMBERED_FILES:
+        table.popitem(last=False)
+
+
+def _verified_level(path: Path) -> int:
+    key = _file_key(path)
+    if key is None:
+        return 0
+    with _verified_lock:
+        level = _verified.get(key, 0)
+        if level:
+            _verified.move_to_end(key)
+    return level
+
+
+def is_verified(path: str | os.PathLike[str], *, full: bool = False) -> bool:
+    """Return True if ``path`` passed a check of this level and is unchanged since."""
+
+    return _verified_level(Path(path)) >= (_FULL if full else _QUICK)
+
+
+def mark_verified(path: str | os.PathLike[str], *, full: bool = False) -> None:
+    """Record that ``path`` passed a check performed by the caller."""
+
+    key = _file_key(Path(path))
+    if key is None:
+        return
+    level = _FULL if full else _QUICK
+    with _verified_lock:
+        _remember(_verified, key, max(level, _verified.get(key, 0)))
+
+
+def mark_failed(path: str | os.PathLike[str], problems: list[str]) -> None:
+    """Record that ``path`` failed a check; it stays failed until the file changes."""
+
+    key = _file_key(Path(path))
+    if key is None or not problems:
+        return
+    with _verified_lock:
+        _verified.pop(key, None)
+        _remember(_failed, key, list(problems))
+
+
+def known_problems(path: str | os.PathLike[str]) -> list[str]:
+    """Return the problems recorded for ``path`` if it is unchanged since it failed."""
+
+    key = _file_key(Path(path))
+    if key is None:
+        return []
+    with _verified_lock:
+        problems = _failed.get(key)
+    return list(problems) if problems else []
+
+
+def add_failure_listener(callback: IntegrityCallback) -> Callable[[], None]:
+    """Call ``callback(path, problems)`` whenever a background full check fails.
+
+    Listeners run on the checking thread.  Returns a function that removes
+    the listener.
+    """
+
+    with _verified_lock:
+        _failure_listeners.append(callback)
+
+    def _remove() -> None:
+        with _verified_lock:
+            if callback in _failure_listeners:
+                _failure_listeners.remove(callback)
+
+    return _remove
+
+
+def check_integrity(path: str | os.PathLike[str], *, full: bool = False) -> list[str]:
+    """Check a database file and return the problems found (empty when ok).
+
+    Runs ``PRAGMA quick_check`` by default and ``PRAGMA integrity_check`` with
+    ``full=True``.  Files that already passed a check of at least this level
+    and have not changed since are not opened again.
+    """
+
+    path = Path(path)
+    if is_verified(path, full=full):
+        return []
+    recorded = known_problems(path)
+    if recorded:
+        return recorded
+    state = _file_state(path)
+    if state is None:
+        return [f"missing database file: {path}"]
+
+    pragma = "integrity_check" if full else "quick_check"
+    uri = f"file:{path.as_posix()}?mode=ro"
+    try:
+        with closing(sqlite3.connect(uri, uri=True, timeout=5)) as db:
+            rows = db.execute(f"PRAGMA {pragma}").fetchall()
+    except sqlite3.Error as exc:
+        return [f"{pragma} failed: {exc}"]
+
+    problems = [str(row[0]) for row in rows if str(row[0]).lower() != "ok"]
+    if not problems and _file_state(path) == state:
+        mark_verified(path, full=full)
+    return problems
+
+
+class IntegrityScheduler:
+    """Run full integrity checks on a background thread during idle time.
+
+    Each submitted file waits until no new submission has arrived for
+    ``idle_delay_s`` seconds, so a burst of saves triggers one scan of the
+    newest snapshot rather than one per save.  Files that already passed a
+    full check are skipped.  The worker is a daemon thread and never delays
+    interpreter exit.
+    """
+
+    def __init__(self, *, idle_delay_s: float = 5.0) -> None:
+        self._idle_delay_s = max(float(idle_delay_s), 0.0)
+        self._cond = threading.Condition()
+        self._pending: dict[str, tuple[Path, list[IntegrityCallback], Future[list[str]]]] = {}
+        self._last_submit = 0.0
+        self._thread: threading.Thread | None = None
+
+    def submit(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        on_done: IntegrityCallback | None = None,
+    ) -> Future[list[str]]:
+        """Queue a full check of ``path``; duplicate submissions share one check."""
+
+        path = Path(path)
+        key = os.fspath(path)
+        with self._cond:
+            entry = self._pending.get(key)
+            if entry is None:
+                entry = (path, [], Future())
+                self._pending[key] = entry
+            if on_done is not None:
+                entry[1].append(on_done)
+            self._last_submit = time.monotonic()
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="integrity-check", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify_all()
+            return entry[2]
+
+    def _next(self) -> tuple[Path, list[IntegrityCallback], Future[list[str]]]:
+        with self._cond:
+            while True:
+                if self._pending:
+                    remaining = self._last_submit + self._idle_delay_s - time.monotonic()
+                    if remaining <= 0:
+                        key = next(iter(self._pending))
+                        return self._pending.pop(key)
+                    self._cond.wait(remaining)
+                else:
+                    self._cond.wait()
+
+    def _run(self) -> None:
+        while True:
+            path, callbacks, future = self._next()
+            if not future.set_running_or_notify_cancel():
+                continue
+            if _file_state(path) is None:
+                # Pruned or cleaned up before we got to it; nothing to verify.
+                problems: list[str] = []
+            else:
+                problems = check_integrity(path, full=True)
+            if problems:
+                log.error("Integrity check failed for %s: %s", path, "; ".join(problems[:5]))
+                mark_failed(path, problems)
+                with _verified_lock:
+                    callbacks = [*callbacks, *_failure_listeners]
+            else:
+                log.debug("Integrity check passed for %s", path)
+            future.set_result(problems)
+            for callback in callbacks:
+                try:
+                    callback(path, problems)
+                except Exception:
+                    log.debug("Integrity callback failed for %s", path, exc_info=True)
+
+
+_default_scheduler: IntegrityScheduler | None = None
+_default_lock = threading.Lock()
+
+
+def default_scheduler() -> IntegrityScheduler:
+    """Return the process-wide scheduler used for snapshot checks."""
+
+    global _default_scheduler
+    with _default_lock:
+        if _default_scheduler is None:
+            _default_scheduler = IntegrityScheduler()
+        return _default_scheduler
+
+
+def schedule_full_check(
+    path: str | os.PathLike[str],
+    *,
+    on_done: IntegrityCallback | None = None,
+) -> Future[list[str]]:
+    """Queue a full integrity check of ``path`` on the default scheduler."""
+
+    return default_scheduler().submit(path, on_done=on_done)
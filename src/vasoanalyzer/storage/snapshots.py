@@ -35,10 +35,11 @@ import time
 import uuid
 from dataclasses import dataclass
 from pathlib import Path
-from typing import cast
 
 from vasoanalyzer.core import project_format
 
+from . import integrity
+
 log = logging.getLogger(__name__)
 
 __all__ = [
@@ -52,6 +53,7 @@ __all__ = [
     "get_current_snapshot",
     "list_snapshots",
     "validate_snapshot",
+    "is_snapshot_verified",
     "prune_old_snapshots",
 ]
 
@@ -341,7 +343,12 @@ def create_snapshot(bundle_path: Path, staging_db: Path, db_writer=None) -> Snap
 
     Uses SQLite backup API to create a consistent snapshot, then atomically
     updates HEAD.json to point to it.  All pending writes must be flushed
-    via ``db_writer.barrier()`` before the backup begins.
+    via ``db_writer.barrier()`` before the backup begins.  The copy gets a
+    ``quick_check`` before it is published and is marked unverified until the
+    full ``integrity_check``, queued on :func:`integrity.schedule_full_check`
+    so it never blocks a save, passes.  Pruning keeps the newest verified
+    snapshot while later ones are unverified.  If the check fails the snapshot
+    is marked corrupt and later opens fall back to an earlier one.
 
     Args:
         bundle_path: Path to bundle directory
@@ -396,13 +403,12 @@ def create_snapshot(bundle_path: Path, staging_db: Path, db_writer=None) -> Snap
             dst = sqlite3.connect(dest_tmp)
             try:
                 src_conn.backup(dst)
-                check = dst.execute("PRAGMA integrity_check").fetchone()
-                if not check or str(check[0]).lower() != "ok":
-                    raise RuntimeError(f"Snapshot integrity check failed: {check}")
-
                 dst.execute("PRAGMA journal_mode=DELETE")
                 dst.execute("PRAGMA optimize")
                 dst.commit()
+                check = dst.execute("PRAGMA quick_check").fetchone()
+                if not check or str(check[0]).lower() != "ok":
+                    raise RuntimeError(f"Snapshot integrity check failed: {check}")
             finally:
                 dst.close()
         finally:
@@ -411,9 +417,13 @@ def create_snapshot(bundle_path: Path, staging_db: Path, db_writer=None) -> Snap
         # Fsync the snapshot file
         fsync_file(dest_tmp)
 
-        # Atomic publish: rename temp to final name
+        # Atomic publish: rename temp to final name.  The unverified marker
+        # goes first so a published snapshot never looks fully checked early.
+        atomic_write_text(_unverified_marker(dest), project_format.iso_utc_now())
         os.replace(dest_tmp, dest)
         log.info(f"Snapshot created: {dest.name}")
+        integrity.mark_verified(dest)
+        integrity.schedule_full_check(dest, on_done=_record_snapshot_integrity)
 
         # Update HEAD to point to new snapshot
         head_doc = project_format.build_head_document(
@@ -438,10 +448,46 @@ def create_snapshot(bundle_path: Path, staging_db: Path, db_writer=None) -> Snap
         # Clean up temp file on error
         if dest_tmp.exists():
             dest_tmp.unlink()
+        if not dest.exists():
+            _unverified_marker(dest).unlink(missing_ok=True)
         log.error(f"Failed to create snapshot: {e}")
         raise RuntimeError(f"Snapshot creation failed: {e}") from e
 
 
+def _corrupt_marker(snap_path: Path) -> Path:
+    return snap_path.with_name(snap_path.name + ".corrupt")
+
+
+def _unverified_marker(snap_path: Path) -> Path:
+    return snap_path.with_name(snap_path.name + ".unverified")
+
+
+def is_snapshot_verified(snap_path: Path) -> bool:
+    """Return True once ``snap_path`` has passed a full integrity check."""
+
+    return (
+        snap_path.exists()
+        and not _unverified_marker(snap_path).exists()
+        and not _corrupt_marker(snap_path).exists()
+    )
+
+
+def _record_snapshot_integrity(snap_path: Path, problems: list[str]) -> None:
+    """Clear the unverified marker after a full check, or mark the snapshot corrupt."""
+
+    if problems:
+        marker = {"checked_utc": project_format.iso_utc_now(), "problems": problems[:20]}
+        try:
+            atomic_write_text(_corrupt_marker(snap_path), json.dumps(marker, indent=2))
+        except OSError as e:
+            log.warning(f"Could not mark snapshot {snap_path.name} as corrupt: {e}")
+            return
+    try:
+        _unverified_marker(snap_path).unlink(missing_ok=True)
+    except OSError as e:
+        log.warning(f"Could not clear unverified marker for {snap_path.name}: {e}")
+
+
 def snapshot_from_staging(bundle_path: Path, staging_db: Path) -> SnapshotInfo:
     """
     Alias for create_snapshot() for compatibility with user's code example.
@@ -614,15 +660,22 @@ def validate_snapshot(snap_path: Path) -> bool:
     """
     if not snap_path.exists():
         return False
+    if _corrupt_marker(snap_path).exists():
+        log.debug(f"Snapshot {snap_path.name} failed a full integrity check earlier")
+        return False
 
-    try:
-        with sqlite3.connect(f"file:{snap_path}?mode=ro", uri=True, timeout=5) as db:
-            result = db.execute("PRAGMA quick_check").fetchone()
-            status = cast(str | None, result[0] if result else None)
-            return status == "ok"
-    except Exception as e:
-        log.debug(f"Snapshot validation failed for {snap_path}: {e}")
+    problems = integrity.check_integrity(snap_path)
+    if problems:
+        log.debug(f"Snapshot validation failed for {snap_path}: {problems[0]}")
         return False
+    if _unverified_marker(snap_path).exists():
+        # The full check from the save that wrote it may never have finished
+        # (for example the app quit first); queue it again.
+        if integrity.is_verified(snap_path, full=True):
+            _record_snapshot_integrity(snap_path, [])
+        else:
+            integrity.schedule_full_check(snap_path, on_done=_record_snapshot_integrity)
+    return True
 
 
 # =============================================================================
@@ -670,9 +723,8 @@ def open_staging_db(
             # Open source snapshot with read lock to prevent it from being deleted mid-copy
             src_conn = sqlite3.connect(f"file:{initialize_from}?mode=ro", uri=True, timeout=10.0)
             try:
-                # Verify source is valid before copying
-                result = src_conn.execute("PRAGMA quick_check").fetchone()
-                if result[0] != "ok":
+                # Verify source is valid before copying (free if HEAD lookup just did)
+                if integrity.check_integrity(initialize_from):
                     raise RuntimeError(f"Source snapshot failed integrity check: {initialize_from}")
 
                 # Copy while holding read lock (this prevents pruning from deleting it)
@@ -792,11 +844,18 @@ def prune_old_snapshots(bundle_path: Path, keep_count: int = 50) -> int:
     # Sort by number, oldest first
     candidates = sorted(snapshots, key=lambda s: s.number)
 
+    # Keep the newest fully verified snapshot as a fallback until the
+    # snapshots written after it pass their full integrity check.
+    keep_nums = set(current_nums)
+    verified = [s for s in candidates if is_snapshot_verified(s.path)]
+    if verified:
+        keep_nums.add(verified[-1].number)
+
     # Keep only the oldest (total - keep_count) snapshots
     to_delete = []
     for snap in candidates[:-keep_count]:
-        # Don't delete current snapshot
-        if snap.number not in current_nums:
+        # Don't delete current snapshot or the verified fallback
+        if snap.number not in keep_nums:
             to_delete.append(snap)
 
     # Delete snapshots
@@ -804,6 +863,8 @@ def prune_old_snapshots(bundle_path: Path, keep_count: int = 50) -> int:
     for snap in to_delete:
         try:
             snap.path.unlink()
+            _corrupt_marker(snap.path).unlink(missing_ok=True)
+            _unverified_marker(snap.path).unlink(missing_ok=True)
             log.debug(f"Deleted snapshot: {snap.path.name}")
             deleted_count += 1
         except Exception as e:
@@ -62,6 +62,36 @@ def apply_cloud_safe_pragmas(conn: sqlite3.Connection) -> None:
     # NOTE: No mmap_size for cloud storage - can cause issues with sync
 
 
+# ``dataset.trace_modified_utc`` is stamped whenever existing trace rows are
+# updated or deleted.  Inserts are not tracked: every insert changes the row
+# count (``(dataset_id, t_seconds)`` is the key), and a per-row insert trigger
+# would double bulk import time.
+_TRACE_MODIFIED_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS trace_modified_on_update AFTER UPDATE ON trace
+    BEGIN
+        UPDATE dataset SET trace_modified_utc = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
+         WHERE id IN (OLD.dataset_id, NEW.dataset_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trace_modified_on_delete AFTER DELETE ON trace
+    BEGIN
+        UPDATE dataset SET trace_modified_utc = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
+         WHERE id = OLD.dataset_id;
+    END
+    """,
+)
+
+
+def _ensure_trace_modified_tracking(conn: sqlite3.Connection) -> None:
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(dataset)")}
+    if "trace_modified_utc" not in columns:
+        conn.execute("ALTER TABLE dataset ADD COLUMN trace_modified_utc TEXT")
+    for statement in _TRACE_MODIFIED_TRIGGERS:
+        conn.execute(statement)
+
+
 def ensure_schema(
     conn: sqlite3.Connection,
     *,
@@ -100,7 +130,8 @@ def ensure_schema(
             signature_version INTEGER NOT NULL DEFAULT 1,
             last_validated_utc TEXT,
             validation_status TEXT NOT NULL DEFAULT 'unknown',
-            validation_error TEXT
+            validation_error TEXT,
+            trace_modified_utc TEXT
         );
 
         CREATE TABLE IF NOT EXISTS trace (
@@ -205,8 +236,15 @@ def ensure_schema(
             png BLOB NOT NULL
         );
 
+        CREATE TABLE IF NOT EXISTS signature_cache (
+            dataset_id INTEGER PRIMARY KEY REFERENCES dataset(id) ON DELETE CASCADE,
+            trace_token TEXT NOT NULL,
+            trace_signature TEXT NOT NULL
+        );
+
         """
     )
+    _ensure_trace_modified_tracking(conn)
     set_user_version(conn, schema_version)
 
     meta_values: dict[str, str] = {
@@ -376,6 +414,26 @@ def run_migrations(
 
             version = 7
 
+        elif version == 7:
+            # Migration from v7 to v8: cache of trace signatures keyed by change token
+            log.info("Migrating schema from v7 to v8 (trace signature cache)")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS signature_cache (
+                    dataset_id INTEGER PRIMARY KEY REFERENCES dataset(id) ON DELETE CASCADE,
+                    trace_token TEXT NOT NULL,
+                    trace_signature TEXT NOT NULL
+                )
+                """
+            )
+            version = 8
+
+        elif version == 8:
+            # Migration from v8 to v9: stamp datasets when their trace rows change
+            log.info("Migrating schema from v8 to v9 (trace modified timestamp)")
+            _ensure_trace_modified_tracking(conn)
+            version = 9
+
         else:
             raise RuntimeError(f"Unknown schema version {version}. Cannot migrate.")
     set_user_version(conn, target)
@@ -5,21 +5,41 @@ from __future__ import annotations
 import logging
 import sqlite3
 import time
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Mapping, Sequence
+from itertools import repeat
+from typing import Any
 
+import numpy as np
 import pandas as pd
 
 log = logging.getLogger(__name__)
 
 __all__ = [
+    "TRACE_COLUMNS",
     "normalize_label",
     "match_trace_columns",
     "nullable_float",
     "prepare_trace_rows",
+    "prepare_trace_columns",
     "fetch_trace_dataframe",
     "count_trace_rows",
 ]
 
+# Value columns of the trace table, in insert order after dataset_id/t_us.
+TRACE_COLUMNS = (
+    "t_seconds",
+    "inner_diam",
+    "outer_diam",
+    "p_avg",
+    "p1",
+    "p2",
+    "frame_number",
+    "tiff_page",
+    "temp",
+    "table_marker",
+    "caliper_length",
+)
+
 
 def normalize_label(label: str) -> str:
     """Normalize free-form column labels for fuzzy matching."""
@@ -356,6 +376,53 @@ def prepare_trace_rows(dataset_id: int, df: pd.DataFrame | None) -> Iterable[tup
     return rows
 
 
+def _float_column(values: Any) -> np.ndarray:
+    array = np.asarray(values)
+    if array.dtype.kind in "biuf":
+        return array.astype(np.float64, copy=False)
+    return pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(dtype=np.float64)
+
+
+def prepare_trace_columns(dataset_id: int, columns: Mapping[str, Any]) -> list[tuple]:
+    """Build trace rows from whole columns keyed by :data:`TRACE_COLUMNS` names.
+
+    Columns already in canonical form (as :func:`fetch_trace_dataframe` returns
+    them) are normalised with array operations instead of value by value.  Any
+    other column names fall back to :func:`prepare_trace_rows`.  NaN is left in
+    place; SQLite stores a bound NaN as NULL.
+    """
+
+    if not columns:
+        return []
+    if not set(columns) <= set(TRACE_COLUMNS) or "t_seconds" not in columns:
+        return list(prepare_trace_rows(dataset_id, pd.DataFrame(dict(columns))))
+
+    stage_start = time.perf_counter()
+    arrays = {name: _float_column(values) for name, values in columns.items()}
+    keep = ~np.isnan(arrays["t_seconds"])
+    for name in ("inner_diam", "outer_diam"):
+        if name in arrays:
+            arrays[name] = np.where(arrays[name] < 0, np.nan, arrays[name])
+    if not keep.all():
+        arrays = {name: array[keep] for name, array in arrays.items()}
+
+    t_seconds = arrays["t_seconds"]
+    total_rows = len(t_seconds)
+    t_us = np.rint(t_seconds * 1_000_000).astype(np.int64)
+    values = [arrays[name].tolist() if name in arrays else repeat(None) for name in TRACE_COLUMNS]
+    rows = list(
+        zip(repeat(dataset_id, total_rows), values[0], t_us.tolist(), *values[1:], strict=False)
+    )
+    log.info(
+        "TRACE-SAVE: prepare_trace_columns dataset_id=%s rows=%d columns=%s duration=%.2fs",
+        dataset_id,
+        total_rows,
+        list(columns),
+        time.perf_counter() - stage_start,
+    )
+    return rows
+
+
 def fetch_trace_dataframe(
     conn: sqlite3.Connection,
     dataset_id: int,
@@ -19,7 +19,7 @@ import sqlite3
 import tempfile
 import time
 import zipfile
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, cast
@@ -70,7 +70,7 @@ __all__ = [
     "convert_legacy_project",
 ]
 
-SCHEMA_VERSION = 7
+SCHEMA_VERSION = 9
 DEFAULT_CHUNK_SIZE = 2 * 1024 * 1024  # 2 MiB
 
 
@@ -208,10 +208,23 @@ def create_project(
     )
 
 
-def open_project(path: str | os.PathLike[str]) -> ProjectStore:
+def _validate_on_open(conn: sqlite3.Connection) -> None:
+    """Sign every dataset concurrently; results reach validation listeners as they finish."""
+
+    from vasoanalyzer.services.validation_service import validate_project
+
+    try:
+        validate_project(conn)
+    except Exception:
+        log.debug("Quick validation failed during open", exc_info=True)
+
+
+def open_project(path: str | os.PathLike[str], *, validate: bool = True) -> ProjectStore:
     """Open an existing SQLite project (bundle or legacy) and return a :class:`ProjectStore`.
 
     Automatically handles both .vasopack bundle directories and legacy .vaso files.
+    With ``validate=False`` the open-time signature pass is skipped, leaving the
+    stored signatures untouched for callers that compare against them.
     """
 
     project_path = Path(path)
@@ -242,10 +255,8 @@ def open_project(path: str | os.PathLike[str]) -> ProjectStore:
             )
             unified_store.conn.commit()
 
-        try:
-            _validation.quick_validate_project(unified_store.conn)
-        except Exception:
-            log.debug("Quick validation failed during bundle open", exc_info=True)
+        if validate:
+            _validate_on_open(unified_store.conn)
         writer = DbWriter(project_path, connection=unified_store.conn)
         # Return the unified store (which is already a ProjectStore-compatible object)
         ps = ProjectStore(
@@ -309,10 +320,8 @@ def open_project(path: str | os.PathLike[str]) -> ProjectStore:
             f"Project schema version {version} is newer than supported {SCHEMA_VERSION}"
         )
 
-    try:
-        _validation.quick_validate_project(conn)
-    except Exception:
-        log.debug("Quick validation failed during open", exc_info=True)
+    if validate:
+        _validate_on_open(conn)
 
     writer = DbWriter(project_path, connection=conn)
     return ProjectStore(
@@ -447,7 +456,7 @@ def close_project(store: ProjectStore) -> None:
 def add_dataset(
     store: ProjectStore,
     name: str,
-    trace_df: pd.DataFrame,
+    trace_df: pd.DataFrame | Mapping[str, Any],
     events_df: pd.DataFrame | None,
     *,
     metadata: dict | None = None,
@@ -456,10 +465,20 @@ def add_dataset(
     chunk_size: int = DEFAULT_CHUNK_SIZE,
     thumbnail_png: bytes | None = None,
 ) -> int:
-    """Insert a dataset with trace/events rows and optional TIFF asset."""
+    """Insert a dataset with trace/events rows and optional TIFF asset.
+
+    ``trace_df`` may also be a mapping of whole columns named as in
+    ``_traces.TRACE_COLUMNS``; those rows are built without going through a
+    DataFrame (see ``_traces.prepare_trace_columns``).
+    """
 
     dataset_timer = time.perf_counter()
-    trace_len = len(trace_df.index) if isinstance(trace_df, pd.DataFrame) else 0
+    if isinstance(trace_df, pd.DataFrame):
+        trace_len = len(trace_df.index)
+    elif isinstance(trace_df, Mapping) and trace_df:
+        trace_len = len(next(iter(trace_df.values())))
+    else:
+        trace_len = 0
     event_len = len(events_df.index) if isinstance(events_df, pd.DataFrame) else 0
     log.info(
         "TRACE-SAVE: add_dataset start name=%s trace_rows=%d event_rows=%d embed_tiff=%s",
@@ -513,7 +532,10 @@ def add_dataset(
             dataset_id = int(dataset_rowid)
 
             trace_prep_start = time.perf_counter()
-            trace_rows = list(_traces.prepare_trace_rows(dataset_id, trace_df))
+            if isinstance(trace_df, Mapping):
+                trace_rows = _traces.prepare_trace_columns(dataset_id, trace_df)
+            else:
+                trace_rows = list(_traces.prepare_trace_rows(dataset_id, trace_df))
             log.info(
                 "TRACE-SAVE: prepare_trace_rows finished dataset_id=%s rows=%d duration=%.2fs",
                 dataset_id,
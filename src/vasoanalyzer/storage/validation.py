@@ -7,17 +7,27 @@ import json
 import logging
 import math
 import sqlite3
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
+import numpy as np
+
 log = logging.getLogger(__name__)
 
 DEFAULT_SIGNATURE_VERSION = 1
 
+# Rows pulled per fetchmany() call while streaming trace times.
+_TRACE_FETCH_ROWS = 65_536
+
 __all__ = [
+    "DatasetSignatures",
+    "compute_dataset_signatures",
     "compute_events_signature",
     "compute_trace_signature",
+    "flag_duplicate_signatures",
     "quick_validate_project",
+    "record_dataset_validation",
     "update_dataset_signatures",
 ]
 
@@ -113,29 +123,42 @@ def compute_events_signature(conn: sqlite3.Connection, dataset_id: int) -> str:
     return _stable_hash(normalized)
 
 
+def _trace_times_us(conn: sqlite3.Connection, dataset_id: int) -> np.ndarray:
+    """Stream a dataset's trace times as sorted integer microseconds."""
+
+    cursor = conn.cursor()
+    cursor.row_factory = None  # plain tuples; sqlite3.Row triples the fetch cost
+    cursor.execute(
+        "SELECT t_seconds FROM trace WHERE dataset_id = ? ORDER BY t_seconds ASC",
+        (dataset_id,),
+    )
+    chunks: list[np.ndarray] = []
+    while rows := cursor.fetchmany(_TRACE_FETCH_ROWS):
+        seconds = np.fromiter((row[0] for row in rows), dtype=float, count=len(rows))
+        # rint rounds half to even, exactly like round() on the same doubles.
+        chunks.append(np.rint(seconds * 1_000_000).astype(np.int64))
+    if not chunks:
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate(chunks)
+
+
 def compute_trace_signature(conn: sqlite3.Connection, dataset_id: int, *, sample_k: int = 8) -> str:
     """Compute a signature for the trace time axis."""
 
-    times = [
-        float(row[0])
-        for row in conn.execute(
-            "SELECT t_seconds FROM trace WHERE dataset_id = ? ORDER BY t_seconds ASC",
-            (dataset_id,),
-        ).fetchall()
-    ]
-    if not times:
+    t_us = _trace_times_us(conn, dataset_id)
+    if not t_us.size:
         return _stable_hash({"samples": [], "dt": None})
 
-    t_us = [int(round(t * 1_000_000)) for t in times]
-    n = len(t_us)
-    sample_prefix = t_us[:sample_k]
-    sample_suffix = t_us[-sample_k:] if n > sample_k else []
+    n = int(t_us.size)
+    sample_prefix = t_us[:sample_k].tolist()
+    sample_suffix = t_us[-sample_k:].tolist() if n > sample_k else []
 
     if n > 1:
-        deltas = [b - a for a, b in zip(t_us[:-1], t_us[1:], strict=False)]
-        median_dt = sorted(deltas)[len(deltas) // 2]
-        min_dt = min(deltas)
-        max_dt = max(deltas)
+        deltas = np.diff(t_us)
+        mid = deltas.size // 2
+        median_dt = int(np.partition(deltas, mid)[mid])
+        min_dt = int(deltas.min())
+        max_dt = int(deltas.max())
     else:
         median_dt = min_dt = max_dt = 0
 
@@ -150,11 +173,99 @@ def compute_trace_signature(conn: sqlite3.Connection, dataset_id: int, *, sample
     return _stable_hash(payload)
 
 
+def _trace_change_token(conn: sqlite3.Connection, dataset_id: int) -> str:
+    """Return a cheap token that changes whenever the trace time axis does.
+
+    Inserts always change the row count, and schema v9 triggers stamp
+    ``dataset.trace_modified_utc`` on every trace update or delete, so interior
+    edits and rewrites that keep the count and endpoints are caught too.
+    (``trace`` is a WITHOUT ROWID table, so there is no rowid to track.)  MIN
+    and MAX sit in separate subqueries so each is a single index probe; COUNT
+    walks the covering ``trace_ds_t`` index without surfacing rows to Python.
+    """
+
+    counts = conn.execute(
+        """
+        SELECT (SELECT COUNT(*) FROM trace WHERE dataset_id = :ds),
+               (SELECT MIN(t_seconds) FROM trace WHERE dataset_id = :ds),
+               (SELECT MAX(t_seconds) FROM trace WHERE dataset_id = :ds)
+        """,
+        {"ds": dataset_id},
+    ).fetchone()
+    try:
+        modified = conn.execute(
+            "SELECT trace_modified_utc FROM dataset WHERE id = ?", (dataset_id,)
+        ).fetchone()
+    except sqlite3.OperationalError:
+        # Schemas older than v9 (e.g. a read-only open that skipped migration)
+        # do not track trace edits.
+        modified = None
+    stamp = modified[0] if modified else None
+    return json.dumps([DEFAULT_SIGNATURE_VERSION, *counts, stamp], separators=(",", ":"))
+
+
+def _lookup_trace_signature(conn: sqlite3.Connection, dataset_id: int, token: str) -> str | None:
+    try:
+        row = conn.execute(
+            "SELECT trace_token, trace_signature FROM signature_cache WHERE dataset_id = ?",
+            (dataset_id,),
+        ).fetchone()
+    except sqlite3.OperationalError:
+        # Schemas older than v8 (e.g. a read-only open that skipped migration)
+        # have no cache table.
+        return None
+    if row is not None and row[0] == token:
+        return str(row[1])
+    return None
+
+
+@dataclass(frozen=True)
+class DatasetSignatures:
+    """Signatures computed for one dataset, ready to be recorded."""
+
+    dataset_id: int
+    events_signature: str
+    trace_signature: str
+    trace_token: str
+    trace_cached: bool
+
+
+def compute_dataset_signatures(conn: sqlite3.Connection, dataset_id: int) -> DatasetSignatures:
+    """Compute both signatures for ``dataset_id`` without writing anything.
+
+    The trace signature is taken from ``signature_cache`` while the trace's
+    change token is unchanged, so this is safe on read-only connections.
+    """
+
+    token = _trace_change_token(conn, dataset_id)
+    cached = _lookup_trace_signature(conn, dataset_id, token)
+    trace_sig = cached if cached is not None else compute_trace_signature(conn, dataset_id)
+    return DatasetSignatures(
+        dataset_id=dataset_id,
+        events_signature=compute_events_signature(conn, dataset_id),
+        trace_signature=trace_sig,
+        trace_token=token,
+        trace_cached=cached is not None,
+    )
+
+
+def _store_trace_signature(conn: sqlite3.Connection, sigs: DatasetSignatures) -> None:
+    if sigs.trace_cached:
+        return
+    conn.execute(
+        "INSERT OR REPLACE INTO signature_cache(dataset_id, trace_token, trace_signature) "
+        "VALUES (?, ?, ?)",
+        (sigs.dataset_id, sigs.trace_token, sigs.trace_signature),
+    )
+
+
 def update_dataset_signatures(conn: sqlite3.Connection, dataset_id: int) -> dict[str, str]:
     """Compute and persist event/trace signatures for a dataset."""
 
-    events_sig = compute_events_signature(conn, dataset_id)
-    trace_sig = compute_trace_signature(conn, dataset_id)
+    sigs = compute_dataset_signatures(conn, dataset_id)
+    _store_trace_signature(conn, sigs)
+    events_sig = sigs.events_signature
+    trace_sig = sigs.trace_signature
     now = datetime.now(timezone.utc).isoformat()
     conn.execute(
         """
@@ -181,7 +292,14 @@ def _duplicate_signature_issues(conn: sqlite3.Connection) -> list[dict[str, Any]
         """
         SELECT id, events_signature, trace_source_fingerprint, events_source_fingerprint
           FROM dataset
-         WHERE events_signature IS NOT NULL
+         WHERE events_signature IN (
+                SELECT events_signature
+                  FROM dataset
+                 WHERE events_signature IS NOT NULL
+                 GROUP BY events_signature
+                HAVING COUNT(*) > 1
+               )
+         ORDER BY id
         """
     ).fetchall()
     sig_map: dict[str, list[sqlite3.Row]] = {}
@@ -205,76 +323,80 @@ def _duplicate_signature_issues(conn: sqlite3.Connection) -> list[dict[str, Any]
     return issues
 
 
-def quick_validate_project(conn: sqlite3.Connection) -> list[dict[str, Any]]:
-    """
-    Recompute signatures and flag drift/duplication.
+def record_dataset_validation(
+    conn: sqlite3.Connection,
+    sigs: DatasetSignatures,
+    *,
+    stored_events: str | None,
+    stored_trace: str | None,
+    now: str,
+) -> list[dict[str, Any]]:
+    """Persist freshly computed signatures and return any drift issues.
 
-    Returns a list of validation issues; also updates dataset validation fields.
+    ``stored_events``/``stored_trace`` are the signatures the dataset row held
+    before validation.  The caller commits.
     """
 
+    ds_id = sigs.dataset_id
+    computed_events = sigs.events_signature
+    computed_trace = sigs.trace_signature
     issues: list[dict[str, Any]] = []
-    now = datetime.now(timezone.utc).isoformat()
-    datasets = conn.execute(
-        "SELECT id, events_signature, trace_signature FROM dataset ORDER BY id"
-    ).fetchall()
-    for row in datasets:
-        ds_id = int(row[0])
-        stored_events = row[1]
-        stored_trace = row[2]
-        computed_events = compute_events_signature(conn, ds_id)
-        computed_trace = compute_trace_signature(conn, ds_id)
-
-        status = "ok"
-        error_msg = None
-        if stored_events and stored_events != computed_events:
-            status = "error"
-            error_msg = "events_signature drift detected"
-            issues.append(
-                {
-                    "kind": "events_signature_drift",
-                    "dataset_id": ds_id,
-                    "stored": stored_events,
-                    "computed": computed_events,
-                }
-            )
-        if stored_trace and stored_trace != computed_trace:
-            # Keep the highest severity
-            status = "error" if status != "error" else status
-            error_msg = error_msg or "trace_signature drift detected"
-            issues.append(
-                {
-                    "kind": "trace_signature_drift",
-                    "dataset_id": ds_id,
-                    "stored": stored_trace,
-                    "computed": computed_trace,
-                }
-            )
 
-        conn.execute(
-            """
-            UPDATE dataset
-               SET events_signature = ?,
-                   trace_signature = ?,
-                   signature_version = ?,
-                   last_validated_utc = ?,
-                   validation_status = ?,
-                   validation_error = ?
-             WHERE id = ?
-            """,
-            (
-                computed_events,
-                computed_trace,
-                DEFAULT_SIGNATURE_VERSION,
-                now,
-                status,
-                error_msg,
-                ds_id,
-            ),
+    status = "ok"
+    error_msg = None
+    if stored_events and stored_events != computed_events:
+        status = "error"
+        error_msg = "events_signature drift detected"
+        issues.append(
+            {
+                "kind": "events_signature_drift",
+                "dataset_id": ds_id,
+                "stored": stored_events,
+                "computed": computed_events,
+            }
+        )
+    if stored_trace and stored_trace != computed_trace:
+        # Keep the highest severity
+        status = "error" if status != "error" else status
+        error_msg = error_msg or "trace_signature drift detected"
+        issues.append(
+            {
+                "kind": "trace_signature_drift",
+                "dataset_id": ds_id,
+                "stored": stored_trace,
+                "computed": computed_trace,
+            }
         )
 
-    # Duplicate detection across datasets
+    _store_trace_signature(conn, sigs)
+    conn.execute(
+        """
+        UPDATE dataset
+           SET events_signature = ?,
+               trace_signature = ?,
+               signature_version = ?,
+               last_validated_utc = ?,
+               validation_status = ?,
+               validation_error = ?
+         WHERE id = ?
+        """,
+        (
+            computed_events,
+            computed_trace,
+            DEFAULT_SIGNATURE_VERSION,
+            now,
+            status,
+            error_msg,
+            ds_id,
+        ),
+    )
+    return issues
+
+
+def flag_duplicate_signatures(conn: sqlite3.Connection) -> list[dict[str, Any]]:
+    """Mark datasets sharing an events signature across sources; caller commits."""
+
     dup_issues = _duplicate_signature_issues(conn)
-    issues.extend(dup_issues)
     if dup_issues:
         affected = {ds_id for issue in dup_issues for ds_id in issue.get("dataset_ids", [])}
         for ds_id in affected:
@@ -287,7 +409,34 @@ def quick_validate_project(conn: sqlite3.Connection) -> list[dict[str, Any]]:
                 """,
                 (ds_id,),
             )
+    return dup_issues
+
+
+def quick_validate_project(conn: sqlite3.Connection) -> list[dict[str, Any]]:
+    """
+    Recompute signatures and flag drift/duplication.
+
+    Event signatures are always recomputed; trace signatures come from
+    ``signature_cache`` while the trace's change token is unchanged.
+    Returns a list of validation issues; also updates dataset validation fields.
+    See :mod:`vasoanalyzer.services.validation_service` for a concurrent variant.
+    """
+
+    issues: list[dict[str, Any]] = []
+    now = datetime.now(timezone.utc).isoformat()
+    datasets = conn.execute(
+        "SELECT id, events_signature, trace_signature FROM dataset ORDER BY id"
+    ).fetchall()
+    for row in datasets:
+        sigs = compute_dataset_signatures(conn, int(row[0]))
+        issues.extend(
+            record_dataset_validation(
+                conn, sigs, stored_events=row[1], stored_trace=row[2], now=now
+            )
+        )
 
+    # Duplicate detection across datasets
+    issues.extend(flag_duplicate_signatures(conn))
     conn.commit()
     return issues
 
@@ -45,14 +45,11 @@ class DeleteEventsCommand(QUndoCommand):
         self._removed = sorted(removed, key=lambda r: r[0])
 
     def redo(self) -> None:
-        # Remove in reverse order so indices stay valid
-        for idx, _row, _meta in reversed(self._removed):
-            self.app._remove_event_at(idx)
+        self.app._remove_events_at([idx for idx, _row, _meta in self._removed])
 
     def undo(self) -> None:
-        # Re-insert in ascending order
-        for idx, row, meta in self._removed:
-            self.app._insert_event_at(idx, row, meta)
+        # Re-insert in ascending order so each index lands where it was
+        self.app._insert_events_at(self._removed)
 
 
 class ReplaceEventCommand(QUndoCommand):
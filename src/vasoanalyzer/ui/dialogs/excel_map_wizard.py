@@ -59,7 +59,7 @@ import logging
 
 import vasoanalyzer.ui.theme as theme
 from vasoanalyzer.excel import TemplateMetadata
-from vasoanalyzer.excel.label_matching import normalize_label, best_match
+from vasoanalyzer.excel.label_matching import LabelIndex, normalize_label
 
 __all__ = ["ExcelMapWizard"]
 
@@ -2475,25 +2475,21 @@ class ExcelMapWizard(QWizard):
         assigned_indices: set[int] = {
             idx for idx in self.row_assignments.values() if idx is not None
         }
-        remaining_labels = [
-            e.label
-            for e in self.session_events
-            if e.index not in assigned_indices
+        remaining_events = [e for e in self.session_events if e.index not in assigned_indices]
+        remaining: dict[str, deque[int]] = {}
+        for event in remaining_events:
+            remaining.setdefault(event.label, deque()).append(event.index)
+        # One index for every row; consume=True keeps each event to one row.
+        index = LabelIndex(e.label for e in remaining_events)
+        unassigned_rows = [
+            row
+            for row in self.event_rows
+            if not row.is_header and self.row_assignments.get(row.row_index) is None
         ]
-        for row in self.event_rows:
-            if row.is_header:
-                continue
-            if self.row_assignments.get(row.row_index) is not None:
-                continue
-            match_label = best_match(row.label, remaining_labels)
+        matches = index.match_all([row.label for row in unassigned_rows], consume=True)
+        for row, match_label in zip(unassigned_rows, matches, strict=True):
             if match_label is not None:
-                # Find the event index for this label
-                for event in self.session_events:
-                    if event.label == match_label and event.index not in assigned_indices:
-                        self.row_assignments[row.row_index] = event.index
-                        assigned_indices.add(event.index)
-                        remaining_labels.remove(match_label)
-                        break
+                self.row_assignments[row.row_index] = remaining[match_label].popleft()
 
     # --------------------------------------------------
     # Mapping persistence — remember user corrections
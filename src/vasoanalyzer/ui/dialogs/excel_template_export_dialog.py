@@ -33,7 +33,7 @@ from vasoanalyzer.excel.flexible_writer import (
     apply_flexible_write_plan,
     build_flexible_write_plan,
 )
-from vasoanalyzer.excel.label_matching import best_match as _find_best_match
+from vasoanalyzer.excel.label_matching import LabelIndex
 from vasoanalyzer.excel.template_metadata import read_template_metadata
 from vasoanalyzer.excel.template_v1 import inspect_template, validate_template_or_raise
 from vasoanalyzer.excel.writer_v1 import apply_write_plan, build_write_plan
@@ -378,6 +378,7 @@ class ExcelTemplateExportDialog(QDialog):
         # Row mapping table
         session_labels = self._get_session_event_labels()
         choices = ["(skip)"] + session_labels
+        label_index = LabelIndex(session_labels)
 
         self._mapping_table.setRowCount(0)
         for event_row in metadata.event_rows:
@@ -400,7 +401,7 @@ class ExcelTemplateExportDialog(QDialog):
 
                 combo = QComboBox()
                 combo.addItems(choices)
-                best = _find_best_match(event_row.label, session_labels)
+                best = label_index.match(event_row.label)
                 if best:
                     idx = combo.findText(best)
                     if idx >= 0:
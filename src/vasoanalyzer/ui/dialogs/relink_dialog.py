@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import threading
 from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QBrush, QColor, QShowEvent
 from PyQt6.QtWidgets import (
     QDialog,
@@ -14,6 +15,7 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QMessageBox,
+    QProgressDialog,
     QPushButton,
     QTreeWidget,
     QTreeWidgetItem,
@@ -21,6 +23,7 @@ from PyQt6.QtWidgets import (
 )
 
 from vasoanalyzer.core.project import SampleN
+from vasoanalyzer.pkg.relink import RelinkTarget, locate_files
 
 
 @dataclass
@@ -43,6 +46,41 @@ class MissingAsset:
         return "Missing"
 
 
+class LocateFilesThread(QThread):
+    """Runs :func:`locate_files` off the GUI thread with cancellation support."""
+
+    progress = pyqtSignal(int, int)  # targets settled, total
+    located = pyqtSignal(dict)  # {target.key: Path}
+    error = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, root: Path, targets: list[RelinkTarget], parent=None) -> None:
+        super().__init__(parent)
+        self._root = root
+        self._targets = targets
+        self._stop = threading.Event()
+
+    def cancel(self) -> None:
+        """Request cancellation; the search stops at its next check."""
+        self._stop.set()
+
+    def run(self) -> None:
+        try:
+            found = locate_files(
+                self._root,
+                self._targets,
+                progress_callback=self.progress.emit,
+                should_stop=self._stop.is_set,
+            )
+        except Exception as exc:
+            self.error.emit(str(exc))
+            return
+        if self._stop.is_set():
+            self.cancelled.emit()
+        else:
+            self.located.emit(found)
+
+
 class RelinkDialog(QDialog):
     """Non-modal dialog offering tools to relink missing files."""
 
@@ -55,6 +93,7 @@ class RelinkDialog(QDialog):
         self.resize(720, 360)
 
         self._assets: list[MissingAsset] = []
+        self._search: LocateFilesThread | None = None
 
         self._build_ui()
 
@@ -76,6 +115,10 @@ class RelinkDialog(QDialog):
         self.tree.setSelectionMode(QTreeWidget.SelectionMode.SingleSelection)
         layout.addWidget(self.tree, stretch=1)
 
+        self.status_label = QLabel("")
+        self.status_label.setWordWrap(True)
+        layout.addWidget(self.status_label)
+
         btn_row = QHBoxLayout()
         layout.addLayout(btn_row)
 
@@ -137,8 +180,10 @@ class RelinkDialog(QDialog):
     # ------------------------------------------------------------------
     def _update_buttons(self) -> None:
         has_selection = bool(self.tree.selectedItems())
+        searching = self._search is not None
         self.file_btn.setEnabled(has_selection)
-        self.apply_btn.setEnabled(any(asset.new_path for asset in self._assets))
+        self.root_btn.setEnabled(not searching)
+        self.apply_btn.setEnabled(not searching and any(asset.new_path for asset in self._assets))
 
     # ------------------------------------------------------------------
     def _choose_root(self) -> None:
@@ -147,12 +192,74 @@ class RelinkDialog(QDialog):
             return
 
         root_path = Path(root)
+        unresolved: list[MissingAsset] = []
         for asset in self._assets:
             candidate = self._candidate_from_root(root_path, asset)
             if candidate and candidate.exists():
                 asset.new_path = candidate.as_posix()
+            else:
+                unresolved.append(asset)
+
+        # Anything not at its expected spot is searched for in one walk.
+        targets = [
+            target
+            for index, asset in enumerate(unresolved)
+            if (target := self._search_target(index, asset)) is not None
+        ]
+        self._refresh_tree()
+        if targets:
+            self._start_search(root_path, targets, unresolved)
+
+    # ------------------------------------------------------------------
+    def _start_search(
+        self, root: Path, targets: list[RelinkTarget], unresolved: list[MissingAsset]
+    ) -> None:
+        progress = QProgressDialog("Searching for missing files…", "Cancel", 0, len(targets), self)
+        progress.setWindowTitle("Relink Missing Files")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.setValue(0)
+
+        search = LocateFilesThread(root, targets, self)
+        search.progress.connect(lambda done, _total: progress.setValue(done))
+        progress.canceled.connect(search.cancel)
+        search.located.connect(
+            lambda found: self._on_search_finished(found, unresolved, len(targets))
+        )
+        search.error.connect(self._on_search_error)
+        search.cancelled.connect(lambda: self._on_search_cancelled(len(targets)))
+        search.finished.connect(progress.close)
+        search.finished.connect(progress.deleteLater)
+        search.finished.connect(self._on_search_stopped)
+        self._search = search
+        self.status_label.setText(f"Searching {root} for {len(targets)} missing file(s)…")
+        self._update_buttons()
+        search.start()
+
+    def _on_search_finished(self, found: dict, unresolved: list[MissingAsset], total: int) -> None:
+        for index, path in found.items():
+            unresolved[index].new_path = path.resolve().as_posix()
+        self.status_label.setText(f"Search found {len(found)} of {total} missing file(s).")
         self._refresh_tree()
 
+    def _on_search_cancelled(self, total: int) -> None:
+        self.status_label.setText(
+            f"Search cancelled; {total} file(s) were not located. "
+            "Select a root folder to search again."
+        )
+
+    def _on_search_error(self, message: str) -> None:
+        self.status_label.setText("Search failed.")
+        QMessageBox.warning(
+            self, "Relink Search Failed", f"Could not search the folder:\n{message}"
+        )
+
+    def _on_search_stopped(self) -> None:
+        if self._search is not None:
+            self._search.deleteLater()
+            self._search = None
+        self._update_buttons()
+
     # ------------------------------------------------------------------
     def _candidate_from_root(self, root: Path, asset: MissingAsset) -> Path | None:
         if asset.relative:
@@ -166,6 +273,24 @@ class RelinkDialog(QDialog):
             return (root / target).resolve(strict=False)
         return None
 
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _search_target(key: int, asset: MissingAsset) -> RelinkTarget | None:
+        source = asset.current_path or asset.hint or asset.relative
+        if not source:
+            return None
+        size = None
+        if asset.signature:
+            # Signatures are "<size>-<mtime>"; only the size survives a copy.
+            head = asset.signature.split("-", 1)[0]
+            size = int(head) if head.isdigit() else None
+        return RelinkTarget(
+            key=key,
+            name=Path(source.replace("\\", "/")).name,
+            size=size,
+            rel_hint=asset.relative,
+        )
+
     # ------------------------------------------------------------------
     def _choose_file_for_selected(self) -> None:
         items = self.tree.selectedItems()
@@ -192,6 +317,13 @@ class RelinkDialog(QDialog):
         self.relink_applied.emit(ready)
         self.close()
 
+    # ------------------------------------------------------------------
+    def closeEvent(self, event) -> None:
+        if self._search is not None:
+            self._search.cancel()
+            self._search.wait()
+        super().closeEvent(event)
+
     # ------------------------------------------------------------------
     def showEvent(self, event: QShowEvent) -> None:
         super().showEvent(event)
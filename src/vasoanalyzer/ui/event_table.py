@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import logging
+import math
 from collections.abc import Sequence
 
+import numpy as np
 import pandas as pd
 from PyQt6.QtCore import (
     QAbstractTableModel,
@@ -96,6 +98,65 @@ COLUMN_LABELS = {
 COLUMN_KEY_FOR_LABEL = {label: key for key, label in COLUMN_LABELS.items()}
 COLUMN_KEY_FOR_LABEL["Time"] = "time"
 
+# Numeric EventRow fields in tuple order after the label.  Field names match
+# the column contract keys so headers map to storage through COLUMN_KEY_FOR_LABEL.
+_NUMERIC_FIELDS = ("time", "id", "od", "avg_p", "set_p", "frame")
+_OPTIONAL_FIELDS = frozenset(("od", "avg_p", "set_p"))
+
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_EDIT_ROLE = Qt.ItemDataRole.EditRole
+_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+_DECORATION_ROLE = Qt.ItemDataRole.DecorationRole
+_TOOLTIP_ROLE = Qt.ItemDataRole.ToolTipRole
+_CELL_ROLES = frozenset(
+    (_DISPLAY_ROLE, _EDIT_ROLE, _ALIGNMENT_ROLE, _DECORATION_ROLE, _TOOLTIP_ROLE)
+)
+_STATUS_ALIGNMENT = Qt.AlignmentFlag.AlignCenter
+_LABEL_ALIGNMENT = Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft
+_NUMBER_ALIGNMENT = Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight
+
+
+def _float_or_nan(value) -> float:
+    if value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _canonical_row(row: Sequence) -> tuple:
+    """Pad legacy short rows to the seven ``EventRow`` fields.
+
+    Older call sites build ``(label, time, id, frame)`` or
+    ``(label, time, id, od, frame)``; the frame is always the last element.
+    """
+    fields = list(row)
+    if len(fields) >= 7:
+        return tuple(fields[:7])
+    label = fields[0] if fields else ""
+    time_s = fields[1] if len(fields) > 1 else None
+    inner = fields[2] if len(fields) > 2 else None
+    frame = fields[-1] if len(fields) > 3 else None
+    optional = fields[3:-1] + [None] * 3
+    return (label, time_s, inner, *optional[:3], frame)
+
+
+def _rows_to_columns(rows: Sequence[Sequence]) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """Split event rows into a label array and one float64 array per numeric field."""
+    canonical = [_canonical_row(row) for row in rows]
+    labels = np.empty(len(canonical), dtype=object)
+    labels[:] = [row[0] for row in canonical]
+    values = {
+        field: np.fromiter(
+            (_float_or_nan(row[position]) for row in canonical),
+            dtype=float,
+            count=len(canonical),
+        )
+        for position, field in enumerate(_NUMERIC_FIELDS, start=1)
+    }
+    return labels, values
+
 
 def build_event_table_column_contract(
     *,
@@ -210,7 +271,15 @@ class NumericCellDelegate(QStyledItemDelegate):
 
 
 class EventTableModel(QAbstractTableModel):
-    """Model backing the event table view with editable event labels."""
+    """Model backing the event table view with editable event labels.
+
+    Events are stored column-wise: labels in an object array, each numeric
+    ``EventRow`` field in its own float64 array (``NaN`` standing in for
+    ``None``) and review states as small integer codes.  Display strings are
+    formatted on first paint and cached per cell; edits invalidate only the
+    cells they touch.  :meth:`to_dataframe` hands out views of the numeric
+    arrays, so the next in-place edit copies them first.
+    """
 
     value_edited = pyqtSignal(int, float, float)
     label_edited = pyqtSignal(int, str, str)
@@ -218,10 +287,19 @@ class EventTableModel(QAbstractTableModel):
 
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
-        self._rows: list[tuple] = []
+        self._labels = np.empty(0, dtype=object)
+        self._values = {field: np.empty(0, dtype=float) for field in _NUMERIC_FIELDS}
+        self._shared = False
         self._has_outer = False
+        self._has_avg_pressure = False
+        self._has_set_pressure = False
         self._headers: list[str] = []
-        self._review_states: list[str] = []
+        self._fields: list[str] = []
+        self._state_names: list[str] = [DEFAULT_REVIEW_STATE]
+        self._state_codes: dict[str, int] = {DEFAULT_REVIEW_STATE: 0}
+        self._review_codes = np.empty(0, dtype=np.int16)
+        # Per-row lists of formatted cell text (None = not formatted yet).
+        self._display: list[list | None] = []
         self._status_icons: dict[str, QPixmap] = {}
         self._time_formatter = TimeFormatter(TimeMode.SECONDS)
         self._time_mode = TimeMode.SECONDS
@@ -232,6 +310,9 @@ class EventTableModel(QAbstractTableModel):
             return
         self._time_mode = resolved
         self._time_formatter.set_mode(resolved)
+        for cells in self._display:
+            if cells is not None:
+                cells[TIME_COLUMN_INDEX] = None
         if self.rowCount() > 0 and self.columnCount() > TIME_COLUMN_INDEX:
             top_left = self.index(0, TIME_COLUMN_INDEX)
             bottom_right = self.index(self.rowCount() - 1, TIME_COLUMN_INDEX)
@@ -249,7 +330,7 @@ class EventTableModel(QAbstractTableModel):
 
     # Qt model API -----------------------------------------------------
     def rowCount(self, parent: QModelIndex = DEFAULT_QMODEL_INDEX) -> int:
-        return 0 if parent.isValid() else len(self._rows)
+        return 0 if parent.isValid() else len(self._labels)
 
     def columnCount(self, parent: QModelIndex = DEFAULT_QMODEL_INDEX) -> int:
         if parent.isValid():
@@ -285,35 +366,39 @@ class EventTableModel(QAbstractTableModel):
         return super().headerData(section, orientation, role)
 
     def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
-        if not index.isValid():
+        # Called for every role of every visible cell on each repaint, so the
+        # role checks use module-level constants and bail out early.
+        if role not in _CELL_ROLES or not index.isValid():
             return None
         row_idx = index.row()
         col = index.column()
-        if row_idx >= len(self._rows) or col >= self.columnCount():
+        if row_idx >= len(self._labels) or col >= self.columnCount():
             return None
 
         if col == STATUS_COLUMN_INDEX:
-            state = self._review_states[row_idx] if row_idx < len(self._review_states) else None
-            if role == Qt.ItemDataRole.DecorationRole:
-                return self._status_icon_for(state)
-            if role == Qt.ItemDataRole.ToolTipRole:
-                return self._status_tooltip(state)
-            if role == Qt.ItemDataRole.DisplayRole:
+            if role == _DECORATION_ROLE:
+                return self._status_icon_for(self._review_state_at(row_idx))
+            if role == _TOOLTIP_ROLE:
+                return self._status_tooltip(self._review_state_at(row_idx))
+            if role == _DISPLAY_ROLE:
                 return ""
-            if role == Qt.ItemDataRole.TextAlignmentRole:
-                return Qt.AlignmentFlag.AlignCenter
+            if role == _ALIGNMENT_ROLE:
+                return _STATUS_ALIGNMENT
             return None
 
-        raw_value = self._value_at(row_idx, col - 1)
-
-        if role == Qt.ItemDataRole.DisplayRole:
-            return self._format_display(col, raw_value)
-        if role == Qt.ItemDataRole.EditRole:
+        if role == _DISPLAY_ROLE:
+            cells = self._display[row_idx]
+            if cells is None:
+                cells = self._display[row_idx] = [None] * (len(self._headers) + 1)
+            text = cells[col]
+            if text is None:
+                text = cells[col] = self._format_display(col, self._value_at(row_idx, col - 1))
+            return text
+        if role == _EDIT_ROLE:
+            raw_value = self._value_at(row_idx, col - 1)
             return "" if raw_value is None else str(raw_value)
-        if role == Qt.ItemDataRole.TextAlignmentRole:
-            if col == EVENT_COLUMN_INDEX:
-                return Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft
-            return Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight
+        if role == _ALIGNMENT_ROLE:
+            return _LABEL_ALIGNMENT if col == EVENT_COLUMN_INDEX else _NUMBER_ALIGNMENT
         return None
 
     def flags(self, index: QModelIndex):
@@ -339,28 +424,27 @@ class EventTableModel(QAbstractTableModel):
         row_idx = index.row()
         col = index.column()
 
-        if not 0 <= row_idx < len(self._rows):
+        if not 0 <= row_idx < len(self._labels):
             return False
 
         # Skip status column
         if col == STATUS_COLUMN_INDEX:
             return False
 
-        # Map display column to tuple index
-        tuple_idx = self._column_to_tuple_index(col - 1)  # -1 for status column offset
-        if tuple_idx is None:
+        field = self._field_for_column(col - 1)  # -1 for status column offset
+        if field is None:
             return False
 
-        current = list(self._rows[row_idx])
-
         # Handle Event label column (string)
-        if tuple_idx == 0:
-            old_label = str(current[0]) if current and current[0] is not None else ""
+        if field == "event":
+            current = self._labels[row_idx]
+            old_label = str(current) if current is not None else ""
             new_label = "" if value is None else str(value)
             if new_label == old_label:
                 return False
-            current[0] = new_label
-            self._rows[row_idx] = tuple(current)
+            self._ensure_owned()
+            self._labels[row_idx] = new_label
+            self._invalidate_cell(row_idx, col)
             self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
             self.label_edited.emit(row_idx, new_label, old_label)
             return True
@@ -373,24 +457,16 @@ class EventTableModel(QAbstractTableModel):
         except (TypeError, ValueError):
             return False  # Invalid numeric input
 
-        # Get old value
-        old_val = current[tuple_idx] if tuple_idx < len(current) else None
-        if old_val is not None:
-            try:
-                if abs(float(old_val) - new_val) < 1e-9:
-                    return False  # No change
-            except (TypeError, ValueError):
-                pass
-
-        # Update the row tuple
-        if tuple_idx < len(current):
-            current[tuple_idx] = new_val
-            self._rows[row_idx] = tuple(current)
-            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
-            self.value_edited.emit(row_idx, new_val, float(old_val) if old_val is not None else 0.0)
-            return True
+        old_val = self._value_at(row_idx, col - 1)
+        if old_val is not None and abs(old_val - new_val) < 1e-9:
+            return False  # No change
 
-        return False
+        self._ensure_owned()
+        self._values[field][row_idx] = new_val
+        self._invalidate_cell(row_idx, col)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+        self.value_edited.emit(row_idx, new_val, float(old_val) if old_val is not None else 0.0)
+        return True
 
     # Public helpers ---------------------------------------------------
     def set_events(
@@ -403,7 +479,8 @@ class EventTableModel(QAbstractTableModel):
         review_states: Sequence[str] | None = None,
     ) -> None:
         self.beginResetModel()
-        self._rows = [tuple(row) for row in rows]
+        self._labels, self._values = _rows_to_columns(rows)
+        self._shared = False
         self._has_outer = has_outer_diameter
         self._has_avg_pressure = has_avg_pressure
         self._has_set_pressure = has_set_pressure
@@ -416,6 +493,8 @@ class EventTableModel(QAbstractTableModel):
             headers.append("Set P (mmHg)")
         # Note: Frame data is still in the row tuple but not displayed as a column
         self._headers = headers
+        self._fields = [COLUMN_KEY_FOR_LABEL[header] for header in headers]
+        self._display = [None] * len(self._labels)
         self.set_review_states(list(review_states or []), suppress_layout=True)
         self.endResetModel()
         self.structure_changed.emit()
@@ -424,55 +503,104 @@ class EventTableModel(QAbstractTableModel):
         self.set_events([], has_outer_diameter=False)
 
     def rows(self) -> list[tuple]:
-        return list(self._rows)
+        return self._rows_between(0, len(self._labels))
 
     def has_outer(self) -> bool:
         return self._has_outer
 
     def review_states(self) -> list[str]:
-        return list(self._review_states)
+        names = self._state_names
+        return [names[code] for code in self._review_codes.tolist()]
 
     def to_dataframe(self) -> pd.DataFrame:
-        n_cols = len(self._headers)
-        # Row tuples may contain trailing fields (e.g. frame number) not
-        # covered by headers; truncate to match.
-        trimmed = [row[:n_cols] for row in self._rows]
-        return pd.DataFrame(trimmed, columns=self._headers)
+        """Return the visible columns; they share the model's arrays until the next edit."""
+        columns = {
+            header: self._labels if field == "event" else self._values[field]
+            for header, field in zip(self._headers, self._fields, strict=True)
+        }
+        self._shared = True
+        return pd.DataFrame(columns, columns=self._headers, copy=False)
 
     def insert_row(self, index: int, row: tuple) -> None:
-        self.beginInsertRows(QModelIndex(), index, index)
-        self._rows.insert(index, tuple(row))
+        self.insert_rows(index, [row])
+
+    def insert_rows(self, index: int, rows: Sequence[tuple]) -> None:
+        """Insert *rows* before *index* with a single rowsInserted signal."""
+        if not rows:
+            return
+        labels, values = _rows_to_columns(rows)
+        count = len(labels)
+        self.beginInsertRows(QModelIndex(), index, index + count - 1)
+        self._labels = np.concatenate((self._labels[:index], labels, self._labels[index:]))
+        self._values = {
+            field: np.concatenate((column[:index], values[field], column[index:]))
+            for field, column in self._values.items()
+        }
+        self._shared = False
+        default = np.zeros(count, dtype=self._review_codes.dtype)
+        self._review_codes = np.concatenate(
+            (self._review_codes[:index], default, self._review_codes[index:])
+        )
+        self._display[index:index] = [None] * count
         self.endInsertRows()
 
     def append_row(self, row: tuple) -> None:
-        self.insert_row(len(self._rows), row)
+        self.insert_row(len(self._labels), row)
 
     def remove_row(self, index: int) -> tuple:
-        self.beginRemoveRows(QModelIndex(), index, index)
-        removed = self._rows.pop(index)
-        self.endRemoveRows()
+        return self.remove_rows([index])[0]
+
+    def remove_rows(self, indices: Sequence[int]) -> list[tuple]:
+        """Remove the rows at *indices*, one rowsRemoved signal per contiguous run.
+
+        Returns the removed rows in ascending index order.
+        """
+        positions = sorted({int(i) for i in indices})
+        if not positions:
+            return []
+        runs: list[tuple[int, int]] = []
+        for pos in positions:
+            if runs and pos == runs[-1][1] + 1:
+                runs[-1] = (runs[-1][0], pos)
+            else:
+                runs.append((pos, pos))
+
+        removed: list[tuple] = []
+        # Bottom-up so earlier runs keep their indices.
+        for first, last in reversed(runs):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            removed[:0] = self._rows_between(first, last + 1)
+            keep = np.r_[0:first, last + 1 : len(self._labels)]
+            self._labels = self._labels[keep]
+            self._values = {field: column[keep] for field, column in self._values.items()}
+            self._shared = False
+            self._review_codes = self._review_codes[keep]
+            del self._display[first : last + 1]
+            self.endRemoveRows()
         return removed
 
     def update_row(self, index: int, row: tuple) -> None:
-        if not 0 <= index < len(self._rows):
+        if not 0 <= index < len(self._labels):
             return
-        self._rows[index] = tuple(row)
+        labels, values = _rows_to_columns([row])
+        self._ensure_owned()
+        self._labels[index] = labels[0]
+        for field, column in self._values.items():
+            column[index] = values[field][0]
+        self._display[index] = None
         left = self.index(index, 0)
         right = self.index(index, self.columnCount() - 1)
         self.dataChanged.emit(left, right, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
 
     def set_review_states(self, review_states: list[str] | None, *, suppress_layout: bool = False):
-        target_len = len(self._rows)
-        incoming = list(review_states or [])
-        if len(incoming) < target_len:
-            incoming.extend([DEFAULT_REVIEW_STATE] * (target_len - len(incoming)))
-        elif len(incoming) > target_len:
-            incoming = incoming[:target_len]
-        # Normalize entries
-        self._review_states = [
-            state if isinstance(state, str) and state.strip() else DEFAULT_REVIEW_STATE
-            for state in incoming
-        ]
+        target_len = len(self._labels)
+        incoming = list(review_states or [])[:target_len]
+        codes = np.zeros(target_len, dtype=np.int16)
+        for row, state in enumerate(incoming):
+            # Normalize entries
+            if isinstance(state, str) and state.strip():
+                codes[row] = self._state_code(state)
+        self._review_codes = codes
         if not suppress_layout:
             top_left = self.index(0, STATUS_COLUMN_INDEX) if self.rowCount() else QModelIndex()
             bottom_right = (
@@ -484,84 +612,59 @@ class EventTableModel(QAbstractTableModel):
                 self.dataChanged.emit(top_left, bottom_right, [Qt.ItemDataRole.DecorationRole, Qt.ItemDataRole.ToolTipRole])
 
     # Internal helpers -------------------------------------------------
-    def _column_to_tuple_index(self, column: int) -> int | None:
-        """Map display column index to row tuple index for editing.
-
-        Returns the index in the row tuple, or None if column is not editable.
-        """
-        # Columns: Event(0), Time(1), ID(2), [OD(3)], [AvgP(?)]  [SetP(?)], Frame(last)
-        # Row tuple: (label, time, id, od|None, avg_p|None, set_p|None, frame|None)
+    def _invalidate_cell(self, row_idx: int, col: int) -> None:
+        cells = self._display[row_idx]
+        if cells is not None:
+            cells[col] = None
+
+    def _ensure_owned(self) -> None:
+        """Copy the columns before an in-place write if a DataFrame views them."""
+        if self._shared:
+            self._labels = self._labels.copy()
+            self._values = {field: column.copy() for field, column in self._values.items()}
+            self._shared = False
+
+    def _state_code(self, state: str) -> int:
+        code = self._state_codes.get(state)
+        if code is None:
+            code = self._state_codes[state] = len(self._state_names)
+            self._state_names.append(state)
+        return code
+
+    def _review_state_at(self, row_idx: int) -> str | None:
+        if row_idx >= len(self._review_codes):
+            return None
+        return self._state_names[self._review_codes[row_idx]]
+
+    def _rows_between(self, start: int, stop: int) -> list[EventRow]:
+        labels = self._labels[start:stop].tolist()
+        times = self._values["time"][start:stop].tolist()
+        inner = self._values["id"][start:stop].tolist()
+        optional = [
+            [None if math.isnan(v) else v for v in self._values[field][start:stop].tolist()]
+            for field in ("od", "avg_p", "set_p")
+        ]
+        frames = [
+            None if math.isnan(v) else int(v) for v in self._values["frame"][start:stop].tolist()
+        ]
+        return list(zip(labels, times, inner, *optional, frames, strict=True))
 
-        if column == 0:  # Event label
-            return 0
-        if column == 1:  # Time
-            return 1
-        if column == 2:  # ID
-            return 2
-
-        # Build column mapping dynamically
-        col_idx = 3
-
-        if self._has_outer:
-            if column == col_idx:
-                return 3
-            col_idx += 1
-
-        if self._has_avg_pressure:
-            if column == col_idx:
-                return 4
-            col_idx += 1
-
-        if self._has_set_pressure:
-            if column == col_idx:
-                return 5
-            col_idx += 1
-
-        # Frame column is not editable
+    def _field_for_column(self, column: int) -> str | None:
+        """Map a data column (status column excluded) to its ``EventRow`` field."""
+        if 0 <= column < len(self._fields):
+            return self._fields[column]
         return None
 
     def _value_at(self, row_idx: int, column: int):
-        """Map display column to row tuple index."""
-        row = self._rows[row_idx]
-        if len(row) < 3:
+        field = self._field_for_column(column)
+        if field is None:
             return None
-
-        # Columns: Event(0), Time(1), ID(2), [OD(3)], [AvgP(?)]  [SetP(?)], Frame(last)
-        # Row tuple: (label, time, id, od|None, avg_p|None, set_p|None, frame|None)
-
-        if column == 0:  # Event label
-            return row[0]
-        if column == 1:  # Time
-            return row[1]
-        if column == 2:  # ID
-            return row[2]
-
-        # Build column mapping dynamically
-        col_idx = 3
-
-        if self._has_outer:
-            if column == col_idx:
-                return row[3] if len(row) > 3 else None
-            col_idx += 1
-
-        if self._has_avg_pressure:
-            if column == col_idx:
-                return row[4] if len(row) > 4 else None
-            col_idx += 1
-
-        if self._has_set_pressure:
-            if column == col_idx:
-                return row[5] if len(row) > 5 else None
-            col_idx += 1
-
-        # Last column is always Frame
-        if column == col_idx:
-            frame_idx = len(row) - 1
-            if frame_idx < 0:
-                return None
-            return row[frame_idx] if frame_idx < len(row) else None
-
-        return None
+        if field == "event":
+            return self._labels[row_idx]
+        value = float(self._values[field][row_idx])
+        if field in _OPTIONAL_FIELDS and math.isnan(value):
+            return None
+        return value
 
     def _format_display(self, column: int, value):
         if column == EVENT_COLUMN_INDEX:  # Event label
@@ -573,24 +676,11 @@ class EventTableModel(QAbstractTableModel):
         if 0 <= data_idx < len(self._headers):
             header_label = self._headers[data_idx]
 
-        if isinstance(header_label, str):
-            lowered = header_label.lower()
-            if "frame" in lowered or "trace idx" in lowered:
-                try:
-                    fv = float(value)
-                    import math
-                    if not math.isfinite(fv):
-                        return "—"
-                    return f"{int(round(fv)):,}"
-                except (TypeError, ValueError):
-                    return value
-
         try:
             num = float(value)
         except (TypeError, ValueError):
             return value
 
-        import math
         if not math.isfinite(num):
             return "—"
 
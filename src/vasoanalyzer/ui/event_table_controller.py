@@ -85,6 +85,10 @@ class EventTableController(QObject):
         self._model.insert_row(index, row)
         self.rows_changed.emit()
 
+    def insert_rows(self, index: int, rows: Sequence[EventRow]) -> None:
+        self._model.insert_rows(index, rows)
+        self.rows_changed.emit()
+
     def append_row(self, row: EventRow) -> None:
         self._model.append_row(row)
         self.rows_changed.emit()
@@ -94,6 +98,11 @@ class EventTableController(QObject):
         self.rows_changed.emit()
         return removed
 
+    def remove_rows(self, indices: Sequence[int]) -> list[EventRow]:
+        removed = self._model.remove_rows(indices)
+        self.rows_changed.emit()
+        return removed
+
     def update_row(self, index: int, row: EventRow) -> None:
         self._model.update_row(index, row)
         self.rows_changed.emit()
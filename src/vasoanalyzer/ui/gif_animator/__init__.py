@@ -9,6 +9,8 @@ Main entry point:
 
 from .animator_window import GifAnimatorWindow
 from .frame_synchronizer import FrameSynchronizer, FrameTimingInfo
+from .gif_encoder import GifStreamWriter, stream_gif
+from .parallel_render import iter_frames_parallel
 from .renderer import AnimationRenderer, estimate_gif_size_mb, save_gif
 from .specs import AnimationSpec, TracePanelSpec
 
@@ -18,6 +20,9 @@ __all__ = [
     "TracePanelSpec",
     "AnimationRenderer",
     "save_gif",
+    "stream_gif",
+    "GifStreamWriter",
+    "iter_frames_parallel",
     "estimate_gif_size_mb",
     "FrameSynchronizer",
     "FrameTimingInfo",
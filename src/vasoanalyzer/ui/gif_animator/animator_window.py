@@ -5,6 +5,7 @@ following the shared window layout pattern.
 """
 
 import logging
+from contextlib import closing
 
 import numpy as np
 import pandas as pd
@@ -35,9 +36,11 @@ from PyQt6.QtWidgets import (
 from vasoanalyzer.io.tiffs import resolve_frame_times
 
 from .frame_synchronizer import FrameSynchronizer
+from .gif_encoder import ExportCancelled, stream_gif
+from .parallel_render import default_worker_count, iter_frames_parallel
 from .poster_renderer import PosterFigureRenderer
 from .preview_player import PreviewPlayerWidget
-from .renderer import AnimationRenderer, EventSpec, RenderContext, estimate_gif_size_mb, save_gif
+from .renderer import AnimationRenderer, EventSpec, RenderContext, estimate_gif_size_mb
 from .specs import AnimationSpec, FrameTimeExtractionResult, TracePanelSpec
 
 logger = logging.getLogger(__name__)
@@ -47,18 +50,31 @@ WIDE_CANVAS_HEIGHT_RATIO = 1 / 3
 
 
 class RenderThread(QThread):
-    """Background thread for rendering frames to avoid blocking UI with cancellation support."""
+    """Background thread for rendering frames to avoid blocking UI with cancellation support.
+
+    With ``export_path`` set, frames are not collected: each one is rendered,
+    quantized and encoded straight into the GIF as it is produced, so memory
+    stays bounded, and ``exported`` is emitted once the file is complete.
+    ``workers`` > 1 renders long animations on that many processes (see
+    :func:`iter_frames_parallel`); the output is identical either way.
+    """
 
     progress = pyqtSignal(int, int)  # current, total
     finished = pyqtSignal(list)  # rendered frames
+    exported = pyqtSignal(str)  # path of the written GIF
     error = pyqtSignal(str)  # error message
     cancelled = pyqtSignal()  # emitted when rendering is cancelled
 
-    def __init__(self, renderer, ctx, timings):
+    def __init__(
+        self, renderer, ctx, timings, *, export_path=None, export_options=None, workers=1
+    ):
         super().__init__()
         self.renderer = renderer
         self.ctx = ctx
         self.timings = timings
+        self.workers = workers
+        self.export_path = export_path
+        self.export_options = dict(export_options or {})
         self._should_stop = False
         import threading
 
@@ -70,29 +86,35 @@ class RenderThread(QThread):
             self._should_stop = True
             logger.info("Render cancellation requested")
 
+    def _stop_requested(self) -> bool:
+        with self._lock:
+            return self._should_stop
+
     def run(self):
         """Run rendering in background thread with cancellation checks."""
+        if self.export_path is not None:
+            self._run_export()
+            return
         try:
             frames = []
             total = len(self.timings)
 
-            for i, timing in enumerate(self.timings):
-                # Check cancellation before each frame
-                with self._lock:
-                    if self._should_stop:
-                        logger.info(
-                            "Render cancelled by user",
-                            extra={"frames_completed": i, "total_frames": total},
-                        )
-                        self.cancelled.emit()
-                        return
+            with closing(self._frames()) as frame_iter:
+                for i, frame in enumerate(frame_iter):
+                    # Check cancellation before each frame
+                    with self._lock:
+                        if self._should_stop:
+                            logger.info(
+                                "Render cancelled by user",
+                                extra={"frames_completed": i, "total_frames": total},
+                            )
+                            self.cancelled.emit()
+                            return
 
-                # Render single frame
-                frame = self.renderer.render_frame(self.ctx, timing)
-                frames.append(frame)
+                    frames.append(frame)
 
-                # Report progress
-                self.progress.emit(i + 1, total)
+                    # Report progress
+                    self.progress.emit(i + 1, total)
 
             self.finished.emit(frames)
             logger.info("Render completed successfully", extra={"total_frames": len(frames)})
@@ -101,6 +123,37 @@ class RenderThread(QThread):
             logger.error("Render failed with exception", extra={"error": str(e)}, exc_info=True)
             self.error.emit(str(e))
 
+    def _frames(self):
+        """Frame generator: worker processes when ``workers`` allows, else this thread."""
+        return iter_frames_parallel(
+            self.renderer.spec, self.ctx, self.timings, workers=self.workers
+        )
+
+    def _run_export(self):
+        """Render frames one at a time straight into the GIF encoder."""
+        total = len(self.timings)
+        try:
+            with closing(self._frames()) as frame_iter:
+                stream_gif(
+                    frame_iter,
+                    self.export_path,
+                    total_frames=total,
+                    progress_callback=self.progress.emit,
+                    should_stop=self._stop_requested,
+                    dirty_rects=self.renderer.iter_dirty_rects(self.ctx, self.timings),
+                    **self.export_options,
+                )
+        except ExportCancelled:
+            logger.info("Export cancelled by user", extra={"total_frames": total})
+            self.cancelled.emit()
+            return
+        except Exception as e:
+            logger.error("Export failed with exception", extra={"error": str(e)}, exc_info=True)
+            self.error.emit(str(e))
+            return
+        logger.info("Export completed successfully", extra={"total_frames": total})
+        self.exported.emit(str(self.export_path))
+
 
 class CropImageLabel(QLabel):
     """Image label with rubber-band ROI selection."""
@@ -215,7 +268,7 @@ class CropSelectionDialog(QDialog):
 class GifAnimatorWindow(QMainWindow):
     """Main window for GIF animation creation and preview."""
 
-    def __init__(self, parent, project_ctx, sample, trace_model, events_df):
+    def __init__(self, parent, project_ctx, sample, trace_model, events_df, vessel_frames=None):
         """Initialize GIF Animator window.
 
         Args:
@@ -224,11 +277,14 @@ class GifAnimatorWindow(QMainWindow):
             sample: SampleN instance with snapshots and data
             trace_model: TraceModel instance
             events_df: Pandas DataFrame with event data
+            vessel_frames: Indexable TIFF frames to use instead of ``sample.snapshots``
+                (e.g. a lazily decoded ``TiffPageSource``)
         """
         super().__init__(parent)
 
         self.project_ctx = project_ctx
         self.sample = sample
+        self.vessel_frames = vessel_frames if vessel_frames is not None else sample.snapshots
         self.trace_model = trace_model
         self.events_df = events_df
 
@@ -268,7 +324,7 @@ class GifAnimatorWindow(QMainWindow):
         Returns:
             FrameTimeExtractionResult with frame times and metadata about the extraction
         """
-        n_frames = len(self.sample.snapshots)
+        n_frames = len(self.vessel_frames)
         warnings: list[str] = []
         trace_start_s = self._trace_start_time_s()
 
@@ -531,15 +587,21 @@ class GifAnimatorWindow(QMainWindow):
         self._apply_tiff_aspect_ratio(spec)
         return spec
 
+    def _has_vessel_frames(self) -> bool:
+        frames = self.vessel_frames
+        if isinstance(frames, np.ndarray):
+            return frames.size > 0
+        return frames is not None and len(frames) > 0
+
     def _compute_tiff_aspect_ratio(self) -> float | None:
         """Return TIFF frame aspect ratio (width / height) if available."""
-        if not isinstance(self.sample.snapshots, np.ndarray) or self.sample.snapshots.size == 0:
+        if not self._has_vessel_frames():
             return None
         rect = self._load_crop_rect()
         if rect is not None:
             _, _, w, h = rect
         else:
-            frame = self.sample.snapshots[0]
+            frame = self.vessel_frames[0]
             if frame.ndim == 2:
                 h, w = frame.shape
             elif frame.ndim >= 3:
@@ -600,10 +662,10 @@ class GifAnimatorWindow(QMainWindow):
                 logger.debug("Failed to mark parent session dirty", exc_info=True)
 
     def _set_crop_roi(self) -> None:
-        if not isinstance(self.sample.snapshots, np.ndarray) or self.sample.snapshots.size == 0:
+        if not self._has_vessel_frames():
             QMessageBox.warning(self, "No TIFF Frames", "No TIFF frames available to crop.")
             return
-        frame = self.sample.snapshots[0]
+        frame = self.vessel_frames[0]
         dialog = CropSelectionDialog(frame, self)
         if dialog.exec() != QDialog.DialogCode.Accepted:
             return
@@ -1330,8 +1392,12 @@ class GifAnimatorWindow(QMainWindow):
             pad = (y_max - y_min) * 0.05
         return (y_min - pad, y_max + pad)
 
-    def _refresh_preview(self):
-        """Refresh preview by rendering animation frames."""
+    def _plan_render(self) -> tuple[list, list[int] | None] | None:
+        """Validate the current settings and return frame timings and durations.
+
+        Returns None (after telling the user why) when the settings or the
+        time range are invalid.
+        """
         # Update spec from UI
         self._on_event_selection_changed()
         self._on_settings_changed()
@@ -1340,7 +1406,7 @@ class GifAnimatorWindow(QMainWindow):
         errors = self.current_spec.validate()
         if errors:
             QMessageBox.warning(self, "Invalid Settings", "\n".join(errors))
-            return
+            return None
 
         # Validate with frame synchronizer
         try:
@@ -1353,12 +1419,12 @@ class GifAnimatorWindow(QMainWindow):
             valid, error_msg = synchronizer.validate_time_range()
             if not valid:
                 QMessageBox.warning(self, "Time Range Error", error_msg)
-                return
+                return None
         except ValueError as e:
             QMessageBox.warning(self, "Error", str(e))
-            return
+            return None
 
-        # Estimate frame count and file size
+        # Frame timings for the selected time range
         if self.current_spec.use_tiff_frames:
             timings = synchronizer.get_tiff_keyframes(
                 playback_speed=self.current_spec.playback_speed
@@ -1369,24 +1435,30 @@ class GifAnimatorWindow(QMainWindow):
                 self.current_spec.playback_speed,
             )
         n_frames = len(timings)
-        self.rendered_frame_durations_ms = None
+        durations_ms = None
         if self.current_spec.use_tiff_frames and timings:
-            self.rendered_frame_durations_ms = synchronizer.get_tiff_keyframe_durations_ms(
+            durations_ms = synchronizer.get_tiff_keyframe_durations_ms(
                 timings,
                 playback_speed=self.current_spec.playback_speed,
             )
-            if (
-                self.rendered_frame_durations_ms
-                and len(self.rendered_frame_durations_ms) != n_frames
-            ):
+            if durations_ms and len(durations_ms) != n_frames:
                 logger.warning(
                     "Frame duration count mismatch; falling back to constant duration",
                     extra={
                         "n_frames": n_frames,
-                        "duration_count": len(self.rendered_frame_durations_ms),
+                        "duration_count": len(durations_ms),
                     },
                 )
-                self.rendered_frame_durations_ms = None
+                durations_ms = None
+        return timings, durations_ms or None
+
+    def _refresh_preview(self):
+        """Refresh preview by rendering animation frames."""
+        plan = self._plan_render()
+        if plan is None:
+            return
+        timings, self.rendered_frame_durations_ms = plan
+        n_frames = len(timings)
         estimated_size_mb = estimate_gif_size_mb(
             self.current_spec.output_width_px,
             self.current_spec.output_height_px,
@@ -1440,7 +1512,9 @@ class GifAnimatorWindow(QMainWindow):
         # Render in background thread
         renderer = AnimationRenderer(self.current_spec)
 
-        self.render_thread = RenderThread(renderer, ctx, timings)
+        self.render_thread = RenderThread(
+            renderer, ctx, timings, workers=default_worker_count()
+        )
         self.render_thread.progress.connect(self._on_render_progress)
         self.render_thread.finished.connect(self._on_render_finished)
         self.render_thread.error.connect(self._on_render_error)
@@ -1494,7 +1568,7 @@ class GifAnimatorWindow(QMainWindow):
 
         return RenderContext(
             trace_model=self.trace_model,
-            vessel_frames=self.sample.snapshots,
+            vessel_frames=self.vessel_frames,
             events=events,
             sample_name=self.sample.name,
         )
@@ -1575,13 +1649,19 @@ class GifAnimatorWindow(QMainWindow):
         return memory_mb
 
     def _export_gif(self):
-        """Export animation as GIF file."""
-        if not self.rendered_frames:
-            QMessageBox.information(
-                self,
-                "No Preview",
-                "Please refresh the preview before exporting.",
-            )
+        """Export animation as GIF file.
+
+        Frames are rendered and encoded as a stream on a RenderThread, so the
+        export does not depend on (or hold) the preview frames.
+        """
+        if self.is_rendering:
+            return
+        plan = self._plan_render()
+        if plan is None:
+            return
+        timings, durations_ms = plan
+        if not timings:
+            QMessageBox.information(self, "No Frames", "The selected range has no frames.")
             return
 
         # Get export path
@@ -1597,48 +1677,66 @@ class GifAnimatorWindow(QMainWindow):
             return
 
         # Show progress dialog
-        progress = QProgressDialog("Exporting GIF...", "Cancel", 0, 100, self)
+        progress = QProgressDialog("Exporting GIF...", "Cancel", 0, len(timings), self)
         progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
         progress.show()
 
-        try:
-            # Save GIF
-            durations_ms = self.rendered_frame_durations_ms
-            if durations_ms and len(durations_ms) != len(self.rendered_frames):
-                logger.warning(
-                    "Export duration count mismatch; using constant duration",
-                    extra={
-                        "frames": len(self.rendered_frames),
-                        "durations": len(durations_ms),
-                    },
-                )
-                durations_ms = None
-            save_gif(
-                self.rendered_frames,
-                file_path,
-                self.current_spec.fps,
-                self.current_spec.loop_count,
-                optimize=self.current_spec.optimize,
-                quality=self.current_spec.quality,
-                durations_ms=durations_ms,
-            )
+        renderer = AnimationRenderer(self.current_spec)
+        self.render_thread = RenderThread(
+            renderer,
+            self._create_render_context(),
+            timings,
+            export_path=file_path,
+            workers=default_worker_count(),
+            export_options={
+                "fps": self.current_spec.fps,
+                "loop_count": self.current_spec.loop_count,
+                "optimize": self.current_spec.optimize,
+                "durations_ms": durations_ms,
+            },
+        )
+        self.render_thread.progress.connect(lambda current, _total: progress.setValue(current))
+        progress.canceled.connect(self.render_thread.cancel)
+        self.render_thread.exported.connect(lambda path: self._on_export_finished(progress, path))
+        self.render_thread.error.connect(lambda msg: self._on_export_error(progress, msg))
+        self.render_thread.cancelled.connect(lambda: self._on_export_cancelled(progress))
 
-            progress.setValue(100)
-            progress.close()
+        self.refresh_btn.setVisible(False)
+        self.cancel_render_btn.setVisible(True)
+        self.export_btn.setEnabled(False)
+        self.is_rendering = True
+        self._set_status_message(f"Exporting {len(timings)} frames...", tone="info")
 
-            QMessageBox.information(
-                self,
-                "Export Complete",
-                f"GIF saved successfully:\n{file_path}",
-            )
+        self.render_thread.start()
 
-        except Exception as e:
-            progress.close()
-            QMessageBox.critical(
-                self,
-                "Export Error",
-                f"Failed to save GIF:\n\n{str(e)}",
-            )
+    def _on_export_finished(self, progress: QProgressDialog, file_path: str):
+        """Handle streaming export completion."""
+        progress.close()
+        self._restore_ui_after_render()
+        self._set_status_message("✓ GIF exported", tone="success")
+        QMessageBox.information(
+            self,
+            "Export Complete",
+            f"GIF saved successfully:\n{file_path}",
+        )
+
+    def _on_export_error(self, progress: QProgressDialog, error_msg: str):
+        """Handle streaming export failure."""
+        progress.close()
+        self._restore_ui_after_render()
+        self._set_status_message("✗ Export failed", tone="error")
+        QMessageBox.critical(
+            self,
+            "Export Error",
+            f"Failed to save GIF:\n\n{error_msg}",
+        )
+
+    def _on_export_cancelled(self, progress: QProgressDialog):
+        """Handle streaming export cancellation."""
+        progress.close()
+        self._restore_ui_after_render()
+        self._set_status_message("⊗ Export cancelled by user", tone="error")
 
     def _export_static_frame(self):
         """Export a single rendered frame as PNG."""
@@ -1768,18 +1866,18 @@ class GifAnimatorWindow(QMainWindow):
             )
 
     def _select_poster_frame(self) -> np.ndarray | None:
-        if not isinstance(self.sample.snapshots, np.ndarray) or self.sample.snapshots.size == 0:
+        if not self._has_vessel_frames():
             return None
 
-        n_frames = len(self.sample.snapshots)
+        n_frames = len(self.vessel_frames)
         if not self.frame_times or len(self.frame_times) != n_frames:
-            return self.sample.snapshots[n_frames // 2]
+            return self.vessel_frames[n_frames // 2]
 
         mid_time = (self.current_spec.start_time_s + self.current_spec.end_time_s) / 2.0
         times = np.asarray(self.frame_times, dtype=float)
         idx = int(np.argmin(np.abs(times - mid_time)))
         idx = max(0, min(n_frames - 1, idx))
-        return self.sample.snapshots[idx]
+        return self.vessel_frames[idx]
 
     def closeEvent(self, event):
         """Handle window close event with proper thread cleanup.
@@ -0,0 +1,365 @@
+"""Streaming GIF encoder for animation export (no Qt dependencies).
+
+Frames flow through a two-stage pipeline: the caller's thread pulls each RGB
+frame from an iterable (usually :meth:`AnimationRenderer.iter_frames`, so the
+frame is rendered on demand) and quantizes it against the shared palette; an
+encoder thread receives the palettized frames through a bounded queue and
+appends them to the file with :class:`GifStreamWriter`.  At most
+``queue_size`` frames plus the encoder's previous frame are alive at once,
+whatever the animation length.
+
+Each frame after the first is stored as the sub-rectangle that changed, with
+the pixels that did not change inside it made transparent, so the static
+axes, labels and background are encoded once.  Callers that know where a
+frame can change (:meth:`AnimationRenderer.dirty_rects`) pass those
+rectangles along and the encoder only compares pixels inside them.
+"""
+
+import logging
+import os
+import queue
+import threading
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
+from PIL import GifImagePlugin, Image
+
+log = logging.getLogger(__name__)
+
+Rect = tuple[int, int, int, int]
+
+__all__ = [
+    "ExportCancelled",
+    "FrameQuantizer",
+    "GifStreamWriter",
+    "stream_gif",
+]
+
+
+class ExportCancelled(Exception):
+    """Raised by :func:`stream_gif` when ``should_stop`` asks it to stop."""
+
+
+def _dither_mode(dither: str):
+    dither_name = dither.lower() if isinstance(dither, str) else ""
+    if hasattr(Image, "Dither"):
+        return Image.Dither.NONE if dither_name == "none" else Image.Dither.FLOYDSTEINBERG
+    none_mode = getattr(Image, "NONE", 0)
+    floyd_mode = getattr(Image, "FLOYDSTEINBERG", 3)
+    return none_mode if dither_name == "none" else floyd_mode
+
+
+class FrameQuantizer:
+    """Convert RGB frames to palette images.
+
+    With ``shared_palette`` the first frame defines an adaptive 255-colour
+    palette and every later frame is mapped onto it, so the GIF needs a
+    single global colour table and index 255 stays free for transparency.
+    Otherwise each frame gets its own adaptive palette.
+
+    Without dithering each pixel maps independently, so when the caller
+    passes the rectangles that changed only those are quantized and the rest
+    of the previous frame's indices are reused.
+    """
+
+    def __init__(self, *, shared_palette: bool = True, dither: str = "none") -> None:
+        self.shared_palette = bool(shared_palette)
+        self._dither = _dither_mode(dither)
+        self._base: Image.Image | None = None
+        self._previous: np.ndarray | None = None
+
+    def __call__(self, frame: np.ndarray, dirty: Sequence[Rect] | None = None) -> Image.Image:
+        image = Image.fromarray(frame)
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        if not self.shared_palette:
+            return image.convert("P", palette=Image.ADAPTIVE, colors=256)
+        if self._base is None:
+            self._base = image.convert("P", palette=Image.ADAPTIVE, colors=255)
+        previous = self._previous
+        if (
+            dirty is None
+            or previous is None
+            or previous.shape != (image.height, image.width)
+            or self._dither != _dither_mode("none")
+        ):
+            # The first frame is mapped the same way as the rest, so identical
+            # RGB pixels always get identical indices and static areas never
+            # show up as changed.
+            result = image.quantize(palette=self._base, dither=self._dither)
+            self._previous = np.asarray(result)
+            return result
+
+        indices = previous.copy()
+        for x0, y0, x1, y1 in _clip_rects(dirty, image.width, image.height):
+            region = image.crop((x0, y0, x1, y1)).quantize(palette=self._base, dither=self._dither)
+            indices[y0:y1, x0:x1] = np.asarray(region)
+        self._previous = indices
+        result = Image.fromarray(indices)
+        result.putpalette(self._base.getpalette())
+        return result
+
+
+def _clip_rects(rects: Sequence[Rect], width: int, height: int) -> Iterator[Rect]:
+    for x0, y0, x1, y1 in rects:
+        x0, y0 = max(0, int(x0)), max(0, int(y0))
+        x1, y1 = min(width, int(x1)), min(height, int(y1))
+        if x1 > x0 and y1 > y0:
+            yield x0, y0, x1, y1
+
+
+class GifStreamWriter:
+    """Append palette frames to an animated GIF one at a time.
+
+    Only the previous frame (to find the changed region) and one pending
+    frame (whose duration may still grow when identical frames follow) are
+    kept.  With ``optimize`` each frame after the first is cropped to the
+    rectangle that differs from its predecessor, unchanged pixels inside it
+    are written as a transparent index that is unused in that rectangle
+    (disposal 1 keeps the previous frame underneath), and identical frames
+    are merged.  Call :meth:`close` to finish the file.
+    """
+
+    def __init__(
+        self,
+        fp: BinaryIO,
+        *,
+        loop_count: int | None = 0,
+        optimize: bool = True,
+    ) -> None:
+        self._fp = fp
+        self._loop_count = loop_count
+        self._optimize = bool(optimize)
+        self._palette: list[int] | None = None
+        self._size: tuple[int, int] | None = None
+        self._previous: np.ndarray | None = None
+        self._pending: tuple[Image.Image, tuple[int, int], int, dict[str, object]] | None = None
+        self.frames_written = 0
+
+    def add_frame(
+        self,
+        frame: Image.Image,
+        duration_ms: int,
+        dirty: Sequence[Rect] | None = None,
+    ) -> None:
+        """Queue ``frame`` (mode ``"P"``) to be shown for ``duration_ms``.
+
+        ``dirty`` optionally lists the ``(x0, y0, x1, y1)`` rectangles that
+        may differ from the previous frame; pixels outside them are taken as
+        unchanged without being compared.
+        """
+
+        if frame.mode != "P":
+            raise ValueError("GifStreamWriter expects palette ('P') frames")
+        duration_ms = max(0, int(duration_ms))
+        if self._size is None:
+            self._write_header(frame)
+        elif frame.size != self._size:
+            raise ValueError(f"Frame size {frame.size} does not match animation {self._size}")
+
+        palette = frame.getpalette()
+        params: dict[str, object] = {}
+        if palette != self._palette:
+            params["include_color_table"] = True
+        offset = (0, 0)
+        region = frame
+        if self._optimize and not params:
+            indices = np.asarray(frame)
+            if self._previous is not None and self._pending is not None:
+                bbox = _changed_bbox(self._previous, indices, dirty)
+                if bbox is None:
+                    image, pending_offset, pending_ms, extra = self._pending
+                    self._pending = (image, pending_offset, pending_ms + duration_ms, extra)
+                    return
+                x0, y0, x1, y1 = bbox
+                offset = (x0, y0)
+                region = frame.crop(bbox)
+                transparency = self._transparent_index(indices[y0:y1, x0:x1])
+                if transparency is not None:
+                    crop = indices[y0:y1, x0:x1]
+                    masked = np.where(crop == self._previous[y0:y1, x0:x1], transparency, crop)
+                    region = Image.fromarray(masked.astype(np.uint8))
+                    region.putpalette(palette)
+                    params.update(transparency=transparency, disposal=1)
+            self._previous = indices
+        else:
+            self._previous = None
+
+        self._flush_pending()
+        self._pending = (region, offset, duration_ms, params)
+
+    def _transparent_index(self, region: np.ndarray) -> int | None:
+        # The global colour table is padded to a power of two (minimum 2);
+        # a padding entry is never used by the frames, so prefer that.
+        colours = len(self._palette or ()) // 3
+        table_size = 2
+        while table_size < colours:
+            table_size *= 2
+        if colours < table_size:
+            return table_size - 1
+        unused = np.flatnonzero(np.bincount(region.ravel(), minlength=256)[:table_size] == 0)
+        return int(unused[-1]) if unused.size else None
+
+    def close(self) -> None:
+        """Write the last frame and the GIF trailer."""
+
+        self._flush_pending()
+        if self._size is not None:
+            self._fp.write(b";")
+        self._fp.flush()
+
+    def _write_header(self, frame: Image.Image) -> None:
+        self._size = frame.size
+        self._palette = frame.getpalette()
+        info = {"loop": self._loop_count} if self._loop_count is not None else {}
+        header, _ = GifImagePlugin.getheader(frame.copy(), info=info)
+        for chunk in header:
+            self._fp.write(chunk)
+
+    def _flush_pending(self) -> None:
+        if self._pending is None:
+            return
+        image, offset, duration_ms, params = self._pending
+        self._pending = None
+        for chunk in GifImagePlugin.getdata(image, offset=offset, duration=duration_ms, **params):
+            self._fp.write(chunk)
+        self.frames_written += 1
+
+
+def _changed_bbox(
+    previous: np.ndarray, current: np.ndarray, dirty: Sequence[Rect] | None = None
+) -> Rect | None:
+    height, width = current.shape[:2]
+    if dirty is None:
+        dirty = [(0, 0, width, height)]
+    boxes = []
+    for x0, y0, x1, y1 in _clip_rects(dirty, width, height):
+        changed = previous[y0:y1, x0:x1] != current[y0:y1, x0:x1]
+        rows = np.flatnonzero(changed.any(axis=1))
+        if not rows.size:
+            continue
+        cols = np.flatnonzero(changed[rows[0] : rows[-1] + 1].any(axis=0))
+        boxes.append((x0 + cols[0], y0 + rows[0], x0 + cols[-1] + 1, y0 + rows[-1] + 1))
+    if not boxes:
+        return None
+    x0s, y0s, x1s, y1s = zip(*boxes, strict=True)
+    return int(min(x0s)), int(min(y0s)), int(max(x1s)), int(max(y1s))
+
+
+_DONE = object()
+
+
+def _encode_worker(
+    items: "queue.Queue[object]", writer: GifStreamWriter, failure: list[BaseException]
+) -> None:
+    while True:
+        item = items.get()
+        if item is _DONE:
+            return
+        if failure:
+            continue  # keep draining so the producer never blocks
+        try:
+            image, duration_ms, dirty = item
+            writer.add_frame(image, duration_ms, dirty)
+        except BaseException as exc:
+            failure.append(exc)
+
+
+def _durations(fps: int, durations_ms: Iterable[int] | None) -> Iterator[int]:
+    if durations_ms is None:
+        constant = int(1000 / max(1, int(fps)))
+        while True:
+            yield constant
+    yield from (int(ms) for ms in durations_ms)
+
+
+def stream_gif(
+    frames: Iterable[np.ndarray],
+    output_path: str | os.PathLike[str],
+    fps: int,
+    loop_count: int = 0,
+    optimize: bool = True,
+    durations_ms: list[int] | None = None,
+    shared_palette: bool = True,
+    dither: str = "none",
+    *,
+    queue_size: int = 4,
+    total_frames: int | None = None,
+    progress_callback: Callable[[int, int], None] | None = None,
+    should_stop: Callable[[], bool] | None = None,
+    dirty_rects: Iterable[Sequence[Rect] | None] | None = None,
+) -> int:
+    """Encode ``frames`` into an animated GIF without holding them all in memory.
+
+    ``frames`` may be any iterable, including a generator that renders on
+    demand; pass ``total_frames`` to report a total to ``progress_callback``
+    for iterables without a length.  The file is written next to
+    ``output_path`` and moved into place only when complete, so a failed or
+    cancelled export leaves any existing file untouched.  ``dirty_rects``
+    optionally yields, per frame, the rectangles that can differ from the
+    previous frame (None for "anywhere").  Returns the number of frames
+    consumed.
+
+    Raises:
+        ValueError: if there are no frames or ``durations_ms`` does not match.
+        ExportCancelled: if ``should_stop`` returned True.
+    """
+
+    sized = hasattr(frames, "__len__")
+    total = len(frames) if sized else int(total_frames or 0)
+    if durations_ms is not None and sized and len(durations_ms) != total:
+        raise ValueError("durations_ms length does not match frames")
+
+    target = Path(output_path)
+    partial = target.with_name(target.name + ".part")
+    quantize = FrameQuantizer(shared_palette=shared_palette, dither=dither)
+    items: queue.Queue[object] = queue.Queue(maxsize=max(1, int(queue_size)))
+    failure: list[BaseException] = []
+    count = 0
+
+    with open(partial, "wb") as fp:
+        writer = GifStreamWriter(fp, loop_count=loop_count, optimize=optimize)
+        worker = threading.Thread(
+            target=_encode_worker, args=(items, writer, failure), name="gif-encoder", daemon=True
+        )
+        worker.start()
+        try:
+            durations = _durations(fps, durations_ms)
+            regions = iter(dirty_rects) if dirty_rects is not None else None
+            for frame in frames:
+                if should_stop is not None and should_stop():
+                    raise ExportCancelled()
+                duration_ms = next(durations, None)
+                if duration_ms is None:
+                    raise ValueError("durations_ms length does not match frames")
+                dirty = next(regions, None) if regions is not None else None
+                items.put((quantize(frame, dirty), duration_ms, dirty))
+                count += 1
+                if failure:
+                    break
+                if progress_callback is not None:
+                    progress_callback(count, total)
+            if not failure:
+                if not count:
+                    raise ValueError("Cannot save empty frame list")
+                if durations_ms is not None and next(durations, None) is not None:
+                    raise ValueError("durations_ms length does not match frames")
+        except BaseException:
+            items.put(_DONE)
+            worker.join()
+            fp.close()
+            partial.unlink(missing_ok=True)
+            raise
+        items.put(_DONE)
+        worker.join()
+        if failure:
+            fp.close()
+            partial.unlink(missing_ok=True)
+            raise failure[0]
+        writer.close()
+
+    os.replace(partial, target)
+    log.debug("Wrote %d GIF frames (%d after merging) to %s", count, writer.frames_written, target)
+    return count
@@ -0,0 +1,150 @@
+"""Multi-process frame rendering for GIF animations (no Qt dependencies).
+
+:func:`iter_frames_parallel` splits the frame timings into contiguous chunks
+and renders them on a pool of worker processes.  Each worker builds one
+:class:`AnimationRenderer` (and therefore one trace cache) when it starts and
+reuses it for every chunk; the caller receives the frames in timing order,
+with at most ``(workers + 1) * chunk_size`` rendered frames held at once, so
+it can feed them straight into :func:`~.gif_encoder.stream_gif` without
+giving up the encoder's bounded memory use.
+
+Output is deterministic: workers are started with the parent's matplotlib
+rcParams, frames are rendered by the same code from the same inputs, and the
+encoder sees them in the same order, so a parallel export is byte-identical
+to a serial one.
+"""
+
+import logging
+import multiprocessing
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import replace
+from itertools import islice
+from typing import Any
+
+import matplotlib
+import numpy as np
+
+from .frame_synchronizer import FrameTimingInfo
+from .renderer import AnimationRenderer, RenderContext
+from .specs import AnimationSpec
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    "PARALLEL_MIN_FRAMES",
+    "default_worker_count",
+    "iter_frames_parallel",
+]
+
+PARALLEL_MIN_FRAMES = 32
+"""Below this many frames, worker start-up costs more than it saves."""
+
+_MAX_WORKERS = 8
+_RC_SKIP = {"backend", "backend_fallback", "interactive"}
+
+_worker_renderer: AnimationRenderer | None = None
+_worker_ctx: RenderContext | None = None
+
+
+def default_worker_count() -> int:
+    """Leave one core for the UI and the encoder thread."""
+
+    return max(1, min(_MAX_WORKERS, (os.cpu_count() or 1) - 1))
+
+
+def _rc_snapshot() -> dict[str, Any]:
+    return {key: value for key, value in matplotlib.rcParams.items() if key not in _RC_SKIP}
+
+
+def _init_worker(
+    spec: AnimationSpec,
+    trace_model: object,
+    events: list,
+    sample_name: str,
+    rc_params: dict[str, Any],
+) -> None:
+    global _worker_renderer, _worker_ctx
+    matplotlib.rcParams.update(rc_params)
+    _worker_renderer = AnimationRenderer(spec)
+    _worker_ctx = RenderContext(
+        trace_model=trace_model,
+        vessel_frames=None,
+        events=events,
+        sample_name=sample_name,
+    )
+
+
+def _render_chunk(
+    timings: Sequence[FrameTimingInfo],
+    vessel_frames: dict[int, np.ndarray],
+) -> list[np.ndarray]:
+    assert _worker_renderer is not None and _worker_ctx is not None
+    ctx = replace(_worker_ctx, vessel_frames=vessel_frames)
+    return [_worker_renderer.render_frame(ctx, timing) for timing in timings]
+
+
+def _vessel_subset(vessel_frames, timings: Sequence[FrameTimingInfo]) -> dict[int, np.ndarray]:
+    """Only the TIFF frames a chunk needs, keyed by their stack index."""
+
+    indices = {int(timing.tiff_frame_index) for timing in timings}
+    return {index: np.asarray(vessel_frames[index]) for index in sorted(indices)}
+
+
+def iter_frames_parallel(
+    spec: AnimationSpec,
+    ctx: RenderContext,
+    timings: Iterable[FrameTimingInfo],
+    *,
+    workers: int | None = None,
+    chunk_size: int = 2,
+) -> Iterator[np.ndarray]:
+    """Render ``timings`` across worker processes and yield frames in order.
+
+    Falls back to rendering in this process when ``workers`` is 1 or there
+    are fewer than :data:`PARALLEL_MIN_FRAMES` frames.  Completed chunks are
+    sent back to this process whether or not they have been consumed, so the
+    number of chunks submitted but not yet fully yielded is capped at
+    ``workers + 1``: one per worker plus the chunk being yielded.  Closing the
+    generator early (e.g. on cancel) drops the queued chunks without waiting
+    for running ones.
+    """
+
+    timings = list(timings)
+    chunk_size = max(1, int(chunk_size))
+    chunks = [timings[i : i + chunk_size] for i in range(0, len(timings), chunk_size)]
+    workers = default_worker_count() if workers is None else int(workers)
+    workers = min(workers, len(chunks))
+    if workers <= 1 or len(timings) < PARALLEL_MIN_FRAMES:
+        yield from AnimationRenderer(spec).iter_frames(ctx, timings)
+        return
+
+    log.info("Rendering %d frames across %d processes", len(timings), workers)
+    # Spawn rather than fork: the parent is usually a running Qt application.
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(spec, ctx.trace_model, ctx.events, ctx.sample_name, _rc_snapshot()),
+    )
+    pending: deque[Future[list[np.ndarray]]] = deque()
+    remaining = iter(chunks)
+
+    def _submit(chunk: list[FrameTimingInfo]) -> None:
+        pending.append(
+            executor.submit(_render_chunk, chunk, _vessel_subset(ctx.vessel_frames, chunk))
+        )
+
+    try:
+        for chunk in islice(remaining, workers + 1):
+            _submit(chunk)
+        while pending:
+            yield from pending.popleft().result()
+            # Refill only once the chunk is consumed, keeping the bound.
+            chunk = next(remaining, None)
+            if chunk is not None:
+                _submit(chunk)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -5,7 +5,7 @@ following the spec-based architecture pattern used across the UI.
 """
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
 
 import matplotlib
@@ -19,6 +19,7 @@ from matplotlib.figure import Figure
 from matplotlib.ticker import MaxNLocator
 
 from .frame_synchronizer import FrameTimingInfo
+from .gif_encoder import stream_gif
 from .specs import AnimationSpec
 
 ACTIVE_LINE_SCALE = 1.25
@@ -27,6 +28,8 @@ INACTIVE_LINE_ALPHA = 0.6
 ACTIVE_MARKER_SIZE = 110
 ACTIVE_MARKER_RADIUS_PX = 7
 
+Rect = tuple[int, int, int, int]
+
 
 @dataclass
 class EventSpec:
@@ -42,7 +45,7 @@ class RenderContext:
     """Context data needed for rendering (similar to FigureSpec's RenderContext)."""
 
     trace_model: object  # TraceModel instance
-    vessel_frames: np.ndarray  # TIFF stack subset (n_frames, H, W)
+    vessel_frames: np.ndarray  # TIFF stack (n_frames, H, W) or an indexable lazy source
     events: list[EventSpec]  # Event markers
     sample_name: str = ""
 
@@ -58,6 +61,7 @@ class AnimationRenderer:
         """
         self.spec = spec
         self._trace_cache = None
+        self._layout: dict[str, Rect] | None = None
         self._time_offset_s = 0.0
         if getattr(self.spec, "display_time_zero", False):
             try:
@@ -493,31 +497,14 @@ class AnimationRenderer:
         if not spec.show_time_indicator:
             return base.copy()
 
-        xlim = self._trace_cache["xlim"]
-        ylim = self._trace_cache.get("ylim")
-        bbox = self._trace_cache["bbox"]
-        width, height = self._trace_cache["size"]
-
-        x_min, x_max = xlim
-        if x_max == x_min:
+        x_img = self._cursor_x(timing)
+        if x_img is None:
             return base.copy()
 
-        x0, y0, x1, y1 = bbox
-        axis_width = max(1.0, x1 - x0)
-        scale = axis_width / (x_max - x_min)
+        ylim = self._trace_cache.get("ylim")
+        x0, y0, x1, y1 = self._trace_cache["bbox"]
+        width, height = self._trace_cache["size"]
         t_val_abs = float(timing.trace_time_s)
-        t_val = self._display_time(t_val_abs)
-        if not np.isfinite(t_val):
-            return base.copy()
-        if t_val < x_min:
-            t_val = x_min
-        elif t_val > x_max:
-            t_val = x_max
-        x_disp = x0 + (t_val - x_min) * scale
-        x_disp = max(x0, min(x1, x_disp))
-        x_disp = max(0.0, min(float(width - 1), x_disp))
-
-        x_img = int(round(x_disp))
         y_top = int(round(height - y1))
         y_bottom = int(round(height - y0))
 
@@ -602,6 +589,28 @@ class AnimationRenderer:
 
         return np.array(pil_img)
 
+    def _cursor_x(self, timing: FrameTimingInfo) -> int | None:
+        """Pixel column of the time indicator in the cached trace panel, or None."""
+        x_min, x_max = self._trace_cache["xlim"]
+        if x_max == x_min:
+            return None
+
+        x0, _y0, x1, _y1 = self._trace_cache["bbox"]
+        width, _height = self._trace_cache["size"]
+        axis_width = max(1.0, x1 - x0)
+        scale = axis_width / (x_max - x_min)
+        t_val = self._display_time(float(timing.trace_time_s))
+        if not np.isfinite(t_val):
+            return None
+        if t_val < x_min:
+            t_val = x_min
+        elif t_val > x_max:
+            t_val = x_max
+        x_disp = x0 + (t_val - x_min) * scale
+        x_disp = max(x0, min(x1, x_disp))
+        x_disp = max(0.0, min(float(width - 1), x_disp))
+        return int(round(x_disp))
+
     def _build_trace_cache(self, ctx: RenderContext) -> dict[str, object]:
         """Render the full trace once and cache pixel mapping for fast overlays."""
         spec = self.spec.trace_spec
@@ -819,6 +828,119 @@ class AnimationRenderer:
             return img_array[:, :, :3]
         return img_array
 
+    def iter_frames(
+        self,
+        ctx: RenderContext,
+        timings: Iterable[FrameTimingInfo],
+    ) -> Iterator[np.ndarray]:
+        """Render frames lazily, one per timing, for streaming export.
+
+        Args:
+            ctx: RenderContext with trace model and vessel frames
+            timings: FrameTimingInfo for each frame
+
+        Yields:
+            RGB numpy arrays, one per frame
+        """
+        for timing in timings:
+            yield self.render_frame(ctx, timing)
+
+    def frame_layout(self) -> dict[str, Rect]:
+        """Panel rectangles ``(x0, y0, x1, y1)`` in composite-frame pixels.
+
+        Mirrors the padding :meth:`render_frame` applies, without rendering.
+
+        Returns:
+            Dict with ``"vessel"`` and ``"trace"`` rectangles
+        """
+        if self._layout is not None:
+            return self._layout
+        vessel_w, vessel_h = self.spec.vessel_width_px, self.spec.vessel_height_px
+        dpi = 100
+        fig = Figure(
+            figsize=(self.spec.trace_width_px / dpi, self.spec.trace_height_px / dpi), dpi=dpi
+        )
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        trace_w, trace_h = FigureCanvasAgg(fig).get_width_height()
+
+        if self.spec.layout_mode == "side_by_side":
+            height = max(vessel_h, trace_h)
+            vessel_top = (height - vessel_h) // 2
+            trace_top = (height - trace_h) // 2
+            if self.spec.vessel_position == "left":
+                vessel = (0, vessel_top, vessel_w, vessel_top + vessel_h)
+                trace = (vessel_w, trace_top, vessel_w + trace_w, trace_top + trace_h)
+            else:
+                trace = (0, trace_top, trace_w, trace_top + trace_h)
+                vessel = (trace_w, vessel_top, trace_w + vessel_w, vessel_top + vessel_h)
+        else:  # stacked
+            width = max(vessel_w, trace_w)
+            vessel_left = (width - vessel_w) // 2
+            trace_left = (width - trace_w) // 2
+            vessel = (vessel_left, 0, vessel_left + vessel_w, vessel_h)
+            trace = (trace_left, vessel_h, trace_left + trace_w, vessel_h + trace_h)
+        self._layout = {"vessel": vessel, "trace": trace}
+        return self._layout
+
+    def dirty_rects(
+        self,
+        ctx: RenderContext,
+        previous: FrameTimingInfo | None,
+        timing: FrameTimingInfo,
+    ) -> list[Rect] | None:
+        """Regions of the frame for ``timing`` that can differ from ``previous``.
+
+        The vessel panel changes with the TIFF frame (or the timestamp
+        overlay); with ``fast_render`` the trace panel only changes in the
+        columns swept by the time indicator and its marker, otherwise the
+        whole trace panel is redrawn.  Everything outside the returned
+        rectangles is pixel-identical to the previous frame.
+
+        Args:
+            ctx: RenderContext with trace model and vessel frames
+            previous: Timing of the preceding frame, or None for the first
+            timing: Timing of the frame being encoded
+
+        Returns:
+            List of ``(x0, y0, x1, y1)`` rectangles, or None for the whole frame
+        """
+        if previous is None:
+            return None
+        layout = self.frame_layout()
+        rects: list[Rect] = []
+
+        if previous.tiff_frame_index != timing.tiff_frame_index or (
+            self.spec.vessel_show_timestamp and previous.trace_time_s != timing.trace_time_s
+        ):
+            rects.append(layout["vessel"])
+
+        tx0, ty0, tx1, ty1 = layout["trace"]
+        spec = self.spec.trace_spec
+        if not spec.fast_render:
+            rects.append(layout["trace"])
+        elif spec.show_time_indicator:
+            if self._trace_cache is None:
+                self._trace_cache = self._build_trace_cache(ctx)
+            pad = max(int(round(spec.indicator_width)), ACTIVE_MARKER_RADIUS_PX + 1) + 1
+            columns = {self._cursor_x(previous), self._cursor_x(timing)} - {None}
+            for x_img in sorted(columns):
+                left = max(tx0, tx0 + x_img - pad)
+                right = min(tx1, tx0 + x_img + pad + 1)
+                rects.append((left, ty0, right, ty1))
+        return rects
+
+    def iter_dirty_rects(
+        self,
+        ctx: RenderContext,
+        timings: Iterable[FrameTimingInfo],
+    ) -> Iterator[list[Rect] | None]:
+        """Yield :meth:`dirty_rects` for consecutive timings (None for the first)."""
+        previous = None
+        for timing in timings:
+            yield self.dirty_rects(ctx, previous, timing)
+            previous = timing
+
     def render_all_frames(
         self,
         ctx: RenderContext,
@@ -838,8 +960,7 @@ class AnimationRenderer:
         frames = []
         total = len(timings)
 
-        for i, timing in enumerate(timings):
-            frame = self.render_frame(ctx, timing)
+        for i, frame in enumerate(self.iter_frames(ctx, timings)):
             frames.append(frame)
 
             if progress_callback is not None:
@@ -881,7 +1002,7 @@ class AnimationRenderer:
 
 
 def save_gif(
-    frames: list[np.ndarray],
+    frames: Iterable[np.ndarray],
     output_path: str,
     fps: int,
     loop_count: int = 0,
@@ -893,59 +1014,31 @@ def save_gif(
 ) -> None:
     """Save frames as animated GIF using Pillow.
 
+    Frames are quantized and encoded one at a time (see
+    :func:`~.gif_encoder.stream_gif`), so ``frames`` can be a generator such
+    as :meth:`AnimationRenderer.iter_frames` and memory stays bounded.
+
     Args:
-        frames: List of RGB numpy arrays (H, W, 3)
+        frames: RGB numpy arrays (H, W, 3), as a list or any iterable
         output_path: Destination file path
         fps: Frames per second
         loop_count: 0 = infinite loop, N = loop N times
-        optimize: Enable GIF optimization (reduces file size)
+        optimize: Crop to changed regions, make unchanged pixels transparent
+            and merge identical frames
         quality: 1-100 compression quality (not directly used by GIF)
         durations_ms: Optional per-frame durations in milliseconds
         shared_palette: Use a shared adaptive palette across frames for sharper output
         dither: "none" or "floyd"
     """
-    from PIL import Image
-
-    if not frames:
-        raise ValueError("Cannot save empty frame list")
-
-    duration_arg: int | list[int]
-    if durations_ms is not None:
-        if len(durations_ms) != len(frames):
-            raise ValueError("durations_ms length does not match frames")
-        duration_arg = durations_ms
-    else:
-        safe_fps = max(1, int(fps))
-        duration_arg = int(1000 / safe_fps)
-
-    # Convert numpy arrays to PIL Images
-    pil_frames = [Image.fromarray(frame) for frame in frames]
-
-    if shared_palette:
-        base = pil_frames[0].convert("P", palette=Image.ADAPTIVE, colors=256)
-        dither_mode = None
-        dither_name = dither.lower() if isinstance(dither, str) else ""
-        if hasattr(Image, "Dither"):
-            dither_mode = (
-                Image.Dither.NONE if dither_name == "none" else Image.Dither.FLOYDSTEINBERG
-            )
-        else:
-            none_mode = getattr(Image, "NONE", 0)
-            floyd_mode = getattr(Image, "FLOYDSTEINBERG", 3)
-            dither_mode = none_mode if dither_name == "none" else floyd_mode
-        pal_frames = [base]
-        for frame in pil_frames[1:]:
-            pal_frames.append(frame.convert("P", palette=base, dither=dither_mode))
-        pil_frames = pal_frames
-
-    # Save as animated GIF
-    pil_frames[0].save(
+    stream_gif(
+        frames,
         output_path,
-        save_all=True,
-        append_images=pil_frames[1:],
-        duration=duration_arg,
-        loop=loop_count,
+        fps,
+        loop_count,
         optimize=optimize,
+        durations_ms=durations_ms,
+        shared_palette=shared_palette,
+        dither=dither,
     )
 
 
@@ -6,7 +6,7 @@
 # Snapshot viewer notes:
 # - Class: VasoAnalyzerApp hosts the TIFF viewer v2 widget and sync wiring.
 # - Created in: initUI() → vasoanalyzer.ui.shell.init_ui.init_ui builds snapshot_widget and wires v2 controls.
-# - Data source: Sample.snapshots numpy stack or snapshot asset/path resolved via _ensure_sample_snapshots_loaded/_SnapshotLoadJob (npz/npy or TIFF via vasoanalyzer.io.tiffs.load_tiff); manual _load_snapshot_from_path also uses load_tiff then np.stack.
+# - Data source: Sample.snapshots numpy stack or snapshot asset/path resolved via _ensure_sample_snapshots_loaded/_SnapshotLoadJob (npz/npy, or a lazily decoded TiffPageSource via vasoanalyzer.io.tiffs.open_tiff_stack); manual _load_snapshot_from_path opens full stacks the same way and only materialises reduced loads.
 # - Sync: trace["Time (s)"] is canonical. TIFF frames are aligned via trace["TiffPage"] → frame_trace_time, and jump_to_time(t) drives the v2 viewer.
 
 # mypy: ignore-errors
@@ -99,6 +99,7 @@ import vasoanalyzer.core.project as project_module
 from utils.config import APP_VERSION
 from vasoanalyzer.core.audit import serialize_edit_log
 from vasoanalyzer.core.change_log_manager import ChangeLogManager
+from vasoanalyzer.core.events.values import EventValueEngine, NearestSampleIndex, SamplingRule
 from vasoanalyzer.core.project import (
     Attachment,
     Experiment,
@@ -129,7 +130,7 @@ from vasoanalyzer.io.importers import (
     import_vasotracker_v2,
     trace_frames_to_dataframe,
 )
-from vasoanalyzer.io.tiffs import load_tiff, resolve_frame_times
+from vasoanalyzer.io.tiffs import TiffPageSource, open_tiff_stack, resolve_frame_times
 from vasoanalyzer.io.trace_events import load_trace_and_events
 from vasoanalyzer.io.traces import load_trace
 from vasoanalyzer.services.cache_service import DataCache, cache_dir_for_project
@@ -146,6 +147,8 @@ from vasoanalyzer.services.project_service import (
     save_project_file,
 )
 from vasoanalyzer.services.types import ProjectRepository
+from vasoanalyzer.services.validation_service import add_result_listener
+from vasoanalyzer.storage import integrity as _integrity
 from vasoanalyzer.storage.dataset_package import (
     DatasetPackageValidationError,
     export_dataset_package,
@@ -496,17 +499,17 @@ class _SnapshotLoadJob(QRunnable):
             if ctx is not None:
                 close_project_ctx(ctx)
 
-    def _load_from_path(self) -> np.ndarray | None:
+    def _load_from_path(self) -> TiffPageSource | None:
         if not self._snapshot_path:
             return None
         path = Path(self._snapshot_path).expanduser()
         if not path.exists():
             return None
-        self._emit_progress(40, "Reading TIFF file")
-        frames, _, _ = load_tiff(path.as_posix(), metadata=False)
-        if frames:
-            self._emit_progress(80, "Building image stack")
-            return np.stack(frames)
+        self._emit_progress(40, "Opening TIFF file")
+        source, _, _ = open_tiff_stack(path.as_posix())
+        if len(source):
+            return source
+        source.close()
         return None
 
     def _stack_from_bytes(self, data: bytes) -> np.ndarray | None:
@@ -548,6 +551,13 @@ class _MissingAssetScanJob(QRunnable):
         self.signals.finished.emit(self._token, payload)
 
 
+class _StorageHealthSignals(QObject):
+    """Carries validation and integrity results from storage threads to the window."""
+
+    datasetChecked = pyqtSignal(object)
+    integrityFailed = pyqtSignal(object, object)
+
+
 class _ProgressAnimator(QObject):
     """Animates a QProgressBar with an asymptotic crawl toward a cap, then snaps to 100% on finish.
 
@@ -1031,6 +1041,13 @@ class VasoAnalyzerApp(QMainWindow):
         self.undo_stack = QUndoStack(self)
         self._change_log = ChangeLogManager()
         self._thread_pool = QThreadPool.globalInstance()
+        self._storage_health = _StorageHealthSignals(self)
+        self._storage_health.datasetChecked.connect(self._on_dataset_checked)
+        self._storage_health.integrityFailed.connect(self._on_snapshot_integrity_failed)
+        self._storage_listener_removers = [
+            add_result_listener(self._storage_health.datasetChecked.emit),
+            _integrity.add_failure_listener(self._storage_health.integrityFailed.emit),
+        ]
         self._current_sample_token: object | None = None
         self._loading_dataset_ids: set[int] = set()  # Track in-flight dataset loads
         self._pending_asset_scan_token: object | None = None
@@ -3149,20 +3166,16 @@ class VasoAnalyzerApp(QMainWindow):
 
                     # Sample pressure values from trace at event times
                     if df is not None and not df.empty:
-                        arr_t = df["Time (s)"].values
+                        event_rows = NearestSampleIndex(df["Time (s)"].values).nearest(
+                            np.asarray(times, dtype=float)
+                        )
                         if "Avg Pressure (mmHg)" in df.columns:
-                            arr_avg_p = df["Avg Pressure (mmHg)"].values
-                            p_avg_vals = [
-                                float(arr_avg_p[int(np.argmin(np.abs(arr_t - t)))]) for t in times
-                            ]
-                            events_data["p_avg"] = p_avg_vals
+                            arr_avg_p = df["Avg Pressure (mmHg)"].to_numpy(dtype=float)
+                            events_data["p_avg"] = arr_avg_p[event_rows].tolist()
 
                         if "Set Pressure (mmHg)" in df.columns:
-                            arr_set_p = df["Set Pressure (mmHg)"].values
-                            p1_vals = [
-                                float(arr_set_p[int(np.argmin(np.abs(arr_t - t)))]) for t in times
-                            ]
-                            events_data["p1"] = p1_vals
+                            arr_set_p = df["Set Pressure (mmHg)"].to_numpy(dtype=float)
+                            events_data["p1"] = arr_set_p[event_rows].tolist()
 
                     sample.events_data = pd.DataFrame(events_data)
 
@@ -4552,6 +4565,12 @@ class VasoAnalyzerApp(QMainWindow):
     ) -> tuple[float | None, float | None, float | None, float | None]:
         return self._sample_mgr._sample_values_at_time(time_sec)
 
+    def _event_value_engine(self) -> EventValueEngine | None:
+        return self._sample_mgr._event_value_engine()
+
+    def _invalidate_event_values(self) -> None:
+        self._sample_mgr._invalidate_event_values()
+
     def _insert_event_meta(self, index: int, meta: dict[str, Any] | None = None) -> None:
         self._event_mgr._insert_event_meta(index, meta)
 
@@ -4561,9 +4580,15 @@ class VasoAnalyzerApp(QMainWindow):
     def _insert_event_at(self, index: int, row: tuple, meta: dict[str, Any] | None = None) -> None:
         self._event_mgr._insert_event_at(index, row, meta)
 
+    def _insert_events_at(self, entries: list[tuple[int, tuple, dict[str, Any] | None]]) -> None:
+        self._event_mgr._insert_events_at(entries)
+
     def _remove_event_at(self, index: int) -> tuple | None:
         return self._event_mgr._remove_event_at(index)
 
+    def _remove_events_at(self, indices: list[int]) -> list[tuple]:
+        return self._event_mgr._remove_events_at(indices)
+
     def _fallback_restore_review_states(self, event_count: int) -> None:
         self._event_mgr._fallback_restore_review_states(event_count)
 
@@ -6772,7 +6797,7 @@ QPushButton[isGhost="true"]:pressed {{
 
         if tiff_path:
             try:
-                snapshots, _, _ = load_tiff(tiff_path, metadata=False)
+                snapshots, _, _ = open_tiff_stack(tiff_path)
                 self.load_snapshots(snapshots)
                 self.toggle_snapshot_viewer(True)
             except Exception as e:
@@ -6831,14 +6856,8 @@ QPushButton[isGhost="true"]:pressed {{
             sample.import_metadata = self._sanitize_import_metadata(meta)
 
             if snapshots is not None:
-                try:
-                    sample.snapshots = np.stack(snapshots)
-                except Exception:
-                    log.debug(
-                        "Failed to materialise snapshot stack for %s",
-                        sample_name,
-                        exc_info=True,
-                    )
+                # The viewer decodes the stack lazily; the sample reopens it by path.
+                sample.snapshot_path = os.path.abspath(tiff_path)
 
             target_experiment.samples.append(sample)
             self.current_experiment = target_experiment
@@ -7113,7 +7132,6 @@ QPushButton[isGhost="true"]:pressed {{
         has_set_pressure = self.trace_data is not None and set_label in self.trace_data.columns
 
         if self.trace_data is not None and self.event_times:
-            arr_t = self.trace_data["Time (s)"].values
             arr_d = self.trace_data["Inner Diameter"].values
             arr_od = (
                 self.trace_data["Outer Diameter"]
@@ -7123,7 +7141,15 @@ QPushButton[isGhost="true"]:pressed {{
             arr_avg_p = self.trace_data[avg_label].values if has_avg_pressure else None
             arr_set_p = self.trace_data[set_label].values if has_set_pressure else None
             default_offset_sec = 2.0
-            time_trace = self.trace_data["Time (s)"]
+            # Sample each event before the *next* event (or before trace end),
+            # for all events in one pass.
+            value_engine = self._event_value_engine()
+            event_time_arr = np.asarray(self.event_times, dtype=float)
+            nearest_rows = value_engine.nearest_rows(event_time_arr).tolist()
+            sample_rows = value_engine.sample_rows(
+                event_time_arr,
+                rule=SamplingRule("steady_state", settle_offset_s=default_offset_sec),
+            ).tolist()
 
             # Event times should come from trace["Time (s)"] via FrameNumber mapping, not parsed event CSV strings.
             for idx_ev, (lbl, t, fr) in enumerate(
@@ -7140,27 +7166,10 @@ QPushButton[isGhost="true"]:pressed {{
                     event_trace_indices[idx_ev] if idx_ev < len(event_trace_indices) else None
                 )
                 if trace_idx is None:
-                    trace_idx = int(np.argmin(np.abs(arr_t - t)))
+                    trace_idx = nearest_rows[idx_ev]
                 frame_number = int(fr) if fr is not None else trace_idx
 
-                # Sample a value before the *next* event (or before trace end)
-                if len(self.event_times) > 1 and idx_ev < len(self.event_times) - 1:
-                    next_t = self.event_times[idx_ev + 1]
-                    gap = max(0.0, float(next_t) - float(t))
-                    if gap <= 0.5:
-                        t_sample = float(t) + gap * 0.5
-                    elif gap <= 1.0:
-                        t_sample = float(t) + gap * 0.6
-                    else:
-                        lookback = min(5.0, max(1.0, gap / 2.0, default_offset_sec))
-                        lookback = min(lookback, gap - 0.05) if gap > 0.05 else gap * 0.5
-                        t_sample = float(next_t) - lookback
-                else:
-                    t_sample = float(time_trace.iloc[-1]) - default_offset_sec
-                # Clamp sample time within trace range
-                t_sample = max(float(time_trace.iloc[0]), min(t_sample, float(time_trace.iloc[-1])))
-
-                idx_pre = int(np.argmin(np.abs(arr_t - t_sample)))
+                idx_pre = sample_rows[idx_ev]
 
                 diam_val = float(arr_d[idx_pre])
                 # Fallback to stored diam_before when the trace has NaN at the sample point
@@ -7290,6 +7299,9 @@ QPushButton[isGhost="true"]:pressed {{
     ) -> None:
         self._snapshot_mgr._set_snapshot_data_source(stack, frame_times)
 
+    def _release_snapshot_source(self) -> None:
+        self._snapshot_mgr._release_snapshot_source()
+
     def load_snapshots(self, stack):
         self._snapshot_mgr.load_snapshots(stack)
 
@@ -9200,6 +9212,7 @@ QPushButton[isGhost="true"]:pressed {{
         self.frame_number_to_trace_idx = {}
         self.frame_trace_time = None
         self.frame_trace_index = None
+        self._release_snapshot_source()
         self.snapshot_frames = []
         self.frames_metadata = []
         self.frame_times = []
@@ -9739,8 +9752,34 @@ QPushButton[isGhost="true"]:pressed {{
         log.warning("RESTORE_SELECTION: Failed to find experiment '%s' in tree", last_exp)
         return False
 
+    def _on_dataset_checked(self, check) -> None:
+        if check.ok:
+            self.statusBar().showMessage(f"Validated dataset {check.dataset_id}", 1500)
+            return
+        log.warning("Dataset %s could not be validated: %s", check.dataset_id, check.error)
+        self.statusBar().showMessage(
+            f"\u26a0 Dataset {check.dataset_id} could not be validated: {check.error}", 8000
+        )
+
+    def _on_snapshot_integrity_failed(self, path, problems) -> None:
+        name = Path(path).name
+        detail = problems[0] if problems else "unknown error"
+        self.statusBar().showMessage(f"\u26a0 Snapshot {name} failed its integrity check", 10000)
+        QMessageBox.warning(
+            self,
+            "Snapshot Integrity",
+            (
+                f"A background integrity check found problems in snapshot {name}:\n\n"
+                f"{detail}\n\n"
+                "The snapshot has been marked as corrupt. The next time the project is "
+                "opened it will load from the most recent valid snapshot."
+            ),
+        )
+
     def closeEvent(self, event):
         self._shutdown_update_checker()
+        for remove_listener in self._storage_listener_removers:
+            remove_listener()
         if self.current_project and self.current_project.path:
             # Stop autosave timers to prevent concurrent saves during shutdown
             self.autosave_timer.stop()
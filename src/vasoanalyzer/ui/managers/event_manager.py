@@ -35,6 +35,7 @@ from vasoanalyzer.export.profiles import (
     EVENT_VALUES_SINGLE_COLUMN_ID,
     PRESSURE_CURVE_STANDARD_ID,
 )
+from vasoanalyzer.io.events import load_events
 from vasoanalyzer.services.project_service import (
     events_dataframe_from_rows,
     normalize_event_table_rows,
@@ -80,6 +81,13 @@ class EventManager(QObject):
         super().__init__(parent)
         self._host = host
 
+    def _nearest_trace_row(self, t: float) -> int | None:
+        """Return the trace row nearest to ``t``, or None without a trace timebase."""
+        engine = self._host._event_value_engine()
+        if engine is None:
+            return None
+        return int(engine.nearest_rows([t])[0])
+
     def quick_add_event_at_trace_point(self, x: float, y: float, trace_type: str = "inner") -> None:
         h = self._host
         """Quick-add an event marker at the clicked trace position."""
@@ -97,7 +105,9 @@ class EventManager(QObject):
             QMessageBox.warning(h, "No Trace", "Trace timebase is empty.")
             return
 
-        nearest_idx = int(np.argmin(np.abs(times - click_time)))
+        nearest_idx = self._nearest_trace_row(click_time)
+        if nearest_idx is None:
+            return
         event_time = float(times[nearest_idx])
 
         default_label = f"Event {len(h.event_table_data) + 1}"
@@ -193,8 +203,11 @@ class EventManager(QObject):
         has_avg_p = h.trace_data is not None and avg_label in h.trace_data.columns
         has_set_p = h.trace_data is not None and set_label in h.trace_data.columns
 
+        idx = self._nearest_trace_row(x)
+        if idx is None:
+            QMessageBox.warning(h, "No Trace", "Load a trace before adding events.")
+            return
         arr_t = h.trace_data["Time (s)"].values
-        idx = int(np.argmin(np.abs(arr_t - x)))
         event_time = float(arr_t[idx])
 
         # Always use actual trace values at the snapped time point
@@ -261,8 +274,10 @@ class EventManager(QObject):
             return
 
         insert_idx = insert_labels.index(selected)
-        arr_t = h.trace_data["Time (s)"].values
-        frame_number = int(np.argmin(np.abs(arr_t - t_val)))
+        frame_number = self._nearest_trace_row(t_val)
+        if frame_number is None:
+            QMessageBox.warning(h, "No Trace", "Load a trace before adding events.")
+            return
         od_val = None
         if has_od:
             od_val, ok = QInputDialog.getDouble(h, "Outer Diameter", "OD (µm):", 0.0, 0, 1e6, 2)
@@ -414,6 +429,7 @@ class EventManager(QObject):
                 setattr(h, attr, [])
 
         if index >= len(h.event_table_data):
+            index = len(h.event_table_data)
             h.event_table_data.append(row)
             h.event_labels.append(label)
             h.event_times.append(time_val)
@@ -427,11 +443,69 @@ class EventManager(QObject):
             h._insert_event_meta(index, meta)
 
         h._ensure_event_meta_length(len(h.event_table_data))
-        h.populate_table()
+        self._show_inserted_rows([index])
+        h.update_plot()
+        h.auto_export_table()
+        h.mark_session_dirty()
+
+    def _insert_events_at(self, entries: list[tuple[int, tuple, dict[str, Any] | None]]) -> None:
+        """Insert several ``(index, row, meta)`` entries, refreshing the UI once.
+
+        Entries are applied in ascending index order, so each index refers to
+        the table as it looks after the earlier entries were inserted.
+        """
+        h = self._host
+        if not entries:
+            return
+        for attr in ("event_labels", "event_times", "event_frames", "event_label_meta"):
+            if not isinstance(getattr(h, attr, None), list):
+                setattr(h, attr, [])
+
+        positions: list[int] = []
+        for index, row, meta in sorted(entries, key=lambda entry: entry[0]):
+            index = min(index, len(h.event_table_data))
+            h.event_table_data.insert(index, row)
+            h.event_labels.insert(index, row[0] if row else "")
+            h.event_times.insert(index, float(row[1]) if len(row) > 1 else 0.0)
+            h.event_frames.insert(index, int(row[-1]) if (row and row[-1] is not None) else 0)
+            h._insert_event_meta(index, meta)
+            positions.append(index)
+
+        h._ensure_event_meta_length(len(h.event_table_data))
+        self._show_inserted_rows(positions)
         h.update_plot()
         h.auto_export_table()
         h.mark_session_dirty()
 
+    def _show_inserted_rows(self, positions: list[int]) -> None:
+        """Insert the rows now at ascending *positions* into the table model.
+
+        Each contiguous run goes in with one ``insert_rows`` call.  An empty
+        table is rebuilt with ``populate_table`` instead, since only a rebuild
+        sets up its columns.
+        """
+        h = self._host
+        if len(positions) >= len(h.event_table_data):
+            h.populate_table()
+            return
+
+        runs: list[tuple[int, int]] = []
+        for pos in positions:
+            if runs and pos == runs[-1][1]:
+                runs[-1] = (runs[-1][0], pos + 1)
+            else:
+                runs.append((pos, pos + 1))
+
+        h._event_table_updating = True
+        try:
+            for start, stop in runs:
+                h.event_table_controller.insert_rows(start, h.event_table_data[start:stop])
+            states = h._current_review_states()
+            if any(states[pos] != REVIEW_UNREVIEWED for pos in positions):
+                h.event_table_controller.set_review_states(states)
+        finally:
+            h._event_table_updating = False
+
     def _remove_event_at(self, index: int) -> tuple | None:
         """Remove the event at *index* from all event arrays and refresh the UI.
 
@@ -456,6 +530,33 @@ class EventManager(QObject):
         h.mark_session_dirty()
         return removed
 
+    def _remove_events_at(self, indices: list[int]) -> list[tuple]:
+        """Remove several events with one table update and one replot.
+
+        Returns the removed ``EventRow`` tuples in ascending index order.
+        """
+        h = self._host
+        valid = sorted({idx for idx in indices if 0 <= idx < len(h.event_table_data)})
+        if not valid:
+            return []
+
+        removed = [h.event_table_data[idx] for idx in valid]
+        for index in reversed(valid):
+            del h.event_table_data[index]
+            if index < len(h.event_labels):
+                del h.event_labels[index]
+            if index < len(h.event_times):
+                del h.event_times[index]
+            if index < len(h.event_frames):
+                del h.event_frames[index]
+            h._delete_event_meta(index)
+        h.event_table_controller.remove_rows(valid)
+
+        h.update_plot()
+        h.auto_export_table()
+        h.mark_session_dirty()
+        return removed
+
     def _sync_event_data_from_table(self) -> None:
         h = self._host
         """Recompute cached event arrays, metadata, and annotation entries."""
@@ -1811,8 +1912,9 @@ class EventManager(QObject):
             return
 
         id_val, od_val, avg_p, set_p = h._sample_values_at_time(t_val)
-        times = h.trace_data["Time (s)"].to_numpy(dtype=float)
-        frame = int(np.argmin(np.abs(times - t_val))) if times.size > 0 else 0
+        frame = self._nearest_trace_row(t_val)
+        if frame is None:
+            return
 
         def _ro(v: float | None) -> float | None:
             if v is None:
@@ -1877,7 +1979,7 @@ class EventManager(QObject):
     def _load_events_from_path(self, file_path: str) -> bool:
         h = self._host
         try:
-            labels, times, frames = load_events(file_path)
+            labels, times, frames = load_events(file_path, cache=h._ensure_data_cache(file_path))
         except Exception as exc:
             QMessageBox.critical(
                 h,
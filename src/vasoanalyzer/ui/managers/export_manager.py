@@ -38,6 +38,7 @@ from vasoanalyzer.storage.dataset_package import (
 )
 from vasoanalyzer.ui.dialogs.excel_mapping_dialog import update_excel_file
 from vasoanalyzer.ui.dialogs.excel_template_export_dialog import ExcelTemplateExportDialog
+from vasoanalyzer.ui.tiff_viewer_v2.stack_source import StackSource
 
 if TYPE_CHECKING:
     from vasoanalyzer.ui.main_window import VasoAnalyzerApp
@@ -356,9 +357,7 @@ class ExportManager(QObject):
 
         # Check for required data
         has_trace = sample.trace_data is not None or sample.dataset_id is not None
-        has_snapshots = (
-            isinstance(sample.snapshots, np.ndarray) and sample.snapshots.size > 0
-        )
+        has_snapshots = self._sample_has_snapshots(sample)
         has_events = sample.events_data is not None and len(sample.events_data) >= 2
 
         # Enable only if all requirements are met
@@ -377,6 +376,19 @@ class ExportManager(QObject):
             )
         host._sync_clip_enabled = should_enable
 
+    def _lazy_snapshot_source(self, sample) -> StackSource | None:
+        """The viewer's lazily decoded stack, when it belongs to ``sample``."""
+        host = self._host
+        frames = getattr(host, "snapshot_frames", None)
+        if sample is host.current_sample and isinstance(frames, StackSource) and len(frames):
+            return frames
+        return None
+
+    def _sample_has_snapshots(self, sample) -> bool:
+        if isinstance(sample.snapshots, np.ndarray) and sample.snapshots.size > 0:
+            return True
+        return self._lazy_snapshot_source(sample) is not None
+
     def show_gif_animator(self, checked: bool = False) -> None:
         """Launch GIF Animator window."""
         self.open_sync_clip_exporter(checked)
@@ -422,10 +434,7 @@ class ExportManager(QObject):
             return
 
         # Validate requirements
-        has_snapshots = (
-            isinstance(host.current_sample.snapshots, np.ndarray)
-            and host.current_sample.snapshots.size > 0
-        )
+        has_snapshots = self._sample_has_snapshots(host.current_sample)
         has_events = (
             host.current_sample.events_data is not None
             and len(host.current_sample.events_data) >= 2
@@ -462,12 +471,19 @@ class ExportManager(QObject):
             log.info("Export Clip blocked (trace_model missing)")
             return
 
+        # A lazily viewed stack is handed to the exporter as-is; frames are
+        # decoded on demand while rendering instead of materialising the stack.
+        vessel_frames = host.current_sample.snapshots
+        if not isinstance(vessel_frames, np.ndarray):
+            vessel_frames = self._lazy_snapshot_source(host.current_sample)
+
         try:
             existing = getattr(host, "_sync_clip_window", None)
             if existing is not None:
                 if (
                     getattr(existing, "sample", None) is not host.current_sample
                     or getattr(existing, "trace_model", None) is not trace_model
+                    or getattr(existing, "vessel_frames", None) is not vessel_frames
                 ):
                     with contextlib.suppress(Exception):
                         existing.close()
@@ -482,6 +498,7 @@ class ExportManager(QObject):
                     sample=host.current_sample,
                     trace_model=trace_model,
                     events_df=host.current_sample.events_data,
+                    vessel_frames=vessel_frames,
                 )
                 host._sync_clip_window.destroyed.connect(
                     lambda *_: setattr(host, "_sync_clip_window", None)
@@ -508,7 +525,7 @@ class ExportManager(QObject):
             window.raise_()
             window.activateWindow()
 
-            n_frames = len(host.current_sample.snapshots) if has_snapshots else 0
+            n_frames = len(vessel_frames) if vessel_frames is not None else 0
             log.info(
                 "Export Clip: context set (trace=%s, tiff=%s, frames=%s)",
                 trace_model is not None,
@@ -1217,6 +1217,8 @@ class PlotManager(QObject):
                 else:
                     h.trace_data["Outer Diameter (raw)"] = h.trace_model.outer_raw.copy()
 
+        h._invalidate_event_values()
+
         serialized_log = serialize_edit_log(h.trace_model.edit_log)
         h.trace_data.attrs["edit_log"] = serialized_log
 
@@ -31,6 +31,7 @@ from PyQt6.QtWidgets import (
 )
 
 from collections.abc import Mapping
+from vasoanalyzer.core.events.values import EventValueEngine, NearestSampleIndex
 from vasoanalyzer.core.project import Attachment, Experiment, SampleN
 from vasoanalyzer.core.project_context import ProjectContext
 from vasoanalyzer.core.trace_model import TraceModel
@@ -58,6 +59,8 @@ class SampleManager(QObject):
     def __init__(self, host: "VasoAnalyzerApp", parent: QObject | None = None):
         super().__init__(parent)
         self._host = host
+        self._value_engine: EventValueEngine | None = None
+        self._value_engine_key: tuple[Any, ...] | None = None
 
     def _ensure_data_cache(self, hint_path: str | None = None) -> DataCache:
         """Return the active DataCache, creating it when necessary."""
@@ -1063,6 +1066,7 @@ class SampleManager(QObject):
         h.canvas.draw_idle()
 
         # Clear snapshot UI
+        h._release_snapshot_source()
         h.snapshot_frames = []
         h.frames_metadata = []
         h._set_playback_state(False)
@@ -1359,8 +1363,8 @@ class SampleManager(QObject):
                         stored_id = [None] * len(times)
                         stored_od = [None] * len(times)
 
-                    for i, t in enumerate(times):
-                        idx_evt = int(np.argmin(np.abs(arr_t - t)))
+                    event_rows = NearestSampleIndex(arr_t).nearest(np.asarray(times, dtype=float))
+                    for i, idx_evt in enumerate(event_rows.tolist()):
                         id_val = float(arr_d[idx_evt])
                         if not np.isfinite(id_val) and i < len(stored_id) and stored_id[i] is not None:
                             id_val = stored_id[i]
@@ -1538,43 +1542,77 @@ class SampleManager(QObject):
         if h.current_project and h.current_project.path:
             save_project(h.current_project, h.current_project.path)
 
+    def _event_value_columns(self) -> tuple[str | None, ...]:
+        h = self._host
+        return (
+            "Inner Diameter",
+            "Outer Diameter",
+            h._trace_label_for("p_avg"),
+            h._trace_label_for("p2"),
+        )
+
+    def _event_value_engine(self) -> EventValueEngine | None:
+        """Return the event value engine for the current trace, or None without one.
+
+        The engine is rebuilt when the trace DataFrame, its length or the
+        pressure column labels change; in-place edits call
+        :meth:`_invalidate_event_values`.
+        """
+        h = self._host
+        trace = h.trace_data
+        if trace is None or "Time (s)" not in trace.columns:
+            return None
+        labels = self._event_value_columns()
+        key = (trace, len(trace.index), labels)
+        cached_key = self._value_engine_key
+        if (
+            self._value_engine is None
+            or cached_key is None
+            or cached_key[0] is not trace
+            or cached_key[1:] != key[1:]
+        ):
+            columns = {
+                label: trace[label].to_numpy()
+                for label in labels
+                if label and label in trace.columns
+            }
+            self._value_engine = EventValueEngine(trace["Time (s)"].to_numpy(), columns)
+            self._value_engine_key = key
+        return self._value_engine
+
+    def _invalidate_event_values(self) -> None:
+        """Drop the cached engine after the trace columns were edited in place."""
+        self._value_engine = None
+        self._value_engine_key = None
+
     def _sample_values_at_time(
         self, time_sec: float
     ) -> tuple[float | None, float | None, float | None, float | None]:
         """Sample ID/OD/Avg P/Set P at a given time using current trace data."""
-        h = self._host
-        if h.trace_data is None or "Time (s)" not in h.trace_data.columns:
+        engine = self._event_value_engine()
+        if engine is None:
             return (None, None, None, None)
         try:
             target_time = float(time_sec)
         except Exception:
             return (None, None, None, None)
 
-        times = h.trace_data["Time (s)"].to_numpy()
-        if times.size == 0:
-            return (None, None, None, None)
-
-        idx = int(np.argmin(np.abs(times - target_time)))
+        sampled = engine.evaluate([target_time])
 
         def _sample_column(label: str | None) -> float | None:
-            if not label or label not in h.trace_data.columns:
-                return None
-            try:
-                value = h.trace_data[label].iloc[idx]
-            except Exception:
+            column = sampled.get(label) if label else None
+            if column is None or not column.size:
                 return None
-            if pd.isna(value):
-                return None
-            try:
-                return float(value)
-            except (TypeError, ValueError):
-                return None
-
-        id_val = _sample_column("Inner Diameter")
-        od_val = _sample_column("Outer Diameter")
-        avg_val = _sample_column(h._trace_label_for("p_avg"))
-        set_val = _sample_column(h._trace_label_for("p2"))
-        return (id_val, od_val, avg_val, set_val)
+            value = float(column[0])
+            return None if np.isnan(value) else value
+
+        id_label, od_label, avg_label, set_label = self._event_value_columns()
+        return (
+            _sample_column(id_label),
+            _sample_column(od_label),
+            _sample_column(avg_label),
+            _sample_column(set_label),
+        )
 
     def _start_sample_load_progress(self, sample_name: str) -> None:
         """Begin animated progress bar for sample load."""
@@ -26,8 +26,9 @@ import tifffile
 from PyQt6.QtCore import QObject
 from PyQt6.QtWidgets import QFileDialog, QMessageBox
 
-from vasoanalyzer.core.timebase import page_for_time
-from vasoanalyzer.io.tiffs import load_tiff, resolve_frame_times
+from vasoanalyzer.core.timebase import PageTimeIndex
+from vasoanalyzer.io.tiffs import load_tiff, open_tiff_stack, resolve_frame_times
+from vasoanalyzer.ui.tiff_viewer_v2.stack_source import StackSource
 
 if TYPE_CHECKING:
     from vasoanalyzer.core.project import SampleN
@@ -54,12 +55,36 @@ def _log_time_sync(label: str, **fields) -> None:
         log.debug("[SYNC] %s %s", label, payload)
 
 
+def _stack_frames(frames: Sequence[np.ndarray]) -> np.ndarray:
+    """Stack ``frames``, reusing the buffer they were sliced from when possible."""
+    first = frames[0] if len(frames) else None
+    owner = first.base if first is not None else None
+    if (
+        isinstance(owner, np.ndarray)
+        and owner.dtype == first.dtype
+        and owner.flags.c_contiguous
+        and owner.size == first.size * len(frames)
+        and all(
+            frame.shape == first.shape
+            and frame.flags.c_contiguous
+            and frame.ctypes.data == owner.ctypes.data + i * first.nbytes
+            for i, frame in enumerate(frames)
+        )
+    ):
+        return owner.reshape((len(frames), *first.shape))
+    return np.stack(frames)
+
+
 class SnapshotManager(QObject):
     """Manages TIFF snapshot loading, display, playback, and synchronization."""
 
     def __init__(self, host: "VasoAnalyzerApp", parent: QObject | None = None):  # type: ignore[name-defined]  # noqa: F821
         super().__init__(parent)
         self._host = host
+        # Page/time index for the bound stack, keyed by the times object it
+        # was built from so cursor syncs reuse it until the stack changes.
+        self._frame_time_index: PageTimeIndex | None = None
+        self._frame_time_index_source: object | None = None
 
     # ------------------------------------------------------------------
     # Snapshot view mode
@@ -142,6 +167,7 @@ class SnapshotManager(QObject):
                     self.load_snapshots(stack)
                 except Exception:
                     log.debug("Failed to initialise snapshot viewer", exc_info=True)
+                    self._release_snapshot_source()
                     h.snapshot_frames = []
                 else:
                     h._snapshot_viewer_pending_open = False
@@ -404,38 +430,68 @@ class SnapshotManager(QObject):
                         chosen_stride = stride
                         max_frames = int(math.ceil(total_frames / stride))
 
-            frames, frames_metadata, loading_info = load_tiff(file_path, max_frames=max_frames)
-            loading_info = loading_info or {}
-            valid_frames = []
-            valid_metadata = []
-            raw_indices = loading_info.get("frame_indices") or list(range(len(frames)))
-            valid_indices: list[int] = []
-
-            for i, frame in enumerate(frames):
-                if frame is not None and frame.size > 0:
-                    valid_frames.append(frame)
-                    if i < len(frames_metadata):
-                        valid_metadata.append(frames_metadata[i])
-                    else:
-                        valid_metadata.append({})
-                    if i < len(raw_indices):
-                        try:
-                            valid_indices.append(int(raw_indices[i]))
-                        except Exception:
-                            valid_indices.append(raw_indices[i])
-                    else:
-                        valid_indices.append(i)
-
-            if len(valid_frames) < len(frames):
-                QMessageBox.warning(h, "TIFF Warning", "Skipped empty or corrupted TIFF frames.")
-
-            if not valid_frames:
-                QMessageBox.warning(
-                    h,
-                    "TIFF Load Error",
-                    "No valid frames were found in the dropped TIFF file.",
+            index_dir = h._ensure_data_cache(file_path).root
+            if max_frames is None:
+                # Full loads stay lazy: pages decode on demand as the viewer asks for them.
+                source, valid_metadata, loading_info = open_tiff_stack(
+                    file_path, index_dir=index_dir
                 )
-                return False
+                if not len(source):
+                    source.close()
+                    QMessageBox.warning(
+                        h,
+                        "TIFF Load Error",
+                        "No valid frames were found in the dropped TIFF file.",
+                    )
+                    return False
+                valid_frames = source
+                valid_indices = list(loading_info["frame_indices"])
+            else:
+                frames, frames_metadata, loading_info = load_tiff(
+                    file_path,
+                    max_frames=max_frames,
+                    index_dir=index_dir,
+                )
+                loading_info = loading_info or {}
+                valid_frames = []
+                valid_positions: list[int] = []
+                raw_indices = loading_info.get("frame_indices") or list(range(len(frames)))
+                valid_indices: list[int] = []
+
+                for i, frame in enumerate(frames):
+                    if frame is not None and frame.size > 0:
+                        valid_frames.append(frame)
+                        valid_positions.append(i)
+                        if i < len(raw_indices):
+                            try:
+                                valid_indices.append(int(raw_indices[i]))
+                            except Exception:
+                                valid_indices.append(raw_indices[i])
+                        else:
+                            valid_indices.append(i)
+
+                # Keep lazily read TIFF metadata lazy; only index the valid positions.
+                select_metadata = getattr(frames_metadata, "select", None)
+                if callable(select_metadata) and len(frames_metadata) == len(frames):
+                    valid_metadata = select_metadata(valid_positions)
+                else:
+                    valid_metadata = [
+                        frames_metadata[i] if i < len(frames_metadata) else {}
+                        for i in valid_positions
+                    ]
+
+                if len(valid_frames) < len(frames):
+                    QMessageBox.warning(
+                        h, "TIFF Warning", "Skipped empty or corrupted TIFF frames."
+                    )
+
+                if not valid_frames:
+                    QMessageBox.warning(
+                        h,
+                        "TIFF Load Error",
+                        "No valid frames were found in the dropped TIFF file.",
+                    )
+                    return False
 
             frame_stride = int(loading_info.get("frame_stride", chosen_stride or 1))
             total_frames_value = loading_info.get(
@@ -458,6 +514,7 @@ class SnapshotManager(QObject):
                 frame_stride > 1 or len(valid_frames) < int(total_frames_value or 0)
             )
 
+            self._release_snapshot_source()
             h.snapshot_frames = valid_frames
             h.frames_metadata = valid_metadata
             h.snapshot_loading_info = loading_info
@@ -600,7 +657,13 @@ class SnapshotManager(QObject):
 
             if h.current_sample is not None:
                 try:
-                    h.current_sample.snapshots = np.stack(h.snapshot_frames)
+                    # A lazy stack is reopened from ``snapshot_path``; only
+                    # reduced loads are kept in memory on the sample.
+                    h.current_sample.snapshots = (
+                        None
+                        if isinstance(h.snapshot_frames, StackSource)
+                        else _stack_frames(h.snapshot_frames)
+                    )
                     h.current_sample.snapshot_path = os.path.abspath(file_path)
                 except Exception:
                     log.warning("Failed to stack snapshot frames", exc_info=True)
@@ -685,18 +748,28 @@ class SnapshotManager(QObject):
     # ------------------------------------------------------------------
 
     def _set_snapshot_data_source(
-        self, stack: Sequence[np.ndarray] | np.ndarray, frame_times: Sequence[float] | None
+        self,
+        stack: Sequence[np.ndarray] | np.ndarray | StackSource,
+        frame_times: Sequence[float] | None,
     ) -> None:
-        """Bind a canonical snapshot data source for controller-driven viewing."""
+        """Bind a canonical snapshot data source for controller-driven viewing.
+
+        ``stack`` may be a lazy :class:`StackSource` (e.g. ``TiffPageSource``),
+        which is handed to the viewer as-is so frames decode on demand.
+        """
         h = self._host
         viewer = getattr(h, "snapshot_widget", None)
         if viewer is None:
             return
-        try:
-            frames = list(stack) if not isinstance(stack, np.ndarray) else list(stack)
-        except Exception:
-            log.debug("Failed to coerce snapshot stack for v2 viewer", exc_info=True)
-            return
+        frames: Sequence[np.ndarray] | StackSource
+        if isinstance(stack, StackSource):
+            frames = stack
+        else:
+            try:
+                frames = list(stack)
+            except Exception:
+                log.debug("Failed to coerce snapshot stack for v2 viewer", exc_info=True)
+                return
         from vasoanalyzer.ui.tiff_viewer_v2.page_time_map import (
             PageTimeMap,
             derive_page_time_map_from_trace,
@@ -720,6 +793,9 @@ class SnapshotManager(QObject):
             )
             if not page_time_map.valid:
                 page_time_map = PageTimeMap.invalid(page_time_map.status)
+        if page_time_map.index is not None and frame_times is not None:
+            self._frame_time_index = page_time_map.index
+            self._frame_time_index_source = frame_times
         if page_time_map.valid:
             log.info("V2 sync status: %s", page_time_map.status or "Sync available")
         else:
@@ -727,13 +803,32 @@ class SnapshotManager(QObject):
         with contextlib.suppress(Exception):
             viewer.set_stack_source(frames, page_time_map=page_time_map)
 
+    def _release_snapshot_source(self) -> None:
+        """Close the lazy stack currently bound to the viewer, if any."""
+        h = self._host
+        close = getattr(h.snapshot_frames, "close", None)
+        if not callable(close):
+            return
+        # A clip exporter rendering from this stack cannot outlive it.
+        clip_window = getattr(h, "_sync_clip_window", None)
+        clip_frames = getattr(clip_window, "vessel_frames", None)
+        if clip_window is not None and clip_frames is h.snapshot_frames:
+            with contextlib.suppress(Exception):
+                clip_window.close()
+            h._sync_clip_window = None
+        with contextlib.suppress(Exception):
+            close()
+
     # ------------------------------------------------------------------
     # Load snapshots from numpy stack
     # ------------------------------------------------------------------
 
     def load_snapshots(self, stack) -> None:
         h = self._host
-        h.snapshot_frames = [frame for frame in stack]
+        if stack is not h.snapshot_frames:
+            self._release_snapshot_source()
+        # Lazy sources are kept as-is; iterating one would decode every page.
+        h.snapshot_frames = stack if isinstance(stack, StackSource) else [frame for frame in stack]
         if h.snapshot_frames:
             h.snapshot_frame_indices = list(range(len(h.snapshot_frames)))
             h.snapshot_frame_stride = 1
@@ -843,17 +938,23 @@ class SnapshotManager(QObject):
         except (TypeError, ValueError):
             return None
 
-        times = None
         if h.frame_trace_time is not None and len(h.frame_trace_time):
-            times = np.asarray(h.frame_trace_time, dtype=float)
+            source = h.frame_trace_time
         elif h.frame_times:
-            with contextlib.suppress(Exception):
-                times = np.asarray(h.frame_times, dtype=float)
-
-        if times is None or times.size == 0:
+            source = h.frame_times
+        else:
             return None
 
-        return page_for_time(t_val, times, mode="nearest")
+        if source is not self._frame_time_index_source:
+            try:
+                index = PageTimeIndex(source)
+            except (TypeError, ValueError):
+                return None
+            self._frame_time_index = index
+            self._frame_time_index_source = source
+        if self._frame_time_index is None:
+            return None
+        return self._frame_time_index.page_for_time(t_val, mode="nearest")
 
     # ------------------------------------------------------------------
     # Time jump (canonical)
@@ -1597,6 +1698,7 @@ class SnapshotManager(QObject):
                 h.snapshot_viewer_action.blockSignals(True)
                 h.snapshot_viewer_action.setChecked(False)
                 h.snapshot_viewer_action.blockSignals(False)
+                self._release_snapshot_source()
                 h.snapshot_frames = []
                 h.frames_metadata = []
                 h.frame_times = []
@@ -1657,24 +1759,31 @@ class SnapshotManager(QObject):
         self,
         token: object,
         sample: "SampleN",
-        stack: np.ndarray | None,
+        stack: np.ndarray | StackSource | None,
         error: str | None,
     ) -> None:
         h = self._host
+        lazy = isinstance(stack, StackSource)
         if token != h._snapshot_load_token or sample is not h._snapshot_loading_sample:
+            if lazy:
+                stack.close()
             return
 
         h._snapshot_load_token = None
         h._snapshot_loading_sample = None
         h.hide_progress()
         if stack is not None:
-            sample.snapshots = stack
+            if not lazy:
+                sample.snapshots = stack
             h.statusBar().showMessage("Snapshots ready", 2000)
+            should_show = sample is h.current_sample and bool(
+                h._snapshot_viewer_pending_open
+                or (h.snapshot_viewer_action and h.snapshot_viewer_action.isChecked())
+            )
+            if lazy and not should_show:
+                # Nothing holds an unviewed lazy stack; it is reopened on demand.
+                stack.close()
             if sample is h.current_sample:
-                should_show = bool(
-                    h._snapshot_viewer_pending_open
-                    or (h.snapshot_viewer_action and h.snapshot_viewer_action.isChecked())
-                )
                 if should_show:
                     try:
                         self.load_snapshots(stack)
@@ -1682,6 +1791,7 @@ class SnapshotManager(QObject):
                         self.toggle_snapshot_viewer(True, source="data")
                     except Exception:
                         log.error("Failed to initialise snapshot viewer", exc_info=True)
+                        self._release_snapshot_source()
                         h.snapshot_frames = []
                         self.toggle_snapshot_viewer(False, source="data")
                 # Update GIF Animator state after snapshots are loaded
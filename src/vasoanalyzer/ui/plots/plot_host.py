@@ -18,6 +18,7 @@ from matplotlib.text import Annotation, Text
 from PyQt6.QtCore import QTimer
 
 from vasoanalyzer.app.flags import is_enabled
+from vasoanalyzer.core.events.cluster import EventClusterIndex
 from vasoanalyzer.core.trace_model import TraceModel
 from vasoanalyzer.ui.event_labels import EventLabeler, LayoutOptions
 from vasoanalyzer.ui.event_labels_v3 import (
@@ -68,6 +69,7 @@ class PlotHost:
         self._model: TraceModel | None = None
         self._current_window: tuple[float, float] | None = None
         self._event_times: list[float] = []
+        self._event_cluster_index: EventClusterIndex | None = None
         self._event_colors: list[str] | None = None
         self._event_labels: list[str] = []
         self._event_label_meta: list[dict[str, Any]] = []
@@ -368,6 +370,7 @@ class PlotHost:
                 normalized_labels.append(str(label_list[idx]))
 
         self._event_times = normalized_times
+        self._event_cluster_index = None
         if color_list is not None and normalized_colors:
             self._event_colors = normalized_colors
         else:
@@ -615,6 +618,7 @@ class PlotHost:
         self._model = None
         self._current_window = None
         self._event_times = []
+        self._event_cluster_index = None
         self._event_colors = None
         self._event_labels = []
         self._event_label_meta = []
@@ -1623,11 +1627,11 @@ class PlotHost:
         except Exception:
             ax_width_px = max(int(self.canvas.width()), 1)
 
-        from vasoanalyzer.core.events.cluster import cluster_events
         from vasoanalyzer.ui.plots.event_label_layer import draw_event_labels
 
-        clusters = cluster_events(
-            self._event_times,
+        if self._event_cluster_index is None:
+            self._event_cluster_index = EventClusterIndex(self._event_times)
+        clusters = self._event_cluster_index.clusters(
             anchor_ax.get_xlim(),
             ax_width_px,
             min_gap_px=max(self._event_label_gap_px, 1),
@@ -6,9 +6,11 @@ from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
 import pyqtgraph as pg
 from PyQt6.QtGui import QColor, QFont, QFontMetricsF
 
+from vasoanalyzer.core.events.cluster import cluster_breaks
 from vasoanalyzer.ui.event_labels_v3 import EventEntryV3, LayoutOptionsV3
 from vasoanalyzer.ui.theme import CURRENT_THEME
 
@@ -128,26 +130,12 @@ class PyQtGraphEventLabeler:
         # Sort events by time
         sorted_events = sorted(events, key=lambda e: e.t)
 
-        # Cluster events within min_px distance
-        clusters: list[list[EventEntryV3]] = []
-        current_cluster: list[EventEntryV3] = [sorted_events[0]]
-
-        for event in sorted_events[1:]:
-            # Calculate pixel distance from last event in current cluster
-            last_event = current_cluster[-1]
-            px_distance = abs(event.t - last_event.t) * px_per_unit
-
-            if px_distance < min_px:
-                # Add to current cluster
-                current_cluster.append(event)
-            else:
-                # Start new cluster
-                clusters.append(current_cluster)
-                current_cluster = [event]
-
-        # Don't forget the last cluster
-        if current_cluster:
-            clusters.append(current_cluster)
+        # Split wherever neighbours are at least min_px apart on screen
+        px_gaps = np.diff(np.array([e.t for e in sorted_events], dtype=float)) * px_per_unit
+        breaks = cluster_breaks(px_gaps, min_px, join_equal=False).tolist()
+        starts = [0, *breaks]
+        stops = [*breaks, len(sorted_events)]
+        clusters = [sorted_events[a:b] for a, b in zip(starts, stops, strict=True)]
 
         return clusters
 
@@ -11,20 +11,31 @@ import logging
 import math
 import os
 from collections.abc import Iterable, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from vasoanalyzer.core.timebase import page_for_time
+import numpy as np
+
+from vasoanalyzer.core.timebase import PageTimeIndex
 
 log = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
 class PageTimeMap:
-    """Validated page time mapping with status messaging."""
+    """Validated page time mapping with status messaging.
+
+    Valid maps carry a :class:`PageTimeIndex` built once at construction, so
+    per-frame ``page_for_time`` calls are binary searches.
+    """
 
     page_times: tuple[float, ...]
     valid: bool
     status: str
+    index: PageTimeIndex | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.valid:
+            object.__setattr__(self, "index", PageTimeIndex(self.page_times))
 
     @classmethod
     def invalid(cls, reason: str) -> PageTimeMap:
@@ -32,16 +43,18 @@ class PageTimeMap:
 
     @classmethod
     def from_times(cls, times: Iterable[float]) -> PageTimeMap:
-        page_times = tuple(float(v) for v in times)
-        if not page_times:
+        values = np.array(times, dtype=float).ravel()
+        if not values.size:
             return cls.invalid("Sync unavailable: no mapped pages")
-        for idx, value in enumerate(page_times):
-            if not math.isfinite(value):
+        non_finite = np.flatnonzero(~np.isfinite(values))
+        backwards = np.flatnonzero(values[1:] < values[:-1]) + 1
+        if non_finite.size or backwards.size:
+            if not backwards.size or (non_finite.size and non_finite[0] <= backwards[0]):
                 return cls.invalid("Sync unavailable: non-finite times")
-            if idx > 0 and value < page_times[idx - 1]:
-                return cls.invalid("Sync unavailable: non-monotonic times")
-            if idx > 0 and value == page_times[idx - 1]:
-                log.warning("TIFF page times are not strictly increasing.")
+            return cls.invalid("Sync unavailable: non-monotonic times")
+        if np.any(values[1:] == values[:-1]):
+            log.warning("TIFF page times are not strictly increasing.")
+        page_times = tuple(values.tolist())
         return cls(page_times, True, f"Sync available ({len(page_times)} pages mapped)")
 
     @property
@@ -63,9 +76,16 @@ class PageTimeMap:
         return value
 
     def page_for_time(self, t_seconds: float) -> int | None:
-        if not self.valid:
+        if self.index is None:
             return None
-        return page_for_time(t_seconds, self.page_times, mode="nearest")
+        return self.index.page_for_time(t_seconds, mode="nearest")
+
+    def pages_for_times(self, times: Sequence[float] | np.ndarray) -> np.ndarray:
+        """Nearest page for each time; ``-1`` where no page can be mapped."""
+
+        if self.index is None:
+            return np.full(np.shape(times), -1, dtype=np.int64)
+        return self.index.pages_for_times(times, mode="nearest")
 
 
 def _normalize_column_name(name: str) -> str:
@@ -194,13 +214,9 @@ def derive_page_time_map_from_trace(
             log.warning("Missing TIFF pages in trace mapping: %s", missing_pages)
         return PageTimeMap.invalid("Sync unavailable: TiffPage coverage mismatch (expected 0..N-1)")
 
-    for idx in range(1, len(times)):
-        if not math.isfinite(times[idx]):
-            return PageTimeMap.invalid("Sync unavailable: non-finite times")
-        if times[idx] < times[idx - 1]:
-            return PageTimeMap.invalid("Sync unavailable: non-monotonic times")
-        if times[idx] == times[idx - 1]:
-            log.warning("TIFF page times are not strictly increasing.")
+    page_time_map = PageTimeMap.from_times(times)
+    if not page_time_map.valid:
+        return page_time_map
 
     if _sync_debug_enabled():
         log.info(
@@ -211,7 +227,7 @@ def derive_page_time_map_from_trace(
             times[-1],
         )
 
-    return PageTimeMap.from_times(times)
+    return page_time_map
 
 
 __all__ = ["PageTimeMap", "derive_page_time_map_from_trace"]
@@ -10,6 +10,8 @@ from __future__ import annotations
 from collections.abc import Sequence
 from typing import Any, Protocol, runtime_checkable
 
+from vasoanalyzer.io.tiffs import TiffPageSource
+
 
 @runtime_checkable
 class StackSource(Protocol):
@@ -49,4 +51,4 @@ class InMemoryStackSource:
         return self._source_kind
 
 
-__all__ = ["InMemoryStackSource", "StackSource"]
+__all__ = ["InMemoryStackSource", "StackSource", "TiffPageSource"]
@@ -0,0 +1,142 @@
+import dataclasses
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vasoanalyzer.analysis.contract import AnalysisParamsV1, StepWindows
+from vasoanalyzer.services import batch_analysis_service
+from vasoanalyzer.services.batch_analysis_service import RESULT_KIND, run_batch_analysis
+from vasoanalyzer.storage import validation
+from vasoanalyzer.storage.repair import soft_delete_events
+from vasoanalyzer.storage.sqlite_store import add_dataset, create_project, get_results
+
+
+def _trace(offset: float = 0.0) -> pd.DataFrame:
+    t = np.arange(0, 400, dtype=np.float64)
+    pressure = np.where(t < 200, 20.0, 60.0)
+    diameter = np.where(t < 200, 200.0, 180.0) + offset
+    diameter[300:] = 240.0 + offset
+    return pd.DataFrame({"t_seconds": t, "inner_diam": diameter, "p_avg": pressure})
+
+
+def _events() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "t_seconds": [0.0, 200.0, 300.0, 399.0],
+            "label": ["20 mmHg", "60 mmHg", "Passive", "end"],
+        }
+    )
+
+
+@pytest.fixture
+def project(tmp_path: Path):
+    store = create_project(tmp_path / "project.vaso", app_version="test", timezone="UTC")
+    ids = [add_dataset(store, f"vessel {i}", _trace(i), _events()) for i in range(3)]
+    yield store, ids
+    store.close()
+
+
+def test_batch_computes_then_hits_cache(project):
+    store, ids = project
+
+    first = run_batch_analysis(store, max_workers=2)
+    assert first.computed == 3 and first.failed == 0
+    stored = get_results(store, ids[0], kind=RESULT_KIND)
+    result = stored[0]["payload"]["result"]
+    assert [step["target_mmhg"] for step in result["step_results"]] == [20.0, 60.0]
+    assert result["passive_diameter_um"] == pytest.approx([240.0, 240.0])
+
+    second = run_batch_analysis(store, max_workers=2)
+    assert second.cached == 3 and second.computed == 0
+    assert len(get_results(store, ids[0], kind=RESULT_KIND)) == 1
+
+
+def test_only_changed_inputs_are_recomputed(project):
+    store, ids = project
+    run_batch_analysis(store, max_workers=1)
+
+    event_id = store.conn.execute(
+        "SELECT id FROM event WHERE dataset_id = ? AND label = 'end'", (ids[1],)
+    ).fetchone()[0]
+    soft_delete_events(store.conn, ids[1], [event_id])
+    validation.update_dataset_signatures(store.conn, ids[1])
+
+    report = run_batch_analysis(store, max_workers=1)
+    assert {item.dataset_id: item.status for item in report.items} == {
+        ids[0]: "cached",
+        ids[1]: "computed",
+        ids[2]: "cached",
+    }
+
+    changed = AnalysisParamsV1(step_windows=StepWindows(steady_state_window_s=20.0))
+    assert run_batch_analysis(store, changed, max_workers=1).computed == 3
+
+
+def test_event_edit_misses_the_cache_without_revalidation(project):
+    store, ids = project
+    run_batch_analysis(store, max_workers=1)
+
+    # Edit an event the way the event table does, without refreshing signatures.
+    store.conn.execute(
+        "UPDATE event SET t_seconds = 210.0, t_us = 210000000 "
+        "WHERE dataset_id = ? AND label = '60 mmHg'",
+        (ids[2],),
+    )
+    store.conn.commit()
+
+    report = run_batch_analysis(store, max_workers=1)
+    assert {item.dataset_id: item.status for item in report.items} == {
+        ids[0]: "cached",
+        ids[1]: "cached",
+        ids[2]: "computed",
+    }
+
+
+def test_analysis_errors_are_reported_per_dataset(tmp_path: Path):
+    store = create_project(tmp_path / "project.vaso", app_version="test", timezone="UTC")
+    try:
+        events = pd.DataFrame({"t_seconds": [0.0, 200.0], "label": ["20 mmHg", "60 mmHg"]})
+        ds_id = add_dataset(store, "no passive", _trace(), events)
+        report = run_batch_analysis(store, max_workers=1)
+    finally:
+        store.close()
+    assert report.items[0].dataset_id == ds_id
+    assert report.items[0].status == "failed"
+    assert "passive" in report.items[0].error.lower()
+
+
+def test_unexpected_errors_fail_only_their_dataset(project, monkeypatch):
+    store, ids = project
+    real = batch_analysis_service.analyze_pressure_myography_v1
+
+    def _flaky(dataset, params):
+        if dataset.dataset_id == str(ids[1]):
+            raise IndexError("malformed trace")
+        return real(dataset, params)
+
+    monkeypatch.setattr(batch_analysis_service, "analyze_pressure_myography_v1", _flaky)
+    report = run_batch_analysis(store, max_workers=1)
+
+    status = {item.dataset_id: item for item in report.items}
+    assert status[ids[0]].status == status[ids[2]].status == "computed"
+    assert status[ids[1]].status == "failed"
+    assert status[ids[1]].error == "IndexError: malformed trace"
+
+
+def test_non_finite_values_are_stored_as_null(project, monkeypatch):
+    store, ids = project
+    real = batch_analysis_service.analyze_pressure_myography_v1
+
+    def _with_nan(dataset, params):
+        result = real(dataset, params)
+        first = dataclasses.replace(result.step_results[0], mean_diameter_inner_um=float("nan"))
+        return dataclasses.replace(result, step_results=(first, *result.step_results[1:]))
+
+    monkeypatch.setattr(batch_analysis_service, "analyze_pressure_myography_v1", _with_nan)
+    assert run_batch_analysis(store, max_workers=1).computed == 3
+
+    result = get_results(store, ids[0], kind=RESULT_KIND)[0]["payload"]["result"]
+    assert result["step_results"][0]["mean_diameter_inner_um"] is None
+    assert run_batch_analysis(store, max_workers=1).cached == 3
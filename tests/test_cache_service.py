@@ -0,0 +1,158 @@
+import mmap
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from vasoanalyzer.services.cache_service import DataCache
+
+
+def _write_csv(path: Path, values: list[float]) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame({"Time (s)": np.arange(len(values), dtype=float), "Inner": values}).to_csv(
+        path, index=False
+    )
+    return path
+
+
+def _counting_loader(calls: list[Path]):
+    def _load(path: Path) -> pd.DataFrame:
+        calls.append(path)
+        return pd.read_csv(path)
+
+    return _load
+
+
+def _is_memory_mapped(values: np.ndarray) -> bool:
+    base = values
+    while base is not None:
+        if isinstance(base, (np.memmap, mmap.mmap)):
+            return True
+        base = getattr(base, "base", None)
+    return False
+
+
+def test_same_stem_in_different_folders_does_not_collide(tmp_path: Path):
+    cache = DataCache(tmp_path / "cache")
+    first = _write_csv(tmp_path / "a" / "trace.csv", [1.0, 2.0, 3.0])
+    second = _write_csv(tmp_path / "b" / "trace.csv", [7.0, 8.0, 9.0])
+    calls: list[Path] = []
+
+    df_first = cache.read_dataframe(first, _counting_loader(calls))
+    df_second = cache.read_dataframe(second, _counting_loader(calls))
+    assert list(df_first["Inner"]) == [1.0, 2.0, 3.0]
+    assert list(df_second["Inner"]) == [7.0, 8.0, 9.0]
+
+    again = cache.read_dataframe(first, _counting_loader(calls))
+    assert list(again["Inner"]) == [1.0, 2.0, 3.0]
+    assert len(calls) == 2
+    assert cache.stats()["hits"] == 1
+
+
+def test_identical_content_in_new_folder_is_a_hit(tmp_path: Path):
+    cache = DataCache(tmp_path / "cache")
+    first = _write_csv(tmp_path / "day1" / "trace.csv", [4.0, 5.0])
+    copy = tmp_path / "day2" / "renamed.csv"
+    copy.parent.mkdir()
+    copy.write_bytes(first.read_bytes())
+    calls: list[Path] = []
+
+    cache.read_dataframe(first, _counting_loader(calls))
+    df = cache.read_dataframe(copy, _counting_loader(calls))
+    assert len(calls) == 1
+    assert list(df["Inner"]) == [4.0, 5.0]
+    assert cache.stats()["entries"] == 1
+
+
+def test_cached_frame_is_memory_mapped_and_writable(tmp_path: Path):
+    cache = DataCache(tmp_path / "cache")
+    src = _write_csv(tmp_path / "trace.csv", [1.0, 2.0])
+    cache.read_dataframe(src, pd.read_csv)
+
+    df = cache.read_dataframe(src, pd.read_csv)
+    assert _is_memory_mapped(df["Inner"].to_numpy())
+    df.loc[0, "Inner"] = 42.0
+    reread = cache.read_dataframe(src, pd.read_csv)
+    assert reread.loc[0, "Inner"] == 1.0
+
+
+def test_non_default_index_and_labels_round_trip(tmp_path: Path):
+    cache = DataCache(tmp_path / "cache")
+    src = tmp_path / "events.csv"
+    src.write_text("x")
+
+    def _loader(_path: Path) -> pd.DataFrame:
+        frame = pd.DataFrame({0: ["start", "stop", "start"], 1: [0.5, 1.5, 2.5]})
+        frame.index = pd.Index(["a", "b", "c"], name="key")
+        return frame
+
+    cache.read_dataframe(src, _loader)
+    df = cache.read_dataframe(src, _loader)
+    assert list(df.columns) == [0, 1]
+    assert list(df.index) == ["a", "b", "c"]
+    assert df.index.name == "key"
+    assert list(df[0].astype(str)) == ["start", "stop", "start"]
+
+
+def test_budget_evicts_least_recently_accessed(tmp_path: Path):
+    cache = DataCache(tmp_path / "cache")
+    old = _write_csv(tmp_path / "old.csv", list(np.arange(2000, dtype=float)))
+    recent = _write_csv(tmp_path / "recent.csv", list(np.arange(2000, dtype=float) + 1))
+    cache.read_dataframe(old, pd.read_csv)
+    cache.read_dataframe(recent, pd.read_csv)
+    cache.read_dataframe(recent, pd.read_csv)
+
+    entry_bytes = cache.stats()["bytes"] // 2
+    cache.limit_gb = (entry_bytes * 2.5) / 1024**3
+    newest = _write_csv(tmp_path / "newest.csv", list(np.arange(2000, dtype=float) + 2))
+    cache.read_dataframe(newest, pd.read_csv)
+    assert cache.stats()["entries"] == 2
+
+    calls: list[Path] = []
+    cache.read_dataframe(recent, _counting_loader(calls))
+    cache.read_dataframe(newest, _counting_loader(calls))
+    assert calls == []
+    cache.read_dataframe(old, _counting_loader(calls))
+    assert len(calls) == 1
+
+
+def test_miss_without_same_sized_source_skips_hashing(tmp_path: Path, monkeypatch):
+    from vasoanalyzer.services import cache_service
+
+    hashed: list[Path] = []
+    real_content_key = cache_service._content_key
+
+    def _tracking_content_key(path: Path, version: int) -> str:
+        hashed.append(path)
+        return real_content_key(path, version)
+
+    monkeypatch.setattr(cache_service, "_content_key", _tracking_content_key)
+    cache = DataCache(tmp_path / "cache")
+    first = _write_csv(tmp_path / "a" / "trace.csv", [1.0, 2.0, 3.0])
+    cache.read_dataframe(first, pd.read_csv)
+    assert hashed == []
+
+    copy = tmp_path / "b" / "trace.csv"
+    copy.parent.mkdir()
+    copy.write_bytes(first.read_bytes())
+    calls: list[Path] = []
+    df = cache.read_dataframe(copy, _counting_loader(calls))
+    assert calls == []
+    assert list(df["Inner"]) == [1.0, 2.0, 3.0]
+    assert cache.stats()["entries"] == 1
+    assert list(cache.read_dataframe(first, pd.read_csv)["Inner"]) == [1.0, 2.0, 3.0]
+
+
+def test_storing_an_existing_payload_keeps_it_readable(tmp_path: Path):
+    cache = DataCache(tmp_path / "cache")
+    frame = pd.DataFrame({"Time (s)": [0.0, 1.0], "Inner": [5.0, 6.0]})
+    with cache._connect() as conn:
+        cache._store_entry(conn, "ab" * 20, frame)
+        payload = cache._payload_path("ab" * 20)
+        held = cache._load_entry(conn, "ab" * 20, memory_map=True)
+        cache._store_entry(conn, "ab" * 20, frame)
+        again = cache._load_entry(conn, "ab" * 20, memory_map=True)
+
+    assert list(held["Inner"]) == [5.0, 6.0]
+    assert list(again["Inner"]) == [5.0, 6.0]
+    assert sorted(p.name for p in payload.parent.iterdir()) == [payload.name]
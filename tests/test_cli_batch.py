@@ -0,0 +1,139 @@
+import json
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from vasoanalyzer.cli import main
+
+
+def _write_vessel(folder: Path) -> None:
+    folder.mkdir(parents=True)
+    t = np.arange(0, 400, dtype=np.float64)
+    diameter = np.where(t < 200, 200.0, 180.0)
+    diameter[300:] = 240.0
+    pd.DataFrame(
+        {
+            "Time (s)": t,
+            "Inner Diameter": diameter,
+            "Avg Pressure (mmHg)": np.where(t < 200, 20.0, 60.0),
+        }
+    ).to_csv(folder / "exp1.csv", index=False)
+    pd.DataFrame(
+        {"Event": ["20 mmHg", "60 mmHg", "Passive"], "Time (s)": [0.0, 200.0, 300.0]}
+    ).to_csv(folder / "exp1_table.csv", index=False)
+
+
+def _run(capsys, *argv: str) -> tuple[int, list[dict]]:
+    code = main(list(argv))
+    lines = capsys.readouterr().out.splitlines()
+    return code, [json.loads(line) for line in lines]
+
+
+def test_import_analyze_export_round_trip(tmp_path: Path, capsys):
+    _write_vessel(tmp_path / "data" / "vessel 1")
+    _write_vessel(tmp_path / "data" / "vessel 2")
+    project = str(tmp_path / "batch.vaso")
+
+    code, records = _run(capsys, "import-folder", project, str(tmp_path / "data"), "-j", "1")
+    assert code == 0
+    assert records[-1] == {
+        "event": "summary",
+        "command": "import-folder",
+        "imported": 2,
+        "failed": 0,
+        "project": project,
+    }
+
+    # Traces that are already in the project are not imported twice.
+    _code, records = _run(capsys, "import-folder", project, str(tmp_path / "data"))
+    assert records[-1]["imported"] == 0
+
+    code, records = _run(capsys, "analyze", project, "--jobs", "1")
+    assert code == 0 and records[-1]["computed"] == 2
+    _code, records = _run(capsys, "analyze", project, "--jobs", "1")
+    assert records[-1]["cached"] == 2
+
+    out_dir = tmp_path / "events"
+    code, records = _run(capsys, "export-events", project, "--out", str(out_dir), "--dataset", "2")
+    assert code == 0
+    exported = pd.read_csv(records[0]["path"])
+    assert exported["Event Label"].tolist() == ["20 mmHg", "60 mmHg", "Passive"]
+    assert exported["Value"].tolist() == [200.0, 180.0, 240.0]
+
+    code, records = _run(capsys, "export-events", project, "--out", str(out_dir), "-j", "2")
+    assert code == 0
+    assert [r["dataset_id"] for r in records if r["event"] == "progress"] == [1, 2]
+    assert pd.read_csv(records[1]["path"]).equals(exported)
+
+
+def test_validate_reports_signature_drift(tmp_path: Path, capsys):
+    _write_vessel(tmp_path / "data" / "vessel")
+    project = tmp_path / "batch.vaso"
+    _run(capsys, "import-folder", str(project), str(tmp_path / "data"))
+
+    code, records = _run(capsys, "validate", str(project), "-j", "2")
+    assert code == 0
+    assert records == [
+        {
+            "event": "summary",
+            "command": "validate",
+            "datasets": 1,
+            "drifted": 0,
+            "failed": 0,
+            "project": str(project),
+        }
+    ]
+
+    with sqlite3.connect(project) as conn:
+        conn.execute("UPDATE event SET label = 'edited' WHERE label = 'Passive'")
+
+    code, records = _run(capsys, "validate", str(project))
+    assert code == 1
+    drift = [r for r in records if r["event"] == "drift"]
+    assert len(drift) == 1
+    assert list(drift[0]["signatures"]) == ["events_signature"]
+    changed = drift[0]["signatures"]["events_signature"]
+    assert changed["stored"] != changed["computed"]
+    assert records[-1]["drifted"] == 1
+
+    # Reporting does not overwrite the stored signatures.
+    code, records = _run(capsys, "validate", str(project))
+    assert code == 1 and records[-1]["drifted"] == 1
+
+
+def test_export_excel_fills_one_replicate_per_dataset(tmp_path: Path, capsys):
+    _write_vessel(tmp_path / "data" / "vessel 1")
+    _write_vessel(tmp_path / "data" / "vessel 2")
+    project = str(tmp_path / "batch.vaso")
+    _run(capsys, "import-folder", project, str(tmp_path / "data"), "-j", "1")
+
+    out = tmp_path / "filled.xlsx"
+    code, records = _run(capsys, "export-excel", project, "--out", str(out), "-j", "2")
+    assert code == 0
+    progress = [r for r in records if r["event"] == "progress"]
+    assert [r["replicate"] for r in progress] == ["Replicate_1", "Replicate_2"]
+    assert records[-1]["cells"] == sum(r["cells"] for r in progress)
+    assert out.is_file()
+
+
+def test_render_report_writes_pages(tmp_path: Path, capsys):
+    _write_vessel(tmp_path / "data" / "vessel 1")
+    _write_vessel(tmp_path / "data" / "vessel 2")
+    project = str(tmp_path / "batch.vaso")
+    _run(capsys, "import-folder", project, str(tmp_path / "data"), "-j", "1")
+
+    out_dir = tmp_path / "reports"
+    code, records = _run(
+        capsys, "render-report", project, "--out", str(out_dir), "--format", "png", "--dpi", "30"
+    )
+    assert code == 0
+    assert records[-1]["rendered"] == 2
+    assert all(Path(r["path"]).is_file() for r in records[:-1])
+
+    code, records = _run(
+        capsys, "render-report", project, "--out", str(out_dir), "--multipage", "--dpi", "30"
+    )
+    assert code == 0
+    assert {r["path"] for r in records[:-1]} == {str(out_dir / "report.pdf")}
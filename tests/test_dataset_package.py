@@ -1,11 +1,14 @@
+import json
 import zipfile
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from vasoanalyzer.core.project import Experiment, Project, SampleN, save_project, load_project
 from vasoanalyzer.storage import sqlite_store
+from vasoanalyzer.storage.sqlite import traces as _traces
 from vasoanalyzer.storage.dataset_package import (
     DatasetPackageValidationError,
     export_dataset_package,
@@ -112,11 +115,94 @@ def test_dataset_name_collision_suffix(tmp_path: Path):
     assert names[second_import_id] == "SampleA (Copy)"
 
 
+def _dataset_frames(path: Path, dataset_id: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+    store = sqlite_store.open_project(path)
+    try:
+        return sqlite_store.get_trace(store, dataset_id), sqlite_store.get_events(store, dataset_id)
+    finally:
+        store.close()
+
+
+@pytest.mark.parametrize(
+    ("payload", "compression", "fmt"),
+    [
+        ("columnar", "zstd", "vasods-v2"),
+        ("columnar", "none", "vasods-v2"),
+        ("csv", "zstd", "vasods-v1"),
+    ],
+)
+def test_dataset_payload_round_trip(tmp_path: Path, payload, compression, fmt):
+    src_project = _make_project(tmp_path, "ProjectPayload")
+    dataset_id = _first_dataset_id(src_project)
+    package_path = tmp_path / "payload.vasods"
+    export_dataset_package(
+        src_project, dataset_id, package_path, payload=payload, compression=compression
+    )
+
+    with zipfile.ZipFile(package_path, "r") as zf:
+        manifest = json.loads(zf.read("manifest.json"))
+        names = set(zf.namelist())
+    assert manifest["format"] == fmt
+    assert ("data/trace.csv" in names) == (payload == "csv")
+
+    dest_project = _make_empty_project(
+        tmp_path, "ProjectPayloadDest", experiments=[Experiment(name="ExpB", samples=[])]
+    )
+    new_dataset_id = import_dataset_package(
+        dest_project, package_path, target_experiment_name="ExpB"
+    )
+
+    src_trace, src_events = _dataset_frames(src_project, dataset_id)
+    dest_trace, dest_events = _dataset_frames(dest_project, new_dataset_id)
+    pd.testing.assert_frame_equal(dest_trace, src_trace)
+    assert dest_events["label"].tolist() == src_events["label"].tolist()
+    assert dest_events["t_seconds"].tolist() == src_events["t_seconds"].tolist()
+
+
+def test_trace_columns_match_row_normalisation():
+    columns = {
+        "t_seconds": np.array([0.0, 0.5, np.nan, 1.5]),
+        "inner_diam": np.array([10.0, -1.0, 11.0, np.nan]),
+        "p2": [None, 60.0, 60.0, "x"],
+        "frame_number": np.array([0, 1, 2, 3], dtype="<i8"),
+    }
+
+    rows = _traces.prepare_trace_columns(7, columns)
+    expected = list(_traces.prepare_trace_rows(7, pd.DataFrame(columns)))
+
+    assert len(rows) == len(expected) == 3
+    for row, expected_row in zip(rows, expected, strict=True):
+        assert [None if v != v else v for v in row] == list(expected_row)
+
+
+def test_columnar_import_skips_dataframe_rows(tmp_path: Path, monkeypatch):
+    src_project = _make_project(tmp_path, "ProjectBulk")
+    dataset_id = _first_dataset_id(src_project)
+    package_path = tmp_path / "bulk.vasods"
+    export_dataset_package(src_project, dataset_id, package_path, compression="none")
+    dest_project = _make_empty_project(
+        tmp_path, "ProjectBulkDest", experiments=[Experiment(name="ExpB", samples=[])]
+    )
+
+    def _unexpected(*_args, **_kwargs):
+        raise AssertionError("columnar import went through prepare_trace_rows")
+
+    monkeypatch.setattr(_traces, "prepare_trace_rows", _unexpected)
+    new_dataset_id = import_dataset_package(
+        dest_project, package_path, target_experiment_name="ExpB"
+    )
+    monkeypatch.undo()
+
+    src_trace, _ = _dataset_frames(src_project, dataset_id)
+    dest_trace, _ = _dataset_frames(dest_project, new_dataset_id)
+    pd.testing.assert_frame_equal(dest_trace, src_trace)
+
+
 def test_package_checksum_validation(tmp_path: Path):
     project_path = _make_project(tmp_path, "ProjectTamper")
     dataset_id = _first_dataset_id(project_path)
     package_path = tmp_path / "tamper.vasods"
-    export_dataset_package(project_path, dataset_id, package_path)
+    export_dataset_package(project_path, dataset_id, package_path, payload="csv")
 
     # Tamper with trace.csv without updating manifest by rewriting the archive
     with zipfile.ZipFile(package_path, "r") as zf:
@@ -169,7 +255,7 @@ def test_best_effort_import(tmp_path: Path):
     bad_ds, bad_pkg = packages[1]
     with zipfile.ZipFile(bad_pkg, "r") as zf:
         entries = {name: zf.read(name) for name in zf.namelist()}
-    entries["data/trace.csv"] = b"t_seconds,inner_diam\n0.0,99.0\n"
+    entries["data/trace/001.col"] = b"\x00" * 16
     rebuilt = bad_pkg.with_suffix(".tmp")
     with zipfile.ZipFile(rebuilt, "w", compression=zipfile.ZIP_DEFLATED) as zf:
         for name, data in entries.items():
@@ -0,0 +1,61 @@
+import math
+
+import numpy as np
+
+from vasoanalyzer.core.events import EventClusterIndex, cluster_events
+
+
+def _reference_clusters(times, xlim, width, min_gap_px, max_visible):
+    xmin, xmax = xlim
+    scale = width / (xmax - xmin)
+    visible = sorted(
+        float(t) for t in times if t is not None and math.isfinite(t) and xmin <= t <= xmax
+    )
+    groups: list[list[float]] = []
+    for t in visible:
+        if groups and (t - xmin) * scale - (groups[-1][-1] - xmin) * scale <= min_gap_px:
+            groups[-1].append(t)
+        else:
+            groups.append([t])
+    return [
+        (
+            0.5 * ((g[0] - xmin) * scale + (g[-1] - xmin) * scale),
+            tuple(g[:max_visible]),
+            max(0, len(g) - max_visible),
+        )
+        for g in groups
+    ]
+
+
+def test_cluster_events_matches_sequential_grouping():
+    rng = np.random.default_rng(11)
+    for _ in range(200):
+        times = list(np.round(rng.uniform(0.0, 100.0, rng.integers(1, 200)), 1))
+        times[0] = None
+        times.append(float("nan"))
+        x0 = float(rng.uniform(-10.0, 80.0))
+        xlim = (x0, x0 + float(rng.uniform(1.0, 60.0)))
+        width = int(rng.integers(50, 1500))
+        gap = int(rng.integers(1, 20))
+        visible = int(rng.integers(0, 4))
+
+        got = cluster_events(times, xlim, width, min_gap_px=gap, max_visible_per_cluster=visible)
+        assert [(c.x_px, c.times, c.hidden) for c in got] == _reference_clusters(
+            times, xlim, width, gap, visible
+        )
+
+
+def test_index_pans_without_changing_clusters():
+    rng = np.random.default_rng(5)
+    times = rng.uniform(0.0, 3600.0, 5000)
+    index = EventClusterIndex(times)
+    assert len(index) == 5000
+
+    for start in np.linspace(0.0, 3000.0, 40):
+        xlim = (float(start), float(start) + 300.0)
+        got = index.clusters(xlim, 1200, min_gap_px=12, max_visible_per_cluster=2)
+        want = cluster_events(times, xlim, 1200, min_gap_px=12, max_visible_per_cluster=2)
+        assert [(c.times, c.hidden) for c in got] == [(c.times, c.hidden) for c in want]
+
+    assert index.clusters((10.0, 10.0), 1200) == []
+    assert EventClusterIndex([]).clusters((0.0, 1.0), 1200) == []
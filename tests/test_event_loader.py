@@ -0,0 +1,46 @@
+from pathlib import Path
+
+import pytest
+
+from vasoanalyzer.io import events as events_io
+from vasoanalyzer.io.events import load_events, read_events_dataframe
+from vasoanalyzer.services.cache_service import DataCache
+
+
+def test_ragged_rows_keep_times_and_labels(tmp_path: Path):
+    path = tmp_path / "events.csv"
+    path.write_text("Label,Time\nstart,1.5,12\nstop,3.0,40\n")
+
+    labels, times, frames = load_events(path)
+
+    assert labels == ["start", "stop"]
+    assert times == pytest.approx([1.5, 3.0])
+    assert frames is None
+
+
+def test_numeric_first_row_is_treated_as_data(tmp_path: Path):
+    path = tmp_path / "events.txt"
+    path.write_text("1.0\tbaseline\n2.5\tdrug\n")
+
+    df = read_events_dataframe(path)
+
+    assert list(df.columns) == ["col0", "col1"]
+    assert len(df) == 2
+    labels, times, _frames = load_events(path)
+    assert labels == ["baseline", "drug"]
+    assert times == pytest.approx([1.0, 2.5])
+
+
+def test_cache_hit_does_not_reopen_source(tmp_path: Path, monkeypatch):
+    path = tmp_path / "events.csv"
+    path.write_text("﻿Event,Time (s),Frame\nA,0.5,3\nB,1.0,6\n")
+    cache = DataCache(tmp_path / "cache")
+    first = load_events(path, cache=cache)
+
+    def _fail(_path):
+        raise AssertionError("source re-read on cache hit")
+
+    monkeypatch.setattr(events_io, "_read_event_text", _fail)
+    assert load_events(path, cache=cache) == first
+    assert first[0] == ["A", "B"]
+    assert first[2] == [3, 6]
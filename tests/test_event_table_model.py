@@ -0,0 +1,77 @@
+import numpy as np
+from PyQt6.QtCore import Qt
+
+from vasoanalyzer.ui.event_table import EventTableModel
+
+DISPLAY = Qt.ItemDataRole.DisplayRole
+
+
+def _rows(n: int) -> list[tuple]:
+    return [(f"E{i}", float(i), 100.0 + i, None, 60.0, None, i * 10) for i in range(n)]
+
+
+def _model(qt_app, rows) -> EventTableModel:
+    model = EventTableModel()
+    model.set_events(rows, has_outer_diameter=True, has_avg_pressure=True)
+    return model
+
+
+def test_rows_round_trip_and_legacy_short_rows(qt_app):
+    rows = _rows(3)
+    model = _model(qt_app, rows + [("legacy", 4.0, 90.0, 7)])
+    assert model.rows()[:3] == rows
+    assert model.rows()[3] == ("legacy", 4.0, 90.0, None, None, None, 7)
+    assert model.data(model.index(3, 4), DISPLAY) == "—"
+    assert model.data(model.index(1, 5), DISPLAY) == "60.00"
+
+
+def test_edit_invalidates_only_the_edited_cell(qt_app):
+    model = _model(qt_app, _rows(3))
+    assert model.data(model.index(1, 3), DISPLAY) == "101.00"
+    assert model.setData(model.index(1, 3), "55.5")
+    assert model.data(model.index(1, 3), DISPLAY) == "55.50"
+    assert model.rows()[1][2] == 55.5
+    assert model.setData(model.index(1, 1), "renamed")
+    assert model.data(model.index(1, 1), DISPLAY) == "renamed"
+    assert model.data(model.index(1, 3), DISPLAY) == "55.50"
+
+
+def test_to_dataframe_shares_arrays_until_the_next_edit(qt_app):
+    model = _model(qt_app, _rows(4))
+    df = model.to_dataframe()
+    assert list(df.columns) == ["Event", "Time (s)", "ID (µm)", "OD (µm)", "Avg P (mmHg)"]
+    assert np.shares_memory(df["ID (µm)"].to_numpy(), model._values["id"])
+
+    model.setData(model.index(0, 3), "1.0")
+    assert df["ID (µm)"].iloc[0] == 100.0
+    assert model.to_dataframe()["ID (µm)"].iloc[0] == 1.0
+
+    df = model.to_dataframe()
+    model.setData(model.index(0, 1), "zzz")
+    assert df["Event"].iloc[0] == "E0"
+    assert model.to_dataframe()["Event"].iloc[0] == "zzz"
+
+    df = model.to_dataframe()
+    model.update_row(1, ("renamed", 2.0, 3.0, None, None, None, 0))
+    assert df["Event"].iloc[1] == "E1"
+    assert model.to_dataframe()["Event"].iloc[1] == "renamed"
+
+
+def test_batch_insert_and_remove_emit_one_signal_per_run(qt_app):
+    model = _model(qt_app, _rows(6))
+    model.set_review_states(["CONFIRMED"] * 6)
+    inserted: list[tuple[int, int]] = []
+    removed: list[tuple[int, int]] = []
+    model.rowsInserted.connect(lambda _parent, first, last: inserted.append((first, last)))
+    model.rowsRemoved.connect(lambda _parent, first, last: removed.append((first, last)))
+
+    model.insert_rows(2, [("new A", 1.5, 1.0, None, None, None, 0)] * 2)
+    assert inserted == [(2, 3)]
+    assert [row[0] for row in model.rows()][:5] == ["E0", "E1", "new A", "new A", "E2"]
+    assert model.review_states()[2:4] == ["UNREVIEWED", "UNREVIEWED"]
+
+    gone = model.remove_rows([7, 2, 3, 0])
+    assert removed == [(7, 7), (2, 3), (0, 0)]
+    assert [row[0] for row in gone] == ["E0", "new A", "new A", "E5"]
+    assert [row[0] for row in model.rows()] == ["E1", "E2", "E3", "E4"]
+    assert model.data(model.index(0, 1), DISPLAY) == "E1"
@@ -0,0 +1,69 @@
+from vasoanalyzer.ui.event_table import EventTableModel
+from vasoanalyzer.ui.managers.event_manager import EventManager
+
+
+def _row(label: str, t: float) -> tuple:
+    return (label, t, 100.0, None, None, None, int(t))
+
+
+class _Host:
+    """Just enough of the main window for the undo insert path."""
+
+    def __init__(self, rows):
+        self.event_table_data = list(rows)
+        self.event_labels = [row[0] for row in rows]
+        self.event_times = [row[1] for row in rows]
+        self.event_frames = [row[-1] for row in rows]
+        self.event_label_meta = [{"review_state": "CONFIRMED"} for _ in rows]
+        self.event_table_controller = EventTableModel()
+        self.event_table_controller.set_events(rows, has_outer_diameter=False)
+        self._event_table_updating = False
+        self.rebuilds = 0
+        manager = EventManager(self)
+        for name in (
+            "_insert_event_meta",
+            "_ensure_event_meta_length",
+            "_normalize_event_label_meta",
+            "_current_review_states",
+        ):
+            setattr(self, name, getattr(manager, name))
+        self.manager = manager
+
+    @staticmethod
+    def _with_default_review_state(meta):
+        payload = dict(meta or {})
+        payload.setdefault("review_state", "UNREVIEWED")
+        return payload
+
+    def populate_table(self):
+        self.rebuilds += 1
+
+    def update_plot(self):
+        pass
+
+    def auto_export_table(self):
+        pass
+
+    def mark_session_dirty(self):
+        pass
+
+
+def test_undo_insert_updates_the_model_without_a_rebuild(qt_app):
+    host = _Host([_row(f"E{i}", float(i)) for i in range(4)])
+    model = host.event_table_controller
+    inserted = []
+    model.rowsInserted.connect(lambda _parent, first, last: inserted.append((first, last)))
+
+    host.manager._insert_events_at(
+        [
+            (1, _row("A", 0.5), {"review_state": "REJECTED"}),
+            (2, _row("B", 0.7), None),
+            (6, _row("C", 9.0), None),
+        ]
+    )
+
+    assert host.rebuilds == 0
+    assert inserted == [(1, 2), (6, 6)]
+    assert model.rows() == host.event_table_data
+    assert [row[0] for row in model.rows()] == ["E0", "A", "B", "E1", "E2", "E3", "C"]
+    assert model.review_states()[:3] == ["CONFIRMED", "REJECTED", "UNREVIEWED"]
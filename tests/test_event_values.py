@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from vasoanalyzer.core.events import EventValueEngine, SamplingRule
+
+
+def _steady_state_row(trace_time, times, idx, offset=2.0):
+    """Per-event sampling rule used when an event table is first built."""
+    t = times[idx]
+    if len(times) > 1 and idx < len(times) - 1:
+        next_t = times[idx + 1]
+        gap = max(0.0, float(next_t) - float(t))
+        if gap <= 0.5:
+            t_sample = t + gap * 0.5
+        elif gap <= 1.0:
+            t_sample = t + gap * 0.6
+        else:
+            lookback = min(5.0, max(1.0, gap / 2.0, offset))
+            lookback = min(lookback, gap - 0.05) if gap > 0.05 else gap * 0.5
+            t_sample = next_t - lookback
+    else:
+        t_sample = float(trace_time[-1]) - offset
+    t_sample = max(float(trace_time[0]), min(t_sample, float(trace_time[-1])))
+    return int(np.argmin(np.abs(trace_time - t_sample)))
+
+
+def test_sampling_rules_match_per_event_scans():
+    rng = np.random.default_rng(3)
+    for _ in range(100):
+        trace_time = np.round(np.sort(rng.uniform(0.0, 120.0, rng.integers(2, 2000))), 2)
+        diam = rng.normal(100.0, 5.0, trace_time.size)
+        times = np.round(np.sort(rng.uniform(-5.0, 125.0, rng.integers(1, 30))), 1)
+
+        nearest = EventValueEngine(trace_time, {"ID": diam, "OD": None})
+        assert nearest.columns == ("ID",)
+        want = [int(np.argmin(np.abs(trace_time - t))) for t in times]
+        assert nearest.sample_rows(times).tolist() == want
+        np.testing.assert_array_equal(nearest.evaluate(times)["ID"], diam[want])
+
+        steady = nearest.sample_rows(times, rule=SamplingRule("steady_state"))
+        assert steady.tolist() == [
+            _steady_state_row(trace_time, times, i) for i in range(times.size)
+        ]
+
+
+def test_window_mean_skips_gaps_and_falls_back_to_nearest():
+    trace_time = np.arange(0.0, 10.0, 0.5)
+    diam = np.arange(20.0)
+    diam[3] = np.nan
+    engine = EventValueEngine(
+        trace_time, {"ID": diam}, rule=SamplingRule("window_mean", window_s=1.0)
+    )
+    np.testing.assert_allclose(engine.evaluate([2.0, 1.5, -5.0])["ID"], [3.0, 1.5, 0.0])
+    with pytest.raises(ValueError):
+        SamplingRule("median")
+
+
+@pytest.mark.parametrize("mode", ["nearest", "window_mean", "steady_state"])
+def test_update_recomputes_only_moved_rows(mode):
+    rng = np.random.default_rng(8)
+    trace_time = np.arange(0.0, 600.0, 0.1)
+    columns = {
+        "ID": rng.normal(100.0, 5.0, trace_time.size),
+        "P": rng.normal(60.0, 1.0, trace_time.size),
+    }
+    engine = EventValueEngine(trace_time, columns, rule=SamplingRule(mode))
+    times = np.sort(rng.uniform(0.0, 590.0, 2000))
+
+    assert engine.update(times).size == times.size
+    moved = times.copy()
+    moved[[10, 500]] += 0.7
+    dirty = engine.update(moved)
+    expected = {10, 500} | ({9, 499} if mode == "steady_state" else set())
+    assert set(dirty.tolist()) == expected
+    for name, values in engine.evaluate(moved).items():
+        np.testing.assert_array_equal(engine.values[name], values)
+
+    assert engine.shift(1.5).size == times.size
+    np.testing.assert_array_equal(engine.event_times, moved + 1.5)
+    for name, values in engine.evaluate(moved + 1.5).items():
+        np.testing.assert_array_equal(engine.values[name], values)
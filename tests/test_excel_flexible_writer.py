@@ -0,0 +1,42 @@
+from openpyxl import Workbook, load_workbook
+
+from vasoanalyzer.excel import FlexibleWritePlan, apply_flexible_write_plans
+
+
+def test_apply_flexible_write_plans_fills_columns_in_one_workbook(tmp_path):
+    template = tmp_path / "template.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws["A2"], ws["A3"] = "20 mmHg", "40 mmHg"
+    ws["E2"] = "=AVERAGE(B2:D2)"
+    wb.save(template)
+
+    output = tmp_path / "out" / "filled.xlsx"
+    plans = [
+        FlexibleWritePlan(
+            template_path=str(template),
+            output_path=str(output),
+            sheet_name="Data",
+            writes=[(2, col, 10.0 * col), (3, col, None)],
+        )
+        for col in (2, 3, 4)
+    ]
+    apply_flexible_write_plans(plans)
+
+    ws = load_workbook(output)["Data"]
+    assert [ws.cell(row=2, column=col).value for col in (2, 3, 4)] == [20.0, 30.0, 40.0]
+    assert ws["E2"].value == "=AVERAGE(B2:D2)"
+    assert load_workbook(template)["Data"]["B2"].value is None
+
+
+def test_apply_flexible_write_plans_rejects_mixed_outputs(tmp_path):
+    plans = [
+        FlexibleWritePlan(str(tmp_path / "t.xlsx"), str(tmp_path / name), "Data", [(1, 1, 1.0)])
+        for name in ("a.xlsx", "b.xlsx")
+    ]
+    try:
+        apply_flexible_write_plans(plans)
+        assert False, "Expected mismatched outputs to be rejected."
+    except ValueError as exc:
+        assert "share" in str(exc)
@@ -0,0 +1,57 @@
+import random
+
+from vasoanalyzer.excel.label_matching import (
+    LabelIndex,
+    _token_overlap_score,
+    best_match,
+    normalize_label,
+)
+
+
+def _reference_match(template_label, candidates, threshold=0.5):
+    norm_tpl = normalize_label(template_label)
+    norms = [normalize_label(c) for c in candidates]
+    for c, norm in zip(candidates, norms):
+        if norm == norm_tpl:
+            return c
+    for c, norm in zip(candidates, norms):
+        if norm_tpl in norm or norm in norm_tpl:
+            return c
+    scored = [(_token_overlap_score(norm_tpl, norm), c) for c, norm in zip(candidates, norms)]
+    best = max(scored, key=lambda item: item[0], default=(0.0, None))
+    return best[1] if best[0] > 0 and best[0] >= threshold else None
+
+
+def test_label_index_cascade():
+    index = LabelIndex(["20 mmHg – Max", "1 µM PE", "Passive Ca-free", "ACh 10 uM"])
+    assert index.match("20mmHg: Max") == "20 mmHg – Max"
+    assert index.match("PE") == "1 µM PE"
+    assert index.match("Passive") == "Passive Ca-free"
+    assert index.match("ACh 10 uM response") == "ACh 10 uM"
+    assert index.match("Baseline tone") is None
+
+
+def test_label_index_matches_best_match_on_random_labels():
+    words = ["20", "60", "mmHg", "Max", "µM", "PE", "CCh", "passive", "ca", "free", "-", ":"]
+    rng = random.Random(7)
+
+    def label():
+        return " ".join(rng.choice(words) for _ in range(rng.randint(0, 4)))
+
+    for _ in range(300):
+        candidates = [label() for _ in range(rng.randint(0, 10))]
+        templates = [label() for _ in range(5)]
+        index = LabelIndex(candidates)
+        expected = [_reference_match(t, candidates) for t in templates]
+        assert index.match_all(templates) == expected
+        assert [best_match(t, candidates) for t in templates] == expected
+
+
+def test_match_all_consume_assigns_each_candidate_once():
+    index = LabelIndex(["20 mmHg", "20 mmHg", "40 mmHg"])
+    assert index.match_all(["20 mmHg", "20 mmHg", "20 mmHg", "40 mmHg"], consume=True) == [
+        "20 mmHg",
+        "20 mmHg",
+        None,
+        "40 mmHg",
+    ]
@@ -7,7 +7,9 @@ from openpyxl.utils import range_boundaries
 from vasoanalyzer.excel.template_v1 import inspect_template
 from vasoanalyzer.excel.writer_v1 import (
     apply_write_plan,
+    apply_write_plans,
     build_write_plan,
+    build_write_plans,
     validate_write_plan_or_raise,
 )
 
@@ -49,6 +51,21 @@ def test_build_write_plan_maps_metrics_to_rows(tmp_path):
     assert all(item.target_cell.startswith("B") for item in plan.items)
 
 
+def test_non_numeric_values_of_unplaced_metrics_are_skipped(tmp_path):
+    block = _first_block()
+    export_table = pd.DataFrame(
+        [
+            {"Metric": "20 mmHg – Max", "Value": 101.5},
+            {"Metric": "Notes", "Value": "n/a"},
+        ]
+    )
+    plan = build_write_plan(
+        str(_template_path()), str(tmp_path / "filled.xlsx"), block, "Replicate_1", export_table
+    )
+    assert [item.value for item in plan.items] == [101.5]
+    assert plan.missing_metrics == ["Notes"]
+
+
 def test_missing_metrics_fail_fast(tmp_path):
     block = _first_block()
     export_table = pd.DataFrame([{"Metric": "Missing Metric", "Value": 1.0}])
@@ -102,3 +119,37 @@ def test_apply_write_plan_writes_values_and_preserves_formulas(tmp_path):
     assert ws.cell(row=row_20, column=replicate_col).value == 101.5
     assert ws.cell(row=row_60, column=replicate_col).value == 88.25
     assert str(ws.cell(row=row_20, column=mean_col).value).startswith("=")
+
+
+def test_apply_write_plans_fills_replicates_with_one_save(tmp_path):
+    template_path = _template_path()
+    block = _first_block()
+    tables = [
+        (
+            replicate,
+            pd.DataFrame(
+                [
+                    {"Metric": "20 mmHg – Max", "Value": 100.0 + i},
+                    {"Metric": "Missing Metric", "Value": 1.0},
+                ]
+            ),
+        )
+        for i, replicate in enumerate(block.replicate_cols[:3])
+    ]
+    output_path = tmp_path / "filled.xlsx"
+    plans = build_write_plans(str(template_path), str(output_path), block, tables)
+    assert [plan.replicate_col for plan in plans] == block.replicate_cols[:3]
+    assert all(plan.missing_metrics == ["Missing Metric"] for plan in plans)
+
+    try:
+        apply_write_plans(plans)
+        assert False, "Expected missing metrics to fail the batch."
+    except ValueError as exc:
+        assert "Missing metrics" in str(exc)
+    assert not output_path.exists()
+
+    apply_write_plans(plans, allow_missing=True)
+    ws = load_workbook(output_path, data_only=False)[block.sheet_name]
+    for i, plan in enumerate(plans):
+        (item,) = plan.items
+        assert ws[item.target_cell].value == 100.0 + i
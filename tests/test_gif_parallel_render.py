@@ -0,0 +1,92 @@
+from concurrent.futures import Future
+
+import matplotlib
+import numpy as np
+
+from vasoanalyzer.core.trace_model import TraceModel
+from vasoanalyzer.ui.gif_animator import parallel_render
+from vasoanalyzer.ui.gif_animator.frame_synchronizer import FrameSynchronizer
+from vasoanalyzer.ui.gif_animator.gif_encoder import stream_gif
+from vasoanalyzer.ui.gif_animator.parallel_render import iter_frames_parallel
+from vasoanalyzer.ui.gif_animator.renderer import AnimationRenderer, EventSpec, RenderContext
+from vasoanalyzer.ui.gif_animator.specs import AnimationSpec
+
+
+def _setup(n_frames=36, *, fast_render=False):
+    t = np.linspace(0, 60, 6000)
+    inner = 100 + 10 * np.sin(t / 5)
+    trace = TraceModel(t, inner, inner + 20)
+    stack = (np.random.default_rng(1).random((61, 48, 64)) * 255).astype(np.uint8)
+    spec = AnimationSpec(
+        start_time_s=5.0,
+        end_time_s=5.0 + n_frames / 10,
+        fps=10,
+        output_width_px=320,
+        output_height_px=160,
+    )
+    spec.trace_spec.fast_render = fast_render
+    sync = FrameSynchronizer(
+        list(np.arange(61) * 1.0), trace.time_full, spec.start_time_s, spec.end_time_s
+    )
+    timings = sync.get_animation_keyframes(spec.fps, spec.playback_speed)
+    ctx = RenderContext(
+        trace_model=trace, vessel_frames=stack, events=[EventSpec(7.0, "A", "#ff0000")]
+    )
+    return spec, ctx, timings
+
+
+def test_parallel_render_matches_serial_bytes(tmp_path, monkeypatch):
+    # Workers must pick up the parent's matplotlib settings.
+    monkeypatch.setitem(matplotlib.rcParams, "font.size", 17.0)
+    spec, ctx, timings = _setup()
+    assert len(timings) >= 32
+
+    serial = list(AnimationRenderer(spec).iter_frames(ctx, timings))
+    parallel = list(iter_frames_parallel(spec, ctx, timings, workers=2, chunk_size=5))
+    assert len(parallel) == len(serial)
+    for got, expected in zip(parallel, serial, strict=True):
+        np.testing.assert_array_equal(got, expected)
+
+    serial_gif = tmp_path / "serial.gif"
+    parallel_gif = tmp_path / "parallel.gif"
+    stream_gif(serial, serial_gif, fps=spec.fps)
+    stream_gif(iter_frames_parallel(spec, ctx, timings, workers=2), parallel_gif, fps=spec.fps)
+    assert parallel_gif.read_bytes() == serial_gif.read_bytes()
+
+
+def test_parallel_render_falls_back_to_serial_for_short_runs():
+    spec, ctx, timings = _setup(n_frames=6, fast_render=True)
+    frames = iter_frames_parallel(spec, ctx, timings, workers=4)
+    expected = AnimationRenderer(spec).iter_frames(ctx, timings)
+    for got, want in zip(frames, expected, strict=True):
+        np.testing.assert_array_equal(got, want)
+
+
+def test_parallel_render_bounds_frames_in_flight(monkeypatch):
+    spec, ctx, timings = _setup(n_frames=60, fast_render=True)
+    workers, chunk_size = 4, 3
+    held = {"now": 0, "max": 0}
+
+    class _InlineExecutor:
+        # Completes every chunk at submit time, like workers that outrun the encoder.
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def submit(self, _fn, chunk, _vessel):
+            held["now"] += len(chunk)
+            held["max"] = max(held["max"], held["now"])
+            future = Future()
+            future.set_result([np.zeros(1)] * len(chunk))
+            return future
+
+        def shutdown(self, **kwargs):
+            pass
+
+    monkeypatch.setattr(parallel_render, "ProcessPoolExecutor", _InlineExecutor)
+    count = 0
+    for _frame in iter_frames_parallel(spec, ctx, timings, workers=workers, chunk_size=chunk_size):
+        held["now"] -= 1
+        count += 1
+
+    assert count == len(timings)
+    assert held["max"] == (workers + 1) * chunk_size
@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+from PIL import Image, ImageSequence
+
+from vasoanalyzer.ui.gif_animator.gif_encoder import ExportCancelled, FrameQuantizer, stream_gif
+
+
+def _frames(n, h=60, w=80):
+    rng = np.random.default_rng(4)
+    background = (rng.random((h, w, 3)) * 255).astype(np.uint8)
+    for i in range(n):
+        frame = background.copy()
+        pos = 2 if i == 3 else i % 40  # frame 3 repeats frame 2
+        frame[5 + pos : 15 + pos, 10:20] = (255, 0, 0)
+        yield frame
+
+
+def _decoded(path):
+    with Image.open(path) as im:
+        info = dict(im.info)
+        frames = [np.asarray(f.convert("RGB")) for f in ImageSequence.Iterator(im)]
+    return frames, info
+
+
+def test_stream_gif_round_trips_generated_frames(tmp_path):
+    path = tmp_path / "anim.gif"
+    progress = []
+    count = stream_gif(
+        _frames(8),
+        path,
+        fps=10,
+        durations_ms=[100] * 8,
+        total_frames=8,
+        progress_callback=lambda i, total: progress.append((i, total)),
+    )
+    assert count == 8
+    assert progress[-1] == (8, 8)
+
+    quantize = FrameQuantizer()
+    expected = [np.asarray(quantize(f).convert("RGB")) for f in _frames(8)]
+    del expected[3]  # identical consecutive frames are merged
+    got, info = _decoded(path)
+    assert info.get("loop") == 0
+    assert len(got) == len(expected)
+    for g, e in zip(got, expected, strict=True):
+        np.testing.assert_array_equal(g, e)
+
+
+def test_stream_gif_cancel_and_errors_leave_existing_file(tmp_path):
+    path = tmp_path / "anim.gif"
+    path.write_bytes(b"old")
+    with pytest.raises(ExportCancelled):
+        stream_gif(_frames(50), path, fps=10, should_stop=lambda: True)
+    with pytest.raises(ValueError):
+        stream_gif(_frames(3), path, fps=10, durations_ms=[100, 100])
+    with pytest.raises(ValueError):
+        stream_gif(iter(()), path, fps=10)
+    assert path.read_bytes() == b"old"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["anim.gif"]
+
+
+def test_dirty_rects_limit_encoding_to_changed_regions(tmp_path):
+    frames = list(_frames(6))
+    # Only the red square's column band changes between frames.
+    dirty = [None] + [[(10, 0, 20, 60)]] * 5
+    hinted = tmp_path / "hinted.gif"
+    plain = tmp_path / "plain.gif"
+    stream_gif(frames, hinted, fps=10, dirty_rects=dirty)
+    stream_gif(frames, plain, fps=10)
+
+    got, _ = _decoded(hinted)
+    expected, _ = _decoded(plain)
+    assert len(got) == len(expected) == 5
+    for g, e in zip(got, expected, strict=True):
+        np.testing.assert_array_equal(g, e)
+    # Later frames carry a graphic control extension with disposal 1 and
+    # the transparency flag set.
+    data = hinted.read_bytes()
+    packed = [data[i + 3] for i in range(len(data) - 3) if data[i : i + 3] == b"\x21\xf9\x04"]
+    assert any(flags & 0x1 and (flags >> 2) & 0x7 == 1 for flags in packed[1:])
+
+
+def test_renderer_dirty_rects_cover_every_changed_pixel():
+    from vasoanalyzer.core.trace_model import TraceModel
+    from vasoanalyzer.ui.gif_animator.frame_synchronizer import FrameSynchronizer
+    from vasoanalyzer.ui.gif_animator.renderer import (
+        AnimationRenderer,
+        EventSpec,
+        RenderContext,
+    )
+    from vasoanalyzer.ui.gif_animator.specs import AnimationSpec
+
+    t = np.linspace(0, 60, 6000)
+    trace = TraceModel(t, 100 + 10 * np.sin(t / 5), 120 + 10 * np.sin(t / 5))
+    stack = (np.random.default_rng(1).random((61, 48, 64)) * 255).astype(np.uint8)
+    ctx = RenderContext(
+        trace_model=trace, vessel_frames=stack, events=[EventSpec(7.0, "A", "#ff0000")]
+    )
+    for layout in ("side_by_side", "stacked"):
+        spec = AnimationSpec(
+            start_time_s=5.0, end_time_s=7.0, fps=10, output_width_px=320, output_height_px=200
+        )
+        spec.layout_mode = layout
+        spec.trace_spec.fast_render = True
+        spec.vessel_show_timestamp = False
+        sync = FrameSynchronizer(list(np.arange(61) * 1.0), t, 5.0, 7.0)
+        timings = sync.get_animation_keyframes(spec.fps, spec.playback_speed)
+        renderer = AnimationRenderer(spec)
+        frames = list(renderer.iter_frames(ctx, timings))
+        rects = list(renderer.iter_dirty_rects(ctx, timings))
+        assert rects[0] is None
+        coverage = []
+        for prev, frame, dirty in zip(frames[:-1], frames[1:], rects[1:], strict=True):
+            covered = np.zeros(frame.shape[:2], dtype=bool)
+            for x0, y0, x1, y1 in dirty:
+                covered[y0:y1, x0:x1] = True
+            changed = (frame != prev).any(axis=2)
+            assert not (changed & ~covered).any()
+            coverage.append(covered.mean())
+        assert np.mean(coverage) < 0.5
@@ -9,7 +9,9 @@ from vasoanalyzer.storage import validation
 from vasoanalyzer.storage.repair import repair_dataset_from_raw, soft_delete_events
 from vasoanalyzer.storage.snapshots import create_bundle, create_snapshot
 from vasoanalyzer.storage.sqlite import events as _events
+from vasoanalyzer.storage.sqlite import projects as _projects
 from vasoanalyzer.storage.sqlite_store import (
+    SCHEMA_VERSION,
     add_dataset,
     create_project,
     open_project,
@@ -193,3 +195,63 @@ def test_dataset_switch_during_autosave_no_contamination(tmp_path):
         "SELECT events_signature FROM dataset WHERE id = ?", (ds_b,)
     ).fetchone()[0]
     assert sig_a != sig_b
+
+
+def test_trace_signature_payload_and_cache(tmp_path):
+    store, dataset_id = _make_project(tmp_path)
+    conn = store.conn
+    second = 1_000_000
+    assert validation.compute_trace_signature(conn, dataset_id) == validation._stable_hash(
+        {
+            "n": 4,
+            "prefix": [0, second, 2 * second, 3 * second],
+            "suffix": [],
+            "median_dt": second,
+            "min_dt": second,
+            "max_dt": second,
+        }
+    )
+
+    assert not validation.quick_validate_project(conn)
+    cached = conn.execute(
+        "SELECT trace_signature FROM signature_cache WHERE dataset_id = ?", (dataset_id,)
+    ).fetchone()[0]
+    assert cached == validation.compute_trace_signature(conn, dataset_id)
+
+    # A changed trace invalidates the cached signature and is reported as drift.
+    conn.execute("INSERT INTO trace(dataset_id, t_seconds) VALUES (?, 4.5)", (dataset_id,))
+    issues = validation.quick_validate_project(conn)
+    assert [issue["kind"] for issue in issues] == ["trace_signature_drift"]
+
+
+def test_signature_cache_table_comes_from_the_v8_migration(tmp_path):
+    conn = sqlite3.connect(tmp_path / "v7.sqlite")
+    _projects.ensure_schema(conn, schema_version=7, now="2024-01-01T00:00:00Z")
+    conn.execute("DROP TABLE signature_cache")
+    conn.commit()
+
+    _projects.run_migrations(conn, start=7, target=SCHEMA_VERSION, now="2024-01-02T00:00:00Z")
+
+    assert _projects.get_user_version(conn) == SCHEMA_VERSION == 9
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(signature_cache)")]
+    assert columns == ["dataset_id", "trace_token", "trace_signature"]
+    conn.close()
+
+
+def test_interior_trace_edit_invalidates_cached_signature(tmp_path):
+    store, dataset_id = _make_project(tmp_path)
+    conn = store.conn
+    assert not validation.quick_validate_project(conn)
+    token = validation._trace_change_token(conn, dataset_id)
+
+    # Same count and endpoints, different interior sample.
+    conn.execute(
+        "UPDATE trace SET t_seconds = 1.5 WHERE dataset_id = ? AND t_seconds = 1.0",
+        (dataset_id,),
+    )
+    assert validation._trace_change_token(conn, dataset_id) != token
+    sigs = validation.compute_dataset_signatures(conn, dataset_id)
+    assert not sigs.trace_cached
+    assert sigs.trace_signature == validation.compute_trace_signature(conn, dataset_id)
+    issues = validation.quick_validate_project(conn)
+    assert [issue["kind"] for issue in issues] == ["trace_signature_drift"]
@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vasoanalyzer.io.traces import merge_traces
+
+
+def _write_segment(path: Path, start: float, rows: int, *, tiff: bool = True) -> Path:
+    data = {
+        "Time (s)": start + np.arange(rows) * 0.5,
+        "FrameNumber": np.arange(rows) + 1,
+        "Inner Diameter": np.linspace(100.0, 110.0, rows),
+    }
+    if tiff:
+        data["TiffPage"] = np.arange(rows)
+    pd.DataFrame(data).to_csv(path, index=False)
+    return path
+
+
+def test_merge_offsets_time_frame_and_tiff(tmp_path: Path):
+    paths = [
+        _write_segment(tmp_path / "seg0.csv", 0.0, 4),
+        _write_segment(tmp_path / "seg1.csv", 0.0, 3),
+        _write_segment(tmp_path / "seg2.csv", 10.0, 2),
+    ]
+
+    merged = merge_traces([p.as_posix() for p in paths], max_workers=3)
+
+    assert len(merged) == 9
+    time = merged["Time (s)"].to_numpy()
+    assert np.all(np.diff(time) > 0)
+    assert time[4] == pytest.approx(2.0)
+    assert list(merged["FrameNumber"]) == [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    assert list(merged["TiffPage"]) == list(range(9))
+    segments = merged.attrs["merged_segments"]
+    assert [seg["rows"] for seg in segments] == [4, 3, 2]
+    assert segments[1]["applied_frame_offset"] == 4
+    assert merged.attrs["merged_from_paths"] == [p.as_posix() for p in paths]
+
+
+def test_merge_skips_bad_segments_and_fills_missing_columns(tmp_path: Path):
+    good = _write_segment(tmp_path / "good.csv", 0.0, 3)
+    no_tiff = _write_segment(tmp_path / "no_tiff.csv", 0.0, 2, tiff=False)
+    bad = tmp_path / "bad.csv"
+    bad.write_text("foo,bar\n1,2\n")
+
+    merged = merge_traces([good.as_posix(), bad.as_posix(), no_tiff.as_posix()])
+
+    assert len(merged) == 5
+    assert merged["TiffPage"].isna().sum() == 2
+    assert merged.attrs["merged_skipped_paths"][0]["path"] == bad.as_posix()
+    assert merged.attrs["merge_warnings"]
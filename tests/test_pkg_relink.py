@@ -0,0 +1,145 @@
+import warnings
+from pathlib import Path
+
+from vasoanalyzer.pkg import relink
+from vasoanalyzer.pkg.blobs import compute_sha256
+from vasoanalyzer.pkg.models import ChannelSpec, DatasetMeta, RefEntry, Sampling
+from vasoanalyzer.pkg.package import VasoPackage
+from vasoanalyzer.pkg.relink import RelinkTarget, locate_files
+
+
+def _write(path: Path, payload: bytes) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(payload)
+    return path
+
+
+def test_locate_files_filters_by_size_and_hash(tmp_path: Path, monkeypatch):
+    root = tmp_path / "moved"
+    wanted = _write(root / "b" / "trace.csv", b"time,inner\n0,1\n")
+    _write(root / "a" / "trace.csv", b"time,inner\n0,2\n")  # same size, other content
+    _write(root / "c" / "trace.csv", b"short")
+    _write(root / "events.csv", b"t,label\n")
+
+    hashed: list[Path] = []
+    real_hash = relink.compute_sha256
+
+    def _counting_hash(path: Path) -> str:
+        hashed.append(path)
+        return real_hash(path)
+
+    monkeypatch.setattr(relink, "compute_sha256", _counting_hash)
+    progress: list[tuple[int, int]] = []
+    digest = compute_sha256(wanted)
+    found = locate_files(
+        root,
+        [
+            RelinkTarget(key="trace", name="trace.csv", size=wanted.stat().st_size, sha256=digest),
+            RelinkTarget(key="events", name="events.csv"),
+            RelinkTarget(key="gone", name="missing.csv", sha256=digest),
+        ],
+        workers=2,
+        progress_callback=lambda done, total: progress.append((done, total)),
+    )
+
+    assert found == {"trace": wanted, "events": root / "events.csv"}
+    # The short same-named file is ruled out by size before hashing.
+    assert sorted(hashed) == sorted([wanted, root / "a" / "trace.csv"])
+    assert progress[0] == (0, 3)
+    assert progress[-1] == (3, 3)
+
+
+def test_locate_files_breaks_ties_with_relative_hint(tmp_path: Path):
+    root = tmp_path / "data"
+    _write(root / "day1" / "trace.csv", b"x")
+    expected = _write(root / "day2" / "trace.csv", b"x")
+
+    found = locate_files(
+        root, [RelinkTarget(key=1, name="trace.csv", rel_hint="../day2/trace.csv")]
+    )
+
+    assert found == {1: expected}
+
+
+def test_locate_files_stops_when_asked(tmp_path: Path):
+    root = tmp_path / "data"
+    payload = b"time,inner\n0,1\n"
+    for name in ("a", "b", "c"):
+        _write(root / name / "trace.csv", payload)
+    digest = compute_sha256(root / "a" / "trace.csv")
+    targets = [
+        RelinkTarget(key=1, name="trace.csv", size=len(payload), sha256=digest),
+        RelinkTarget(key=2, name="events.csv"),
+    ]
+
+    assert locate_files(root, targets, should_stop=lambda: True) == {}
+
+    progress: list[tuple[int, int]] = []
+    found = locate_files(
+        root,
+        targets,
+        progress_callback=lambda done, total: progress.append((done, total)),
+        should_stop=lambda: len(progress) > 1,
+    )
+    # The unhashed target settles before hashing starts; the hashed one is dropped.
+    assert found == {}
+    assert progress == [(0, 2), (1, 2)]
+
+
+def test_package_relink_resolves_moved_refs_in_one_pass(tmp_path: Path):
+    original = _write(tmp_path / "old" / "stack.tif", b"tiff-bytes")
+    digest = compute_sha256(original)
+    path = tmp_path / "project.vaso"
+    pkg = VasoPackage.create(path)
+    meta = DatasetMeta(
+        name="A",
+        modality="diameter",
+        sampling=Sampling(rate_hz=1.0),
+        channels=[ChannelSpec(key="inner", unit="um")],
+    )
+    ref = RefEntry(
+        sha256=digest,
+        size=original.stat().st_size,
+        mime="image/tiff",
+        role="tiff",
+        uri=original.as_posix(),
+    )
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", "Duplicate name", UserWarning)
+        pkg.add_dataset(meta, refs=[ref])
+
+        moved = _write(tmp_path / "new" / "nested" / "stack.tif", original.read_bytes())
+        original.unlink()
+
+        updates = VasoPackage.open(path).relink(tmp_path / "new")
+
+    assert updates == {original.as_posix(): moved.resolve().as_posix()}
+    reopened = VasoPackage.open(path)
+    assert reopened.refs[meta.id][0].uri == moved.resolve().as_posix()
+    assert reopened.linkmap == updates
+
+
+def test_relink_dialog_disables_apply_while_searching(qt_app, tmp_path: Path):
+    from vasoanalyzer.core.project import SampleN
+    from vasoanalyzer.ui.dialogs.relink_dialog import MissingAsset, RelinkDialog
+
+    moved = _write(tmp_path / "new" / "nested" / "trace.csv", b"time,inner\n0,1\n")
+    dialog = RelinkDialog()
+    ready = MissingAsset(SampleN(name="A"), "events", "A events", None, new_path=str(moved))
+    missing = MissingAsset(SampleN(name="A"), "trace", "A trace", "/old/trace.csv")
+    dialog.set_assets([ready, missing])
+    assert dialog.apply_btn.isEnabled()
+
+    targets = [dialog._search_target(0, missing)]
+    dialog._start_search(tmp_path / "new", targets, [missing])
+    search = dialog._search
+    assert not dialog.apply_btn.isEnabled()
+    assert not dialog.root_btn.isEnabled()
+
+    assert search.wait(10_000)
+    qt_app.processEvents()
+    assert dialog._search is None
+    assert dialog.apply_btn.isEnabled() and dialog.root_btn.isEnabled()
+    assert missing.new_path == moved.resolve().as_posix()
+    assert dialog.status_label.text() == "Search found 1 of 1 missing file(s)."
+    dialog.close()
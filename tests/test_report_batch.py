@@ -0,0 +1,89 @@
+import io
+import re
+
+import numpy as np
+import pandas as pd
+from PIL import Image
+
+from vasoanalyzer.export.report_batch import (
+    ReportFigureRenderer,
+    ReportPage,
+    render_report_pages,
+    write_report_pdf,
+)
+from vasoanalyzer.export.report_figure import render_report_figure
+
+
+def _page(i, n_events, *, snapshot=True, pressure=True):
+    rng = np.random.default_rng(i)
+    t = np.arange(0, 300 + 50 * i, 0.5)
+    data = {
+        "Time (s)": t,
+        "Inner Diameter": 100 + 10 * i + np.cumsum(rng.normal(0, 0.2, t.size)),
+        "Outer Diameter": 130 + np.cumsum(rng.normal(0, 0.2, t.size)),
+    }
+    if pressure:
+        data["Avg Pressure (mmHg)"] = 60 + 20 * np.sin(t / 30)
+    times = np.sort(rng.uniform(0, t[-1], n_events))
+    labels = [f"E{k}" for k in range(n_events)]
+    events = pd.DataFrame(
+        {"Event": labels, "Time (s)": times, "ID (µm)": rng.uniform(90, 110, n_events)}
+    )
+    return ReportPage(
+        name=f"vessel_{i}",
+        trace=pd.DataFrame(data),
+        xlim=(0.0, float(t[-1])),
+        events_df=events if n_events else None,
+        event_times=list(times),
+        event_labels=labels,
+        snapshot_image=(rng.random((40 + 5 * i, 60)) * 255).astype(np.uint8) if snapshot else None,
+        metadata={"sample_name": f"Vessel {i}", "date": "2026-01-01"},
+    )
+
+
+def _pixels(fig):
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=40, facecolor="white")
+    return np.asarray(Image.open(buf))
+
+
+def test_reused_figure_matches_fresh_render():
+    pages = [
+        _page(0, 5),
+        _page(1, 20),
+        _page(2, 0),
+        _page(3, 8, snapshot=False),
+        _page(4, 8, pressure=False),
+        _page(5, 3),
+    ]
+    renderer = ReportFigureRenderer(dpi=40)
+    for page in pages:
+        fresh = render_report_figure(
+            page.trace_model(),
+            page.xlim,
+            events_df=page.events_df,
+            event_times=page.event_times,
+            event_labels=page.event_labels,
+            snapshot_image=page.snapshot_image,
+            metadata=page.metadata,
+            dpi=40,
+        )
+        np.testing.assert_array_equal(_pixels(renderer.render(page)), _pixels(fresh))
+
+
+def test_render_report_pages_across_processes(tmp_path):
+    pages = [_page(i, 4) for i in range(4)]
+    pages.append(ReportPage(name="broken", trace=pd.DataFrame({"x": [1.0]}), xlim=(0.0, 1.0)))
+    seen = []
+    results = render_report_pages(
+        pages, tmp_path, fmt="png", dpi=30, workers=2, on_result=seen.append
+    )
+    assert [r.name for r in results] == [p.name for p in pages]
+    assert seen == results
+    assert [r.ok for r in results] == [True] * 4 + [False]
+    assert all((tmp_path / f"vessel_{i}.png").stat().st_size > 0 for i in range(4))
+
+    pdf = tmp_path / "all.pdf"
+    results = write_report_pdf(pages[:3], pdf, dpi=30)
+    assert all(r.ok for r in results)
+    assert len(re.findall(rb"/Type\s*/Page\b", pdf.read_bytes())) == 3
@@ -1,7 +1,7 @@
 import numpy as np
 import pandas as pd
 
-from vasoanalyzer.core.timebase import derive_tiff_page_times, page_for_time
+from vasoanalyzer.core.timebase import PageTimeIndex, derive_tiff_page_times, page_for_time
 
 
 def test_tiff_page_time_mapping_from_trace():
@@ -33,3 +33,28 @@ def test_page_for_time_midpoints():
     assert page_for_time(0.51, times, mode="nearest") == 1
     assert page_for_time(1.5, times, mode="nearest") == 1
     assert page_for_time(2.51, times, mode="nearest") == 3
+
+
+def test_page_time_index_batch_matches_scalar_lookups():
+    rng = np.random.default_rng(7)
+    stacks = [
+        np.cumsum(rng.uniform(0.5, 1.5, 50)),  # monotonic
+        np.round(rng.uniform(0.0, 20.0, 50)),  # unordered, repeated times
+        np.where(np.arange(50) % 7 == 3, np.nan, np.arange(50.0)),  # gaps
+    ]
+    queries = np.concatenate([rng.uniform(-5.0, 60.0, 200), [np.nan, np.inf]])
+    for times in stacks:
+        index = PageTimeIndex(times)
+        for mode in ("nearest", "floor"):
+            batch = index.pages_for_times(queries, mode=mode)
+            scalar = [page_for_time(t, list(times), mode=mode) for t in queries]
+            assert [None if page < 0 else page for page in batch.tolist()] == scalar
+
+
+def test_page_time_index_ties_and_degenerate_stacks():
+    # Unordered stacks resolve ties to the lowest page.
+    assert page_for_time(1.5, PageTimeIndex([3.0, 2.0, 1.0, 2.0])) == 1
+    assert page_for_time(2.0, [3.0, 2.0, 1.0, 2.0]) == 1
+    assert PageTimeIndex([0.0, 1.0, 2.0]).page_for_time(1.7, mode="floor") == 1
+    assert PageTimeIndex([np.nan, np.nan]).page_for_time(1.0) is None
+    assert PageTimeIndex([]).pages_for_times([1.0]).tolist() == [-1]
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from vasoanalyzer.core.sweeps import TriggerConfig, _detect_triggers, compute_sweeps
+from vasoanalyzer.core.trace_model import TraceModel
+
+
+def _oscillating_model(with_outer: bool = True) -> TraceModel:
+    time = np.arange(0.0, 100.0, 0.05)
+    inner = 100.0 + 10.0 * np.sin(2 * np.pi * time / 5.0)
+    outer = inner + 20.0 if with_outer else None
+    return TraceModel(time, inner, outer)
+
+
+def test_triggers_and_sweeps_follow_each_crossing():
+    model = _oscillating_model()
+    config = TriggerConfig("inner", 100.0, "rising", pre_window=1.0, post_window=2.0)
+
+    result = compute_sweeps(model, config)
+
+    # Rising crossings at t = 5, 10, ..., 95; t = 0 has no preceding sample.
+    np.testing.assert_allclose(result.triggers, np.arange(5.0, 100.0, 5.0), atol=1e-9)
+    assert result.inner_sweeps.shape == (result.count, result.relative_time.size)
+    assert result.has_outer()
+    np.testing.assert_allclose(result.average_outer - result.average_inner, 20.0)
+
+
+def test_nan_windows_and_min_interval_are_rejected():
+    model = _oscillating_model(with_outer=False)
+    model.inner_full[np.searchsorted(model.time_full, 25.5)] = np.nan
+    config = TriggerConfig(
+        "inner", 100.0, "rising", pre_window=1.0, post_window=2.0, min_interval=9.0
+    )
+
+    result = compute_sweeps(model, config)
+
+    np.testing.assert_allclose(
+        result.triggers, [5.0, 15.0, 35.0, 45.0, 55.0, 65.0, 75.0, 85.0, 95.0]
+    )
+    assert result.outer_sweeps is None
+
+
+def test_streaming_averages_match_sweep_matrix():
+    model = _oscillating_model()
+    config = TriggerConfig("outer", 115.0, "falling", pre_window=0.5, post_window=0.5)
+
+    full = compute_sweeps(model, config)
+    streamed = compute_sweeps(model, config, keep_sweeps=False)
+
+    assert streamed.count == full.count > 0
+    assert streamed.inner_sweeps.shape == (0, full.relative_time.size)
+    np.testing.assert_allclose(streamed.average_inner, full.inner_sweeps.mean(axis=0))
+    np.testing.assert_allclose(streamed.average_outer, full.outer_sweeps.mean(axis=0))
+
+
+def test_invalid_direction_raises():
+    with pytest.raises(ValueError):
+        compute_sweeps(_oscillating_model(), TriggerConfig("inner", 100.0, "up", 1.0, 1.0))
+
+
+def test_non_finite_samples_never_form_a_crossing():
+    time = np.arange(5.0)
+    for spike in (np.inf, -np.inf, np.nan):
+        signal = np.array([0.0, 0.0, spike, 0.0, 0.0])
+        assert _detect_triggers(time, signal, 0.5, "rising").size == 0
+        assert _detect_triggers(time, -signal, -0.5, "falling").size == 0
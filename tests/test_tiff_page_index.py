@@ -0,0 +1,119 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import tifffile
+
+from vasoanalyzer.io import tiff_index
+from vasoanalyzer.io.tiff_index import (
+    TiffFrameMetadata,
+    build_tiff_page_index,
+    load_tiff_page_index,
+    tiff_page_index_path,
+)
+from vasoanalyzer.io.tiffs import TiffPageSource, load_tiff, resolve_frame_times
+
+
+def _write_timed_stack(path: Path, pages: int = 6) -> np.ndarray:
+    data = np.arange(pages * 8 * 8, dtype=np.uint16).reshape(pages, 8, 8)
+    with tifffile.TiffWriter(path) as writer:
+        for idx, frame in enumerate(data):
+            description = json.dumps({"FrameTime": f"{idx * 0.5:.1f} s", "Rec_intvl": "0.5 s"})
+            writer.write(frame, description=description, compression="zlib")
+    return data
+
+
+def test_page_index_records_offsets_shapes_and_times(tmp_path: Path):
+    path = tmp_path / "timed.tif"
+    _write_timed_stack(path)
+
+    index = build_tiff_page_index(path)
+
+    assert index.page_count == 6
+    assert np.all(np.diff(index.offsets) > 0)
+    assert index.page_shape(3) == (8, 8)
+    assert index.dtype == "uint16"
+    assert index.frame_times[2] == "1.0 s"
+
+
+def test_page_index_sidecar_is_reused_until_source_changes(tmp_path: Path):
+    path = tmp_path / "timed.tif"
+    _write_timed_stack(path)
+    cache_dir = tmp_path / "cache"
+
+    first = load_tiff_page_index(path, cache_dir=cache_dir)
+    sidecar = tiff_page_index_path(path, cache_dir)
+    assert sidecar.exists()
+    mtime = sidecar.stat().st_mtime_ns
+
+    again = load_tiff_page_index(path, cache_dir=cache_dir)
+    assert sidecar.stat().st_mtime_ns == mtime
+    np.testing.assert_array_equal(first.offsets, again.offsets)
+
+    _write_timed_stack(path, pages=3)
+    rebuilt = load_tiff_page_index(path, cache_dir=cache_dir)
+    assert rebuilt.page_count == 3
+
+
+def test_load_tiff_metadata_is_lazy_and_resolves_times(tmp_path: Path):
+    path = tmp_path / "timed.tif"
+    data = _write_timed_stack(path)
+
+    frames, metadata, info = load_tiff(path, index_dir=tmp_path / "cache")
+
+    assert len(frames) == 6
+    np.testing.assert_array_equal(frames[4], data[4])
+    assert all(np.shares_memory(frames[0].base, frame) for frame in frames)
+    assert len(metadata) == 6
+    assert metadata[1]["FrameTime"] == "0.5 s"
+    assert metadata[1]["index"] == 1
+    assert "ImageWidth" in metadata[1]
+
+    result = resolve_frame_times(
+        metadata, n_frames=len(frames), frame_indices=info["frame_indices"]
+    )
+    np.testing.assert_allclose(result.frame_times_s, np.arange(6) * 0.5)
+
+
+def test_page_source_uses_index_offsets(tmp_path: Path):
+    path = tmp_path / "timed.tif"
+    data = _write_timed_stack(path)
+    index = build_tiff_page_index(path)
+
+    with TiffPageSource(path, page_index=index, prefetch_ahead=0, prefetch_behind=0) as source:
+        assert len(source) == 6
+        np.testing.assert_array_equal(source.get_frame(5), data[5])
+
+
+def test_frame_metadata_keeps_one_file_handle(tmp_path: Path, monkeypatch):
+    path = tmp_path / "timed.tif"
+    _write_timed_stack(path)
+    index = build_tiff_page_index(path)
+    opened: list[str] = []
+    real_tiff_file = tifffile.TiffFile
+
+    def _counting(*args, **kwargs):
+        opened.append(str(args[0]))
+        return real_tiff_file(*args, **kwargs)
+
+    monkeypatch.setattr(tiff_index.tifffile, "TiffFile", _counting)
+    metadata = TiffFrameMetadata(index, range(6))
+    try:
+        times = [metadata[i]["FrameTime"] for i in range(6)]
+        assert metadata[1:4][0]["FrameTime"] == "0.5 s"
+        assert metadata.select([5])[0]["index"] == 5
+    finally:
+        metadata.close()
+    assert times[3] == "1.5 s"
+    assert len(opened) == 1
+
+
+def test_frame_metadata_can_share_the_page_source_handle(tmp_path: Path):
+    path = tmp_path / "timed.tif"
+    _write_timed_stack(path)
+    index = build_tiff_page_index(path)
+
+    with TiffPageSource(path, page_index=index, prefetch_ahead=0, prefetch_behind=0) as source:
+        metadata = TiffFrameMetadata(index, [0, 2, 4], reader=source.page_metadata)
+        assert metadata[1]["FrameTime"] == "1.0 s"
+        assert metadata[2]["shape"] == (8, 8)
@@ -0,0 +1,115 @@
+import time
+from pathlib import Path
+
+import numpy as np
+import tifffile
+
+from vasoanalyzer.io.tiffs import TiffPageSource, open_tiff_stack
+from vasoanalyzer.ui.tiff_viewer_v2.stack_source import StackSource
+
+
+def _write_stack(path: Path, pages: int = 12, *, compression: str | None = "zlib") -> np.ndarray:
+    data = np.arange(pages * 16 * 16, dtype=np.uint16).reshape(pages, 16, 16)
+    tifffile.imwrite(path, data, compression=compression)
+    return data
+
+
+def test_tiff_page_source_decodes_compressed_pages_on_demand(tmp_path: Path):
+    path = tmp_path / "stack.tif"
+    data = _write_stack(path)
+
+    with TiffPageSource(path, prefetch_ahead=0, prefetch_behind=0) as source:
+        assert isinstance(source, StackSource)
+        assert len(source) == 12
+        assert source.cached_bytes == 0
+        np.testing.assert_array_equal(source.get_frame(5), data[5])
+        np.testing.assert_array_equal(source[11], data[11])
+        assert source.get_frame(12) is None
+        assert source.get_frame(-1) is None
+
+
+def test_tiff_page_source_respects_cache_budget(tmp_path: Path):
+    path = tmp_path / "stack.tif"
+    data = _write_stack(path, compression=None)
+    frame_bytes = data[0].nbytes
+
+    with TiffPageSource(
+        path, cache_bytes=3 * frame_bytes, prefetch_ahead=0, prefetch_behind=0
+    ) as source:
+        for idx in range(len(source)):
+            source.get_frame(idx)
+        assert source.cached_bytes == 3 * frame_bytes
+
+
+def test_tiff_page_source_prefetches_ahead_of_playhead(tmp_path: Path):
+    path = tmp_path / "stack.tif"
+    data = _write_stack(path)
+
+    with TiffPageSource(path, prefetch_ahead=4, prefetch_behind=1) as source:
+        source.get_frame(2)
+        deadline = time.monotonic() + 5.0
+        while source.cached_bytes < 6 * data[0].nbytes and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert source.cached_bytes == 6 * data[0].nbytes
+        np.testing.assert_array_equal(source.get_frame(6), data[6])
+
+
+def test_open_tiff_stack_decodes_nothing_up_front(tmp_path: Path):
+    path = tmp_path / "stack.tif"
+    data = _write_stack(path)
+
+    source, metadata, info = open_tiff_stack(
+        path, index_dir=tmp_path / "cache", prefetch_ahead=0, prefetch_behind=0
+    )
+    with source:
+        assert isinstance(source, TiffPageSource)
+        assert source.cached_bytes == 0
+        assert info["total_frames"] == info["loaded_frames"] == len(metadata) == 12
+        assert info["frame_indices"] == list(range(12)) and not info["is_subsampled"]
+        assert metadata[3]["shape"] == (16, 16)
+        np.testing.assert_array_equal(source.get_frame(3), data[3])
+
+
+def test_lazy_snapshot_stack_is_embedded_on_save(tmp_path: Path):
+    import io
+
+    import pandas as pd
+
+    from vasoanalyzer.core.project import (
+        Experiment,
+        Project,
+        SampleN,
+        load_project,
+        save_project,
+    )
+    from vasoanalyzer.storage import sqlite_store
+
+    tiff_path = tmp_path / "stack.tif"
+    data = _write_stack(tiff_path)
+    sample = SampleN(
+        name="S",
+        trace_data=pd.DataFrame({"t_seconds": [0.0, 1.0], "inner_diam": [10.0, 11.0]}),
+        snapshots=None,
+        snapshot_path=tiff_path.as_posix(),
+    )
+    project = Project(name="P", experiments=[Experiment(name="E", samples=[sample])])
+    project.embed_snapshots = True
+    vaso_path = tmp_path / "lazy.vaso"
+    save_project(project, vaso_path.as_posix())
+    project.close()
+
+    reopened = load_project(vaso_path.as_posix())
+    try:
+        loaded = reopened.experiments[0].samples[0]
+        assert loaded.snapshot_role == "snapshot_stack"
+        asset_id = loaded.asset_roles["snapshot_stack"]
+    finally:
+        reopened.close()
+
+    store = sqlite_store.open_project(vaso_path)
+    try:
+        payload = sqlite_store.get_asset_bytes(store, asset_id)
+    finally:
+        store.close()
+    with np.load(io.BytesIO(payload), allow_pickle=False) as npz_file:
+        np.testing.assert_array_equal(npz_file["stack"], data)
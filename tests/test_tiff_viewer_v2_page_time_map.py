@@ -13,6 +13,9 @@ def test_page_time_map_from_times_valid():
     assert page_map.time_for_page(0) == 0.0
     assert page_map.time_for_page(2) == 2.0
     assert page_map.page_for_time(1.4) == 1
+    assert page_map.pages_for_times([-1.0, 0.6, 1.4, 9.0]).tolist() == [0, 1, 1, 2]
+    assert PageTimeMap.from_times([0.0, float("nan"), 1.0]).status.endswith("non-finite times")
+    assert PageTimeMap.from_times([0.0, 2.0, 1.0]).status.endswith("non-monotonic times")
 
 
 def test_derive_page_time_map_missing_tiff_column():
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from vasoanalyzer.io.trace_events import _TraceTimeIndex, load_trace_and_events
+
+
+def test_nearest_matches_argmin_over_finite_samples():
+    rng = np.random.default_rng(3)
+    time = np.round(rng.uniform(0.0, 50.0, 400), 1)  # unsorted, with repeats
+    time[rng.integers(0, time.size, 20)] = np.nan
+    targets = np.concatenate([rng.uniform(-5.0, 55.0, 300), time[:50], [np.nan]])
+
+    index = _TraceTimeIndex(time)
+
+    finite = np.flatnonzero(np.isfinite(time))
+    expected = [finite[np.argmin(np.abs(time[finite] - t))] for t in targets]
+    np.testing.assert_array_equal(index.nearest(targets), expected)
+
+
+def test_events_align_by_frame_number_and_time(tmp_path: Path):
+    n = 200
+    pd.DataFrame(
+        {
+            "Time (s)": np.arange(n) * 0.5,
+            "Inner Diameter": np.arange(n, dtype=float),
+            "Outer Diameter": np.arange(n, dtype=float) + 50.0,
+            "FrameNumber": np.arange(n) // 2,
+            "TiffPage": np.where(np.arange(n) % 4 == 0, np.arange(n) // 4, np.nan),
+        }
+    ).to_csv(tmp_path / "trace.csv", index=False)
+    pd.DataFrame(
+        {"Event": ["a", "b", "c"], "Time (s)": [0.0, 0.0, 0.0], "Frame": [3, 10, 40]}
+    ).to_csv(tmp_path / "events.csv", index=False)
+
+    _df, labels, times, frames, diam, od_diam, extras = load_trace_and_events(
+        str(tmp_path / "trace.csv"), str(tmp_path / "events.csv")
+    )
+
+    # Duplicate frame numbers map to their last trace row, as before.
+    assert extras["frame_number_to_trace_idx"][3] == 7
+    assert extras["tiff_page_to_trace_idx"][5] == 20
+    assert labels == ["a", "b", "c"]
+    assert times == [3.5, 10.5, 40.5]
+    assert frames == [3, 10, 40]
+    assert diam == [7.0, 21.0, 81.0]
+    assert od_diam == [57.0, 71.0, 131.0]
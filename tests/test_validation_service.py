@@ -0,0 +1,177 @@
+import sqlite3
+import threading
+
+import pandas as pd
+
+from vasoanalyzer.services.validation_service import (
+    add_result_listener,
+    database_path,
+    iter_dataset_checks,
+    validate_project,
+)
+from vasoanalyzer.storage import integrity, snapshots, validation
+from vasoanalyzer.storage.sqlite_store import add_dataset, create_project, open_project
+
+
+def _project_with_datasets(tmp_path, count=5):
+    store = create_project(tmp_path / "project.vaso", app_version="test", timezone="UTC")
+    ids = []
+    for i in range(count):
+        trace_df = pd.DataFrame(
+            {
+                "t_seconds": [0.0, 1.0, 2.0, 3.0 + i],
+                "inner_diam": [1.0, 1.1, 1.2, 1.3 + i],
+            }
+        )
+        events_df = pd.DataFrame({"t_seconds": [0.5 + i], "label": [f"e{i}"], "frame": [i]})
+        ids.append(add_dataset(store, f"ds{i}", trace_df, events_df))
+    return store, ids
+
+
+def test_validate_project_matches_serial_validation(tmp_path):
+    store, ids = _project_with_datasets(tmp_path)
+    conn = store.conn
+    assert database_path(conn) is not None
+
+    conn.execute("UPDATE event SET t_us = t_us + 1000 WHERE dataset_id = ?", (ids[1],))
+    conn.commit()
+
+    seen = []
+    issues = validate_project(conn, max_workers=3, on_result=seen.append)
+    assert sorted(check.dataset_id for check in seen) == ids
+    assert all(check.ok for check in seen)
+    assert [issue["dataset_id"] for issue in issues] == [ids[1]]
+    assert issues[0]["kind"] == "events_signature_drift"
+
+    rows = conn.execute(
+        "SELECT id, events_signature, trace_signature FROM dataset ORDER BY id"
+    ).fetchall()
+    for row in rows:
+        sigs = validation.compute_dataset_signatures(conn, row[0])
+        assert (row[1], row[2]) == (sigs.events_signature, sigs.trace_signature)
+    assert validation.quick_validate_project(conn) == []
+    store.close()
+
+
+def test_iter_dataset_checks_reports_unreadable_database(tmp_path):
+    checks = list(iter_dataset_checks(tmp_path / "missing.vaso", [1, 2]))
+    assert sorted(check.dataset_id for check in checks) == [1, 2]
+    assert all(not check.ok and check.error for check in checks)
+    assert database_path(sqlite3.connect(":memory:")) is None
+
+
+def test_integrity_checks_are_cached_until_the_file_changes(tmp_path):
+    path = tmp_path / "db.sqlite"
+    with sqlite3.connect(path) as db:
+        db.execute("CREATE TABLE t (x)")
+    assert integrity.check_integrity(path) == []
+    assert integrity.is_verified(path)
+    assert not integrity.is_verified(path, full=True)
+
+    scheduler = integrity.IntegrityScheduler(idle_delay_s=0)
+    done = []
+    future = scheduler.submit(path, on_done=lambda p, problems: done.append((p, problems)))
+    assert future.result(timeout=10) == []
+    assert integrity.is_verified(path, full=True)
+
+    with sqlite3.connect(path) as db:
+        db.execute("INSERT INTO t VALUES (1)")
+    assert not integrity.is_verified(path)
+    assert integrity.check_integrity(tmp_path / "gone.sqlite")
+    assert scheduler.submit(tmp_path / "gone.sqlite").result(timeout=10) == []
+    assert done == [(path, [])]
+
+
+def test_open_project_streams_dataset_checks_to_listeners(tmp_path):
+    store, ids = _project_with_datasets(tmp_path, count=3)
+    path = store.path
+    store.close()
+
+    seen = []
+    remove = add_result_listener(seen.append)
+    try:
+        reopened = open_project(path)
+    finally:
+        remove()
+    reopened.close()
+    assert sorted(check.dataset_id for check in seen) == ids
+    assert all(check.ok for check in seen)
+
+
+def test_failed_background_check_is_recorded_and_reported(tmp_path):
+    path = tmp_path / "000001.sqlite"
+    path.write_bytes(b"not a database" * 100)
+    reported = []
+    finished = threading.Event()
+
+    def _listener(failed_path, problems):
+        reported.append((failed_path, problems))
+        finished.set()
+
+    remove = integrity.add_failure_listener(_listener)
+    try:
+        scheduler = integrity.IntegrityScheduler(idle_delay_s=0)
+        problems = scheduler.submit(path).result(timeout=10)
+        assert finished.wait(timeout=10)
+    finally:
+        remove()
+    assert problems and reported == [(path, problems)]
+    assert integrity.known_problems(path) == problems
+    assert integrity.check_integrity(path) == problems
+
+
+def test_snapshot_marked_corrupt_is_not_valid(tmp_path):
+    path = tmp_path / "000001.sqlite"
+    with sqlite3.connect(path) as db:
+        db.execute("CREATE TABLE t (x)")
+    assert snapshots.validate_snapshot(path)
+
+    snapshots._record_snapshot_integrity(path, ["row 1 missing from index"])
+    assert not snapshots.validate_snapshot(path)
+
+
+def test_integrity_results_are_bounded_and_keyed_by_file_state(tmp_path, monkeypatch):
+    monkeypatch.setattr(integrity, "_MAX_REMEMBERED_FILES", 2)
+    monkeypatch.setattr(integrity, "_verified", integrity.OrderedDict())
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.sqlite"
+        with sqlite3.connect(path) as db:
+            db.execute("CREATE TABLE t (x)")
+        integrity.mark_verified(path)
+        paths.append(path)
+
+    assert len(integrity._verified) == 2
+    assert not integrity.is_verified(paths[0])
+    assert integrity.is_verified(paths[2])
+
+    with sqlite3.connect(paths[2]) as db:
+        db.execute("INSERT INTO t VALUES (1)")
+    integrity.mark_verified(paths[2])
+    assert len(integrity._verified) == 2
+    assert integrity.is_verified(paths[2])
+    assert not integrity.is_verified(paths[1])
+
+
+def test_snapshot_stays_unverified_until_the_full_check_passes(tmp_path, monkeypatch):
+    store, _ids = _project_with_datasets(tmp_path, count=1)
+    scheduled = []
+    monkeypatch.setattr(
+        integrity, "schedule_full_check", lambda path, on_done=None: scheduled.append(path)
+    )
+    bundle = snapshots.create_bundle(tmp_path / "bundle.vasopack")
+
+    first = snapshots.create_snapshot(bundle, store.path)
+    assert scheduled == [first.path]
+    assert not snapshots.is_snapshot_verified(first.path)
+    snapshots._record_snapshot_integrity(first.path, [])
+    assert snapshots.is_snapshot_verified(first.path)
+
+    later = [snapshots.create_snapshot(bundle, store.path) for _ in range(3)]
+    store.close()
+    assert snapshots.prune_old_snapshots(bundle, keep_count=1) == 2
+    remaining = [snap.path for snap in snapshots.list_snapshots(bundle)]
+    assert remaining == [first.path, later[-1].path]
+
+    assert snapshots.validate_snapshot(later[-1].path)
+    assert scheduled[-1] == later[-1].path
@@ -0,0 +1,95 @@
+import warnings
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from vasoanalyzer.pkg.models import ChannelSpec, DatasetMeta, Event, RefEntry, Sampling
+from vasoanalyzer.pkg.package import VasoPackage
+
+
+@pytest.fixture(autouse=True)
+def _quiet_duplicate_members():
+    # Rewrites append a second copy of a member until the package is compacted.
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", "Duplicate name", UserWarning)
+        yield
+
+
+def _meta(name: str) -> DatasetMeta:
+    return DatasetMeta(
+        name=name,
+        modality="diameter",
+        sampling=Sampling(rate_hz=10.0),
+        channels=[ChannelSpec(key="inner", unit="um")],
+    )
+
+
+def _member_names(path: Path) -> list[str]:
+    with zipfile.ZipFile(path) as z:
+        return z.namelist()
+
+
+def test_compact_drops_superseded_members(tmp_path: Path):
+    path = tmp_path / "project.vaso"
+    pkg = VasoPackage.create(path, title="Compact")
+    meta = _meta("A")
+    pkg.add_dataset(meta)
+    for index in range(5):
+        pkg.add_event(Event(id=f"e{index}", dataset_id=meta.id, t=float(index), label="x"))
+
+    names = _member_names(path)
+    assert len(names) > len(set(names))
+
+    assert pkg.compact() > 0
+    names = _member_names(path)
+    assert len(names) == len(set(names))
+
+    reopened = VasoPackage.open(path)
+    assert [event.id for event in reopened.events] == [f"e{index}" for index in range(5)]
+    assert reopened.datasets[meta.id].name == "A"
+    assert reopened.verify()["ok"]
+
+
+def test_open_loads_dataset_metadata_lazily(tmp_path: Path):
+    path = tmp_path / "project.vaso"
+    pkg = VasoPackage.create(path)
+    metas = [_meta(f"D{index}") for index in range(3)]
+    for meta in metas:
+        ref = RefEntry(
+            sha256="0" * 64, size=1, mime="image/tiff", role="tiff", uri=f"/old/{meta.name}.tif"
+        )
+        pkg.add_dataset(meta, refs=[ref])
+    pkg.linkmap = {f"/old/{meta.name}.tif": f"/new/{meta.name}.tif" for meta in metas}
+    pkg.save_project_meta()
+
+    reopened = VasoPackage.open(path)
+    assert sorted(reopened.datasets) == sorted(meta.id for meta in metas)
+    assert metas[0].id in reopened.refs
+    assert reopened.datasets.loaded_keys() == []
+    assert reopened.refs.loaded_keys() == []
+
+    assert reopened.datasets[metas[1].id].name == "D1"
+    assert reopened.datasets.loaded_keys() == [metas[1].id]
+    assert {meta.name for meta in reopened.datasets.values()} == {"D0", "D1", "D2"}
+
+    ref = reopened.refs[metas[2].id][0]
+    assert (ref.uri, ref.rel_hint) == ("/new/D2.tif", "/old/D2.tif")
+    assert reopened.refs.loaded_keys() == [metas[2].id]
+
+
+def test_packed_blobs_are_stored_once(tmp_path: Path):
+    path = tmp_path / "project.vaso"
+    pkg = VasoPackage.create(path)
+    meta = _meta("A")
+    pkg.add_dataset(meta)
+    source = tmp_path / "stack.tif"
+    source.write_bytes(b"tiff" * 1000)
+
+    first = pkg.pack_file_into_blobs(meta.id, source, role="tiff", mime="image/tiff")
+    second = pkg.pack_file_into_blobs(meta.id, source, role="tiff", mime="image/tiff")
+
+    assert first.sha256 == second.sha256
+    blob = f"datasets/_shared/blobs/{first.sha256}"
+    assert _member_names(path).count(blob) == 1
+    assert VasoPackage.open(path).manifest.summary.has_embedded_blobs
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from vasoanalyzer.core.audit import EditAction
+from vasoanalyzer.core.trace_model import TraceModel
+from vasoanalyzer.core.traces.stats import WindowStatsIndex
+
+
+def _brute(time, values, t0, t1):
+    window = values[(time >= t0) & (time < t1)]
+    finite = window[np.isfinite(window)]
+    if not finite.size:
+        return window.size, 0, np.nan, np.nan, np.nan
+    return window.size, finite.size, finite.mean(), finite.min(), finite.max()
+
+
+@pytest.mark.parametrize("block", [1, 4, 64])
+def test_batch_query_matches_masked_scan(block):
+    rng = np.random.default_rng(7)
+    time = np.sort(rng.uniform(0.0, 100.0, 1500))
+    values = rng.normal(size=time.size)
+    values[rng.random(time.size) < 0.1] = np.nan
+    index = WindowStatsIndex(time, values, block=block)
+
+    t0 = rng.uniform(-5.0, 105.0, 200)
+    t1 = t0 + rng.uniform(-1.0, 50.0, 200)
+    stats = index.query(t0, t1)
+
+    for i in range(t0.size):
+        samples, count, mean, lo, hi = _brute(time, values, t0[i], t1[i])
+        assert stats.samples[i] == samples
+        assert stats.count[i] == count
+        np.testing.assert_allclose(
+            [stats.mean[i], stats.min[i], stats.max[i]], [mean, lo, hi], equal_nan=True
+        )
+
+
+def test_scalar_helpers_and_inclusive_bounds():
+    index = WindowStatsIndex(np.arange(10.0), np.arange(10.0) * 2)
+
+    assert index.count(2.0, 5.0) == 3
+    assert index.mean(2.0, 5.0) == pytest.approx(6.0)
+    assert index.max(2.0, 5.0) == 8.0
+    assert index.max(2.0, 5.0, inclusive=True) == 10.0
+    assert np.isnan(index.mean(20.0, 30.0))
+
+
+def test_trace_model_index_follows_edits():
+    time = np.arange(6.0)
+    model = TraceModel(time, np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]))
+    assert model.window_stats("inner").max(0.0, 6.0) == 6.0
+
+    model.apply_actions(
+        [EditAction(channel="inner", op="delete_points", indices=(5,), t_bounds=(5.0, 5.0))]
+    )
+
+    stats = model.window_stats("inner").query(0.0, 6.0)
+    assert stats.max == 5.0
+    assert stats.count == 5
+    with pytest.raises(ValueError):
+        model.window_stats("outer")